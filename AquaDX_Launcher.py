@@ -1,109 +1,92 @@
+import sys
+import time
+_process_started = time.perf_counter()
+
+# 图形界面的启动参数，其余参数都交给命令行模式
+GUI_OPTIONS = ("--profile-startup", "--fast-start", "--watchdog")
+
+# --- 命令行模式 ---
+# 带参数运行时 (switch / launch / current / list) 不启动图形界面，也不导入 tkinter
+if __name__ == "__main__" and any(arg not in GUI_OPTIONS for arg in sys.argv[1:]):
+    from launcher_cli import main
+    sys.exit(main(sys.argv[1:]))
+
+import os
+
+# --- 单实例 ---
+# 已有启动器在运行时，让它的窗口切换到前台，本进程直接退出 (此时还没有导入 tkinter)
+instance_warning = None # 未取得单实例锁但仍然启动时的提示，事件日志配置好后记录并显示在状态栏
+if __name__ == "__main__":
+    import single_instance
+    from launcher_config import data_path as _data_path
+    instance_lock = single_instance.claim(_data_path)
+    if instance_lock is None:
+        # 另一个实例可能刚启动、服务还没开始监听，稍等片刻
+        result = single_instance.forward(_data_path, "focus", wait_for_server=single_instance.SERVER_START_WAIT)
+        if result is not None:
+            print(f"启动器已在运行: {result[1]}", file=sys.stderr)
+            sys.exit(0)
+        instance_warning = "另一个启动器进程持有单实例锁但没有应答，仍然启动 (账号数据将以只读方式打开)"
+
+from startup_profile import profiler
+profiler.start(_process_started, "--profile-startup" in sys.argv or os.environ.get("AQUADX_PROFILE_STARTUP") == "1")
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
-import os
-import json
-import sys
-import subprocess
-from icon import img
-import base64
+profiler.mark("导入 tkinter")
+import launcher_config
+from launcher_config import (
+    CONFIG_FILE, DEFAULT_AUTH_FILENAME, DEFAULT_LAUNCH_BAT_FILENAME, PROFILES_FILE, USAGE_FILE, account_journal, auth_file_path,
+    base_path, data_path, finish_loading, launch_bat_path, load_config, read_accounts, write_config,
+)
+from account_search import AccountSearchIndex, FilteredView
+from account_usage import ORDER_ALPHA, ORDER_LABELS, AccountUsage, PinnedView, read_usage, write_usage
+from cabinet_profiles import assign_accounts, find_profile, inspect_profiles, load_profiles, store_profiles
+from account_transfer import FILE_TYPES, export_accounts, plan_import, read_rows
+from account_store import (
+    EDIT_ADD, EDIT_CONFLICT, EDIT_SET_CARD, EDIT_UNCHANGED, AccountEditSession, AccountStore, classify_edit,
+)
+from card_file import read_card_file
+from card_targets import make_targets, targets_match, write_card_targets
+from file_watch import FileWatcher, file_signature
+from game_launch import STARTING, LaunchSupervisor
+from launch_profiles import PrelaunchError, build_prelaunch, resolve_launch_spec
+from player_profiles import PROFILE_COLUMNS, ProfileService, profile_columns
+from launcher_cli import (
+    EXIT_CARD_FILE, EXIT_ERROR, EXIT_GAME_RUNNING, EXIT_LAUNCH_FAILED, EXIT_OK, EXIT_UNKNOWN_ACCOUNT, EXIT_USAGE,
+)
+from icon_resources import set_window_icon
+from process_scan import DEFAULT_GAME_PROCESSES, ProcessScanner, describe_games
+from single_instance import InstanceServer
+from io_executor import IOExecutor, UIWatchdog
+from virtual_list import VirtualListbox, VirtualTreeview
+import event_log
+import metrics
+profiler.mark("导入其他模块")
+
+# 快速启动：先显示窗口，图标、当前账号识别和路径检查放到首次绘制之后的空闲回调中
+FAST_START_REQUESTED = "--fast-start" in sys.argv or os.environ.get("AQUADX_FAST_START") == "1"
+# 看门狗：测量界面线程的停顿，停顿过久时输出调用栈 (也可在配置中设置 ui_watchdog)
+WATCHDOG_REQUESTED = "--watchdog" in sys.argv or os.environ.get("AQUADX_WATCHDOG") == "1"
 
 # --- 常量 ---
-ACCOUNTS_FILE_NAME = 'accounts.json'
-CONFIG_FILE_NAME = 'config.json'
-DEFAULT_AUTH_FILENAME = "..\\AMDaemon\\DEVICE\\aime.txt"
-DEFAULT_LAUNCH_BAT_FILENAME = "..\\启动.bat"
-PLACEHOLDER_AUTH_PATH = "请设置卡号文件 (aime.txt) 的路径"
-PLACEHOLDER_LAUNCH_BAT_PATH = "请设置游戏启动脚本 (启动.bat) 的路径"
-DATA_DIR_NAME = 'LauncherConfig'
-
-# --- 确定基础路径 ---
-if getattr(sys, 'frozen', False):
-    base_path = os.path.dirname(sys.executable)
-elif __file__:
-    base_path = os.path.dirname(os.path.abspath(__file__))
-else:
-    base_path = os.getcwd()
-
-# --- 数据文件路径 ---
-data_path = os.path.join(base_path, DATA_DIR_NAME)
-ACCOUNTS_FILE = os.path.join(data_path, ACCOUNTS_FILE_NAME)
-CONFIG_FILE = os.path.join(data_path, CONFIG_FILE_NAME)
-
-# --- 辅助函数：确保目录存在 ---
-def ensure_dir_exists(path):
-    if not os.path.exists(path):
-        try:
-            os.makedirs(path, exist_ok=True)
-            print(f"创建目录: {path}")
-        except OSError as e:
-            messagebox.showerror("目录错误", f"无法创建数据目录 '{path}': {e}")
-            return False
-    return True
-
-# --- 账号数据管理 ---
-def load_accounts():
-    if not ensure_dir_exists(data_path): return {}
-    try:
-        if os.path.exists(ACCOUNTS_FILE):
-            with open(ACCOUNTS_FILE, 'r', encoding='utf-8') as f:
-                content = f.read()
-                return json.loads(content) if content.strip() else {}
-        else:
-            save_accounts({})
-            return {}
-    except (json.JSONDecodeError, IOError) as e:
-        messagebox.showerror("加载错误", f"加载账号文件 '{ACCOUNTS_FILE}' 时出错: {e}\n将使用空列表。")
-        return {}
-
-def save_accounts(accounts_data):
-    if not ensure_dir_exists(data_path): return
-    try:
-        with open(ACCOUNTS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(accounts_data, f, indent=4, ensure_ascii=False)
-    except IOError as e:
-        messagebox.showerror("保存错误", f"保存账号到 '{ACCOUNTS_FILE}' 时出错: {e}")
-
-# --- 配置管理 ---
-def load_config():
-    if not ensure_dir_exists(data_path):
-        return {
-            "auth_file_path": PLACEHOLDER_AUTH_PATH,
-            "launch_bat_path": PLACEHOLDER_LAUNCH_BAT_PATH
-        }
-    default_config = {
-        "auth_file_path": PLACEHOLDER_AUTH_PATH,
-        "launch_bat_path": PLACEHOLDER_LAUNCH_BAT_PATH
-    }
-    try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                content = f.read()
-                config = json.loads(content) if content.strip() else default_config
-                if "auth_file_path" not in config or not config["auth_file_path"]:
-                    config["auth_file_path"] = PLACEHOLDER_AUTH_PATH
-                if "launch_bat_path" not in config or not config["launch_bat_path"]:
-                    config["launch_bat_path"] = PLACEHOLDER_LAUNCH_BAT_PATH
-                return config
-        else:
-            return default_config
-    except (json.JSONDecodeError, IOError) as e:
-        messagebox.showerror("加载错误", f"加载配置文件 '{CONFIG_FILE}' 时出错: {e}\n将使用默认设置。")
-        return default_config
-
-def save_config(config_data):
-    if not ensure_dir_exists(data_path): return
-    try:
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, indent=4, ensure_ascii=False)
-    except IOError as e:
-        messagebox.showerror("保存错误", f"保存配置到 '{CONFIG_FILE}' 时出错: {e}")
+VIRTUAL_LIST_THRESHOLD = 1000  # list_mode 为 auto 时，账号数达到此值改用虚拟列表
+AUTH_WATCH_DEBOUNCE_MS = 200   # 卡号文件连续变化时，等待这么久没有新变化再重新读取
+MAIN_WINDOW_SIZE = (450, 330)
+BULK_REFRESH_THRESHOLD = 200   # 一次提交的修改达到此数量时，不逐行更新列表框，提交后整体刷新
+FIRST_PAINT_TIMEOUT_MS = 1000  # 快速启动时，超过这么久还没有绘制 (例如最小化启动) 也执行延后的任务
+DEFAULT_PINNED_COUNT = 5       # 按使用记录排序时，置顶显示的账号数
 
 # --- Helper Function to Center Window ---
-def center_window(window):
-    """Centers a Tkinter window (Tk or Toplevel) on the screen."""
-    window.update_idletasks()  # Ensure window dimensions are calculated
-    width = window.winfo_width()
-    height = window.winfo_height()
+def center_window(window, width=None, height=None):
+    """Centers a Tkinter window (Tk or Toplevel) on the screen.
+
+    已知窗口尺寸时传入 width/height，可以省去 update_idletasks 的完整布局计算。
+    """
+    if width is None or height is None:
+        window.update_idletasks()  # Ensure window dimensions are calculated
+        width = window.winfo_width()
+        height = window.winfo_height()
     screen_width = window.winfo_screenwidth()
     screen_height = window.winfo_screenheight()
     x = (screen_width // 2) - (width // 2)
@@ -114,23 +97,101 @@ def center_window(window):
     # window.geometry(f'{width}x{height}+{x}+{y}')
 
 
-def set_icon(root):
-    tmp = open("tmp.ico","wb+")  
-    tmp.write(base64.b64decode(img)) #写入到临时文件中
-    tmp.close()
-    root.iconbitmap(default="tmp.ico") #设置图标
-    os.remove("tmp.ico")           #删除临时图标
+def use_virtual_list(config, account_count):
+    """根据配置 list_mode ('auto' / 'virtual' / 'classic') 决定是否使用虚拟列表"""
+    list_mode = config.get("list_mode", "auto")
+    if list_mode == "virtual":
+        return True
+    if list_mode == "classic":
+        return False
+    return account_count >= VIRTUAL_LIST_THRESHOLD
+
+
+# --- 后台线程中执行的磁盘操作 (不访问 Tk) ---
+def read_accounts_profiled(use_index):
+    """返回 (账号, 加载问题, 使用记录)"""
+    with profiler.phase("加载账号 (后台)"):
+        accounts, problems = read_accounts(use_index)
+        return accounts, problems, read_usage(USAGE_FILE)
+
+
+def read_auth_state(path):
+    """返回 (文件签名, 卡号)，文件不存在时卡号为 None"""
+    # 先记录状态再读取，读取期间发生的修改会被下一次检查发现
+    signature = file_signature(path)
+    if not os.path.isfile(path):
+        return signature, None
+    return signature, read_card_file(path)
+
+
+def switch_card_file(path, card_id, cached_card, cached_signature, fsync, target_configs=None):
+    """写入卡号文件 (以及 card_targets 中的其他文件)，返回 (结果, 写入后的卡号文件签名)
+
+    结果为 'written'、'skipped' (缓存仍有效且已是目标卡号)、'missing' 或 'not_file'。
+    """
+    if not os.path.isfile(path):
+        return ('not_file' if os.path.exists(path) else 'missing'), None
+    targets = make_targets(path, target_configs, base_path)
+    signature = file_signature(path)
+    if card_id == cached_card and signature == cached_signature and targets_match(targets[1:], card_id):
+        return 'skipped', signature
+    # 所有文件作为一个事务：各自原子写入 (临时文件 + os.replace) 并读回校验，失败时全部恢复
+    write_card_targets(targets, card_id, fsync=fsync)
+    return 'written', file_signature(path)
+
+
+def import_into_session(session, path, update_existing, progress):
+    return plan_import(session, read_rows(path, progress), update_existing)
+
 
 class LauncherApp:
     def __init__(self, root):
         self.root = root
         self.root.title("AquaDX Launcher")
-        self.root.geometry("450x330")
+        self.root.geometry("%dx%d" % MAIN_WINDOW_SIZE)
 
         self.current_active_username = None
+        self.current_active_card = None # 卡号文件中的卡号，账号修改涉及它时才需要重新识别当前账号
+        self.auth_signature = None # 卡号文件上次读取/写入后的状态，用于忽略自己的写入
+        self._auth_reload_job = None
         self.config = load_config()
-        self.current_auth_path = self._resolve_path(self.config.get("auth_file_path"), PLACEHOLDER_AUTH_PATH, DEFAULT_AUTH_FILENAME)
-        self.current_launch_bat_path = self._resolve_path(self.config.get("launch_bat_path"), PLACEHOLDER_LAUNCH_BAT_PATH, DEFAULT_LAUNCH_BAT_FILENAME)
+        # 诊断信息记为事件，定期写入数据目录的 launcher.log (打包后没有控制台)
+        event_log.log.configure(self.config.get("event_log", {}), data_path)
+        self.fast_start = FAST_START_REQUESTED or self.config.get("fast_start", False)
+        event_log.emit(event_log.APP, "启动器已启动", fast_start=self.fast_start, pid=os.getpid())
+        if instance_warning is not None:
+            event_log.warning(event_log.APP, instance_warning)
+        self._first_paint_done = False
+        self._deferred_startup_done = False
+        profiler.mark("加载配置")
+        # 多机台：每个配置有自己的卡号文件和启动脚本，主界面操作当前配置
+        self.profiles, self.active_profile = load_profiles(self.config)
+        profile = find_profile(self.profiles, self.active_profile)
+        self.current_auth_path = auth_file_path(profile)
+        self.current_launch_bat_path = launch_bat_path(profile)
+        # 磁盘操作在后台线程执行，界面线程只处理结果
+        self.io = IOExecutor(root, on_busy_changed=self.update_status_bar)
+        self.instance_server = None # 取得单实例锁时由 start_instance_server() 创建
+        # 跟踪启动的游戏进程树，状态变化由监视线程通知
+        self.launcher = LaunchSupervisor(on_event=self._on_launch_event_threadsafe)
+        # 检测正在运行的游戏进程 (包括不是由本程序启动的)，用于切换账号前的检查
+        self.process_scanner = ProcessScanner(self.config.get("game_process_names", DEFAULT_GAME_PROCESSES),
+                                              on_change=self._on_games_changed_threadsafe)
+        self.watchdog = None
+        self.accounts = AccountStore() # 加载完成前的空列表
+        self.accounts_loaded = False
+        self._resolve_after_load = None # 加载完成前请求识别当前账号时，记下 prompt_unknown
+        self.virtual_list = False
+        self.search_index = None
+        self.list_view = self.accounts # 列表框当前显示的数据：全部账号 (可能置顶常用账号) 或搜索结果
+        self.usage = AccountUsage() # 各账号的切换/启动记录，与账号一起加载
+        self.list_order = self.config.get("list_order", ORDER_ALPHA)
+        self.pinned_count = self.config.get("pinned_count", DEFAULT_PINNED_COUNT)
+        self._pinned_refresh_job = None
+        self.account_listbox = None
+        self.transfer_progress = None # 批量导入/导出的进度文字，显示在状态栏
+        # 可选：按卡号查询 AquaDX 上的玩家信息，显示在账号管理窗口 (未配置时为 None)
+        self.player_profiles = ProfileService.from_config(self.config, PROFILES_FILE)
 
         # --- 菜单栏 ---
         self.menu_bar = tk.Menu(root)
@@ -138,7 +199,19 @@ class LauncherApp:
         settings_menu = tk.Menu(self.menu_bar, tearoff=0)
         self.menu_bar.add_cascade(label="设置", menu=settings_menu)
         settings_menu.add_command(label="账号管理...", command=self.open_manage_accounts_window)
+        settings_menu.add_command(label="导入账号...", command=self.import_accounts)
+        settings_menu.add_command(label="导出账号...", command=self.export_accounts)
         settings_menu.add_command(label="路径设置...", command=self.open_settings_window)
+        settings_menu.add_command(label="机台配置...", command=self.open_profiles_window)
+        settings_menu.add_command(label="分配账号到机台...", command=self.open_batch_assign_window)
+        settings_menu.add_command(label="诊断信息...", command=self.open_diagnostics_window)
+        # 列表排序：按用户名，或把最近/最常使用的账号置顶
+        order_menu = tk.Menu(settings_menu, tearoff=0)
+        self.list_order_var = tk.StringVar(value=self.list_order)
+        for order, label in ORDER_LABELS.items():
+            order_menu.add_radiobutton(label=label, value=order, variable=self.list_order_var,
+                                       command=self.on_list_order_changed)
+        settings_menu.add_cascade(label="列表排序", menu=order_menu)
         settings_menu.add_separator()
         settings_menu.add_command(label="退出", command=root.quit)
 
@@ -151,35 +224,37 @@ class LauncherApp:
         self.account_label.bind("<Button-1>", lambda event: self.process_current_account_on_startup())
         self.account_label.config(cursor="hand2")
 
+        # --- 搜索框：按用户名子串 / 卡号前缀过滤列表 ---
+        search_frame = ttk.Frame(main_frame)
+        search_frame.pack(fill=tk.X)
+        ttk.Label(search_frame, text="搜索:").pack(side=tk.LEFT)
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+
         listbox_frame = ttk.Frame(main_frame)
         # 让这个框架填充可用空间，并允许 Listbox 扩展
         listbox_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
-        # 创建 Scrollbar，父容器是 listbox_frame
-        scrollbar = ttk.Scrollbar(listbox_frame, orient=tk.VERTICAL)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y) # 放在右侧，填充垂直空间
+        # 账号在后台加载，完成前列表框、搜索框和按钮不可用
+        self.listbox_frame = listbox_frame
+        self.loading_label = ttk.Label(listbox_frame, text="正在加载账号...")
+        self.loading_label.pack(fill=tk.BOTH, expand=True)
+        self.search_entry.state(['disabled'])
 
-        # 创建 Listbox，父容器是 listbox_frame
-        # 将 yscrollcommand 关联到 scrollbar.set
-        self.account_listbox = tk.Listbox(listbox_frame, height=10, yscrollcommand=scrollbar.set)
-        # 放在左侧，填充所有剩余空间
-        self.account_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        # 配置 Scrollbar 的 command 来控制 Listbox 的视图
-        scrollbar.config(command=self.account_listbox.yview)
-
-        self.accounts = load_accounts()
-        self.refresh_main_listbox()
-
-        self.account_listbox.bind("<Double-Button-1>", self.on_double_click_switch)
+        account_journal.on_error = lambda e: messagebox.showerror("保存错误", f"保存账号到 '{data_path}' 时出错: {e}", parent=self.root)
+        # 日志写入 (含 fsync) 在后台按提交顺序执行，失败时回到界面线程提示
+        account_journal.write_behind = lambda func, *args: self.io.submit(
+            func, *args, serial=True, on_error=account_journal.on_error).future
 
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=(10, 5))
 
-        self.switch_button = ttk.Button(button_frame, text="切换选中账号", command=self.on_switch_button_click)
+        self.switch_button = ttk.Button(button_frame, text="切换选中账号", command=self.on_switch_button_click, state='disabled')
         self.switch_button.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5))
 
         # ### 修改 ###: 移除 style 参数，添加 default='active'
-        self.launch_game_button = ttk.Button(button_frame, text="启动！", command=self.launch_game_with_switch, default='active')
+        self.launch_game_button = ttk.Button(button_frame, text="启动！", command=self.launch_game_with_switch, default='active', state='disabled')
         self.launch_game_button.pack(side=tk.LEFT, expand=True, fill=tk.X)
         # ### 新增 ###: 让 '启动！' 按钮响应 Enter 键 (需要窗口或框架获取焦点)
         self.root.bind('<Return>', lambda event=None: self.launch_game_button.invoke())
@@ -188,45 +263,182 @@ class LauncherApp:
         self.status_bar = ttk.Label(root, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         self.update_status_bar()
+        profiler.mark("创建界面")
 
-        self.check_paths_on_start()
+        self._load_accounts_in_background()
+
+        if not self.fast_start:
+            self.check_paths_on_start()
+            profiler.mark("检查路径")
 
-        center_window(self.root)
+        # 卡号文件被其他程序 (读卡器、其他工具) 修改时自动刷新当前账号
+        self.auth_watcher = FileWatcher(self.current_auth_path, self._on_auth_file_event_threadsafe)
+        self.auth_watcher.start()
+        self.process_scanner.start()
 
-    def _resolve_path(self, config_value, placeholder, default_filename):
-        if not config_value or config_value == placeholder:
-            return os.path.join(base_path, default_filename)
+        if self.fast_start:
+            center_window(self.root, *MAIN_WINDOW_SIZE)
+            # 首次绘制后 (或超时后) 再执行延后的启动任务
+            self.root.after(FIRST_PAINT_TIMEOUT_MS, self._run_deferred_startup)
+        else:
+            center_window(self.root)
+        profiler.mark("居中窗口")
+        self.root.bind('<Expose>', self._on_first_paint)
+
+        if WATCHDOG_REQUESTED or self.config.get("ui_watchdog", False):
+            self.watchdog = UIWatchdog(self.root)
+            self.watchdog.start()
+
+    # --- 加载账号 ---
+    def _load_accounts_in_background(self):
+        # account_index 为 true 时优先映射二进制索引，首次修改账号前不做完整加载；
+        # 映射索引时总是使用虚拟列表 (忽略 list_mode)，经典列表框要一次解码全部用户名，冷启动又变回 O(n)
+        use_index = self.config.get("account_index", False)
+        self.io.submit(read_accounts_profiled, use_index, description="正在加载账号",
+                       on_done=lambda result: self._on_accounts_loaded(result, use_index),
+                       on_error=lambda e: self._on_accounts_loaded(
+                           (AccountStore(), [('error', "加载错误", f"加载账号数据时出错: {e}\n将使用空列表，本次的修改不会被保存。")],
+                            AccountUsage()),
+                           use_index))
+
+    def _on_accounts_loaded(self, result, use_index):
+        accounts, problems, usage = result
+        self.accounts = finish_loading(accounts, problems, use_index)
+        self.accounts_loaded = True
+        self.virtual_list = not isinstance(self.accounts, AccountStore) or use_virtual_list(self.config, len(self.accounts))
+        # 搜索索引先订阅账号修改，保证 on_account_changed 重新过滤时索引已是最新
+        self.search_index = AccountSearchIndex(self.accounts)
+        self.usage = usage
+        if self.usage.retain(self.accounts):
+            self._save_usage()
+        self.usage.on_modified = self._on_usage_modified
+        self.accounts.subscribe(self.usage.on_account_changed)
+        self.list_view = self._base_view()
+        self.loading_label.destroy()
+
+        if self.virtual_list:
+            # 账号很多：虚拟列表只渲染可见行，接口与 Listbox 相同 (序号为逻辑序号)
+            self.account_listbox = VirtualListbox(self.listbox_frame, self.list_view, height=10)
         else:
-            return config_value
+            # 创建 Scrollbar，父容器是 listbox_frame
+            scrollbar = ttk.Scrollbar(self.listbox_frame, orient=tk.VERTICAL)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y) # 放在右侧，填充垂直空间
+
+            # 创建 Listbox，父容器是 listbox_frame
+            # 将 yscrollcommand 关联到 scrollbar.set
+            self.account_listbox = tk.Listbox(self.listbox_frame, height=10, yscrollcommand=scrollbar.set)
+            # 放在左侧，填充所有剩余空间
+            self.account_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            # 配置 Scrollbar 的 command 来控制 Listbox 的视图
+            scrollbar.config(command=self.account_listbox.yview)
+
+        self.accounts.subscribe(self.on_account_changed)
+        self.refresh_main_listbox()
+
+        self.account_listbox.bind("<Double-Button-1>", self.on_double_click_switch)
+        self.search_var.trace_add('write', lambda *args: self.apply_search())
+        self.search_entry.bind('<Return>', self.on_search_enter)
+        self.search_entry.bind('<Escape>', self.clear_search)
+        self.search_entry.bind('<FocusIn>', lambda event: self.search_index.prepare())
+        self.search_entry.bind('<Down>', lambda event: self.account_listbox.focus_set())
+        for widget in (self.search_entry, self.switch_button, self.launch_game_button):
+            widget.state(['!disabled'])
+        profiler.mark("账号加载完成")
+        event_log.emit(event_log.LOAD, f"已加载 {len(self.accounts)} 个账号", count=len(self.accounts), use_index=use_index)
+
+        if self._resolve_after_load is not None:
+            prompt_unknown, self._resolve_after_load = self._resolve_after_load, None
+            self.process_current_account_on_startup(prompt_unknown)
+
+    # --- 启动过程 ---
+    def _on_first_paint(self, event=None):
+        if self._first_paint_done:
+            return
+        self._first_paint_done = True
+        self.root.unbind('<Expose>')
+        profiler.mark("首次绘制")
+        profiler.report("首次绘制")
+        if self.fast_start:
+            self.root.after_idle(self._run_deferred_startup)
+
+    def _run_deferred_startup(self):
+        """快速启动模式下延后执行的启动任务"""
+        if self._deferred_startup_done:
+            return
+        self._deferred_startup_done = True
+        with profiler.phase("识别当前账号"):
+            self.process_current_account_on_startup()
+        with profiler.phase("设置图标"):
+            set_window_icon(self.root)
+        with profiler.phase("检查路径"):
+            self.check_paths_on_start()
+        profiler.report("空闲时执行的启动任务")
+
+    def resolve_account_on_startup(self):
+        """普通启动模式下窗口显示后识别当前账号"""
+        with profiler.phase("识别当前账号"):
+            self.process_current_account_on_startup()
+        profiler.report("识别当前账号")
+
+    # --- 卡号文件监视 ---
+    def _on_auth_file_event_threadsafe(self):
+        """监视线程中调用：转交到界面线程"""
+        self.io.post(self._on_auth_file_event)
+
+    def _on_auth_file_event(self):
+        # 去抖：写入往往产生多个事件，最后一个事件之后再处理
+        if self._auth_reload_job is not None:
+            self.root.after_cancel(self._auth_reload_job)
+        self._auth_reload_job = self.root.after(AUTH_WATCH_DEBOUNCE_MS, self._reload_auth_file)
+
+    def _reload_auth_file(self):
+        self._auth_reload_job = None
+        # 是否真的被修改 (而不是自己的写入) 在后台读取完成后比较
+        self.process_current_account_on_startup(prompt_unknown=False, only_if_changed=True)
 
     # ### 修改 ###: 重命名并扩展启动时处理逻辑
-    def process_current_account_on_startup(self):
+    def process_current_account_on_startup(self, prompt_unknown=True, only_if_changed=False):
         """
-        读取卡号文件，执行以下操作：
-        1. 如果账号列表为空且卡号文件有卡号，提示用户添加。
+        在后台读取卡号文件，完成后执行以下操作：
+        1. 如果账号列表为空且卡号文件有卡号，提示用户添加 (prompt_unknown 为 False 时不提示)。
         2. 如果账号列表不为空，尝试在列表中选中当前卡号对应的账号。
         3. 更新界面标签。
+        only_if_changed 为 True 时，文件状态与上次读写后一致就不做处理。
         """
-        self.current_active_username = None # 重置状态
-        current_id = ""
+        if not self.accounts_loaded:
+            # 账号加载完成后再识别
+            self._resolve_after_load = bool(self._resolve_after_load) or prompt_unknown
+            return
         aime_path = self.current_auth_path
-        aime_exists = os.path.isfile(aime_path)
+        # 与切换账号的写入使用同一个顺序队列，读到的总是最近一次写入之后的内容
+        self.io.submit(read_auth_state, aime_path, serial=True, key='auth_read', description="正在读取卡号文件",
+                       on_done=lambda result: self._apply_auth_state(aime_path, prompt_unknown, only_if_changed, result),
+                       on_error=lambda e: self._on_auth_read_error(aime_path, e))
 
-        # 1. 尝试读取卡号文件卡号
-        if aime_exists:
-            try:
-                with open(aime_path, 'r', encoding='utf-8') as f:
-                    current_id = f.read().strip()
-            except IOError as e:
-                messagebox.showerror("读取错误", f"读取卡号文件 '{aime_path}' 时出错: {e}", parent=self.root)
-                self.account_label.config(text="当前账号: 读取错误")
-                return
-            except Exception as e:
-                 messagebox.showerror("未知错误", f"读取卡号文件时发生未知错误: {e}", parent=self.root)
-                 self.account_label.config(text="当前账号: 读取未知错误")
-                 return
+    def _on_auth_read_error(self, aime_path, error):
+        self.current_active_username = None # 重置状态
+        self.current_active_card = None
+        if isinstance(error, IOError):
+            messagebox.showerror("读取错误", f"读取卡号文件 '{aime_path}' 时出错: {error}", parent=self.root)
+            self.account_label.config(text="当前账号: 读取错误")
         else:
-            # 文件不存在
+            messagebox.showerror("未知错误", f"读取卡号文件时发生未知错误: {error}", parent=self.root)
+            self.account_label.config(text="当前账号: 读取未知错误")
+
+    def _apply_auth_state(self, aime_path, prompt_unknown, only_if_changed, result):
+        if aime_path != self.current_auth_path:
+            return # 读取期间路径已修改，新路径会另外读取
+        signature, current_id = result
+        if only_if_changed:
+            if signature == self.auth_signature:
+                return # 自己的写入，或者文件状态没有变化
+            event_log.emit(event_log.REFRESH, "检测到卡号文件被外部修改，重新处理当前账号状态...")
+        self.current_active_username = None # 重置状态
+        self.current_active_card = None
+        self.auth_signature = signature
+
+        # 1. 卡号文件不存在
+        if current_id is None:
             self.account_label.config(text="当前账号: 未知 (卡号文件丢失)")
             return # 无法继续
 
@@ -235,35 +447,32 @@ class LauncherApp:
              # 卡号为空
              self.account_label.config(text="当前账号: 未知 (卡号文件为空)")
              return # 无法继续
+        self.current_active_card = current_id
 
-        # 3. 在账号列表中查找卡号对应的用户名
-        target_username = None
-        for username, aid in self.accounts.items():
-            if aid == current_id:
-                target_username = username
-                break # 找到即停止
+        # 3. 在账号列表中查找卡号对应的用户名 (反向索引)
+        target_username = self.accounts.owner_of(current_id)
 
         # --- 核心判断逻辑 ---
         if target_username is None:
             # === 情况：卡号存在于aime.txt，但在accounts.json中未找到匹配的用户名 ===
-            print(f"卡号文件中的卡号 '{current_id}' 未在账号列表中找到，准备提示用户...")
+            event_log.emit(event_log.REFRESH, f"卡号文件中的卡号 '{current_id}' 未在账号列表中找到，准备提示用户...")
             prompt_title = "未找到账号"
             prompt_message = (f"在卡号文件 ({os.path.basename(aime_path)}) 中检测到卡号:\n"
                               f"{current_id}\n\n"
                               "但此卡号尚未添加到账号列表中。\n"
                               "是否前往账号管理并添加此卡号？")
-            add_confirm = messagebox.askyesno(prompt_title, prompt_message, parent=self.root)
+            add_confirm = prompt_unknown and messagebox.askyesno(prompt_title, prompt_message, parent=self.root)
 
             label_text = f"未在列表 (卡号：{current_id})" # 如果不添加，标签显示这个
             active_user_text = label_text        # 如果不添加，当前用户也标记为此状态
 
             if add_confirm:
-                print("用户选择是，打开账号管理并预填卡号。")
+                event_log.emit(event_log.UI, "用户选择是，打开账号管理并预填卡号。")
                 self.open_manage_accounts_window(prefill_id=current_id)
                 label_text = f"待添加 (卡号：{current_id})" # 标签显示等待添加
                 active_user_text = label_text # 内部状态也标记为等待添加
             else:
-                print("用户选择否，不添加。")
+                event_log.emit(event_log.UI, "用户选择否，不添加。" if prompt_unknown else "卡号未在列表中 (自动刷新，不提示添加)。")
                 # label_text 和 active_user_text 保持默认的 "未在列表"
 
             self.account_label.config(text=f"当前账号: {label_text}")
@@ -271,80 +480,275 @@ class LauncherApp:
 
         else:
             # === 情况：卡号存在于aime.txt，且在accounts.json中找到了匹配的用户名 ===
-            print(f"卡号文件卡号 '{current_id}' 匹配到账号: '{target_username}'，尝试选中...")
-            listbox_items = self.account_listbox.get(0, tk.END)
+            event_log.emit(event_log.REFRESH, f"卡号文件卡号 '{current_id}' 匹配到账号: '{target_username}'，尝试选中...")
             try:
-                index = listbox_items.index(target_username)
+                if target_username not in self.list_view:
+                    self.clear_search() # 当前账号被搜索条件过滤掉了，恢复完整列表
+                index = self.list_view.index_of(target_username)
+                if index is None or self.account_listbox.get(index) != target_username:
+                    raise ValueError(target_username)
                 self.account_listbox.selection_clear(0, tk.END)
                 self.account_listbox.selection_set(index)
                 self.account_listbox.see(index)
                 self.account_listbox.activate(index)
-                print(f"启动时自动选中账号: {target_username}")
+                event_log.emit(event_log.REFRESH, f"启动时自动选中账号: {target_username}")
                 self.account_label.config(text=f"当前账号: {target_username}")
                 self.current_active_username = target_username # 更新激活用户名
             except ValueError:
                 # 虽然找到了匹配，但在列表框中显示时出错了（理论上不应发生，除非列表刷新有问题）
-                print(f"错误：账号 '{target_username}' 存在于数据中，但在列表框中未找到。")
+                event_log.error(event_log.REFRESH, f"错误：账号 '{target_username}' 存在于数据中，但在列表框中未找到。")
                 label_text = f"列表显示错误  (卡号: {current_id})"
                 self.account_label.config(text=f"当前账号: {label_text}")
                 self.current_active_username = label_text # 标记状态
 
 
-    def update_status_bar(self):
-        self.status_var.set(f"当前卡号文件: {self.current_auth_path}")
+    def update_status_bar(self, busy=None):
+        """busy 为正在进行的后台操作，默认向 IOExecutor 查询"""
+        if busy is None:
+            busy = self.io.pending_descriptions()
+        text = f"当前卡号文件: {self.current_auth_path}"
+        if len(self.profiles) > 1:
+            text = f"机台: {self.active_profile} | {text}"
+        game = self.launcher.last_session
+        games = self.process_scanner.running_games()
+        if game is not None and game.is_active():
+            text = f"{game.describe()} | {text}"
+        elif games:
+            text = f"游戏运行中: {describe_games(games)} | {text}"
+        elif game is not None:
+            text = f"{game.describe()} | {text}"
+        if instance_warning is not None:
+            text = f"账号数据只读 (另一个启动器持有单实例锁) | {text}"
+        if busy and self.transfer_progress:
+            text = f"{self.transfer_progress} | {text}"
+        elif busy:
+            text = f"{busy[-1]}... | {text}"
+        self.status_var.set(text)
 
     def check_paths_on_start(self):
+        """在后台并发检查所有机台配置的路径"""
+        profiles = [dict(profile) for profile in self.profiles]
+        active = self.active_profile
+        self.io.submit(inspect_profiles, profiles, key='check_paths', description="正在检查路径",
+                       on_done=lambda states: self._report_path_check(active, states))
+
+    def _report_path_check(self, active, states):
+        warnings = []
+        for state in states:
+            if state.name == active:
+                warnings += self._path_warnings(state.auth_path, state.launch_path, state.auth_ok, state.launch_ok)
+            elif not (state.auth_ok and state.launch_ok):
+                missing = [label for label, ok in (("卡号文件", state.auth_ok), ("启动脚本", state.launch_ok)) if not ok]
+                warnings.append(f"机台 '{state.name}' 的{'和'.join(missing)}不存在:\n"
+                                + "\n".join(path for path, ok in ((state.auth_path, state.auth_ok), (state.launch_path, state.launch_ok)) if not ok))
+        if warnings:
+            message = "启动检查发现问题:\n\n" + "\n\n".join(warnings) + "\n\n请将启动器文件夹放置在游戏目录下，或通过 '设置 -> 路径设置...' 重新指定有效路径。"
+            messagebox.showwarning("路径检查警告", message, parent=self.root)
+
+    def _path_warnings(self, auth_path, launch_path, auth_ok, launch_ok):
         warnings = []
-        if not os.path.isfile(self.current_auth_path):
-            if self.current_auth_path == os.path.join(base_path, DEFAULT_AUTH_FILENAME):
+        if not auth_ok:
+            if auth_path == os.path.join(base_path, DEFAULT_AUTH_FILENAME):
                 warnings.append(f"默认卡号文件 '{DEFAULT_AUTH_FILENAME}' 在程序目录下未找到。")
             else:
-                warnings.append(f"配置的卡号文件路径无效或文件不存在:\n'{self.current_auth_path}'")
-        if not os.path.isfile(self.current_launch_bat_path):
-            if self.current_launch_bat_path == os.path.join(base_path, DEFAULT_LAUNCH_BAT_FILENAME):
+                warnings.append(f"配置的卡号文件路径无效或文件不存在:\n'{auth_path}'")
+        if not launch_ok:
+            if launch_path == os.path.join(base_path, DEFAULT_LAUNCH_BAT_FILENAME):
                 warnings.append(f"默认游戏启动脚本 '{DEFAULT_LAUNCH_BAT_FILENAME}' 在程序目录下未找到。")
             else:
-                warnings.append(f"配置的游戏启动脚本路径无效或文件不存在:\n'{self.current_launch_bat_path}'")
-        if warnings:
-            message = "启动检查发现问题:\n\n" + "\n\n".join(warnings) + "\n\n请将启动器文件夹放置在游戏目录下，或通过 '设置 -> 路径设置...' 重新指定有效路径。"
-            messagebox.showwarning("路径检查警告", message, parent=self.root)
+                warnings.append(f"配置的游戏启动脚本路径无效或文件不存在:\n'{launch_path}'")
+        return warnings
 
     def refresh_main_listbox(self):
+        """完整重建列表框 (仅启动时使用，之后由 on_account_changed 增量更新)"""
+        if self.virtual_list:
+            self.account_listbox.render()
+            return
         self.account_listbox.delete(0, tk.END)
-        sorted_usernames = sorted(self.accounts.keys())
-        for username in sorted_usernames:
-            self.account_listbox.insert(tk.END, username)
+        sorted_usernames = self.list_view.sorted_names()
+        if sorted_usernames:
+            self.account_listbox.insert(tk.END, *sorted_usernames)
+
+    def on_account_changed(self, change):
+        """账号数据变化时只更新受影响的那一行"""
+        if isinstance(self.list_view, PinnedView):
+            # 置顶常用账号：位置按置顶行换算，只有修改的是置顶账号时才动置顶行
+            self.list_view, change = self.list_view.apply_change(change)
+            if self.virtual_list:
+                self.account_listbox.source = self.list_view
+        elif self.list_view is not self.accounts:
+            # 正在搜索：用 (已增量更新的) 索引重新过滤
+            self.apply_search()
+            return
+        if self.virtual_list:
+            self.account_listbox.apply_change(change)
+        elif change.op == 'add':
+            self.account_listbox.insert(change.new_index, change.username)
+        elif change.op == 'delete':
+            self.account_listbox.delete(change.old_index)
+        elif change.op == 'rename':
+            was_selected = self.account_listbox.selection_includes(change.old_index)
+            self.account_listbox.delete(change.old_index)
+            self.account_listbox.insert(change.new_index, change.username)
+            if was_selected:
+                self.account_listbox.selection_set(change.new_index)
+        # 'set_card' 不影响列表框中显示的用户名
+
+    # --- 列表排序 ---
+    def _pinned_names(self):
+        if self.list_order == ORDER_ALPHA or self.pinned_count <= 0:
+            return []
+        return [username for username in self.usage.top(self.pinned_count, self.list_order) if username in self.accounts]
+
+    def _base_view(self):
+        """不搜索时列表框显示的数据：全部账号，或常用账号置顶后的全部账号"""
+        pinned = self._pinned_names()
+        return PinnedView(self.accounts, pinned) if pinned else self.accounts
+
+    def on_list_order_changed(self):
+        self.list_order = self.list_order_var.get()
+        self.config["list_order"] = self.list_order
+        self._save_config()
+        if self.accounts_loaded:
+            self.apply_search()
+
+    def _record_use(self, username):
+        """记录一次切换/启动，用于“最近使用”“最常使用”排序"""
+        if self.accounts_loaded and username in self.accounts:
+            self.usage.record(username)
+
+    def _on_usage_modified(self):
+        self._save_usage()
+        # 账号修改的通知可能还没有分发完，置顶列表等空闲时再比较
+        if self.list_order != ORDER_ALPHA and self._pinned_refresh_job is None:
+            self._pinned_refresh_job = self.root.after_idle(self._refresh_pinned)
+
+    def _refresh_pinned(self):
+        """置顶的账号或其顺序变化时才重建列表 (大多数切换不改变前几名)"""
+        self._pinned_refresh_job = None
+        if isinstance(self.list_view, FilteredView):
+            return # 正在搜索，清空搜索框时会重新生成
+        current = self.list_view.pinned if isinstance(self.list_view, PinnedView) else []
+        if self._pinned_names() != current:
+            self.apply_search()
+
+    def _save_usage(self):
+        if account_journal.locked_out:
+            return # 另一个启动器实例持有账号数据，本实例只读
+        self.io.submit(write_usage, USAGE_FILE, self.usage.to_dict(), serial=True, key='save_usage',
+                       description="正在保存使用记录",
+                       on_error=lambda e: event_log.error(event_log.SAVE, f"保存使用记录 '{USAGE_FILE}' 失败: {e}"))
+
+    # --- 搜索 ---
+    def apply_search(self):
+        """按搜索框内容重新过滤列表框，保留选中项"""
+        selection = self.account_listbox.curselection()
+        selected_username = self.account_listbox.get(selection[0]) if selection else None
+        query = self.search_var.get().strip()
+        self.list_view = FilteredView(self.search_index.search(query)) if query else self._base_view()
+        if self.virtual_list:
+            self.account_listbox.set_source(self.list_view)
+        else:
+            self.refresh_main_listbox()
+        if selected_username is not None:
+            index = self.list_view.index_of(selected_username)
+            if index is not None:
+                self.account_listbox.selection_set(index)
+                self.account_listbox.see(index)
+
+    def clear_search(self, event=None):
+        if self.search_var.get():
+            self.search_var.set("") # trace 会调用 apply_search
+        return "break"
+
+    def on_search_enter(self, event=None):
+        """在搜索框中按 Enter：切换到最匹配的账号"""
+        query = self.search_var.get().strip()
+        if not query:
+            return "break"
+        top = self.search_index.top_hit(query, self.list_view.sorted_names())
+        if top is None:
+            self.root.bell()
+            return "break"
+        index = self.list_view.index_of(top)
+        self.account_listbox.selection_clear(0, tk.END)
+        self.account_listbox.selection_set(index)
+        self.account_listbox.see(index)
+        self.account_listbox.activate(index)
+        self._switch_account(top)
+        return "break"
+
+    def _report_failure(self, on_failure, code, title, message):
+        """on_failure(退出码, 信息) 给出时由调用方报告 (例如转交命令的进程)，否则弹出对话框"""
+        if on_failure is not None:
+            on_failure(code, message)
+        else:
+            messagebox.showerror(title, message, parent=self.root)
 
-    def _switch_account(self, username):
+    def _switch_account(self, username, on_success=None, on_failure=None, check_running=True):
+        """在后台写入卡号文件，成功后在界面线程调用 on_success()"""
         selected_id = self.accounts.get(username)
         if not selected_id:
-            messagebox.showerror("错误", f"找不到用户名 '{username}' 对应的卡号。", parent=self.root)
-            return False
-        if not os.path.isfile(self.current_auth_path):
-            if os.path.exists(self.current_auth_path):
-                messagebox.showerror("错误", f"卡号文件路径 '{self.current_auth_path}' 不是一个有效的文件！\n请在 '设置' 中修正。", parent=self.root)
-            else:
-                messagebox.showerror("错误", f"卡号文件 '{self.current_auth_path}' 不存在！\n请在 '设置' 中修正或确保文件存在。", parent=self.root)
-            return False
-        try:
-            target_dir = os.path.dirname(self.current_auth_path)
-            if target_dir and not os.path.exists(target_dir):
-                os.makedirs(target_dir, exist_ok=True)
-            with open(self.current_auth_path, 'w', encoding='utf-8') as f:
-                f.write(selected_id)
-            self.account_label.config(text=f"当前账号: {username}")
-            self.current_active_username = username
-            print(f"账号已切换为: {username}")
-            return True
-        except PermissionError:
-            messagebox.showerror("权限错误", f"没有权限写入文件 '{self.current_auth_path}'。\n请检查文件权限或尝试使用管理员权限运行此程序。", parent=self.root)
-            return False
-        except IOError as e:
-            messagebox.showerror("写入错误", f"写入文件 '{self.current_auth_path}' 时发生错误: {e}", parent=self.root)
-            return False
-        except Exception as e:
-            messagebox.showerror("未知错误", f"切换账号时发生未知错误: {e}", parent=self.root)
-            return False
+            self._report_failure(on_failure, EXIT_UNKNOWN_ACCOUNT, "错误", f"找不到用户名 '{username}' 对应的卡号。")
+            return
+        if check_running and selected_id != self.current_active_card and not self._confirm_switch_while_running(username):
+            event_log.emit(event_log.SWITCH, f"游戏正在运行，取消切换到 {username}。")
+            if on_failure is not None:
+                on_failure(EXIT_GAME_RUNNING, "游戏正在运行，已取消切换")
+            return
+        aime_path = self.current_auth_path
+        started = time.perf_counter()
+        # 缓存的卡号和文件签名交给后台比较：仍有效且就是目标卡号时不必重写
+        self.io.submit(switch_card_file, aime_path, selected_id, self.current_active_card, self.auth_signature,
+                       self.config.get("auth_file_fsync", True),
+                       find_profile(self.profiles, self.active_profile).get("card_targets"),
+                       serial=True, key='switch', description="正在切换账号",
+                       on_done=lambda result: self._on_switch_done(username, selected_id, aime_path, started, result,
+                                                                   on_success, on_failure),
+                       on_error=lambda e: self._on_switch_error(aime_path, e, on_failure))
+
+    def _on_switch_done(self, username, selected_id, aime_path, started, result, on_success, on_failure):
+        status, signature = result
+        if status == 'not_file':
+            self._report_failure(on_failure, EXIT_CARD_FILE, "错误", f"卡号文件路径 '{aime_path}' 不是一个有效的文件！\n请在 '设置' 中修正。")
+            return
+        if status == 'missing':
+            self._report_failure(on_failure, EXIT_CARD_FILE, "错误", f"卡号文件 '{aime_path}' 不存在！\n请在 '设置' 中修正或确保文件存在。")
+            return
+        elapsed = time.perf_counter() - started
+        if status == 'skipped':
+            event_log.emit(event_log.SWITCH, f"卡号文件已是 '{username}' 的卡号，跳过写入", username=username, skipped=True)
+            metrics.histogram('switch.skipped').record(elapsed)
+        else:
+            metrics.histogram('switch.total').record(elapsed)
+        if aime_path != self.current_auth_path:
+            event_log.warning(event_log.SWITCH, f"切换期间卡号文件路径已修改，'{aime_path}' 的写入结果不再使用")
+            if on_failure is not None:
+                on_failure(EXIT_ERROR, "切换期间卡号文件路径已修改")
+            return
+        self.auth_signature = signature # 监视器会忽略这次写入
+        self.account_label.config(text=f"当前账号: {username}")
+        self.current_active_username = username
+        self.current_active_card = selected_id
+        event_log.emit(event_log.SWITCH, f"账号已切换为: {username} (用时 {elapsed * 1000:.1f} ms)",
+                       username=username, elapsed_ms=round(elapsed * 1000, 1))
+        self._record_use(username)
+        if on_success is not None:
+            on_success()
+
+    def _on_switch_error(self, aime_path, error, on_failure=None):
+        if isinstance(error, PermissionError):
+            # 也可能是 card_targets 中的其他文件
+            self._report_failure(on_failure, EXIT_CARD_FILE, "权限错误", f"没有权限写入文件 '{error.filename or aime_path}'。\n请检查文件权限或尝试使用管理员权限运行此程序。")
+        elif isinstance(error, IOError):
+            self._report_failure(on_failure, EXIT_CARD_FILE, "写入错误", f"写入文件 '{aime_path}' 时发生错误: {error}")
+        elif isinstance(error, ValueError):
+            self._report_failure(on_failure, EXIT_ERROR, "配置错误", f"card_targets 配置有误: {error}")
+        else:
+            self._report_failure(on_failure, EXIT_ERROR, "未知错误", f"切换账号时发生未知错误: {error}")
+
+    def open_diagnostics_window(self):
+        DiagnosticsWindow(self)
 
     def on_switch_button_click(self):
         selected_indices = self.account_listbox.curselection()
@@ -357,27 +761,161 @@ class LauncherApp:
     def on_double_click_switch(self, event=None):
         self.on_switch_button_click()
 
-    def _launch_game_script(self):
-        if not os.path.isfile(self.current_launch_bat_path):
-            messagebox.showerror("错误", f"游戏启动脚本路径无效或文件不存在！\n路径: {self.current_launch_bat_path}\n请在 '设置' 中修正或确保文件存在。", parent=self.root)
-            return False
+    def _launch_game_script(self, requested_at=None, on_started=None, on_failure=None):
+        """在后台启动游戏；requested_at 为用户点击启动的时间，用于统计点击到进程创建的耗时"""
         try:
-            bat_dir = os.path.dirname(self.current_launch_bat_path)
-            print(f"尝试执行: {self.current_launch_bat_path} (工作目录: {bat_dir})")
-            subprocess.Popen([self.current_launch_bat_path], cwd=bat_dir, shell=True)
+            # 按当前账号选择启动配置 (参数、环境变量、预启动步骤)
+            spec = resolve_launch_spec(self.config, self.current_launch_bat_path, self.current_active_username, base_path)
+            prelaunch = build_prelaunch(self.config, spec, base_path)
+        except ValueError as e:
+            self._report_failure(on_failure, EXIT_ERROR, "配置错误", f"启动配置有误: {e}")
+            return
+        if spec.profile_name:
+            event_log.emit(event_log.LAUNCH, f"使用启动配置 '{spec.profile_name}'")
+        launch_path = spec.script
+        # 先在界面线程登记，进程创建完成前再次按 Enter 也能被拦截；预启动步骤在后台执行
+        session = self.launcher.begin(launch_path, requested_at, spec.options, prelaunch)
+        self.update_status_bar()
+        self.io.submit(self.launcher.spawn, session, description="正在启动游戏",
+                       on_done=lambda session: self._on_launch_started(on_started),
+                       on_error=lambda e: self._on_launch_error(launch_path, e, on_failure))
+
+    def _on_launch_started(self, on_started):
+        self._record_use(self.current_active_username)
+        if on_started is not None:
+            on_started()
+
+    def _confirm_duplicate_launch(self):
+        """游戏正在启动时忽略重复的启动请求，已在运行时询问是否再启动一个"""
+        session = self.launcher.active_session()
+        if session is not None and session.state == STARTING:
+            event_log.emit(event_log.LAUNCH, "游戏正在启动，忽略重复的启动请求。")
+            self.root.bell()
+            return False
+        running = self._game_running_description()
+        if running is None:
             return True
-        except Exception as e:
-            messagebox.showerror("启动错误", f"启动游戏脚本时发生未知错误: {e}", parent=self.root)
+        return messagebox.askyesno("游戏正在运行", f"{running}。\n\n仍要再启动一次吗？", parent=self.root)
+
+    def _game_running_description(self):
+        """本程序启动的游戏或 (缓存的) 检测到的游戏进程，都没有时返回 None"""
+        session = self.launcher.active_session()
+        if session is not None:
+            return session.describe()
+        games = self.process_scanner.running_games()
+        if games:
+            return f"检测到游戏进程正在运行: {describe_games(games)}"
+        return None
+
+    def _confirm_switch_while_running(self, username):
+        """游戏运行中改写卡号文件会让本局的游玩记录记到错误的账号上，
+        按配置 switch_while_running ('warn' / 'refuse') 询问或拒绝"""
+        running = self._game_running_description()
+        if running is None:
+            return True
+        if self.config.get("switch_while_running", "warn") == "refuse":
+            messagebox.showerror("游戏正在运行", f"{running}。\n\n游戏运行中不能切换账号，请先退出游戏。", parent=self.root)
             return False
+        return messagebox.askyesno(
+            "游戏正在运行",
+            f"{running}。\n\n游戏运行中切换账号，本局的游玩记录可能会记到错误的账号上。\n仍要切换到 {username} 吗？",
+            icon='warning', default='no', parent=self.root)
+
+    # --- 游戏进程监视 ---
+    def _on_launch_event_threadsafe(self, session):
+        """监视线程中调用：转交到界面线程"""
+        self.io.post(self._on_launch_event, session)
+
+    def _on_games_changed_threadsafe(self, games):
+        """扫描线程中调用：转交到界面线程"""
+        self.io.post(self.update_status_bar)
+
+    def _on_launch_event(self, session):
+        if session is self.launcher.last_session:
+            self.update_status_bar()
+
+    def _on_launch_error(self, launch_path, error, on_failure=None):
+        if isinstance(error, PrelaunchError):
+            self._report_failure(on_failure, EXIT_LAUNCH_FAILED, "预启动失败", f"预启动步骤未完成，游戏没有启动:\n{error}")
+        elif isinstance(error, FileNotFoundError):
+            self._report_failure(on_failure, EXIT_LAUNCH_FAILED, "错误", f"游戏启动脚本路径无效或文件不存在！\n路径: {launch_path}\n请在 '设置' 中修正或确保文件存在。")
+        else:
+            self._report_failure(on_failure, EXIT_LAUNCH_FAILED, "启动错误", f"启动游戏脚本时发生未知错误: {error}")
+
+    # --- 其他进程转交的命令 (单实例) ---
+    def start_instance_server(self):
+        self.instance_server = InstanceServer(data_path, self._on_remote_command_threadsafe)
+        try:
+            self.instance_server.start()
+        except OSError as e:
+            event_log.warning(event_log.APP, f"无法启动单实例服务，再次启动时不会转交到本窗口: {e}")
+            self.instance_server = None
+
+    def _on_remote_command_threadsafe(self, command, args, reply):
+        """服务线程中调用：转交到界面线程"""
+        if not self.io.post(self._on_remote_command, command, args, reply):
+            reply(EXIT_ERROR, "启动器正在退出")
+
+    def bring_to_front(self):
+        self.root.deiconify()
+        self.root.lift()
+        # Windows 不允许后台进程直接抢焦点，短暂置顶后恢复
+        self.root.attributes('-topmost', True)
+        self.root.after_idle(self.root.attributes, '-topmost', False)
+        self.root.focus_force()
+
+    def _on_remote_command(self, command, args, reply):
+        event_log.emit(event_log.REMOTE, f"收到其他进程转交的命令: {command} {args}", command=command)
+        self.bring_to_front()
+        if command == "focus":
+            reply(EXIT_OK, "已切换到已打开的启动器窗口")
+            return
+        if command not in ("switch", "launch"):
+            reply(EXIT_USAGE, f"未知命令 '{command}'")
+            return
+        if not self.accounts_loaded:
+            reply(EXIT_ERROR, "启动器正在加载账号，请稍后重试")
+            return
+        requested_at = time.perf_counter()
+        username = args.get("username")
+        force = bool(args.get("force"))
+        running = None if force else self._game_running_description()
+        if command == "launch":
+            session = self.launcher.active_session()
+            if session is not None and session.state == STARTING:
+                reply(EXIT_GAME_RUNNING, "游戏正在启动")
+                return
+            if running is not None:
+                reply(EXIT_GAME_RUNNING, f"{running}，不再启动；确实需要时请加 --force")
+                return
+
+        def launch():
+            self._launch_game_script(requested_at, on_started=lambda: reply(EXIT_OK, "游戏已启动"), on_failure=reply)
+
+        if username is None:
+            launch() # launch 且没有 --as
+            return
+        card_id = self.accounts.get(username)
+        if card_id is None:
+            reply(EXIT_UNKNOWN_ACCOUNT, f"找不到账号 '{username}'")
+            return
+        if running is not None and card_id != self.current_active_card:
+            reply(EXIT_GAME_RUNNING, f"{running}，不切换账号；确实需要时请加 --force")
+            return
+        on_success = launch if command == "launch" else (lambda: reply(EXIT_OK, f"已切换为: {username}"))
+        self._switch_account(username, on_success=on_success, on_failure=reply, check_running=False)
 
     def launch_game_with_switch(self):
+        clicked = time.perf_counter()
+        if not self._confirm_duplicate_launch():
+            return
         selected_indices = self.account_listbox.curselection()
         if not selected_indices:
             # messagebox.showwarning("提示", "请先在列表中选择一个要使用的账号，然后再点击启动！", parent=self.root)
-            self._launch_game_script()
+            self._launch_game_script(clicked)
             return
         selected_username = self.account_listbox.get(selected_indices[0])
-        print(f"准备启动，先切换到账号: {selected_username}")
+        event_log.emit(event_log.LAUNCH, f"准备启动，先切换到账号: {selected_username}")
 
         # --- 新增验证逻辑 ---
         needs_switch = selected_username != self.current_active_username
@@ -386,43 +924,205 @@ class LauncherApp:
             # 当前选中账号与实际激活账号不同，需要弹出确认框
             
             proceed = messagebox.askyesno("确认切换并启动", f"将切换到 {selected_username} 并启动游戏。", parent=self.root)
+            clicked = time.perf_counter() # 从确认时开始计时，不计入对话框等待的时间
 
             if proceed:
                 # 用户确认切换
-                print(f"用户确认，准备切换到账号: {selected_username}")
-                if self._switch_account(selected_username):
-                    # 切换成功，则启动游戏
-                    print("切换成功，尝试启动游戏...")
-                    self._launch_game_script()
-                else:
-                    # 切换失败，不启动游戏 (错误信息已由 _switch_account 显示)
-                    print("切换账号失败，取消启动游戏。")
+                event_log.emit(event_log.LAUNCH, f"用户确认，准备切换到账号: {selected_username}")
+
+                def launch_after_switch():
+                    # 切换成功，则启动游戏；切换失败时不启动 (错误信息已由 _switch_account 显示)
+                    event_log.emit(event_log.LAUNCH, "切换成功，尝试启动游戏...")
+                    self._launch_game_script(clicked)
+
+                self._switch_account(selected_username, on_success=launch_after_switch)
             else:
                 # 用户取消切换
-                print("用户取消切换操作。")
+                event_log.emit(event_log.LAUNCH, "用户取消切换操作。")
                 return # 直接返回，不做任何事
         else:
             # 当前选中账号与实际激活账号相同，直接启动
-            print(f"选中账号 '{selected_username}' 与当前账号一致，直接启动游戏...")
-            self._launch_game_script()
+            event_log.emit(event_log.LAUNCH, f"选中账号 '{selected_username}' 与当前账号一致，直接启动游戏...")
+            self._launch_game_script(clicked)
 
     # ### 修改 ###: 接受可选的 prefill_id 参数
+    def _replace_index_with_store(self, result):
+        """当前为只读索引时，换成后台完整加载的可修改 AccountStore"""
+        if isinstance(self.accounts, AccountStore):
+            return
+        index = self.accounts
+        store = finish_loading(*result)
+        index.close()
+        self.accounts = store
+        self.search_index.attach(self.accounts)
+        self.accounts.subscribe(self.on_account_changed)
+        self.accounts.subscribe(self.usage.on_account_changed)
+        # 两者内容和顺序相同，列表框只需换数据源，保留滚动位置和选中项
+        if not isinstance(self.list_view, FilteredView):
+            self.list_view = self._base_view()
+            if self.virtual_list:
+                self.account_listbox.source = self.list_view
+                self.account_listbox.render()
+        event_log.emit(event_log.LOAD, "已从索引切换为完整加载的账号数据")
+
+    def _on_full_load(self, result, callback):
+        self._replace_index_with_store(result)
+        callback()
+
+    def _with_full_store(self, callback):
+        """需要可修改的 AccountStore 时使用：当前为只读索引时先在后台完整加载，再调用 callback()"""
+        if not self.accounts_loaded:
+            self.root.bell()
+            return
+        if isinstance(self.accounts, AccountStore):
+            callback()
+            return
+        self.io.submit(read_accounts, key='full_load', description="正在加载账号",
+                       on_done=lambda result: self._on_full_load(result, callback),
+                       on_error=lambda e: messagebox.showerror("加载错误", f"加载账号数据时出错: {e}", parent=self.root))
+
     def open_manage_accounts_window(self, prefill_id=None):
         """打开账号管理窗口，可选择预填卡号"""
         # 传递 prefill_id 给 ManageAccountsWindow
-        ManageAccountsWindow(self.root, self.accounts.copy(), self.on_accounts_updated, prefill_id=prefill_id)
-
-    def on_accounts_updated(self, updated_accounts):
-        """账号管理窗口关闭后调用的回调函数"""
-        self.accounts = updated_accounts
-        save_accounts(self.accounts) # 保存更新后的账号
+        self._with_full_store(lambda: ManageAccountsWindow(self.root, self.accounts, self.on_accounts_updated,
+                                                           prefill_id=prefill_id, virtual_list=self.virtual_list,
+                                                           player_profiles=self.player_profiles, io=self.io))
+
+    def _commit_session(self, session):
+        """把编辑会话中记录的修改重放到账号数据，合并为一条日志记录保存；返回因冲突跳过的修改"""
+        if len(session.changes) < BULK_REFRESH_THRESHOLD:
+            # 列表框通过 on_account_changed 逐行更新
+            with account_journal.transaction():
+                return session.commit_to(self.accounts)
+        # 修改很多 (批量导入) 时逐行更新列表框太慢：提交期间不接收通知，之后整体刷新一次
+        selection = self.account_listbox.curselection()
+        selected_username = self.account_listbox.get(selection[0]) if selection else None
+        self.accounts.unsubscribe(self.on_account_changed)
+        try:
+            with account_journal.transaction():
+                return session.commit_to(self.accounts)
+        finally:
+            self.accounts.subscribe(self.on_account_changed)
+            self.account_listbox.selection_clear(0, tk.END)
+            self.apply_search()
+            index = self.list_view.index_of(selected_username) if selected_username is not None else None
+            if index is not None:
+                self.account_listbox.selection_set(index)
+                self.account_listbox.see(index)
 
-        # 刷新列表框
-        self.refresh_main_listbox()
+    def on_accounts_updated(self, session):
+        """账号管理窗口关闭后调用的回调函数，session 为 AccountEditSession"""
+        if not session.changes:
+            event_log.emit(event_log.ACCOUNT, "账号管理窗口未做修改。")
+            return
+        started = time.perf_counter()
+        failed = self._commit_session(session)
+        elapsed = time.perf_counter() - started
+        metrics.histogram('save.accounts').record(elapsed)
+        event_log.emit(event_log.SAVE, f"账号修改已保存: {len(session.changes) - len(failed)} 项 (用时 {elapsed * 1000:.1f} ms)",
+                       changes=len(session.changes), skipped=len(failed), elapsed_ms=round(elapsed * 1000, 1))
+        if failed:
+            details = "\n".join(f"{change.op}: {change.old_username} -> {change.username}" for change in failed[:10])
+            messagebox.showwarning("部分修改未保存", f"以下 {len(failed)} 项修改与当前账号数据冲突，已跳过:\n{details}", parent=self.root)
+
+        # 只有修改涉及卡号文件中的卡号时，才需要重新识别当前账号
+        if self.current_active_card is not None and self.current_active_card in session.touched_cards():
+            event_log.emit(event_log.REFRESH, "当前卡号对应的账号已修改，重新处理当前账号状态...")
+            self.process_current_account_on_startup() # 这会尝试选中当前aime.txt对应的账号
+
+    # --- 批量导入/导出 ---
+    def _report_transfer_progress_threadsafe(self, text):
+        """后台线程中调用：转交到界面线程"""
+        self.io.post(self._set_transfer_progress, text)
+
+    def _set_transfer_progress(self, text):
+        self.transfer_progress = text
+        self.update_status_bar()
 
-        # 账号更新后，重新处理当前账号状态，确保界面一致性
-        print("账号列表已更新，重新处理当前账号状态...")
-        self.process_current_account_on_startup() # 这会尝试选中当前aime.txt对应的账号
+    def import_accounts(self):
+        path = filedialog.askopenfilename(parent=self.root, title="导入账号",
+                                          filetypes=FILE_TYPES + [("所有文件", "*.*")])
+        if not path:
+            return
+        update_existing = messagebox.askyesnocancel(
+            "导入账号",
+            "文件中的行要修改已有账号 (更换卡号或重命名) 时，是否也应用？\n\n"
+            "是：应用这些修改\n否：只添加新账号，这些行列入导入报告\n取消：不导入",
+            parent=self.root)
+        if update_existing is None:
+            return
+        self._with_full_store(lambda: self._start_import(path, update_existing))
+
+    def _start_import(self, path, update_existing):
+        # 会话在界面线程创建 (持有账号数据的写时复制快照)，后台只读写会话自己的叠加层；
+        # on_done 中也引用 session，保证它在界面线程释放
+        session = AccountEditSession(self.accounts)
+        name = os.path.basename(path)
+        progress = lambda fraction, rows: self._report_transfer_progress_threadsafe(
+            f"正在导入 {name}: {rows} 行 ({fraction:.0%})")
+        self.io.submit(import_into_session, session, path, update_existing, progress,
+                       key='import', description=f"正在导入 {name}",
+                       on_done=lambda report: self._on_import_planned(path, session, report),
+                       on_error=lambda e: self._on_transfer_error("导入失败", f"读取 '{path}' 时出错: {e}"))
+
+    def _on_import_planned(self, path, session, report):
+        self._set_transfer_progress(None)
+        if session.changes:
+            report.record_failed(self._commit_session(session))
+        event_log.emit(event_log.ACCOUNT, f"从 '{path}' 导入账号: {report.applied} 项修改已保存", applied=report.applied)
+        if self.current_active_card is not None and self.current_active_card in session.touched_cards():
+            self.process_current_account_on_startup()
+        if not report.problems:
+            messagebox.showinfo("导入完成", report.summary(), parent=self.root)
+            return
+        # 有问题的行写成报告 (CSV，可修改后重新导入)，写完再提示
+        report_path = os.path.splitext(path)[0] + ".import-report.csv"
+        self.io.submit(report.write, report_path, description="正在保存导入报告",
+                       on_done=lambda result: self._show_import_report(report, report_path, None),
+                       on_error=lambda e: self._show_import_report(report, report_path, e))
+
+    def _show_import_report(self, report, report_path, error):
+        details = "\n".join(report.problem_lines(10))
+        if len(report.problems) > 10:
+            details += "\n..."
+        saved = f"无法保存完整报告: {error}" if error is not None else f"完整报告已保存到:\n{report_path}"
+        messagebox.showwarning("导入完成 (部分行未导入)", f"{report.summary()}\n\n{details}\n\n{saved}", parent=self.root)
+
+    def export_accounts(self):
+        path = filedialog.asksaveasfilename(parent=self.root, title="导出账号", defaultextension=".csv",
+                                            filetypes=FILE_TYPES)
+        if not path:
+            return
+        self._with_full_store(lambda: self._start_export(path))
+
+    def _start_export(self, path):
+        # 导出写时复制快照，导出期间仍可修改账号；快照由 on_done 引用，在界面线程释放
+        snapshot = self.accounts.copy()
+        name = os.path.basename(path)
+        progress = lambda fraction, rows: self._report_transfer_progress_threadsafe(
+            f"正在导出 {name}: {rows} 个 ({fraction:.0%})")
+        self.io.submit(export_accounts, snapshot, path, progress, key='export', description=f"正在导出 {name}",
+                       on_done=lambda count: self._on_export_done(path, count, snapshot),
+                       on_error=lambda e: self._on_transfer_error("导出失败", f"写入 '{path}' 时出错: {e}"))
+
+    def _on_export_done(self, path, count, snapshot):
+        self._set_transfer_progress(None)
+        event_log.emit(event_log.ACCOUNT, f"已导出 {count} 个账号到 '{path}'", count=count)
+        messagebox.showinfo("导出完成", f"已导出 {count} 个账号到:\n{path}", parent=self.root)
+
+    def _on_transfer_error(self, title, message):
+        self._set_transfer_progress(None)
+        messagebox.showerror(title, message, parent=self.root)
+
+    def _save_config(self):
+        """在后台保存配置；连续保存时尚未开始的旧请求会被取消"""
+        self.io.submit(write_config, dict(self.config), serial=True, key='save_config', description="正在保存配置",
+                       on_done=lambda result: event_log.emit(event_log.SAVE, "配置已保存"),
+                       on_error=self._on_save_config_error)
+
+    def _on_save_config_error(self, error):
+        event_log.error(event_log.SAVE, f"保存配置到 '{CONFIG_FILE}' 时出错: {error}")
+        messagebox.showerror("保存错误", f"保存配置到 '{CONFIG_FILE}' 时出错: {error}", parent=self.root)
 
     def open_settings_window(self):
         SettingsWindow(
@@ -435,45 +1135,131 @@ class LauncherApp:
     def on_settings_updated(self, updated_settings):
         new_auth_path = updated_settings.get("auth_file_path")
         new_bat_path = updated_settings.get("launch_bat_path")
-        auth_path_changed = False
-        bat_path_changed = False
-
-        if new_auth_path and new_auth_path != self.current_auth_path:
-            self.current_auth_path = new_auth_path
-            self.config["auth_file_path"] = new_auth_path
-            auth_path_changed = True
-        if new_bat_path and new_bat_path != self.current_launch_bat_path:
-            self.current_launch_bat_path = new_bat_path
-            self.config["launch_bat_path"] = new_bat_path
-            bat_path_changed = True
+        profile = find_profile(self.profiles, self.active_profile)
+        auth_path_changed = bool(new_auth_path) and new_auth_path != self.current_auth_path
+        bat_path_changed = bool(new_bat_path) and new_bat_path != self.current_launch_bat_path
+        if auth_path_changed:
+            profile["auth_file_path"] = new_auth_path
+        if bat_path_changed:
+            profile["launch_bat_path"] = new_bat_path
 
         if auth_path_changed or bat_path_changed:
-            save_config(self.config)
+            store_profiles(self.config, self.profiles, self.active_profile)
+            self._save_config()
             updated_items = []
             if auth_path_changed: updated_items.append("卡号文件路径")
             if bat_path_changed: updated_items.append("游戏启动脚本路径")
             messagebox.showinfo("设置更新", f"{' 和 '.join(updated_items)}已更新。", parent=self.root)
+            self._apply_active_profile()
+
+    def _apply_active_profile(self):
+        """当前机台或其路径改变后：更新路径、监视的文件，重新识别当前账号并检查路径"""
+        profile = find_profile(self.profiles, self.active_profile)
+        new_auth_path, new_bat_path = auth_file_path(profile), launch_bat_path(profile)
+        self.current_launch_bat_path = new_bat_path
+        if new_auth_path != self.current_auth_path:
+            self.current_auth_path = new_auth_path
+            # 缓存的卡号和文件状态属于旧文件，不能再用来跳过写入
+            self.current_active_card = None
+            self.auth_signature = None
+            self.auth_watcher.set_path(self.current_auth_path)
+            # 认证路径改变后，需要重新处理当前账号
+            event_log.emit(event_log.CONFIG, "认证路径已更新，重新处理当前账号状态...")
+            self.process_current_account_on_startup()
+        self.update_status_bar()
+        # 可以在这里重新检查新路径是否存在
+        self.check_paths_on_start()
 
-            if auth_path_changed:
-                self.update_status_bar()
-                # 认证路径改变后，需要重新处理当前账号
-                print("认证路径已更新，重新处理当前账号状态...")
-                self.process_current_account_on_startup()
-            # 可以在这里重新检查新路径是否存在
-            self.check_paths_on_start()
+    # --- 多机台 ---
+    def open_profiles_window(self):
+        ProfilesWindow(self.root, self.profiles, self.active_profile, self.on_profiles_updated)
+
+    def on_profiles_updated(self, profiles, active):
+        """机台配置窗口关闭后调用"""
+        old_profile = dict(find_profile(self.profiles, self.active_profile))
+        changed = profiles != self.profiles or active != self.active_profile
+        self.profiles, self.active_profile = profiles, active
+        if not changed:
+            return
+        store_profiles(self.config, self.profiles, self.active_profile)
+        self._save_config()
+        event_log.emit(event_log.CONFIG, f"机台配置已更新，当前机台: {active}")
+        if find_profile(self.profiles, active) != old_profile:
+            self._apply_active_profile()
+        else:
+            self.update_status_bar()
+
+    def open_batch_assign_window(self):
+        if not self.accounts_loaded:
+            self.root.bell()
+            return
+        BatchAssignWindow(self)
+
+    def assign_to_cabinets(self, assignments, on_result, on_done):
+        """assignments 为 [(机台名, 用户名)]，在后台并发写入各机台的卡号文件
+
+        每完成一个机台在界面线程调用 on_result(TargetResult)，全部完成后调用 on_done(结果列表)；
+        返回 False 表示没有开始 (例如游戏运行中取消)。
+        """
+        targets = []
+        for name, username in assignments:
+            card_id = self.accounts.get(username)
+            if card_id is None:
+                messagebox.showerror("错误", f"找不到用户名 '{username}' 对应的卡号。", parent=self.root)
+                return False
+            profile = find_profile(self.profiles, name)
+            if profile is None:
+                messagebox.showerror("错误", f"机台 '{name}' 已被删除，请重新打开分配窗口。", parent=self.root)
+                return False
+            if name == self.active_profile and card_id != self.current_active_card \
+                    and not self._confirm_switch_while_running(username):
+                return False # 进程检测只针对本机运行的游戏，即当前机台
+            targets.append((dict(profile), username, card_id))
+        started = time.perf_counter()
+        self.io.submit(assign_accounts, targets, self.config.get("auth_file_fsync", True),
+                       lambda result: self._call_threadsafe(on_result, result),
+                       serial=True, key='assign_cabinets', description="正在分配账号到机台",
+                       on_done=lambda results: self._on_cabinets_assigned(results, started, on_done),
+                       on_error=lambda e: messagebox.showerror("分配失败", f"分配账号到机台时发生错误: {e}", parent=self.root))
+        return True
+
+    def _call_threadsafe(self, func, *args):
+        """工作线程中调用：转交到界面线程"""
+        self.io.post(func, *args)
+
+    def _on_cabinets_assigned(self, results, started, on_done):
+        elapsed = time.perf_counter() - started
+        for result in results:
+            event_log.emit(event_log.SWITCH, f"机台 '{result.name}' -> {result.username}: {result.describe()}",
+                           cabinet=result.name, username=result.username, status=result.status)
+            if result.ok:
+                metrics.histogram('switch.cabinet').record(result.elapsed)
+                self._record_use(result.username)
+        succeeded = sum(result.ok for result in results)
+        event_log.emit(event_log.SWITCH, f"分配完成: {succeeded}/{len(results)} 个机台成功，总用时 {elapsed * 1000:.1f} ms",
+                       succeeded=succeeded, total=len(results), elapsed_ms=round(elapsed * 1000, 1))
+        # 当前机台的卡号文件被改写：由文件监视器发现并重新识别当前账号
+        on_done(results, elapsed)
 
 
 # --- 账号管理窗口 ---
 class ManageAccountsWindow:
     # ### 修改 ###: 构造函数接受 prefill_id
-    def __init__(self, parent, accounts_data, update_callback, prefill_id=None):
+    def __init__(self, parent, accounts_data, update_callback, prefill_id=None, virtual_list=False,
+                 player_profiles=None, io=None):
         self.parent = parent
-        # 确保操作的是传入数据的副本，避免直接修改原始字典直到回调
-        self.accounts = accounts_data.copy() # 使用 .copy() 确保是副本
+        self.virtual_list = virtual_list
+        self.player_profiles = player_profiles # ProfileService，未配置时为 None (不显示玩家信息列)
+        self.io = io
+        self.closed = False
+        # 在原始数据之上记录修改，原始数据不变，直到回调时才提交
+        self.accounts = AccountEditSession(accounts_data)
         self.update_callback = update_callback
         self.prefill_id = prefill_id
         # <<< 新增: 初始化 IID 到 用户名键 的映射字典 >>>
         self.iid_to_key_map = {}
+        self.key_to_iid_map = {} # 反向映射，用于增量更新某一行
+        self._next_iid = 0
 
         self.window = tk.Toplevel(parent)
         self.window.withdraw()
@@ -490,17 +1276,45 @@ class ManageAccountsWindow:
         list_frame = ttk.Frame(manage_frame)
         list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         ttk.Label(list_frame, text="现有账号 (用户名 - 卡号):").pack(anchor=tk.W)
-        self.tree = ttk.Treeview(list_frame, columns=('Username', 'ID'), show='headings', selectmode='browse') # selectmode='browse' 确保单选
+        if self.player_profiles is not None:
+            self.profile_status_var = tk.StringVar(value="玩家信息: 正在读取缓存")
+            ttk.Label(list_frame, textvariable=self.profile_status_var, foreground="gray").pack(anchor=tk.W)
+        search_frame = ttk.Frame(list_frame)
+        search_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(search_frame, text="搜索:").pack(side=tk.LEFT)
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        self.search_index = AccountSearchIndex(self.accounts)
+        self.tree_view = self.accounts # 表格当前显示的数据：全部账号或搜索结果
+        columns = ('Username', 'ID')
+        if self.player_profiles is not None:
+            columns += tuple(column for column, heading, width in PROFILE_COLUMNS)
+            self.window.geometry("900x400")
+        if self.virtual_list:
+            # 虚拟表格：只渲染可见行，选中项按用户名记录，不使用 IID 映射
+            self.tree = VirtualTreeview(list_frame, self.accounts, self._tree_row_values, columns=columns)
+        else:
+            self.tree = ttk.Treeview(list_frame, columns=columns, show='headings', selectmode='browse') # selectmode='browse' 确保单选
         self.tree.heading('Username', text='用户名')
         self.tree.heading('ID', text='卡号')
         self.tree.column('Username', width=200, anchor=tk.W)
         self.tree.column('ID', width=250, anchor=tk.W)
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscroll=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        # 填充 Treeview 内容
+        if self.player_profiles is not None:
+            for column, heading, width in PROFILE_COLUMNS:
+                self.tree.heading(column, text=heading)
+                self.tree.column(column, width=width, anchor=tk.W)
+        if not self.virtual_list:
+            self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
+            self.tree.configure(yscroll=scrollbar.set)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # 填充 Treeview 内容，之后的修改由 on_account_changed 增量更新
         self.refresh_treeview()
+        self.accounts.subscribe(self.on_account_changed)
+        # 玩家信息：先显示缓存，过期的在后台查询，查到一批更新一批
+        if self.player_profiles is not None:
+            self.request_player_profiles()
 
         # --- 输入框用于添加/编辑 ---
         entry_frame = ttk.Frame(manage_frame)
@@ -512,8 +1326,6 @@ class ManageAccountsWindow:
         self.id_entry = ttk.Entry(entry_frame, width=40)
         self.id_entry.grid(row=1, column=1, padx=5, pady=5, columnspan=2, sticky=tk.EW)
         entry_frame.columnconfigure(1, weight=1) # 让输入框随窗口宽度变化
-        # 调用 refresh_treeview 来填充并建立映射
-        self.refresh_treeview()
 
         # --- 预填卡号 ---
         if self.prefill_id:
@@ -529,13 +1341,23 @@ class ManageAccountsWindow:
         # 确认删除按钮绑定了正确的命令
         self.delete_button = ttk.Button(button_frame, text="删除选中", command=self.delete_selected_account)
         self.delete_button.pack(side=tk.LEFT, padx=5)
+        if self.player_profiles is not None:
+            ttk.Button(button_frame, text="刷新玩家信息",
+                       command=lambda: self.request_player_profiles(force=True)).pack(side=tk.LEFT, padx=5)
         self.close_button = ttk.Button(button_frame, text="完成", command=self.close_window)
         self.close_button.pack(side=tk.RIGHT, padx=5)
 
         # --- 事件绑定 ---
-        self.tree.bind('<<TreeviewSelect>>', self.on_tree_select)
+        if self.virtual_list:
+            self.tree.on_select = lambda username: self.on_tree_select()
+        else:
+            self.tree.bind('<<TreeviewSelect>>', self.on_tree_select)
         # <<< 新增: 绑定左键单击事件 >>>
         self.tree.bind("<Button-1>", self.on_tree_click)
+        self.search_var.trace_add('write', lambda *args: self.apply_search())
+        self.search_entry.bind('<Return>', self.on_search_enter)
+        self.search_entry.bind('<Escape>', self.clear_search)
+        self.search_entry.bind('<FocusIn>', lambda event: self.search_index.prepare())
         self.window.protocol("WM_DELETE_WINDOW", self.close_window) # 处理关闭窗口按钮
 
         # --- 窗口居中 ---
@@ -543,27 +1365,157 @@ class ManageAccountsWindow:
         self.window.deiconify()
 
     def refresh_treeview(self):
-        """清空并重新填充 Treeview，并建立 IID -> Key 映射"""
+        """清空并重新填充 Treeview，并建立 IID -> Key 映射 (仅初始化或数据不一致时使用)"""
+        if self.virtual_list:
+            self.tree.render()
+            return
         # 清空旧映射和 Treeview
         self.iid_to_key_map = {}
-        for item in self.tree.get_children():
+        self.key_to_iid_map = {}
+        children = self.tree.get_children()
+        if children:
             try:
-                self.tree.delete(item)
+                self.tree.delete(*children)
             except tk.TclError as e:
-                print(f"Error deleting tree item {item}: {e}")
+                event_log.error(event_log.UI, f"Error deleting tree items: {e}")
 
         # 填充新数据并建立映射
         try:
-            sorted_usernames = sorted(self.accounts.keys())
-            for username in sorted_usernames: # username 是原始的键 (str)
-                account_id = self.accounts[username] # account_id 也是原始的 str
-                # 插入 Treeview，确保使用字符串，并获取返回的 Item ID (IID)
-                # <<< 修改: 获取 insert 返回的 iid >>>
-                iid = self.tree.insert('', tk.END, values=(str(username), str(account_id)))
-                # <<< 新增: 存储映射关系 >>>
-                self.iid_to_key_map[iid] = username # 将 IID 映射到原始的 username 键
+            for username in self.tree_view.sorted_names(): # username 是原始的键 (str)
+                self._tree_insert_row(tk.END, username, self.accounts.get(username))
         except Exception as e:
-             print(f"Error inserting data into treeview or creating map: {e}")
+             event_log.error(event_log.UI, f"Error inserting data into treeview or creating map: {e}")
+
+    def _tree_row_values(self, username):
+        return self._row_values(username, self.accounts.get(username))
+
+    def _row_values(self, username, account_id):
+        values = (str(username), str(account_id))
+        if self.player_profiles is not None:
+            values += profile_columns(self.player_profiles.lookup(account_id))
+        return values
+
+    def _selected_username(self):
+        """返回选中行对应的用户名，未选中返回 None，选中项无法识别时抛出 KeyError"""
+        if self.virtual_list:
+            return self.tree.selected_key
+        selected_items = self.tree.selection()
+        if not selected_items:
+            return None
+        # <<< 修改: 使用 IID 从映射中获取原始用户名键 >>>
+        username = self.iid_to_key_map.get(selected_items[0])
+        if username is None:
+            raise KeyError(selected_items[0])
+        return username
+
+    def _tree_insert_row(self, index, username, account_id):
+        """插入一行并登记映射，IID 在该账号存续期间保持不变"""
+        iid = f"acc{self._next_iid}"
+        self._next_iid += 1
+        self.tree.insert('', index, iid=iid, values=self._row_values(username, account_id))
+        self.iid_to_key_map[iid] = username # 将 IID 映射到原始的 username 键
+        self.key_to_iid_map[username] = iid
+        return iid
+
+    def on_account_changed(self, change):
+        """账号数据变化时只插入/更新/删除受影响的那一行"""
+        if self.player_profiles is not None and change.op in ('add', 'set_card'):
+            self.request_player_profiles([change.card_id])
+        if self.tree_view is not self.accounts:
+            # 正在搜索：重新过滤
+            self.apply_search()
+            return
+        if self.virtual_list:
+            self.tree.apply_change(change)
+            return
+        if change.op == 'add':
+            self._tree_insert_row(change.new_index, change.username, change.card_id)
+            return
+        iid = self.key_to_iid_map.pop(change.old_username, None)
+        if iid is None:
+            event_log.warning(event_log.UI, f"Error: no tree row for '{change.old_username}', rebuilding treeview")
+            self.refresh_treeview()
+            return
+        if change.op == 'delete':
+            del self.iid_to_key_map[iid]
+            self.tree.delete(iid)
+            return
+        # 'rename' / 'set_card': 原地更新这一行，必要时移动到新的排序位置
+        self.iid_to_key_map[iid] = change.username
+        self.key_to_iid_map[change.username] = iid
+        self.tree.item(iid, values=self._row_values(change.username, change.card_id))
+        if change.new_index != change.old_index:
+            # 先 detach 再 move，index 即为最终位置
+            self.tree.detach(iid)
+            self.tree.move(iid, '', change.new_index)
+
+    # --- 玩家信息 ---
+    def request_player_profiles(self, card_ids=None, force=False):
+        """在后台查询玩家信息；card_ids 省略时查询全部账号 (并清理缓存中已删除账号的卡号)"""
+        everything = card_ids is None
+        if everything:
+            card_ids = [card_id for username, card_id in self.accounts.items()]
+            self.profile_status_var.set("玩家信息: 正在查询")
+        self.io.submit(self.player_profiles.refresh, card_ids, self._on_player_profiles_threadsafe, force, everything,
+                       key='player_profiles' if everything else None, description="正在查询玩家信息",
+                       on_done=self._on_player_profiles_refreshed,
+                       on_error=lambda e: event_log.error(event_log.REFRESH, f"查询玩家信息时出错: {e}"))
+
+    def _on_player_profiles_threadsafe(self, profiles):
+        """查询线程中调用：转交到界面线程"""
+        self.io.post(self._on_player_profiles, profiles)
+
+    def _on_player_profiles(self, profiles):
+        """更新查到玩家信息的卡号所在的行"""
+        if self.closed:
+            return
+        for card_id in profiles:
+            username = self.accounts.owner_of(card_id)
+            if username is None:
+                continue
+            if self.virtual_list:
+                self.tree.refresh_row(username)
+            else:
+                iid = self.key_to_iid_map.get(username)
+                if iid is not None:
+                    self.tree.item(iid, values=self._row_values(username, card_id))
+
+    def _on_player_profiles_refreshed(self, result):
+        if not self.closed:
+            self.profile_status_var.set(result.describe())
+
+    # --- 搜索 ---
+    def apply_search(self):
+        """按搜索框内容重新过滤表格"""
+        query = self.search_var.get().strip()
+        self.tree_view = FilteredView(self.search_index.search(query)) if query else self.accounts
+        if self.virtual_list:
+            self.tree.set_source(self.tree_view)
+        else:
+            self.refresh_treeview()
+
+    def clear_search(self, event=None):
+        if self.search_var.get():
+            self.search_var.set("")
+        return "break"
+
+    def on_search_enter(self, event=None):
+        """在搜索框中按 Enter：选中最匹配的账号并填入输入框"""
+        query = self.search_var.get().strip()
+        top = self.search_index.top_hit(query, self.tree_view.sorted_names()) if query else None
+        if top is None:
+            self.window.bell()
+            return "break"
+        if self.virtual_list:
+            index = self.tree_view.index_of(top)
+            self.tree.selected_key = top
+            self.tree.see(index)
+            self.on_tree_select()
+        else:
+            iid = self.key_to_iid_map[top]
+            self.tree.selection_set(iid) # 触发 <<TreeviewSelect>> 填入输入框
+            self.tree.see(iid)
+        return "break"
 
     def on_tree_click(self, event):
         """处理 Treeview 的单击事件，用于取消选中"""
@@ -578,52 +1530,55 @@ class ManageAccountsWindow:
             # item_iid = self.tree.identify('item', event.x, event.y)
             # if not item_iid: # 如果 identify_item 返回空字符串
 
+            if self.virtual_list:
+                if self.tree.selected_key is not None:
+                    event_log.debug(event_log.UI, "Clicked on empty space in treeview. Deselecting.") # 调试
+                    self.tree.selection_clear()
+                    self.clear_entries()
+                return
+
             # 获取当前的选中项 (可能是一个元组)
             selection = self.tree.selection()
             if selection:
                 # 如果有选中项，则取消选中
-                print("Clicked on empty space in treeview. Deselecting.") # 调试
+                event_log.debug(event_log.UI, "Clicked on empty space in treeview. Deselecting.") # 调试
                 self.tree.selection_remove(selection) # 移除所有选中项
                 # 同时清空下面的输入框
                 self.clear_entries()
 
     def on_tree_select(self, event=None):
         """当 Treeview 中的选择变化时，使用 IID 映射获取原始数据填充输入框"""
-        selected_items = self.tree.selection()
-        if not selected_items:
-            return
-
-        # 获取选中的 Item ID (IID)
-        iid = selected_items[0]
         try:
-            # <<< 修改: 使用 IID 从映射中获取原始用户名键 >>>
-            original_username = self.iid_to_key_map.get(iid)
+            try:
+                original_username = self._selected_username()
+            except KeyError as e:
+                # 映射失败，可能 IID 无效？
+                event_log.error(event_log.UI, f"Error: Could not find key mapping for selected IID {e}")
+                messagebox.showerror("内部错误", "无法识别选中的项目。", parent=self.window)
+                self.clear_entries()
+                return
+            if original_username is None:
+                return
 
-            if original_username is not None: # 检查映射是否成功找到键
-                # 使用原始用户名键从 self.accounts 获取原始 ID
-                if original_username in self.accounts:
-                    original_acc_id = self.accounts[original_username]
+            # 使用原始用户名键从 self.accounts 获取原始 ID
+            if original_username in self.accounts:
+                original_acc_id = self.accounts.get(original_username)
 
-                    print(f"on_tree_select: IID '{iid}' mapped to key '{original_username}'. Populating with ID '{original_acc_id}'") # 调试
+                event_log.debug(event_log.UI, f"on_tree_select: selection mapped to key '{original_username}'. Populating with ID '{original_acc_id}'") # 调试
 
-                    # 使用原始数据填充输入框
-                    self.username_entry.delete(0, tk.END)
-                    self.username_entry.insert(0, original_username)
-                    self.id_entry.delete(0, tk.END)
-                    self.id_entry.insert(0, original_acc_id)
-                else:
-                    # 映射成功但字典中找不到，数据可能已在别处被修改？（理论上不应发生）
-                    print(f"Error: Key '{original_username}' from map not found in self.accounts!")
-                    messagebox.showerror("内部错误", "账号数据不一致，请重新打开管理窗口。", parent=self.window)
-                    self.clear_entries()
+                # 使用原始数据填充输入框
+                self.username_entry.delete(0, tk.END)
+                self.username_entry.insert(0, original_username)
+                self.id_entry.delete(0, tk.END)
+                self.id_entry.insert(0, original_acc_id)
             else:
-                # 映射失败，可能 IID 无效？
-                print(f"Error: Could not find key mapping for selected IID '{iid}'")
-                messagebox.showerror("内部错误", "无法识别选中的项目。", parent=self.window)
+                # 映射成功但字典中找不到，数据可能已在别处被修改？（理论上不应发生）
+                event_log.error(event_log.UI, f"Error: Key '{original_username}' from map not found in self.accounts!")
+                messagebox.showerror("内部错误", "账号数据不一致，请重新打开管理窗口。", parent=self.window)
                 self.clear_entries()
 
         except Exception as e:
-             print(f"An unexpected error occurred during tree selection: {e}")
+             event_log.error(event_log.UI, f"An unexpected error occurred during tree selection: {e}")
              messagebox.showerror("选择错误", f"处理选中项时发生错误: {e}", parent=self.window)
              self.clear_entries()
 
@@ -636,132 +1591,94 @@ class ManageAccountsWindow:
             messagebox.showwarning("输入不完整", "用户名和卡号都不能为空！", parent=self.window)
             return
 
-        # --- 查找当前状态 ---
-        username_exists = target_username in self.accounts
-        id_exists = any(uid == target_id for uid in self.accounts.values())
-
-        current_owner_of_id = None
-        for uname, uid in self.accounts.items():
-            if uid == target_id:
-                current_owner_of_id = uname
-                break
-
-        current_id_of_username = self.accounts.get(target_username)
+        # --- 查找当前状态 (正反向索引，规则与批量导入共用) ---
+        action, other = classify_edit(self.accounts, target_username, target_id)
 
         # --- 开始逻辑判断 ---
 
         # 情况 1: 用户名和卡号都与现有某条记录完全匹配 (无更改)
-        if username_exists and current_id_of_username == target_id:
-            # 此时 current_owner_of_id 必然等于 target_username
+        if action == EDIT_UNCHANGED:
             messagebox.showinfo("无修改", f"用户名 '{target_username}' (卡号: {target_id}) 已存在，未进行任何修改。", parent=self.window)
             return
 
         # 情况 2: 尝试添加全新的记录 (用户名和卡号都是新的)
-        if not username_exists and not id_exists:
-            self.accounts[target_username] = target_id
-            print(f"Added new account: '{target_username}': '{target_id}'")
-
-        # 情况 3: 用户名已存在，尝试修改其关联的卡号
-        elif username_exists and current_id_of_username != target_id:
-            # 子情况 3a: 目标卡号未被任何其他人使用 -> 允许修改卡号
-            if not id_exists:
-                if messagebox.askyesno("确认修改卡号？",
-                                    f"用户名 '{target_username}' 已存在。\n"
-                                    f"是否要将其关联的卡号从 '{current_id_of_username}' 修改为 '{target_id}'？",
-                                    parent=self.window):
-                    self.accounts[target_username] = target_id
-                    print(f"Updated ID for user '{target_username}' to '{target_id}'")
-                else: # 用户取消修改
-                    return
-            # 子情况 3b: 目标卡号已被其他人使用 -> 阻止操作 (卡号冲突)
-            else: # id_exists is True, 并且 current_id_of_username != target_id 说明这个卡号属于别人
-                messagebox.showerror("数据冲突",
-                                    f"无法修改：\n"
-                                    f"用户名 '{target_username}' 或卡号 '{target_id}' 已被占用。",
-                                    parent=self.window)
+        if action == EDIT_ADD:
+            self.accounts.add(target_username, target_id)
+            event_log.emit(event_log.ACCOUNT, f"Added new account: '{target_username}': '{target_id}'")
+
+        # 情况 3a: 用户名已存在，目标卡号未被任何其他人使用 -> 允许修改卡号 (other 为原卡号)
+        elif action == EDIT_SET_CARD:
+            if messagebox.askyesno("确认修改卡号？",
+                                f"用户名 '{target_username}' 已存在。\n"
+                                f"是否要将其关联的卡号从 '{other}' 修改为 '{target_id}'？",
+                                parent=self.window):
+                self.accounts.set_card(target_username, target_id)
+                event_log.emit(event_log.ACCOUNT, f"Updated ID for user '{target_username}' to '{target_id}'")
+            else: # 用户取消修改
                 return
 
-        # 情况 4: 卡号已存在，尝试修改其关联的用户名 (重命名)
-        elif not username_exists and id_exists:
-            # 子情况 4a: 目标用户名未被使用 -> 允许重命名
-            # (这里的 username_exists 检查已经保证了目标用户名是新的)
+        # 情况 3b: 用户名已存在，目标卡号已被其他人使用 -> 阻止操作 (卡号冲突)
+        elif action == EDIT_CONFLICT:
+            messagebox.showerror("数据冲突",
+                                f"无法修改：\n"
+                                f"用户名 '{target_username}' 或卡号 '{target_id}' 已被占用。",
+                                parent=self.window)
+            return
+
+        # 情况 4: 卡号已存在，用户名是新的 -> 重命名卡号的所属用户 (other 为当前所属用户)
+        else:
             if messagebox.askyesno("确认重命名用户？",
                                 f"卡号 '{target_id}' 当前属于用户:\n"
-                                f"'{current_owner_of_id}'\n\n"
+                                f"'{other}'\n\n"
                                 f"是否要将此卡号关联的用户重命名为 '{target_username}'？",
                                 parent=self.window):
-                 # 先删除旧的用户名条目
-                del self.accounts[current_owner_of_id]
-                 # 添加新的用户名和卡号条目
-                self.accounts[target_username] = target_id
-                print(f"Renamed user for ID '{target_id}' from '{current_owner_of_id}' to '{target_username}'")
+                # 卡号不变，直接重命名其所属用户
+                self.accounts.rename(other, target_username)
+                event_log.emit(event_log.ACCOUNT, f"Renamed user for ID '{target_id}' from '{other}' to '{target_username}'")
             else: # 用户取消重命名
                 return
-            # 子情况 4b: (理论上不会发生，因为外层 elif 检查了 not username_exists)
-            # else: # target_username 已存在 -> 阻止操作 (用户名冲突)
-            #     messagebox.showerror("用户名冲突",
-            #                         f"无法重命名：用户名 '{target_username}'\n"
-            #                         f"已经被卡号 '{current_id_of_username}' 使用。\n\n"
-            #                         f"每个用户名必须唯一。",
-            #                         parent=self.window)
-            #     return
-
-
-        else:
-             # 捕获未预料到的状态
-            print(f"Warning: Unhandled state! username_exists={username_exists}, id_exists={id_exists}, current_id_of_username={current_id_of_username}, current_owner_of_id={current_owner_of_id}")
-            messagebox.showerror("逻辑错误", "遇到未处理的账号状态，请联系开发者。", parent=self.window)
-            return # 出现未处理情况，阻止后续
 
-        # --- 如果执行到这里，说明进行了有效的添加或修改 ---
-        self.refresh_treeview()
+        # --- 如果执行到这里，说明进行了有效的添加或修改 (Treeview 已由 on_account_changed 更新) ---
         self.clear_entries()
         self.username_entry.focus_set()
 
     # --- !!! 检查这个方法 !!! ---
     def delete_selected_account(self):
         """删除 Treeview 中选中的账号，使用 IID 映射获取键"""
-        selected_items = self.tree.selection()
-        if not selected_items:
-            messagebox.showwarning("未选择", "请先在列表中选择要删除的账号！", parent=self.window)
-            return
-
-        # 获取选中的 Item ID (IID)
-        iid = selected_items[0]
         try:
-            # <<< 修改: 使用 IID 从映射中获取原始用户名键 >>>
-            username_to_delete = self.iid_to_key_map.get(iid)
-
-            if username_to_delete is None:
+            try:
+                username_to_delete = self._selected_username()
+            except KeyError as e:
                 # 映射失败
-                print(f"Error: Could not find key mapping for selected IID '{iid}' for deletion.")
+                event_log.error(event_log.UI, f"Error: Could not find key mapping for selected IID {e} for deletion.")
                 messagebox.showerror("内部错误", "无法识别要删除的项目。", parent=self.window)
                 return
 
-            print(f"Attempting to delete account with key from map: '{username_to_delete}'") # 调试
+            if username_to_delete is None:
+                messagebox.showwarning("未选择", "请先在列表中选择要删除的账号！", parent=self.window)
+                return
+
+            event_log.debug(event_log.ACCOUNT, f"Attempting to delete account with key from map: '{username_to_delete}'") # 调试
 
             # 再次确认删除
             if messagebox.askyesno("确认删除", f"确定要删除账号 '{username_to_delete}' 吗？", parent=self.window):
                 # 使用从映射获取的原始键进行检查和删除
                 if username_to_delete in self.accounts:
-                    del self.accounts[username_to_delete] # 从字典副本中删除
-                    print(f"Account '{username_to_delete}' deleted from internal dictionary.")
-                    # 从映射中也移除（虽然刷新时会重建，但保持一致性较好）
-                    if iid in self.iid_to_key_map:
-                        del self.iid_to_key_map[iid]
-                    self.refresh_treeview() # 刷新 Treeview 以移除该行并重建映射
+                    self.accounts.delete(username_to_delete) # 从副本中删除
+                    event_log.debug(event_log.ACCOUNT, f"Account '{username_to_delete}' deleted from internal dictionary.")
+                    # 该行及映射已由 on_account_changed 移除
                     self.clear_entries() # 清空输入框
-                    print("Deletion successful in ManageAccountsWindow.")
+                    event_log.emit(event_log.ACCOUNT, "Deletion successful in ManageAccountsWindow.")
                 else:
                     # 映射成功但字典中找不到键
-                    print(f"Error: Key '{username_to_delete}' from map not found in self.accounts dictionary for deletion!")
+                    event_log.error(event_log.ACCOUNT, f"Error: Key '{username_to_delete}' from map not found in self.accounts dictionary for deletion!")
                     messagebox.showerror("数据不一致", f"尝试删除的用户 '{username_to_delete}' 在内部数据中未找到。", parent=self.window)
                     self.refresh_treeview() # 强制刷新同步
             else:
-                print("Deletion cancelled by user.")
+                event_log.debug(event_log.ACCOUNT, "Deletion cancelled by user.")
 
         except Exception as e:
-             print(f"An error occurred during deletion process: {e}")
+             event_log.error(event_log.ACCOUNT, f"An error occurred during deletion process: {e}")
              messagebox.showerror("删除错误", f"删除过程中发生错误: {e}", parent=self.window)
 
     def clear_entries(self):
@@ -772,9 +1689,12 @@ class ManageAccountsWindow:
         # self.tree.selection_remove(self.tree.selection())
 
     def close_window(self):
-        """关闭窗口并调用回调函数传递修改后的数据"""
-        print("Closing ManageAccountsWindow, calling update callback...") # 调试信息
-        # 将修改后的 self.accounts (副本) 传递回主应用
+        """关闭窗口并调用回调函数传递本次编辑会话"""
+        event_log.debug(event_log.UI, "Closing ManageAccountsWindow, calling update callback...") # 调试信息
+        # 将编辑会话 (记录了所有修改) 传递回主应用
+        self.closed = True
+        self.accounts.unsubscribe(self.on_account_changed)
+        self.search_index.detach()
         self.update_callback(self.accounts)
         self.window.destroy()
 
@@ -853,21 +1773,439 @@ class SettingsWindow:
         self.window.destroy()
 
 
+# --- 机台配置窗口 ---
+def browse_file_into(var, parent, title, filetypes):
+    """选择文件，把路径填入 var；初始目录为当前值所在的目录"""
+    initial_dir = base_path
+    dir_name = os.path.dirname(var.get())
+    if dir_name and os.path.isdir(dir_name):
+        initial_dir = dir_name
+    file_path = filedialog.askopenfilename(title=title, initialdir=initial_dir, filetypes=filetypes, parent=parent)
+    if file_path:
+        var.set(file_path)
+
+
+class ProfilesWindow:
+    """编辑机台配置 (名称、卡号文件、启动脚本)，选择主界面操作的当前机台"""
+
+    def __init__(self, parent, profiles, active, update_callback):
+        self.parent = parent
+        self.update_callback = update_callback
+        # 在副本上修改，关闭窗口时交给回调
+        self.profiles = [dict(profile) for profile in profiles]
+        self.active = active
+
+        self.window = tk.Toplevel(parent)
+        self.window.withdraw()
+        self.window.title("机台配置")
+        self.window.geometry("700x400")
+        self.window.transient(parent)
+        self.window.grab_set()
+        frame = ttk.Frame(self.window, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(frame, text="机台 (带 * 的是主界面当前操作的机台):").pack(anchor=tk.W)
+        self.tree = ttk.Treeview(frame, columns=('Name', 'Auth', 'Launch'), show='headings', selectmode='browse', height=6)
+        self.tree.heading('Name', text='名称')
+        self.tree.heading('Auth', text='卡号文件')
+        self.tree.heading('Launch', text='启动脚本')
+        self.tree.column('Name', width=120, anchor=tk.W)
+        self.tree.column('Auth', width=260, anchor=tk.W)
+        self.tree.column('Launch', width=260, anchor=tk.W)
+        self.tree.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.tree.bind('<<TreeviewSelect>>', self.on_tree_select)
+
+        entry_frame = ttk.Frame(frame)
+        entry_frame.pack(fill=tk.X, pady=5)
+        self.name_var = tk.StringVar()
+        self.auth_path_var = tk.StringVar()
+        self.launch_path_var = tk.StringVar()
+        ttk.Label(entry_frame, text="名称:").grid(row=0, column=0, padx=5, pady=3, sticky=tk.W)
+        ttk.Entry(entry_frame, textvariable=self.name_var, width=25).grid(row=0, column=1, padx=5, pady=3, sticky=tk.W)
+        ttk.Label(entry_frame, text="卡号文件:").grid(row=1, column=0, padx=5, pady=3, sticky=tk.W)
+        ttk.Entry(entry_frame, textvariable=self.auth_path_var).grid(row=1, column=1, padx=5, pady=3, sticky=tk.EW)
+        ttk.Button(entry_frame, text="浏览...", command=lambda: browse_file_into(
+            self.auth_path_var, self.window, "选择卡号文件 (.txt)", [("Text files", "*.txt"), ("All files", "*.*")]
+        )).grid(row=1, column=2, padx=5, pady=3)
+        ttk.Label(entry_frame, text="启动脚本:").grid(row=2, column=0, padx=5, pady=3, sticky=tk.W)
+        ttk.Entry(entry_frame, textvariable=self.launch_path_var).grid(row=2, column=1, padx=5, pady=3, sticky=tk.EW)
+        ttk.Button(entry_frame, text="浏览...", command=lambda: browse_file_into(
+            self.launch_path_var, self.window, "选择游戏启动脚本 (.bat, .exe)",
+            [("Scripts/Executables", "*.bat;*.exe"), ("All files", "*.*")]
+        )).grid(row=2, column=2, padx=5, pady=3)
+        entry_frame.columnconfigure(1, weight=1)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=5)
+        ttk.Button(button_frame, text="添加/修改", command=self.add_or_update_profile).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="删除选中", command=self.delete_selected_profile).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="设为当前机台", command=self.set_active_profile).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="完成", command=self.close_window).pack(side=tk.RIGHT, padx=5)
+        self.window.protocol("WM_DELETE_WINDOW", self.close_window)
+
+        self.refresh_tree()
+        center_window(self.window)
+        self.window.deiconify()
+
+    def refresh_tree(self):
+        self.tree.delete(*self.tree.get_children())
+        for index, profile in enumerate(self.profiles):
+            name = f"* {profile['name']}" if profile["name"] == self.active else profile["name"]
+            self.tree.insert('', tk.END, iid=str(index),
+                             values=(name, auth_file_path(profile), launch_bat_path(profile)))
+
+    def _selected_profile(self):
+        selection = self.tree.selection()
+        return self.profiles[int(selection[0])] if selection else None
+
+    def on_tree_select(self, event=None):
+        profile = self._selected_profile()
+        if profile is not None:
+            self.name_var.set(profile["name"])
+            self.auth_path_var.set(auth_file_path(profile))
+            self.launch_path_var.set(launch_bat_path(profile))
+
+    def add_or_update_profile(self):
+        name = self.name_var.get().strip()
+        auth_path = self.auth_path_var.get().strip()
+        launch_path = self.launch_path_var.get().strip()
+        if not name or not auth_path or not launch_path:
+            messagebox.showwarning("输入无效", "名称、卡号文件和启动脚本路径都不能为空！", parent=self.window)
+            return
+        profile = find_profile(self.profiles, name)
+        if profile is None:
+            selected = self._selected_profile()
+            if selected is not None and messagebox.askyesno(
+                    "重命名机台", f"将机台 '{selected['name']}' 重命名为 '{name}' 吗？\n选择“否”则添加为新机台。",
+                    parent=self.window):
+                if self.active == selected["name"]:
+                    self.active = name
+                profile = selected
+                profile["name"] = name
+            else:
+                profile = {"name": name}
+                self.profiles.append(profile)
+        profile["auth_file_path"] = auth_path
+        profile["launch_bat_path"] = launch_path
+        self.refresh_tree()
+
+    def delete_selected_profile(self):
+        profile = self._selected_profile()
+        if profile is None:
+            messagebox.showwarning("提示", "请先选择要删除的机台！", parent=self.window)
+            return
+        if profile["name"] == self.active:
+            messagebox.showwarning("提示", "不能删除当前机台，请先把其他机台设为当前机台。", parent=self.window)
+            return
+        if messagebox.askyesno("确认删除", f"确定要删除机台 '{profile['name']}' 吗？\n(只删除配置，不改动该机台的文件)", parent=self.window):
+            self.profiles.remove(profile)
+            self.refresh_tree()
+
+    def set_active_profile(self):
+        profile = self._selected_profile()
+        if profile is None:
+            messagebox.showwarning("提示", "请先选择一个机台！", parent=self.window)
+            return
+        self.active = profile["name"]
+        self.refresh_tree()
+
+    def close_window(self):
+        self.update_callback(self.profiles, self.active)
+        self.window.destroy()
+
+
+class BatchAssignWindow:
+    """为多个机台分别指定账号，一次并发写入各机台的卡号文件，逐个显示结果和用时"""
+
+    def __init__(self, app):
+        self.app = app
+        self.names = [profile["name"] for profile in app.profiles]
+        self.assignments = {} # 机台名 -> 用户名
+        self.running = False
+
+        # 不设为模态：分配时可以在主界面的列表中查找、选择账号
+        self.window = tk.Toplevel(app.root)
+        self.window.withdraw()
+        self.window.title("分配账号到机台")
+        self.window.geometry("650x380")
+        self.window.transient(app.root)
+        frame = ttk.Frame(self.window, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        self.tree = ttk.Treeview(frame, columns=('Cabinet', 'Current', 'Assigned', 'Result'), show='headings',
+                                 selectmode='extended', height=8)
+        for column, text, width in (('Cabinet', '机台', 110), ('Current', '当前账号', 150),
+                                    ('Assigned', '分配账号', 150), ('Result', '结果', 200)):
+            self.tree.heading(column, text=text)
+            self.tree.column(column, width=width, anchor=tk.W)
+        for index, name in enumerate(self.names):
+            self.tree.insert('', tk.END, iid=str(index), values=(name, "读取中...", "", ""))
+        self.tree.pack(fill=tk.BOTH, expand=True, pady=5)
+
+        entry_frame = ttk.Frame(frame)
+        entry_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(entry_frame, text="账号:").pack(side=tk.LEFT)
+        self.username_var = tk.StringVar()
+        ttk.Entry(entry_frame, textvariable=self.username_var, width=20).pack(side=tk.LEFT, padx=5)
+        ttk.Button(entry_frame, text="填入主界面选中的账号", command=self.fill_from_main_list).pack(side=tk.LEFT, padx=5)
+        ttk.Button(entry_frame, text="分配给选中机台", command=self.assign_selected).pack(side=tk.LEFT, padx=5)
+        ttk.Button(entry_frame, text="清除", command=self.clear_selected).pack(side=tk.LEFT, padx=5)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=5)
+        self.status_var = tk.StringVar(value="选中一个或多个机台，指定账号后点击“执行”。")
+        ttk.Label(button_frame, textvariable=self.status_var).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="关闭", command=self.window.destroy).pack(side=tk.RIGHT, padx=5)
+        self.run_button = ttk.Button(button_frame, text="执行", command=self.run, default='active')
+        self.run_button.pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="刷新", command=self.refresh_state).pack(side=tk.RIGHT, padx=5)
+
+        self.refresh_state()
+        center_window(self.window)
+        self.window.deiconify()
+
+    def _alive(self):
+        try:
+            return bool(self.window.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def _iid(self, name):
+        return str(self.names.index(name))
+
+    def refresh_state(self):
+        """在后台并发读取各机台的卡号文件"""
+        profiles = [dict(profile) for profile in self.app.profiles if profile["name"] in self.names]
+        self.app.io.submit(inspect_profiles, profiles, key='inspect_cabinets', description="正在读取各机台的卡号",
+                           on_done=self._on_inspected)
+
+    def _on_inspected(self, states):
+        if not self._alive():
+            return
+        for state in states:
+            if not state.auth_ok:
+                text = "卡号文件不存在"
+            elif state.error is not None:
+                text = f"读取错误: {state.error}"
+            elif state.card_id is None:
+                text = "(空)"
+            else:
+                text = self.app.accounts.owner_of(state.card_id) or f"未在列表 ({state.card_id})"
+            self.tree.set(self._iid(state.name), 'Current', text)
+
+    def fill_from_main_list(self):
+        selection = self.app.account_listbox.curselection()
+        if not selection:
+            self.window.bell()
+            return
+        self.username_var.set(self.app.account_listbox.get(selection[0]))
+
+    def assign_selected(self):
+        username = self.username_var.get().strip()
+        if username not in self.app.accounts:
+            messagebox.showwarning("提示", f"找不到账号 '{username}'。", parent=self.window)
+            return
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showwarning("提示", "请先选择要分配的机台！", parent=self.window)
+            return
+        for iid in selection:
+            self.assignments[self.names[int(iid)]] = username
+            self.tree.set(iid, 'Assigned', username)
+            self.tree.set(iid, 'Result', "")
+
+    def clear_selected(self):
+        for iid in self.tree.selection():
+            self.assignments.pop(self.names[int(iid)], None)
+            self.tree.set(iid, 'Assigned', "")
+
+    def run(self):
+        if self.running:
+            return
+        pairs = [(name, self.assignments[name]) for name in self.names if name in self.assignments]
+        if not pairs:
+            messagebox.showwarning("提示", "请先为机台指定账号！", parent=self.window)
+            return
+        if not self.app.assign_to_cabinets(pairs, self._on_result, self._on_done):
+            return
+        self.running = True
+        self.run_button.state(['disabled'])
+        for name, username in pairs:
+            self.tree.set(self._iid(name), 'Result', "写入中...")
+        self.status_var.set(f"正在写入 {len(pairs)} 个机台...")
+
+    def _on_result(self, result):
+        if not self._alive():
+            return
+        iid = self._iid(result.name)
+        self.tree.set(iid, 'Result', result.describe())
+        if result.ok:
+            self.tree.set(iid, 'Current', result.username)
+
+    def _on_done(self, results, elapsed):
+        self.running = False
+        if not self._alive():
+            return
+        self.run_button.state(['!disabled'])
+        succeeded = sum(result.ok for result in results)
+        slowest = max(result.elapsed for result in results)
+        self.status_var.set(f"完成: {succeeded}/{len(results)} 个机台成功，总用时 {elapsed * 1000:.0f} ms "
+                            f"(最慢的机台 {slowest * 1000:.0f} ms)")
+
+
+class DiagnosticsWindow:
+    """最近的事件 (内存中的环形缓冲区) 以及计数器和耗时统计；点击“刷新”重新读取"""
+
+    def __init__(self, app):
+        self.app = app
+        self.window = tk.Toplevel(app.root)
+        self.window.withdraw()
+        self.window.title("诊断信息")
+        self.window.geometry("860x560")
+        self.window.transient(app.root)
+        frame = ttk.Frame(self.window, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        filter_frame = ttk.Frame(frame)
+        filter_frame.pack(fill=tk.X)
+        ttk.Label(filter_frame, text="类型:").pack(side=tk.LEFT)
+        self.kind_labels = {"全部": None}
+        self.kind_labels.update({label: kind for kind, label in event_log.KIND_LABELS.items()})
+        self.kind_var = tk.StringVar(value="全部")
+        kind_box = ttk.Combobox(filter_frame, textvariable=self.kind_var, values=list(self.kind_labels),
+                                state='readonly', width=8)
+        kind_box.pack(side=tk.LEFT, padx=5)
+        kind_box.bind('<<ComboboxSelected>>', lambda event: self.refresh())
+        self.problems_only_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(filter_frame, text="只显示警告和错误", variable=self.problems_only_var,
+                        command=self.refresh).pack(side=tk.LEFT, padx=5)
+        self.status_var = tk.StringVar()
+        ttk.Label(frame, textvariable=self.status_var, foreground="gray").pack(anchor=tk.W, pady=(5, 0))
+
+        list_frame = ttk.Frame(frame)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.tree = ttk.Treeview(list_frame, columns=('Time', 'Kind', 'Level', 'Message'), show='headings', height=12)
+        self.tree.heading('Time', text='时间')
+        self.tree.heading('Kind', text='类型')
+        self.tree.heading('Level', text='级别')
+        self.tree.heading('Message', text='内容')
+        self.tree.column('Time', width=100, anchor=tk.W, stretch=False)
+        self.tree.column('Kind', width=50, anchor=tk.W, stretch=False)
+        self.tree.column('Level', width=70, anchor=tk.W, stretch=False)
+        self.tree.column('Message', width=600, anchor=tk.W)
+        self.tree.tag_configure('warning', foreground='#b36b00')
+        self.tree.tag_configure('error', foreground='red')
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscroll=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        ttk.Label(frame, text="计数器和耗时统计:").pack(anchor=tk.W)
+        self.metrics_text = tk.Text(frame, height=8, wrap=tk.NONE)
+        self.metrics_text.pack(fill=tk.X, pady=5)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X)
+        ttk.Button(button_frame, text="刷新", command=self.refresh).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="立即写入日志文件", command=self.flush_now).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="关闭", command=self.window.destroy).pack(side=tk.RIGHT, padx=5)
+        self.window.protocol("WM_DELETE_WINDOW", self.window.destroy)
+
+        self.refresh()
+        center_window(self.window)
+        self.window.deiconify()
+
+    def refresh(self):
+        log = event_log.log
+        min_level = event_log.WARNING if self.problems_only_var.get() else event_log.DEBUG
+        events = log.recent(self.kind_labels.get(self.kind_var.get()), min_level)
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        for event in events:
+            message = event.message
+            if event.fields:
+                message += "  (" + ", ".join(f"{key}={value}" for key, value in event.fields.items()) + ")"
+            stamp = time.strftime("%H:%M:%S", time.localtime(event.time)) + f".{int(event.time * 1000) % 1000:03d}"
+            tags = ('error',) if event.level >= event_log.ERROR else ('warning',) if event.level >= event_log.WARNING else ()
+            self.tree.insert('', tk.END, values=(stamp, event_log.KIND_LABELS.get(event.kind, event.kind),
+                                                 event_log.LEVEL_NAMES.get(event.level, event.level), message), tags=tags)
+        if events:
+            self.tree.see(self.tree.get_children()[-1])
+
+        if log.enabled:
+            status = f"显示 {len(events)} 条事件 (缓冲区最多保留 {log.capacity} 条)，日志文件: {log.path}"
+            if log.dropped:
+                status += f"，{log.dropped} 条未写入文件就被覆盖"
+        else:
+            status = "事件记录已关闭 (config.json 中的 event_log)，只显示统计"
+        self.status_var.set(status)
+
+        lines = [f"{name}: {value}" for name, value in metrics.all_counters().items()]
+        lines += [hist.summary() for hist in metrics.all_histograms()]
+        self.metrics_text.configure(state=tk.NORMAL)
+        self.metrics_text.delete('1.0', tk.END)
+        self.metrics_text.insert('1.0', "\n".join(lines) if lines else "本次运行尚无记录。")
+        self.metrics_text.configure(state=tk.DISABLED)
+
+    def flush_now(self):
+        if not event_log.log.enabled:
+            self.window.bell()
+            return
+        self.app.io.submit(event_log.log.flush, True, description="正在写入事件日志",
+                           on_done=lambda result: self.status_var.set(f"已写入 {event_log.log.path}"),
+                           on_error=lambda e: self.status_var.set(f"写入事件日志失败: {e}"))
+
+
 # --- 程序入口 ---
 if __name__ == "__main__":
+    # 配置/账号加载出错时用对话框提示
+    launcher_config.show_error = messagebox.showerror
+    launcher_config.show_warning = messagebox.showwarning
+
     root = tk.Tk()
+    profiler.mark("创建 Tk")
 
     # <<< Add this line: Hide the window immediately >>>
     root.withdraw()
 
     # Initialize the app (this builds the UI and calls center_window internally)
     app = LauncherApp(root)
+    if instance_lock is not None:
+        app.start_instance_server()
 
-    set_icon(root)
+    if not app.fast_start:
+        set_window_icon(root)
+        profiler.mark("设置图标")
 
     # <<< Add this line: Show the window only AFTER it's built and centered >>>
     root.deiconify()
 
-    root.after(100, lambda: app.process_current_account_on_startup())
-
-    root.mainloop()
\ No newline at end of file
+    if not app.fast_start:
+        root.after(100, app.resolve_account_on_startup)
+
+    root.mainloop()
+
+    app.auth_watcher.stop()
+    app.launcher.stop()
+    app.process_scanner.stop()
+    if app.instance_server is not None:
+        app.instance_server.stop()
+    if app.watchdog is not None:
+        app.watchdog.stop()
+        event_log.emit(event_log.APP, app.watchdog.summary())
+    # 放弃尚未开始的读取，等待已提交的写入 (账号日志、卡号文件、配置) 完成
+    app.io.shutdown()
+    if app.player_profiles is not None:
+        app.player_profiles.close()
+    account_journal.write_behind = None
+    for hist in metrics.all_histograms():
+        event_log.emit(event_log.APP, hist.summary())
+    if not isinstance(app.accounts, AccountStore):
+        app.accounts.close() # 释放索引映射，便于压缩时替换索引文件
+    # 等待后台压缩完成，并确保 accounts.json 为最新
+    account_journal.close()
+    # 写入剩余的事件和最终的统计快照
+    event_log.log.close()
+    if instance_lock is not None:
+        instance_lock.release()
@@ -0,0 +1,204 @@
+# --- 账号二进制索引 ---
+# 可选的紧凑磁盘格式，启动时 mmap 映射后直接二分查找，不必把全部账号读进内存。
+#
+# 文件布局 (小端):
+#   头部        magic, 版本, 账号数, 各区段偏移
+#   名称偏移表  (账号数 + 1) 个 uint32，按用户名排序，第 i 个用户名为 names[off[i]:off[i+1]]
+#   名称区      UTF-8 用户名依次拼接
+#   卡号区      每个账号 10 字节，与用户名同序；纯数字卡号见 account_store.pack_card_id，
+#               其他卡号为 [0xFF][uint32 偏移][uint32 长度][0]，指向卡号字符串区
+#   卡号排序表  账号数个 uint32 行号，按卡号键排序，供按卡号二分查找
+#   卡号字符串区
+import mmap
+import os
+import struct
+
+from account_store import CARD_RECORD_SIZE, pack_card_id, unpack_card_id
+
+INDEX_MAGIC = b"AQDXIDX1"
+INDEX_VERSION = 1
+_HEADER = struct.Struct('<8sII5Q')
+_UINT32 = struct.Struct('<I')
+_UINT32_PAIR = struct.Struct('<II')
+_STRING_CARD = struct.Struct('<BIIx')
+STRING_CARD_MARK = 0xFF
+
+
+def _card_key(card_id):
+    """卡号排序键：纯数字卡号按 (位数, 数值)，其余排在后面按字节序"""
+    packed = pack_card_id(card_id)
+    if packed is not None:
+        return packed
+    return bytes((STRING_CARD_MARK,)) + card_id.encode('utf-8', 'surrogatepass')
+
+
+def build_account_index(accounts, path):
+    """把 {用户名: 卡号} (或 AccountStore) 写成二进制索引，先写临时文件再替换"""
+    names = sorted(accounts)
+    count = len(names)
+    name_offsets = bytearray()
+    name_blob = bytearray()
+    cards = bytearray()
+    card_strings = bytearray()
+    card_keys = []
+    for row, username in enumerate(names):
+        name_offsets += _UINT32.pack(len(name_blob))
+        name_blob += username.encode('utf-8', 'surrogatepass')
+        card_id = accounts.get(username)
+        packed = pack_card_id(card_id)
+        if packed is None:
+            raw = card_id.encode('utf-8', 'surrogatepass')
+            packed = _STRING_CARD.pack(STRING_CARD_MARK, len(card_strings), len(raw))
+            card_strings += raw
+        cards += packed
+        card_keys.append((_card_key(card_id), row))
+    name_offsets += _UINT32.pack(len(name_blob))
+    card_keys.sort()
+    card_order = bytearray()
+    for _, row in card_keys:
+        card_order += _UINT32.pack(row)
+
+    name_offsets_at = _HEADER.size
+    names_at = name_offsets_at + len(name_offsets)
+    cards_at = names_at + len(name_blob)
+    card_order_at = cards_at + len(cards)
+    card_strings_at = card_order_at + len(card_order)
+    header = _HEADER.pack(INDEX_MAGIC, INDEX_VERSION, count,
+                          name_offsets_at, names_at, cards_at, card_order_at, card_strings_at)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            for part in (header, name_offsets, name_blob, cards, card_order, card_strings):
+                f.write(part)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class MappedAccountIndex:
+    """只读账号表：接口与 AccountStore 的查询部分相同，数据按需从 mmap 中解码"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            (magic, version, self._count, self._name_offsets_at, self._names_at, self._cards_at,
+             self._card_order_at, self._card_strings_at) = _HEADER.unpack_from(self._mm, 0)
+            if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                raise ValueError(f"不是有效的账号索引文件: {path}")
+            if self._card_strings_at > len(self._mm) or \
+                    self._card_order_at != self._cards_at + self._count * CARD_RECORD_SIZE:
+                raise ValueError(f"账号索引文件已损坏: {path}")
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        mm = getattr(self, '_mm', None)
+        if mm is not None:
+            mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # --- 解码 ---
+    def name_at(self, index):
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        start, end = _UINT32_PAIR.unpack_from(self._mm, self._name_offsets_at + 4 * index)
+        return self._mm[self._names_at + start:self._names_at + end].decode('utf-8', 'surrogatepass')
+
+    def _card_record(self, row):
+        at = self._cards_at + CARD_RECORD_SIZE * row
+        return self._mm[at:at + CARD_RECORD_SIZE]
+
+    def card_at(self, row):
+        record = self._card_record(row)
+        if record[0] != STRING_CARD_MARK:
+            return unpack_card_id(record)
+        _, offset, length = _STRING_CARD.unpack(record)
+        at = self._card_strings_at + offset
+        return self._mm[at:at + length].decode('utf-8', 'surrogatepass')
+
+    def _card_key_at(self, row):
+        record = self._card_record(row)
+        if record[0] != STRING_CARD_MARK:
+            return record
+        _, offset, length = _STRING_CARD.unpack(record)
+        at = self._card_strings_at + offset
+        return bytes((STRING_CARD_MARK,)) + self._mm[at:at + length]
+
+    # --- 查询 (与 AccountStore 相同的接口) ---
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, username):
+        return self.index_of(username) is not None
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self.name_at(index)
+
+    def items(self):
+        for index in range(self._count):
+            yield self.name_at(index), self.card_at(index)
+
+    def bisect_left(self, username):
+        """用户名在排序表中的插入位置"""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.name_at(mid) < username:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def index_of(self, username):
+        index = self.bisect_left(username)
+        if index < self._count and self.name_at(index) == username:
+            return index
+        return None
+
+    def get(self, username, default=None):
+        index = self.index_of(username)
+        return default if index is None else self.card_at(index)
+
+    def owner_of(self, card_id):
+        key = _card_key(card_id)
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            row = _UINT32.unpack_from(self._mm, self._card_order_at + 4 * mid)[0]
+            if self._card_key_at(row) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count:
+            row = _UINT32.unpack_from(self._mm, self._card_order_at + 4 * lo)[0]
+            if self._card_key_at(row) == key:
+                return self.name_at(row)
+        return None
+
+    def has_card(self, card_id):
+        return self.owner_of(card_id) is not None
+
+    def sorted_names(self):
+        """解码全部用户名，O(n)；列表框应通过 name_at 按需读取 (映射索引时启动器总是使用虚拟列表)"""
+        return list(self)
+
+    def to_dict(self):
+        return dict(self.items())
+
+    # 只读数据永远不会变化，订阅为空操作
+    def subscribe(self, callback):
+        pass
+
+    def unsubscribe(self, callback):
+        pass
@@ -0,0 +1,228 @@
+# --- 账号搜索 ---
+# 输入即搜索：用户名按子串匹配 (不区分大小写)，卡号按前缀匹配。
+# 用户名用二元组 (bigram) 倒排索引，卡号用有序列表按区间二分查找；
+# 索引在第一次搜索时建立，之后订阅账号修改增量维护。
+from bisect import bisect_left
+
+from account_store import MAX_PACKED_DIGITS, card_key
+
+NGRAM = 2
+
+
+def _fold(text):
+    return text.casefold()
+
+
+def _grams(folded):
+    return {folded[i:i + NGRAM] for i in range(len(folded) - NGRAM + 1)}
+
+
+class FilteredView:
+    """搜索结果：按用户名排序的只读列表，接口与虚拟列表数据源相同"""
+
+    def __init__(self, names):
+        self.names = names
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, username):
+        return self.index_of(username) is not None
+
+    def name_at(self, index):
+        return self.names[index]
+
+    def index_of(self, username):
+        index = bisect_left(self.names, username)
+        if index < len(self.names) and self.names[index] == username:
+            return index
+        return None
+
+    def sorted_names(self):
+        return self.names
+
+
+class AccountSearchIndex:
+    """某个账号表 (AccountStore / AccountEditSession / MappedAccountIndex) 的搜索索引"""
+
+    def __init__(self, source):
+        self.source = None
+        self._postings = None   # 二元组 -> 用户名集合；None 表示尚未建立
+        self._short_names = None  # 太短、没有二元组的用户名
+        # 卡号前缀索引：可打包的卡号按 card_key 排序 (即按 (位数, 数值) 排序)，其余按字符串排序，
+        # 各自带一个同序的持有者列表
+        self._num_keys = None
+        self._num_owners = None
+        self._str_cards = None
+        self._str_owners = None
+        self.attach(source)
+
+    def attach(self, source):
+        """改为索引另一个账号表 (例如从只读索引换成完整加载的数据)"""
+        self.detach()
+        self.source = source
+        source.subscribe(self._on_change)
+
+    def detach(self):
+        if self.source is not None:
+            self.source.unsubscribe(self._on_change)
+            self.source = None
+        self._postings = None
+
+    def prepare(self):
+        """提前建立索引 (例如搜索框获得焦点时)，避免第一次按键时卡顿"""
+        if self._postings is None:
+            self._build()
+
+    # --- 索引维护 ---
+    def _build(self):
+        self._postings = {}
+        self._short_names = set()
+        numbered = []
+        named = []
+        for username, card_id in self.source.items():
+            self._add_name(username)
+            key = card_key(card_id)
+            (named if isinstance(key, str) else numbered).append((key, username))
+        numbered.sort()
+        named.sort()
+        self._num_keys = [key for key, _ in numbered]
+        self._num_owners = [username for _, username in numbered]
+        self._str_cards = [key for key, _ in named]
+        self._str_owners = [username for _, username in named]
+
+    def _add_name(self, username):
+        grams = _grams(_fold(username))
+        if not grams:
+            self._short_names.add(username)
+        postings = self._postings
+        for gram in grams:
+            bucket = postings.get(gram)
+            if bucket is None:
+                postings[gram] = {username}
+            else:
+                bucket.add(username)
+
+    def _remove_name(self, username):
+        self._short_names.discard(username)
+        for gram in _grams(_fold(username)):
+            bucket = self._postings.get(gram)
+            if bucket is not None:
+                bucket.discard(username)
+                if not bucket:
+                    del self._postings[gram]
+
+    def _card_lists(self, key):
+        if isinstance(key, str):
+            return self._str_cards, self._str_owners
+        return self._num_keys, self._num_owners
+
+    def _add_card(self, card_id, username):
+        key = card_key(card_id)
+        keys, owners = self._card_lists(key)
+        index = bisect_left(keys, key)
+        keys.insert(index, key)
+        owners.insert(index, username)
+
+    def _remove_card(self, card_id):
+        key = card_key(card_id)
+        keys, owners = self._card_lists(key)
+        index = bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            del keys[index]
+            del owners[index]
+
+    def _rename_card_owner(self, card_id, username):
+        key = card_key(card_id)
+        keys, owners = self._card_lists(key)
+        index = bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            owners[index] = username
+
+    def _on_change(self, change):
+        if self._postings is None:
+            return
+        if change.op == 'add':
+            self._add_name(change.username)
+            self._add_card(change.card_id, change.username)
+        elif change.op == 'delete':
+            self._remove_name(change.username)
+            self._remove_card(change.card_id)
+        elif change.op == 'rename':
+            self._remove_name(change.old_username)
+            self._add_name(change.username)
+            self._rename_card_owner(change.card_id, change.username)
+        elif change.op == 'set_card':
+            self._remove_card(change.old_card_id)
+            self._add_card(change.card_id, change.username)
+
+    # --- 查询 ---
+    def _match_names(self, folded):
+        """用户名 (忽略大小写) 包含 folded 的账号集合"""
+        postings = self._postings
+        matches = {username for username in self._short_names if folded in _fold(username)}
+        if len(folded) < NGRAM:
+            # 单个字符：合并所有包含该字符的二元组
+            buckets = [bucket for gram, bucket in postings.items() if folded in gram]
+            return matches.union(*buckets)
+        buckets = []
+        for gram in _grams(folded):
+            bucket = postings.get(gram)
+            if bucket is None:
+                return matches
+            buckets.append(bucket)
+        buckets.sort(key=len)
+        candidates = buckets[0].intersection(*buckets[1:])
+        if len(folded) > NGRAM:
+            # 各二元组都出现不代表连续出现，逐个确认
+            candidates = {username for username in candidates if folded in _fold(username)}
+        return matches | candidates
+
+    def _match_card_prefix(self, prefix):
+        """卡号以 prefix 开头的账号"""
+        matches = []
+        if prefix.isdigit() and prefix.isascii() and len(prefix) <= MAX_PACKED_DIGITS:
+            # 位数为 digits 的卡号中，以 prefix 开头的是一段连续的数值区间
+            for digits in range(len(prefix), MAX_PACKED_DIGITS + 1):
+                scale = 10 ** (digits - len(prefix))
+                low = card_key(str(int(prefix) * scale).zfill(digits))
+                high = low + scale
+                matches += self._num_owners[bisect_left(self._num_keys, low):bisect_left(self._num_keys, high)]
+        start = bisect_left(self._str_cards, prefix)
+        end = start
+        while end < len(self._str_cards) and self._str_cards[end].startswith(prefix):
+            end += 1
+        matches += self._str_owners[start:end]
+        return matches
+
+    def search(self, query):
+        """返回匹配的用户名列表 (按用户名排序)"""
+        query = query.strip()
+        self.prepare()
+        if not query:
+            return list(self.source)
+        matches = self._match_names(_fold(query))
+        matches.update(self._match_card_prefix(query))
+        if len(matches) * 8 > len(self.source):
+            # 结果很多时按原有顺序筛选比排序快
+            return list(filter(matches.__contains__, self.source))
+        return sorted(matches)
+
+    def top_hit(self, query, names):
+        """从搜索结果中挑出最可能要找的账号：用户名完全相同 > 卡号完全相同 > 用户名前缀 > 排序第一"""
+        if not names:
+            return None
+        query = query.strip()
+        if query in self.source:
+            return query
+        owner = self.source.owner_of(query)
+        if owner is not None:
+            return owner
+        folded = _fold(query)
+        for username in names:
+            if _fold(username).startswith(folded):
+                return username
+        return names[0]
@@ -0,0 +1,487 @@
+# --- 账号存储引擎 ---
+# 每次增删改只在日志末尾追加一条带校验的记录，不再整体重写 accounts.json。
+#
+# LauncherConfig/
+#   accounts.snapshot.json   快照 {"seq": 已包含的最后一条记录序号, "accounts": {...}}
+#   accounts.wal             追加日志，每行一条记录: "<crc32 十六进制> <json>\n"
+#   accounts.wal.compacting  压缩进行中被冻结的旧日志
+#   accounts.json            兼容旧版本/外部工具的导出文件，每次压缩后更新
+#   accounts.idx             (可选) 二进制索引，见 account_index.py，每次压缩后重建
+#
+# 加载 = 快照 + 依次重放 .compacting 和 .wal 中 seq 更大的记录；
+# 日志末尾校验失败的记录 (写到一半断电) 会被丢弃。
+# 压缩在后台进行 (调用线程只取写时复制的快照，O(1))，快照和 accounts.json 都先写临时文件再 os.replace。
+import json
+import os
+import threading
+import zlib
+
+import event_log
+from account_store import AccountStore, AccountConflictError
+from file_lock import FileLock
+from account_index import MappedAccountIndex, build_account_index
+
+SNAPSHOT_FILE_NAME = 'accounts.snapshot.json'
+INDEX_FILE_NAME = 'accounts.idx'
+WAL_FILE_NAME = 'accounts.wal'
+WRITER_LOCK_FILE_NAME = 'accounts.lock'
+WRITER_LOCK_TIMEOUT = 1.0   # 给正在退出的另一个实例留出完成压缩的时间
+COMPACTING_SUFFIX = '.compacting'
+COMPACT_AFTER_RECORDS = 500            # 日志累计这么多条记录后触发后台压缩
+COMPACT_AFTER_BYTES = 1024 * 1024      # 或日志超过这个大小
+
+
+class StorageError(Exception):
+    """账号数据无法读取或写入"""
+
+
+def write_file_atomic(path, data, fsync=True):
+    """写入临时文件后 os.replace 覆盖目标，读者只会看到旧内容或新内容"""
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def encode_record(record):
+    payload = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+
+def read_records(path):
+    """读取日志中所有校验通过的记录，返回 (记录列表, 有效内容的字节数)"""
+    records = []
+    valid_bytes = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b"\n") or len(line) < 10 or line[8:9] != b" ":
+                break
+            payload = line[9:-1]
+            try:
+                if int(line[:8], 16) != zlib.crc32(payload):
+                    break
+                records.append(json.loads(payload.decode('utf-8')))
+            except ValueError:
+                break
+            valid_bytes += len(line)
+    return records, valid_bytes
+
+
+def apply_op(store, op):
+    """把一条日志操作应用到 AccountStore"""
+    kind = op[0]
+    if kind == 'add':
+        store.add(op[1], op[2])
+    elif kind == 'rename':
+        store.rename(op[1], op[2])
+    elif kind == 'set_card':
+        store.set_card(op[1], op[2])
+    elif kind == 'delete':
+        store.delete(op[1])
+    else:
+        raise ValueError(f"未知的日志操作: {kind}")
+
+
+def change_to_op(change):
+    """AccountChange -> 日志操作"""
+    if change.op == 'add':
+        return ['add', change.username, change.card_id]
+    if change.op == 'rename':
+        return ['rename', change.old_username, change.username]
+    if change.op == 'set_card':
+        return ['set_card', change.username, change.card_id]
+    return ['delete', change.username]
+
+
+def load_accounts_json(path):
+    """读取旧格式 accounts.json ({用户名: 卡号})"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    accounts_data = json.loads(content) if content.strip() else {}
+    if not isinstance(accounts_data, dict):
+        raise ValueError("账号文件格式不正确")
+    return accounts_data
+
+
+def dump_accounts_json(accounts_data):
+    return json.dumps(accounts_data, indent=4, ensure_ascii=False).encode('utf-8')
+
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+class AccountJournal:
+    """账号日志存储：load() 得到 AccountStore，attach() 后其修改自动追加到日志"""
+
+    def __init__(self, data_dir, json_path, fsync=True):
+        self.data_dir = data_dir
+        self.json_path = json_path
+        self.snapshot_path = os.path.join(data_dir, SNAPSHOT_FILE_NAME)
+        self.wal_path = os.path.join(data_dir, WAL_FILE_NAME)
+        self.compacting_path = self.wal_path + COMPACTING_SUFFIX
+        self.index_path = None      # enable_index() 后压缩时同时重建二进制索引
+        self.fsync = fsync
+        self.on_error = None        # 写日志失败时回调 on_error(exception)
+        # 设置后日志行交给它在后台按提交顺序写入：write_behind(func, *args) 返回 Future
+        self.write_behind = None
+        self._last_write = None
+        self.store = None
+        self.seq = 0
+        self._wal = None
+        self._wal_records = 0
+        self._wal_bytes = 0
+        self._pending = None        # 事务中缓冲的操作
+        self._tx_depth = 0
+        self._lock = threading.Lock()
+        self._compact_thread = None
+        self._compact_job = None    # 交给 write_behind 的压缩任务 (Future)
+        # 可写加载时取得写入锁并一直持有，同一时间只有一个进程写日志、快照和 accounts.json
+        self._writer_lock = FileLock(os.path.join(data_dir, WRITER_LOCK_FILE_NAME))
+        self.locked_out = False     # 写入锁被其他进程持有，本次只读
+
+    # --- 加载 ---
+    def load(self, read_only=False):
+        """读取快照并重放日志，返回 (AccountStore, 警告信息列表)
+
+        read_only 为 True 时不截断损坏的日志末尾、不打开日志、不生成快照，
+        可以在另一个进程 (图形界面) 正在使用存储时安全地读取。
+        """
+        warnings = []
+        acquired = False # 写入锁是本次加载取得的
+        if not read_only:
+            held = self._writer_lock.locked
+            if not self._writer_lock.acquire(timeout=WRITER_LOCK_TIMEOUT):
+                read_only = True
+                self.locked_out = True
+                warnings.append("账号数据正被另一个启动器进程使用，本次为只读，对账号的修改不会被保存。")
+            else:
+                acquired = not held
+        store = self.store
+        try:
+            return self._load(read_only, warnings)
+        except BaseException:
+            if acquired:
+                # 加载失败时释放写入锁，否则本进程一直持有 accounts.lock，之后的写入者都只能只读打开
+                if self._wal is not None:
+                    self._wal.close()
+                    self._wal = None
+                self.store = store
+                self._writer_lock.release()
+            raise
+
+    def _load(self, read_only, warnings):
+        snapshot_seq = 0
+        accounts_data = {}
+        export_signature = None
+        snapshot_mtime = None
+        try:
+            if os.path.exists(self.snapshot_path):
+                with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                    snapshot = json.load(f)
+                snapshot_seq = snapshot.get("seq", 0)
+                accounts_data = snapshot.get("accounts", {})
+                export_signature = snapshot.get("export_signature")
+                snapshot_mtime = os.stat(self.snapshot_path).st_mtime_ns
+            elif os.path.exists(self.json_path):
+                # 第一次使用日志存储：从旧版 accounts.json 导入
+                accounts_data = load_accounts_json(self.json_path)
+        except (OSError, ValueError) as e:
+            raise StorageError(f"读取账号快照失败: {e}")
+
+        store = AccountStore()
+        for username, card_id in store.update_from_dict(accounts_data):
+            warnings.append(f"卡号重复，已忽略: {username}: {card_id}")
+
+        # accounts.json 在最近一次导出之后被外部修改 (手动编辑或旧版本启动器写入)：以它为准
+        json_signature = _file_signature(self.json_path)
+        externally_modified = (snapshot_mtime is not None and json_signature is not None
+                               and json_signature[0] > snapshot_mtime and json_signature != export_signature)
+        if externally_modified:
+            try:
+                accounts_data = load_accounts_json(self.json_path)
+            except (OSError, ValueError) as e:
+                raise StorageError(f"读取账号文件 '{self.json_path}' 失败: {e}")
+            store = AccountStore()
+            for username, card_id in store.update_from_dict(accounts_data):
+                warnings.append(f"卡号重复，已忽略: {username}: {card_id}")
+            warnings.append("accounts.json 已被外部修改，已重新导入 (其后的日志记录被忽略)。")
+
+        self.seq = snapshot_seq
+        replayed = 0
+        for path in (self.compacting_path, self.wal_path):
+            if not os.path.exists(path):
+                continue
+            try:
+                records, valid_bytes = read_records(path)
+            except OSError as e:
+                raise StorageError(f"读取账号日志 '{path}' 失败: {e}")
+            if valid_bytes != os.path.getsize(path) and not read_only:
+                warnings.append(f"日志 '{os.path.basename(path)}' 末尾有损坏的记录，已丢弃。")
+                with open(path, 'r+b') as f:
+                    f.truncate(valid_bytes)
+            for record in records:
+                seq = record.get("seq", 0)
+                if seq <= self.seq:
+                    continue
+                self.seq = seq
+                if externally_modified:
+                    continue
+                for op in record.get("ops", []):
+                    try:
+                        apply_op(store, op)
+                    except (AccountConflictError, KeyError, ValueError, IndexError) as e:
+                        warnings.append(f"跳过无法应用的日志记录 {op}: {e}")
+                replayed += 1
+
+        if read_only:
+            event_log.emit(event_log.LOAD, f"账号已读取: {len(store)} 个 (重放日志 {replayed} 条)", count=len(store), replayed=replayed)
+            return store, warnings
+        self._open_wal()
+        if snapshot_mtime is None or externally_modified:
+            # 导入旧数据后立即生成快照，之后就不再依赖 accounts.json 的内容
+            self.store = store
+            self.compact(background=False)
+        event_log.emit(event_log.LOAD, f"账号已加载: {len(store)} 个 (重放日志 {replayed} 条)", count=len(store), replayed=replayed)
+        return store, warnings
+
+    # --- 二进制索引 ---
+    def enable_index(self):
+        self.index_path = os.path.join(self.data_dir, INDEX_FILE_NAME)
+
+    def index_is_fresh(self):
+        """索引存在，且比快照和 accounts.json 都新，日志中也没有未压缩的记录"""
+        try:
+            index_mtime = os.stat(self.index_path).st_mtime_ns
+            if os.stat(self.snapshot_path).st_mtime_ns > index_mtime:
+                return False
+            if os.path.exists(self.json_path) and os.stat(self.json_path).st_mtime_ns > index_mtime:
+                return False
+            if os.path.exists(self.wal_path) and os.path.getsize(self.wal_path) > 0:
+                return False
+        except OSError:
+            return False
+        return not os.path.exists(self.compacting_path)
+
+    def open_index(self):
+        """索引可用时返回 MappedAccountIndex，否则返回 None (需完整加载后在后台重建)"""
+        if self.index_path is None or not self.index_is_fresh():
+            return None
+        try:
+            return MappedAccountIndex(self.index_path)
+        except (OSError, ValueError) as e:
+            event_log.warning(event_log.LOAD, f"打开账号索引失败: {e}")
+            return None
+
+    def attach(self, store):
+        """订阅 store 的修改，之后每次修改都追加到日志"""
+        if self.locked_out:
+            event_log.warning(event_log.LOAD, "账号数据由其他进程写入，不挂接日志")
+            return
+        self.store = store
+        store.subscribe(self._on_change)
+
+    # --- 写入 ---
+    def transaction(self):
+        """with journal.transaction(): 其中的所有修改合并为一条日志记录写入"""
+        return _Transaction(self)
+
+    def _on_change(self, change):
+        op = change_to_op(change)
+        if self._pending is not None:
+            self._pending.append(op)
+        else:
+            self._append([op])
+
+    def _append(self, ops):
+        self.seq += 1
+        line = encode_record({"seq": self.seq, "ops": ops})
+        if self.write_behind is not None:
+            # 写入和 fsync 在后台进行，失败由 write_behind 的提交者处理
+            self._last_write = self.write_behind(self._write_line_logged, line)
+        else:
+            try:
+                self._write_line(line)
+            except OSError as e:
+                event_log.error(event_log.SAVE, f"写入账号日志失败: {e}")
+                if self.on_error:
+                    self.on_error(e)
+                return
+        self._wal_records += 1
+        self._wal_bytes += len(line)
+        if self._wal_records >= COMPACT_AFTER_RECORDS or self._wal_bytes >= COMPACT_AFTER_BYTES:
+            self.compact()
+
+    def _write_line(self, line):
+        if self._wal is None:
+            self._open_wal()
+        self._wal.write(line)
+        self._wal.flush()
+        if self.fsync:
+            os.fsync(self._wal.fileno())
+
+    def _write_line_logged(self, line):
+        try:
+            self._write_line(line)
+        except OSError as e:
+            event_log.error(event_log.SAVE, f"写入账号日志失败: {e}")
+            raise
+
+    def _wait_for_writes(self):
+        """等待后台写入的日志行全部落盘 (按顺序执行，等最后一个即可)"""
+        future, self._last_write = self._last_write, None
+        if future is not None:
+            import concurrent.futures # 只有设置了 write_behind 时才会用到，命令行模式不必导入
+            concurrent.futures.wait([future])
+
+    def _open_wal(self):
+        self._wal = open(self.wal_path, 'ab')
+        self._wal_bytes = self._wal.tell()
+
+    # --- 压缩 ---
+    def compact(self, background=True):
+        """把当前数据写成新快照并导出 accounts.json，然后丢弃已包含的日志
+
+        调用线程只取 store 的写时复制快照 (O(1))。background 为 True 且设置了 write_behind 时，
+        冻结日志、生成快照内容和写文件作为一个任务排在已提交的日志行之后，不在调用线程中等待它们落盘；
+        没有 write_behind 时当场冻结日志，其余在单独的线程中进行。
+        """
+        if self.locked_out:
+            return
+        with self._lock:
+            if self._compact_thread is not None and self._compact_thread.is_alive():
+                return
+            if self._compact_job is not None and not self._compact_job.done():
+                return
+            snapshot = self.store.copy() if self.store is not None else None
+            seq = self.seq
+            self._wal_records = 0
+            if background and self.write_behind is not None:
+                self._wal_bytes = 0
+                self._compact_job = self._last_write = self.write_behind(self._compact_in_order, snapshot, seq)
+                return
+            try:
+                self._wait_for_writes()
+                self._freeze_wal()
+            except OSError as e:
+                # 日志仍然可写，之后的修改照常追加，下次再压缩
+                event_log.error(event_log.SAVE, f"压缩账号日志失败: {e}")
+                if self.on_error:
+                    self.on_error(e)
+                return
+            if background:
+                self._compact_thread = threading.Thread(
+                    target=self._write_snapshot_of, args=(snapshot, seq), name="AccountCompaction")
+                self._compact_thread.start()
+        if not background:
+            self._write_snapshot_of(snapshot, seq)
+
+    def _compact_in_order(self, snapshot, seq):
+        """write_behind 的串行线程中执行：之前提交的日志行都已写入"""
+        try:
+            self._freeze_wal()
+        except OSError as e:
+            event_log.error(event_log.SAVE, f"压缩账号日志失败: {e}")
+            raise # 由 write_behind 的提交者 (在界面线程中) 调用 on_error
+        self._write_snapshot_of(snapshot, seq)
+
+    def _freeze_wal(self):
+        """把当前日志移到 .compacting (已存在则追加进去)，然后开始一个新的空日志
+
+        调用前之前的日志行必须已写入。失败时抛出 OSError，日志保持打开，之后的写入不受影响。
+        """
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+        try:
+            if os.path.exists(self.wal_path):
+                if os.path.exists(self.compacting_path):
+                    with open(self.wal_path, 'rb') as src, open(self.compacting_path, 'ab') as dst:
+                        dst.write(src.read())
+                    os.remove(self.wal_path)
+                else:
+                    os.replace(self.wal_path, self.compacting_path)
+        finally:
+            self._open_wal()
+
+    def _write_snapshot_of(self, snapshot, seq):
+        self._write_snapshot(snapshot.to_dict() if snapshot is not None else {}, seq)
+
+    def _write_snapshot(self, accounts_data, seq):
+        try:
+            # 先准备好导出文件，记下其签名写进快照，最后再替换 accounts.json
+            export_tmp = f"{self.json_path}.tmp{os.getpid()}"
+            with open(export_tmp, 'wb') as f:
+                f.write(dump_accounts_json(accounts_data))
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            snapshot = {"seq": seq, "accounts": accounts_data, "export_signature": _file_signature(export_tmp)}
+            write_file_atomic(self.snapshot_path, json.dumps(snapshot, ensure_ascii=False).encode('utf-8'), self.fsync)
+            os.replace(export_tmp, self.json_path)
+            if os.path.exists(self.compacting_path):
+                os.remove(self.compacting_path)
+            event_log.emit(event_log.SAVE, f"账号快照已更新: {len(accounts_data)} 个 (seq {seq})", count=len(accounts_data), seq=seq)
+        except OSError as e:
+            # 失败时 .compacting 保留，下次加载/压缩时仍会被重放
+            event_log.error(event_log.SAVE, f"压缩账号日志失败: {e}")
+            return
+        if self.index_path is not None:
+            try:
+                build_account_index(accounts_data, self.index_path)
+            except OSError as e:
+                # 例如 Windows 上索引仍被其他进程映射；下次压缩时再重建
+                event_log.error(event_log.SAVE, f"重建账号索引失败: {e}")
+
+    def export_json(self, path):
+        """导出为旧格式 accounts.json"""
+        write_file_atomic(path, dump_accounts_json(self.store.to_dict()), self.fsync)
+
+    def close(self):
+        """等待后台压缩结束；日志里还有记录时同步压缩一次，保证 accounts.json 为最新"""
+        thread = self._compact_thread
+        if thread is not None:
+            thread.join()
+        self._wait_for_writes()
+        if self._wal_records and self.store is not None:
+            self.compact(background=False)
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+        self._writer_lock.release()
+
+
+class _Transaction:
+    def __init__(self, journal):
+        self.journal = journal
+
+    def __enter__(self):
+        journal = self.journal
+        if journal._tx_depth == 0:
+            journal._pending = []
+        journal._tx_depth += 1
+        return journal
+
+    def __exit__(self, exc_type, exc, tb):
+        journal = self.journal
+        journal._tx_depth -= 1
+        if journal._tx_depth == 0:
+            ops, journal._pending = journal._pending, None
+            # 即使中途出错，已应用到内存的修改也要落盘，保持与界面一致
+            if ops:
+                journal._append(ops)
+        return False
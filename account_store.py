@@ -0,0 +1,767 @@
+# --- 账号数据存储 ---
+# 紧凑的账号表：每个账号占一个固定的槽位，卡号打包成定长记录存在 bytearray 中；
+# 按用户名排序的 (驻留) 用户名列表 + 同序的槽位号数组负责排序和按用户名查找，
+# 卡号 -> 槽位 的反向索引是 array 里的开放寻址哈希表，
+# 保证 "一个用户名只对应一个卡号、一个卡号只属于一个用户名"。
+# 修改时通知订阅者增量更新界面；copy() 为写时复制，打开管理窗口等场景不再整表复制。
+# AccountEditSession 在只读的基础表上叠加修改，只记录差异，确认后再一次性提交。
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from heapq import merge
+
+
+# --- 卡号打包 ---
+# Aime 卡号一般是 20 位数字，打包成定长 10 字节: [位数 1 字节][数值 9 字节大端]，
+# 位数单独保存以保留前导 0。非纯数字或超过 20 位的卡号无法打包。
+CARD_RECORD_SIZE = 10
+MAX_PACKED_DIGITS = 20
+
+
+def pack_card_id(card_id):
+    """卡号 -> 10 字节；无法打包时返回 None"""
+    if not (0 < len(card_id) <= MAX_PACKED_DIGITS and card_id.isdigit() and card_id.isascii()):
+        return None
+    return bytes((len(card_id),)) + int(card_id).to_bytes(CARD_RECORD_SIZE - 1, 'big')
+
+
+def unpack_card_id(record):
+    """10 字节 -> 卡号"""
+    return str(int.from_bytes(record[1:CARD_RECORD_SIZE], 'big')).zfill(record[0])
+
+
+STRING_CARD_RECORD = b"\xff" * CARD_RECORD_SIZE  # 无法打包的卡号在卡号列中的占位
+
+
+def card_key(card_id):
+    """反向索引的键：可打包的卡号用整数 (比 20 位字符串省内存)，否则用字符串本身"""
+    packed = pack_card_id(card_id)
+    return card_id if packed is None else int.from_bytes(packed, 'big')
+
+
+class AccountConflictError(ValueError):
+    """用户名或卡号已被占用"""
+
+
+class AccountChange:
+    """一次账号修改的描述，供界面增量刷新使用
+
+    op: 'add' / 'rename' / 'set_card' / 'delete'
+    old_index: 修改前该行在排序列表中的位置 (add 时为 None)
+    new_index: 修改后该行在排序列表中的位置 (delete 时为 None)
+    """
+    __slots__ = ('op', 'username', 'card_id', 'old_username', 'old_card_id', 'old_index', 'new_index')
+
+    def __init__(self, op, username, card_id, old_username=None, old_card_id=None, old_index=None, new_index=None):
+        self.op = op
+        self.username = username
+        self.card_id = card_id
+        self.old_username = old_username if old_username is not None else username
+        self.old_card_id = old_card_id if old_card_id is not None else card_id
+        self.old_index = old_index
+        self.new_index = new_index
+
+    def __repr__(self):
+        return (f"AccountChange({self.op!r}, {self.old_username!r}->{self.username!r}, "
+                f"{self.old_card_id!r}->{self.card_id!r}, {self.old_index}->{self.new_index})")
+
+
+class AccountRecord:
+    """一行账号数据"""
+    __slots__ = ('username', 'card_id')
+
+    def __init__(self, username, card_id):
+        self.username = username
+        self.card_id = card_id
+
+    def __iter__(self):
+        return iter((self.username, self.card_id))
+
+    def __repr__(self):
+        return f"AccountRecord({self.username!r}, {self.card_id!r})"
+
+
+_EMPTY = -1
+_MIN_HASH_BITS = 4
+BULK_ADD_THRESHOLD = 64  # 提交编辑会话时，连续这么多个新增改用 add_many 一次合并
+
+
+def _hash_slot(key, bits):
+    """Fibonacci 散列，把任意 hash() 值映射到 2**bits 个桶"""
+    return ((hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> (64 - bits)
+
+
+class _AccountTable:
+    """AccountStore 的实际数据，可被多个 AccountStore 共享 (写时复制)"""
+    __slots__ = ('names', 'order', 'slot_names', 'cards', 'card_strings', 'free',
+                 'buckets', 'bits', 'refs')
+
+    def __init__(self):
+        self.names = []              # 按用户名排序，驻留字符串
+        self.order = array('I')      # 与 names 同序的槽位号
+        self.slot_names = []         # 槽位 -> 用户名 (空闲槽位为 None)
+        self.cards = bytearray()     # 槽位 -> 卡号记录，每个 CARD_RECORD_SIZE 字节
+        self.card_strings = {}       # 槽位 -> 无法打包的卡号 (罕见)
+        self.free = []               # 空闲槽位
+        self.bits = _MIN_HASH_BITS
+        self.buckets = array('i', [_EMPTY]) * (1 << self.bits)  # 卡号哈希表，存槽位号
+        self.refs = 1
+
+    def clone(self):
+        table = _AccountTable()
+        table.names = self.names.copy()
+        table.order = array('I', self.order)
+        table.slot_names = self.slot_names.copy()
+        table.cards = bytearray(self.cards)
+        table.card_strings = self.card_strings.copy()
+        table.free = self.free.copy()
+        table.bits = self.bits
+        table.buckets = array('i', self.buckets)
+        return table
+
+    # --- 槽位 ---
+    def card_at(self, slot):
+        at = slot * CARD_RECORD_SIZE
+        record = self.cards[at:at + CARD_RECORD_SIZE]
+        if record == STRING_CARD_RECORD:
+            return self.card_strings[slot]
+        return unpack_card_id(record)
+
+    def key_at(self, slot):
+        at = slot * CARD_RECORD_SIZE
+        record = self.cards[at:at + CARD_RECORD_SIZE]
+        if record == STRING_CARD_RECORD:
+            return self.card_strings[slot]
+        return int.from_bytes(record, 'big')
+
+    def store_card(self, slot, card_id):
+        packed = pack_card_id(card_id)
+        if packed is None:
+            self.card_strings[slot] = card_id
+            packed = STRING_CARD_RECORD
+        else:
+            self.card_strings.pop(slot, None)
+        at = slot * CARD_RECORD_SIZE
+        if at == len(self.cards):
+            self.cards += packed
+        else:
+            self.cards[at:at + CARD_RECORD_SIZE] = packed
+
+    def allocate_slot(self, username):
+        if self.free:
+            slot = self.free.pop()
+            self.slot_names[slot] = username
+        else:
+            slot = len(self.slot_names)
+            self.slot_names.append(username)
+        return slot
+
+    def release_slot(self, slot):
+        self.slot_names[slot] = None
+        self.card_strings.pop(slot, None)
+        self.free.append(slot)
+
+    # --- 卡号哈希表 (线性探测) ---
+    def find_slot(self, key):
+        buckets = self.buckets
+        mask = len(buckets) - 1
+        i = _hash_slot(key, self.bits)
+        while True:
+            slot = buckets[i]
+            if slot == _EMPTY:
+                return None
+            if self.key_at(slot) == key:
+                return slot
+            i = (i + 1) & mask
+
+    def reserve(self, count):
+        """保证容纳 count 个卡号时负载因子不超过 1/2"""
+        if count * 2 > len(self.buckets):
+            self.rehash(self.bits + 1)
+
+    def hash_insert(self, key, slot):
+        buckets = self.buckets
+        mask = len(buckets) - 1
+        i = _hash_slot(key, self.bits)
+        while buckets[i] != _EMPTY:
+            i = (i + 1) & mask
+        buckets[i] = slot
+
+    def hash_delete(self, key):
+        buckets = self.buckets
+        mask = len(buckets) - 1
+        i = _hash_slot(key, self.bits)
+        while self.key_at(buckets[i]) != key:
+            i = (i + 1) & mask
+        buckets[i] = _EMPTY
+        # 向后移动同一探测链上的后续条目，保证查找不会提前遇到空桶
+        j = i
+        while True:
+            j = (j + 1) & mask
+            slot = buckets[j]
+            if slot == _EMPTY:
+                return
+            home = _hash_slot(self.key_at(slot), self.bits)
+            if (j > i and (home <= i or home > j)) or (j < i and home <= i and home > j):
+                buckets[i] = slot
+                buckets[j] = _EMPTY
+                i = j
+
+    def rehash(self, bits):
+        self.bits = bits
+        self.buckets = array('i', [_EMPTY]) * (1 << bits)
+        buckets = self.buckets
+        mask = len(buckets) - 1
+        for slot in self.order:
+            i = _hash_slot(self.key_at(slot), bits)
+            while buckets[i] != _EMPTY:
+                i = (i + 1) & mask
+            buckets[i] = slot
+
+
+class AccountStore:
+    """双向账号表：按卡号查找为 O(1)，按用户名查找/排序位置为 O(log n)"""
+    __slots__ = ('_table', '_listeners', '__weakref__')
+
+    def __init__(self, accounts=None):
+        self._table = _AccountTable()
+        self._listeners = []
+        if accounts:
+            self.update_from_dict(accounts)
+
+    def __del__(self):
+        table = getattr(self, '_table', None)
+        if table is not None:
+            table.refs -= 1
+
+    def update_from_dict(self, accounts):
+        """从 {用户名: 卡号} 字典载入数据，返回因卡号重复而跳过的 (用户名, 卡号) 列表"""
+        skipped = []
+        merged = dict(self.items())
+        used_cards = {card_key(card_id) for card_id in merged.values()}
+        for username, card_id in accounts.items():
+            username = str(username)
+            card_id = str(card_id)
+            key = card_key(card_id)
+            if username in merged or key in used_cards:
+                skipped.append((username, card_id))
+                continue
+            merged[username] = card_id
+            used_cards.add(key)
+        del used_cards
+
+        # 一次性按排序结果构建各列，旧数据可能仍被其他副本共享，只释放引用
+        self._table.refs -= 1
+        table = _AccountTable()
+        intern = sys.intern
+        table.names = [intern(username) for username in sorted(merged)]
+        table.slot_names = table.names.copy()
+        table.order = array('I', range(len(table.names)))
+        records = []
+        for slot, username in enumerate(table.names):
+            card_id = merged[username]
+            packed = pack_card_id(card_id)
+            if packed is None:
+                table.card_strings[slot] = card_id
+                packed = STRING_CARD_RECORD
+            records.append(packed)
+        table.cards = bytearray(b"".join(records))
+        bits = _MIN_HASH_BITS
+        while (1 << bits) < len(table.names) * 2:
+            bits += 1
+        table.rehash(bits)
+        self._table = table
+        return skipped
+
+    # --- 修改通知 ---
+    def subscribe(self, callback):
+        """注册回调 callback(change: AccountChange)，每次修改后调用"""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, change):
+        for callback in list(self._listeners):
+            callback(change)
+
+    # --- 行操作 ---
+    def _row_of(self, username):
+        names = self._table.names
+        row = bisect_left(names, username)
+        if row < len(names) and names[row] == username:
+            return row
+        return None
+
+    def _writable(self):
+        """修改前调用：数据仍与其他副本共享时先复制一份"""
+        table = self._table
+        if table.refs > 1:
+            table.refs -= 1
+            self._table = table.clone()
+        return self._table
+
+    def _insert_row(self, username, slot):
+        table = self._table
+        row = bisect_left(table.names, username)
+        table.names.insert(row, username)
+        table.order.insert(row, slot)
+        return row
+
+    # --- 查询 ---
+    def __len__(self):
+        return len(self._table.names)
+
+    def __contains__(self, username):
+        return self._row_of(username) is not None
+
+    def __iter__(self):
+        return iter(self._table.names)
+
+    def items(self):
+        table = self._table
+        for username, slot in zip(table.names, table.order):
+            yield username, table.card_at(slot)
+
+    def records(self):
+        for username, card_id in self.items():
+            yield AccountRecord(username, card_id)
+
+    def get(self, username, default=None):
+        row = self._row_of(username)
+        return default if row is None else self._table.card_at(self._table.order[row])
+
+    def owner_of(self, card_id):
+        """返回持有该卡号的用户名，没有则返回 None"""
+        slot = self._table.find_slot(card_key(card_id))
+        return None if slot is None else self._table.slot_names[slot]
+
+    def has_card(self, card_id):
+        return self._table.find_slot(card_key(card_id)) is not None
+
+    def sorted_names(self):
+        """按用户名排序的列表 (只读，不要修改)"""
+        return self._table.names
+
+    def name_at(self, index):
+        return self._table.names[index]
+
+    def bisect_left(self, username):
+        """用户名在排序表中的插入位置"""
+        return bisect_left(self._table.names, username)
+
+    def index_of(self, username):
+        """返回用户名在排序列表中的位置，不存在则返回 None"""
+        return self._row_of(username)
+
+    # --- 修改 ---
+    def add(self, username, card_id):
+        if username in self:
+            raise AccountConflictError(f"用户名 '{username}' 已存在")
+        owner = self.owner_of(card_id)
+        if owner is not None:
+            raise AccountConflictError(f"卡号 '{card_id}' 已属于 '{owner}'")
+        table = self._writable()
+        table.reserve(len(table.names) + 1)
+        username = sys.intern(username)
+        slot = table.allocate_slot(username)
+        table.store_card(slot, card_id)
+        table.hash_insert(card_key(card_id), slot)
+        index = self._insert_row(username, slot)
+        self._notify(AccountChange('add', username, card_id, new_index=index))
+
+    def add_many(self, accounts):
+        """批量添加 [(用户名, 卡号), ...]，排序表只合并一次 (逐个 add 每次都要在列表中间插入)
+
+        全部检查通过才修改，有冲突时抛出 AccountConflictError 且不做任何修改。
+        修改通知按用户名顺序逐个发出，new_index 为最终位置 (按此顺序依次插入即得到最终列表)。
+        """
+        accounts = sorted(accounts)
+        names = set()
+        keys = {}
+        for username, card_id in accounts:
+            if username in names or username in self:
+                raise AccountConflictError(f"用户名 '{username}' 已存在")
+            key = card_key(card_id)
+            if key in keys or self._table.find_slot(key) is not None:
+                raise AccountConflictError(f"卡号 '{card_id}' 已被占用")
+            names.add(username)
+            keys[key] = card_id
+        if not accounts:
+            return
+        table = self._writable()
+        bits = table.bits
+        while (1 << bits) < (len(table.names) + len(accounts)) * 2:
+            bits += 1
+        if bits != table.bits:
+            table.rehash(bits)
+        rows = []
+        for (username, card_id), key in zip(accounts, keys):
+            username = sys.intern(username)
+            slot = table.allocate_slot(username)
+            table.store_card(slot, card_id)
+            table.hash_insert(key, slot)
+            rows.append((username, slot))
+        # 按插入点把原表分段整块复制 (C 层面的切片)，段之间放入新行；
+        # 第 i 个新用户名的最终位置 = i + 原表中排在它前面的用户名数
+        old_names, old_order = table.names, table.order
+        names = []
+        order = array('I')
+        new_indexes = []
+        start = 0
+        for i, (username, slot) in enumerate(rows):
+            at = bisect_left(old_names, username, start)
+            names += old_names[start:at]
+            order += old_order[start:at]
+            new_indexes.append(len(names))
+            names.append(username)
+            order.append(slot)
+            start = at
+        names += old_names[start:]
+        order += old_order[start:]
+        table.names = names
+        table.order = order
+        for (username, card_id), index in zip(accounts, new_indexes):
+            self._notify(AccountChange('add', username, card_id, new_index=index))
+
+    def rename(self, old_username, new_username):
+        """保持卡号不变，修改用户名 (槽位和卡号索引都不用动)"""
+        old_index = self._row_of(old_username)
+        if old_index is None:
+            raise KeyError(old_username)
+        if new_username == old_username:
+            return
+        if new_username in self:
+            raise AccountConflictError(f"用户名 '{new_username}' 已存在")
+        table = self._writable()
+        new_username = sys.intern(new_username)
+        del table.names[old_index]
+        slot = table.order.pop(old_index)
+        table.slot_names[slot] = new_username
+        new_index = self._insert_row(new_username, slot)
+        self._notify(AccountChange('rename', new_username, table.card_at(slot), old_username=old_username,
+                                   old_index=old_index, new_index=new_index))
+
+    def set_card(self, username, card_id):
+        """保持用户名不变，修改其关联的卡号"""
+        index = self._row_of(username)
+        if index is None:
+            raise KeyError(username)
+        old_card_id = self._table.card_at(self._table.order[index])
+        if card_id == old_card_id:
+            return
+        owner = self.owner_of(card_id)
+        if owner is not None:
+            raise AccountConflictError(f"卡号 '{card_id}' 已属于 '{owner}'")
+        table = self._writable()
+        slot = table.order[index]
+        table.hash_delete(card_key(old_card_id))
+        table.store_card(slot, card_id)
+        table.hash_insert(card_key(card_id), slot)
+        self._notify(AccountChange('set_card', username, card_id, old_card_id=old_card_id,
+                                   old_index=index, new_index=index))
+
+    def delete(self, username):
+        """删除账号，返回其卡号"""
+        index = self._row_of(username)
+        if index is None:
+            raise KeyError(username)
+        table = self._writable()
+        del table.names[index]
+        slot = table.order.pop(index)
+        card_id = table.card_at(slot)
+        table.hash_delete(card_key(card_id))
+        table.release_slot(slot)
+        self._notify(AccountChange('delete', username, card_id, old_index=index))
+        return card_id
+
+    def sync_from(self, other):
+        """把本表修改成与 other 相同，只对有差异的账号发出修改通知"""
+        removed = [(username, card_id) for username, card_id in self.items()
+                   if other.get(username) != card_id]
+        added = [(username, card_id) for username, card_id in other.items()
+                 if self.get(username) != card_id]
+        new_owner_of_card = {card_id: username for username, card_id in added}
+        renamed_to = set()
+        # 先处理消失的条目：卡号仍在且新用户名空闲的视为重命名，其余删除
+        for username, card_id in removed:
+            new_username = new_owner_of_card.get(card_id)
+            if new_username is not None and new_username not in self:
+                self.rename(username, new_username)
+                renamed_to.add(new_username)
+            else:
+                self.delete(username)
+        # 此时旧条目占用的用户名和卡号都已释放，新增不会冲突
+        for username, card_id in added:
+            if username not in renamed_to:
+                self.add(username, card_id)
+
+    # --- 导出 ---
+    def to_dict(self):
+        return dict(self.items())
+
+    def copy(self):
+        """写时复制：与本表共享数据，任一方第一次修改时才真正复制"""
+        clone = AccountStore()
+        clone._table.refs -= 1
+        clone._table = self._table
+        self._table.refs += 1
+        return clone
+
+
+# --- 添加/修改账号的规则 ---
+# 账号管理窗口的“添加/修改”和批量导入共用
+EDIT_UNCHANGED = 'unchanged'  # 用户名和卡号与现有记录完全一致
+EDIT_ADD = 'add'              # 用户名和卡号都是新的
+EDIT_SET_CARD = 'set_card'    # 用户名已存在，卡号未被使用：修改其卡号
+EDIT_RENAME = 'rename'        # 卡号已存在，用户名是新的：重命名卡号的所属用户
+EDIT_CONFLICT = 'conflict'    # 用户名已存在，卡号属于另一个用户
+
+
+def classify_edit(accounts, username, card_id):
+    """按现有数据判断“用户名 + 卡号”这条输入会做什么，返回 (EDIT_*, 相关信息)
+
+    相关信息：EDIT_SET_CARD 为原卡号，EDIT_RENAME 和 EDIT_CONFLICT 为卡号当前的所属用户。
+    只使用正反向索引 (均为 O(1) 或 O(log n))。
+    """
+    current_id_of_username = accounts.get(username)
+    current_owner_of_id = accounts.owner_of(card_id)
+    if current_id_of_username is None:
+        if current_owner_of_id is None:
+            return EDIT_ADD, None
+        return EDIT_RENAME, current_owner_of_id
+    if current_id_of_username == card_id:
+        return EDIT_UNCHANGED, None
+    if current_owner_of_id is None:
+        return EDIT_SET_CARD, current_id_of_username
+    return EDIT_CONFLICT, current_owner_of_id
+
+
+# --- 编辑会话 ---
+class AccountEditSession:
+    """在只读基础表上记录增删改的编辑会话
+
+    基础表本身不被修改 (持有的是 base.copy() 的写时复制快照)，修改只保存在叠加层中：
+    被删除/改名/改卡号的基础表账号记在 _hidden (基础表行号，有序)，
+    新的或修改后的账号记在 _added。查询接口与 AccountStore 相同，
+    修改按顺序记入 changes，commit_to() 时重放到目标表。
+    """
+
+    def __init__(self, base):
+        self._base = base.copy()
+        self._removed = set()       # 被隐藏的基础表用户名
+        self._hidden = []           # 被隐藏的基础表行号 (有序)
+        self._added = {}            # 叠加层: 用户名 -> 卡号
+        self._added_names = []      # 叠加层用户名 (有序)
+        self._added_owner = {}      # 叠加层: card_key -> 用户名
+        self._listeners = []
+        self.changes = []           # 按顺序记录的 AccountChange
+
+    # --- 修改通知 ---
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _record(self, change):
+        self.changes.append(change)
+        for callback in list(self._listeners):
+            callback(change)
+
+    # --- 查询 ---
+    def __len__(self):
+        return len(self._base) - len(self._hidden) + len(self._added_names)
+
+    def __contains__(self, username):
+        return username in self._added or (username not in self._removed and username in self._base)
+
+    def __iter__(self):
+        removed = self._removed
+        base_names = (name for name in self._base if name not in removed)
+        return merge(base_names, self._added_names)
+
+    def items(self):
+        for username in self:
+            yield username, self.get(username)
+
+    def get(self, username, default=None):
+        if username in self._added:
+            return self._added[username]
+        if username in self._removed:
+            return default
+        return self._base.get(username, default)
+
+    def owner_of(self, card_id):
+        owner = self._added_owner.get(card_key(card_id))
+        if owner is not None:
+            return owner
+        owner = self._base.owner_of(card_id)
+        return None if owner in self._removed else owner
+
+    def has_card(self, card_id):
+        return self.owner_of(card_id) is not None
+
+    def sorted_names(self):
+        return list(self)
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def _base_rank(self, username):
+        """基础表中未被隐藏、且排在 username 之前的账号数"""
+        row = self._base.bisect_left(username)
+        return row - bisect_left(self._hidden, row)
+
+    def bisect_left(self, username):
+        return self._base_rank(username) + bisect_left(self._added_names, username)
+
+    def index_of(self, username):
+        if username in self._added or (username not in self._removed and username in self._base):
+            return self.bisect_left(username)
+        return None
+
+    def name_at(self, index):
+        total = len(self)
+        if index < 0:
+            index += total
+        if not 0 <= index < total:
+            raise IndexError(index)
+        # 叠加层第 j 个用户名在合并后的位置为 j + _base_rank(名)，随 j 递增，二分查找
+        added_names = self._added_names
+        lo, hi = 0, len(added_names)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if mid + self._base_rank(added_names[mid]) < index:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(added_names) and lo + self._base_rank(added_names[lo]) == index:
+            return added_names[lo]
+        # 否则是基础表中第 rank 个未被隐藏的账号，跳过其前面被隐藏的行
+        rank = index - lo
+        row = rank
+        while True:
+            next_row = rank + bisect_right(self._hidden, row)
+            if next_row == row:
+                return self._base.name_at(row)
+            row = next_row
+
+    # --- 叠加层操作 ---
+    def _put(self, username, card_id):
+        self._added[username] = card_id
+        insort(self._added_names, username)
+        self._added_owner[card_key(card_id)] = username
+
+    def _drop(self, username):
+        """从当前视图中移除账号，返回其卡号"""
+        if username in self._added:
+            card_id = self._added.pop(username)
+            del self._added_names[bisect_left(self._added_names, username)]
+            del self._added_owner[card_key(card_id)]
+            return card_id
+        card_id = self._base.get(username)
+        self._removed.add(username)
+        insort(self._hidden, self._base.index_of(username))
+        return card_id
+
+    # --- 修改 (与 AccountStore 相同的接口和冲突检查) ---
+    def add(self, username, card_id):
+        if username in self:
+            raise AccountConflictError(f"用户名 '{username}' 已存在")
+        owner = self.owner_of(card_id)
+        if owner is not None:
+            raise AccountConflictError(f"卡号 '{card_id}' 已属于 '{owner}'")
+        username = sys.intern(username)
+        self._put(username, card_id)
+        self._record(AccountChange('add', username, card_id, new_index=self.index_of(username)))
+
+    def rename(self, old_username, new_username):
+        old_index = self.index_of(old_username)
+        if old_index is None:
+            raise KeyError(old_username)
+        if new_username == old_username:
+            return
+        if new_username in self:
+            raise AccountConflictError(f"用户名 '{new_username}' 已存在")
+        new_username = sys.intern(new_username)
+        card_id = self._drop(old_username)
+        self._put(new_username, card_id)
+        self._record(AccountChange('rename', new_username, card_id, old_username=old_username,
+                                   old_index=old_index, new_index=self.index_of(new_username)))
+
+    def set_card(self, username, card_id):
+        index = self.index_of(username)
+        if index is None:
+            raise KeyError(username)
+        old_card_id = self.get(username)
+        if card_id == old_card_id:
+            return
+        owner = self.owner_of(card_id)
+        if owner is not None:
+            raise AccountConflictError(f"卡号 '{card_id}' 已属于 '{owner}'")
+        self._drop(username)
+        self._put(username, card_id)
+        self._record(AccountChange('set_card', username, card_id, old_card_id=old_card_id,
+                                   old_index=index, new_index=index))
+
+    def delete(self, username):
+        index = self.index_of(username)
+        if index is None:
+            raise KeyError(username)
+        card_id = self._drop(username)
+        self._record(AccountChange('delete', username, card_id, old_index=index))
+        return card_id
+
+    # --- 提交 ---
+    def touched_cards(self):
+        """本次会话涉及的所有卡号 (修改前和修改后)"""
+        cards = set()
+        for change in self.changes:
+            cards.add(change.card_id)
+            cards.add(change.old_card_id)
+        return cards
+
+    def commit_to(self, store):
+        """把记录的修改按顺序重放到 store，返回因冲突未能应用的 AccountChange 列表
+
+        调用方负责把重放包在一个存储事务中。store 在会话期间被其他途径修改过时，
+        冲突的那一条会被跳过，其余照常应用。
+        """
+        failed = []
+        adds = []
+        for change in self.changes:
+            if change.op == 'add':
+                adds.append(change) # 连续的新增攒起来，批量导入时一次合并
+                continue
+            if adds:
+                self._commit_adds(store, adds, failed)
+                adds = []
+            try:
+                if change.op == 'rename':
+                    store.rename(change.old_username, change.username)
+                elif change.op == 'set_card':
+                    store.set_card(change.username, change.card_id)
+                else:
+                    store.delete(change.username)
+            except (KeyError, AccountConflictError):
+                failed.append(change)
+        if adds:
+            self._commit_adds(store, adds, failed)
+        return failed
+
+    @staticmethod
+    def _commit_adds(store, adds, failed):
+        if len(adds) >= BULK_ADD_THRESHOLD and hasattr(store, 'add_many'):
+            try:
+                store.add_many([(change.username, change.card_id) for change in adds])
+                return
+            except AccountConflictError:
+                pass # 有与 store 冲突的条目：逐个添加，找出失败的那些
+        for change in adds:
+            try:
+                store.add(change.username, change.card_id)
+            except AccountConflictError:
+                failed.append(change)
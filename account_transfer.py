@@ -0,0 +1,262 @@
+# --- 账号批量导入/导出 ---
+# 按扩展名选择格式，逐行流式读写，可以在后台线程中运行：
+#   .csv            用户名,卡号 (可有表头；导出时带 BOM，Excel 可直接打开)
+#   .jsonl .ndjson  每行一个 {"username": ..., "card_id": ...}
+#   .json           旧格式 accounts.json ({用户名: 卡号})，用于从其他机台的启动器迁移
+# 导入按账号管理窗口的规则 (classify_edit) 逐行应用到 AccountEditSession 上，冲突不弹窗，
+# 收集到 ImportReport 中；调用方在界面线程把会话一次性提交到 AccountStore (一个存储事务)。
+import csv
+import json
+import os
+
+from account_store import (
+    EDIT_ADD, EDIT_CONFLICT, EDIT_RENAME, EDIT_SET_CARD, EDIT_UNCHANGED, card_key, classify_edit,
+)
+from account_storage import load_accounts_json
+
+FORMAT_CSV = 'csv'
+FORMAT_JSONL = 'jsonl'
+FORMAT_JSON = 'json'
+FORMAT_EXTENSIONS = {'.csv': FORMAT_CSV, '.jsonl': FORMAT_JSONL, '.ndjson': FORMAT_JSONL, '.json': FORMAT_JSON}
+FILE_TYPES = [("CSV 文件", "*.csv"), ("JSON Lines 文件", "*.jsonl *.ndjson"), ("accounts.json", "*.json")]
+
+USERNAME_FIELDS = ("username", "用户名", "user", "name")
+CARD_FIELDS = ("card_id", "卡号", "card", "id")
+PROGRESS_EVERY = 2000         # 每处理这么多行报告一次进度
+MAX_REPORTED_PROBLEMS = 10000 # 报告中最多保留的问题行 (计数不受限制)
+
+# 导入结果中除 EDIT_* 之外的类别
+DUPLICATE = 'duplicate'       # 同一文件中用户名或卡号重复出现
+INVALID = 'invalid'           # 格式错误或字段为空
+SKIPPED = 'skipped'           # 需要修改已有账号，但导入时选择了不修改
+FAILED = 'failed'             # 提交时与 (导入期间被修改的) 账号数据冲突
+
+KIND_LABELS = {
+    EDIT_ADD: "新增", EDIT_SET_CARD: "修改卡号", EDIT_RENAME: "重命名", EDIT_UNCHANGED: "无变化",
+    EDIT_CONFLICT: "冲突", DUPLICATE: "文件内重复", INVALID: "格式错误", SKIPPED: "未修改已有账号", FAILED: "提交失败",
+}
+
+
+def detect_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMAT_EXTENSIONS:
+        raise ValueError(f"不支持的文件类型 '{extension}'，请使用 .csv、.jsonl 或 .json")
+    return FORMAT_EXTENSIONS[extension]
+
+
+# --- 读取 ---
+def _counted_lines(f, counter):
+    """逐行解码二进制文件，同时累计已读取的字节数 (文本模式迭代时不能 tell())"""
+    for line in f:
+        counter[0] += len(line)
+        yield line.decode('utf-8-sig' if counter[0] == len(line) else 'utf-8')
+
+
+def _find_column(header, names):
+    folded = [field.strip().casefold() for field in header]
+    for name in names:
+        if name in folded:
+            return folded.index(name)
+    return None
+
+
+def _read_csv(f, counter):
+    reader = csv.reader(_counted_lines(f, counter))
+    username_column, card_column = 0, 1
+    for fields in reader:
+        if not any(field.strip() for field in fields):
+            continue
+        if reader.line_num == 1:
+            found_username, found_card = _find_column(fields, USERNAME_FIELDS), _find_column(fields, CARD_FIELDS)
+            if found_username is not None and found_card is not None:
+                username_column, card_column = found_username, found_card
+                continue # 表头
+        if len(fields) <= max(username_column, card_column):
+            yield reader.line_num, None, None, "列数不足"
+            continue
+        yield reader.line_num, fields[username_column].strip(), fields[card_column].strip(), None
+
+
+def _field(record, names):
+    for name in names:
+        if name in record:
+            return record[name]
+    return None
+
+
+def _read_jsonl(f, counter):
+    for line_no, line in enumerate(_counted_lines(f, counter), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_no, None, None, f"JSON 格式错误: {e}"
+            continue
+        if isinstance(record, list) and len(record) == 2:
+            username, card_id = record
+        elif isinstance(record, dict):
+            username, card_id = _field(record, USERNAME_FIELDS), _field(record, CARD_FIELDS)
+        else:
+            username = card_id = None
+        if username is None or card_id is None:
+            yield line_no, None, None, "缺少用户名或卡号"
+            continue
+        yield line_no, str(username).strip(), str(card_id).strip(), None
+
+
+def read_rows(path, progress=None):
+    """逐行读取导入文件，生成 (行号, 用户名, 卡号, 错误信息)；错误信息不为 None 时该行无效
+
+    progress(已处理的比例, 行数) 每 PROGRESS_EVERY 行调用一次。
+    """
+    file_format = detect_format(path)
+    if file_format == FORMAT_JSON:
+        # 旧格式是单个 JSON 对象，无法流式解析；账号文件通常不大，一次读入
+        for line_no, (username, card_id) in enumerate(load_accounts_json(path).items(), start=1):
+            yield line_no, str(username).strip(), str(card_id).strip(), None
+        return
+    total = os.path.getsize(path) or 1
+    counter = [0]
+    with open(path, 'rb') as f:
+        rows = _read_csv(f, counter) if file_format == FORMAT_CSV else _read_jsonl(f, counter)
+        for count, row in enumerate(rows, start=1):
+            yield row
+            if progress is not None and count % PROGRESS_EVERY == 0:
+                progress(counter[0] / total, count)
+
+
+# --- 导入 ---
+class ImportReport:
+    """导入结果：各类别的行数，以及需要用户查看的问题行"""
+
+    def __init__(self):
+        self.rows = 0
+        self.counts = dict.fromkeys(KIND_LABELS, 0)
+        self.problems = [] # (行号, 类别, 用户名, 卡号, 说明)
+
+    def record(self, kind, line_no=None, username=None, card_id=None, detail=""):
+        self.counts[kind] += 1
+        if kind in (EDIT_ADD, EDIT_SET_CARD, EDIT_RENAME, EDIT_UNCHANGED):
+            return
+        if len(self.problems) < MAX_REPORTED_PROBLEMS:
+            self.problems.append((line_no, kind, username, card_id, detail))
+
+    def record_failed(self, changes):
+        """提交时未能应用的修改 (AccountEditSession.commit_to 的返回值)"""
+        for change in changes:
+            self.counts[change.op] -= 1 # 会话中只有 add / set_card / rename 三种修改
+            self.record(FAILED, None, change.username, change.card_id, f"{change.op} 与当前账号数据冲突")
+
+    @property
+    def applied(self):
+        return self.counts[EDIT_ADD] + self.counts[EDIT_SET_CARD] + self.counts[EDIT_RENAME]
+
+    def summary(self):
+        lines = [f"共读取 {self.rows} 行:"]
+        lines += [f"  {KIND_LABELS[kind]}: {count}" for kind, count in self.counts.items() if count]
+        return "\n".join(lines)
+
+    def problem_lines(self, limit=None):
+        lines = []
+        for line_no, kind, username, card_id, detail in (self.problems if limit is None else self.problems[:limit]):
+            prefix = f"第 {line_no} 行 " if line_no is not None else ""
+            lines.append(f"{prefix}[{KIND_LABELS[kind]}] {username or ''} {card_id or ''} {detail}".rstrip())
+        return lines
+
+    def write(self, path):
+        """把问题行写成 CSV，便于修改后重新导入"""
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(["行号", "类别", "用户名", "卡号", "说明"])
+            for line_no, kind, username, card_id, detail in self.problems:
+                writer.writerow([line_no or "", KIND_LABELS[kind], username or "", card_id or "", detail])
+
+
+def plan_import(session, rows, update_existing=True):
+    """把导入行逐行应用到编辑会话 session (AccountEditSession)，返回 ImportReport
+
+    只读写 session 自己的叠加层，可以在后台线程中运行 (session 在界面线程创建)。
+    同一文件中再次出现的用户名或卡号视为重复，不会覆盖前面的行；
+    update_existing 为 False 时，修改已有账号卡号或用户名的行只记录不应用。
+    """
+    report = ImportReport()
+    seen_names = set()
+    seen_cards = set()
+    for line_no, username, card_id, error in rows:
+        report.rows += 1
+        if error is None and (not username or not card_id):
+            error = "用户名和卡号都不能为空"
+        if error is not None:
+            report.record(INVALID, line_no, username, card_id, error)
+            continue
+        key = card_key(card_id)
+        if username in seen_names or key in seen_cards:
+            report.record(DUPLICATE, line_no, username, card_id, "与文件中前面的行重复")
+            continue
+        seen_names.add(username)
+        seen_cards.add(key)
+
+        action, other = classify_edit(session, username, card_id)
+        if action == EDIT_CONFLICT:
+            report.record(action, line_no, username, card_id, f"卡号已属于 '{other}'")
+        elif action in (EDIT_SET_CARD, EDIT_RENAME) and not update_existing:
+            detail = f"原卡号 {other}" if action == EDIT_SET_CARD else f"卡号当前属于 '{other}'"
+            report.record(SKIPPED, line_no, username, card_id, detail)
+        else:
+            if action == EDIT_ADD:
+                session.add(username, card_id)
+            elif action == EDIT_SET_CARD:
+                session.set_card(username, card_id)
+            elif action == EDIT_RENAME:
+                session.rename(other, username)
+            report.record(action)
+    return report
+
+
+# --- 导出 ---
+def _write_rows(f, file_format, items):
+    if file_format == FORMAT_CSV:
+        writer = csv.writer(f)
+        writer.writerow(["username", "card_id"])
+        for count, (username, card_id) in enumerate(items, start=1):
+            writer.writerow([username, card_id])
+            yield count
+    elif file_format == FORMAT_JSONL:
+        for count, (username, card_id) in enumerate(items, start=1):
+            f.write(json.dumps({"username": username, "card_id": card_id}, ensure_ascii=False))
+            f.write("\n")
+            yield count
+    else:
+        # 与 dump_accounts_json 的输出 (indent=4) 相同，逐个账号写出
+        count = 0
+        for count, (username, card_id) in enumerate(items, start=1):
+            f.write("{\n    " if count == 1 else ",\n    ")
+            f.write(f"{json.dumps(username, ensure_ascii=False)}: {json.dumps(card_id, ensure_ascii=False)}")
+            yield count
+        f.write("\n}" if count else "{}")
+
+
+def export_accounts(accounts, path, progress=None):
+    """把 accounts 逐行写入 path (格式按扩展名)，返回导出的账号数
+
+    先写临时文件再替换，中途失败不会留下不完整的文件。accounts 在导出期间不能被修改
+    (界面中传入 AccountStore.copy() 得到的快照)。
+    """
+    file_format = detect_format(path)
+    total = len(accounts) or 1
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    count = 0
+    try:
+        with open(tmp_path, 'w', newline='', encoding='utf-8-sig' if file_format == FORMAT_CSV else 'utf-8') as f:
+            for count in _write_rows(f, file_format, accounts.items()):
+                if progress is not None and count % PROGRESS_EVERY == 0:
+                    progress(count / total, count)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return count
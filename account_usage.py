@@ -0,0 +1,240 @@
+# --- 账号使用记录 ---
+# 记录每个账号的切换/启动次数和最后使用时间，提供“最近使用”和“最常使用”两种排序，
+# 主列表可以把排名前几的账号置顶显示 (PinnedView)。
+# 常用度按指数衰减计分 (半衰期 half_life 秒)：时间 t 的一次使用记 2^(t / half_life) 分，
+# 为避免溢出保存以 2 为底的对数。所有分数按同一速率衰减，排名不随时间变化，
+# 所以分数不必随时间重算；每次使用只更新一个账号，堆中插入一项，O(log n)。
+# 数据保存在数据目录的 accounts.usage.json 中，只含用过的账号，文件很小。
+import heapq
+import json
+import math
+import os
+import time
+from bisect import bisect_left, bisect_right
+
+import event_log
+from account_storage import write_file_atomic
+from account_store import AccountChange
+
+ORDER_ALPHA = 'alpha'       # 按用户名排序 (默认)
+ORDER_FRECENT = 'frecent'   # 最常使用 (按衰减后的使用次数)
+ORDER_RECENT = 'recent'     # 最近使用
+ORDER_LABELS = {ORDER_ALPHA: "按用户名", ORDER_FRECENT: "最常使用", ORDER_RECENT: "最近使用"}
+
+DEFAULT_HALF_LIFE = 7 * 24 * 3600  # 一周前的一次使用只算半次
+USAGE_FILE_VERSION = 1
+
+
+def _log2_add(a, b):
+    """log2(2^a + 2^b)，不会溢出"""
+    if a < b:
+        a, b = b, a
+    return a + math.log2(1.0 + 2.0 ** (b - a))
+
+
+class AccountUsage:
+    """用户名 -> [常用度分数 (log2), 最后使用时间, 使用次数]，以及两个带延迟删除的排名堆"""
+
+    def __init__(self, half_life=DEFAULT_HALF_LIFE, entries=None):
+        self.half_life = half_life
+        self.on_modified = None # 记录变化后调用 (界面据此保存文件、更新置顶列表)
+        self._entries = entries if entries is not None else {}
+        self._rebuild_heaps()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, username):
+        return username in self._entries
+
+    def get(self, username):
+        """返回 (最后使用时间, 使用次数)，没有记录时返回 None"""
+        entry = self._entries.get(username)
+        return None if entry is None else (entry[1], entry[2])
+
+    # --- 排名堆 ---
+    # 堆中保存 (-分数, 用户名)；账号的分数变化后旧项不删除，取出时与 _entries 不一致即丢弃
+    def _rebuild_heaps(self):
+        self._frecent = [(-entry[0], username) for username, entry in self._entries.items()]
+        self._recent = [(-entry[1], username) for username, entry in self._entries.items()]
+        heapq.heapify(self._frecent)
+        heapq.heapify(self._recent)
+
+    def _push(self, username, entry):
+        heapq.heappush(self._frecent, (-entry[0], username))
+        heapq.heappush(self._recent, (-entry[1], username))
+        if len(self._frecent) > 2 * len(self._entries) + 64:
+            self._rebuild_heaps() # 过期项太多时重建，堆的大小保持在账号数的常数倍
+
+    def top(self, count, order=ORDER_FRECENT):
+        """排名前 count 的用户名，O(count log n)"""
+        heap, field = (self._recent, 1) if order == ORDER_RECENT else (self._frecent, 0)
+        result = []
+        kept = []
+        while heap and len(result) < count:
+            item = heapq.heappop(heap)
+            entry = self._entries.get(item[1])
+            if entry is None or entry[field] != -item[0] or item[1] in result:
+                continue # 过期项，丢弃
+            result.append(item[1])
+            kept.append(item)
+        for item in kept:
+            heapq.heappush(heap, item)
+        return result
+
+    # --- 修改 ---
+    def record(self, username, when=None):
+        """记录一次切换或启动"""
+        when = time.time() if when is None else when
+        score = when / self.half_life
+        entry = self._entries.get(username)
+        if entry is None:
+            entry = self._entries[username] = [score, when, 1]
+        else:
+            entry[0] = _log2_add(entry[0], score)
+            entry[1] = max(entry[1], when)
+            entry[2] += 1
+        self._push(username, entry)
+        self._modified()
+
+    def on_account_changed(self, change):
+        """AccountStore 的观察者：账号改名或删除时同步使用记录"""
+        if change.op == 'rename' and change.old_username in self._entries:
+            entry = self._entries.pop(change.old_username)
+            self._entries[change.username] = entry
+            self._push(change.username, entry)
+            self._modified()
+        elif change.op == 'delete' and change.username in self._entries:
+            del self._entries[change.username]
+            self._modified()
+
+    def retain(self, accounts):
+        """去掉 accounts 中已不存在的账号 (例如在其他机台上删除后导入)"""
+        missing = [username for username in self._entries if username not in accounts]
+        for username in missing:
+            del self._entries[username]
+        if missing:
+            self._rebuild_heaps()
+        return len(missing)
+
+    def _modified(self):
+        if self.on_modified is not None:
+            self.on_modified()
+
+    # --- 保存 ---
+    def to_dict(self):
+        """可以交给后台线程写入的快照"""
+        return {
+            "version": USAGE_FILE_VERSION,
+            "half_life": self.half_life,
+            "accounts": {username: [round(score, 6), round(last_used, 3), count]
+                         for username, (score, last_used, count) in self._entries.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        entries = {}
+        for username, value in data.get("accounts", {}).items():
+            score, last_used, count = value
+            entries[str(username)] = [float(score), float(last_used), int(count)]
+        return cls(data.get("half_life", DEFAULT_HALF_LIFE), entries)
+
+
+def read_usage(path):
+    """读取使用记录，文件不存在或损坏时返回空记录 (使用记录丢失不影响账号数据)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return AccountUsage.from_dict(json.load(f))
+    except FileNotFoundError:
+        return AccountUsage()
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        event_log.warning(event_log.LOAD, f"读取使用记录 '{path}' 失败，将重新记录: {e}")
+        return AccountUsage()
+
+
+def write_usage(path, data):
+    """写入 to_dict() 的结果 (可以在后台线程中调用)；丢失最后几次记录无妨，不 fsync"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    write_file_atomic(path, json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), fsync=False)
+
+
+class PinnedView:
+    """置顶的常用账号在前，其余账号按用户名排序在后；接口与虚拟列表数据源相同
+
+    source 为按用户名排序的账号表 (AccountStore / MappedAccountIndex)。
+    """
+
+    def __init__(self, source, pinned):
+        self.source = source
+        self.pinned = [username for username in pinned if username in source]
+        self._pinned_at = {username: index for index, username in enumerate(self.pinned)}
+        self._hidden = sorted(source.index_of(username) for username in self.pinned) # 置顶账号在 source 中的行
+
+    def __len__(self):
+        return len(self.source)
+
+    def __iter__(self):
+        yield from self.pinned
+        for username in self.source:
+            if username not in self._pinned_at:
+                yield username
+
+    def __contains__(self, username):
+        return username in self.source
+
+    def name_at(self, index):
+        if index < 0:
+            index += len(self)
+        if index < len(self.pinned):
+            return self.pinned[index]
+        # 第 rank 个未置顶的账号：跳过它之前的置顶行
+        rank = index - len(self.pinned)
+        row = rank
+        while True:
+            skipped = bisect_right(self._hidden, row)
+            if rank + skipped == row:
+                return self.source.name_at(row)
+            row = rank + skipped
+
+    def index_of(self, username):
+        if username in self._pinned_at:
+            return self._pinned_at[username]
+        row = self.source.index_of(username)
+        if row is None:
+            return None
+        return len(self.pinned) + row - bisect_left(self._hidden, row)
+
+    def apply_change(self, change):
+        """source 修改后的视图和换算为显示位置的修改 (AccountChange)，用于列表框增量更新
+
+        修改的账号是置顶账号时才改变置顶行 (改名原地替换，删除后其余置顶行前移)；
+        新视图只需重新定位置顶账号在 source 中的行，O(k log n)。
+        """
+        pinned = self.pinned
+        if change.old_username in self._pinned_at:
+            pinned = list(pinned)
+            if change.op == 'delete':
+                pinned.remove(change.old_username)
+            else:
+                pinned[self._pinned_at[change.old_username]] = change.username
+        view = PinnedView(self.source, pinned)
+        old_index = None
+        if change.old_index is not None:
+            # 修改前的位置按修改前的置顶行 (self._hidden) 换算
+            old_index = self._pinned_at.get(change.old_username)
+            if old_index is None:
+                old_index = len(self.pinned) + change.old_index - bisect_left(self._hidden, change.old_index)
+        new_index = view.index_of(change.username) if change.new_index is not None else None
+        return view, AccountChange(change.op, change.username, change.card_id, change.old_username,
+                                   change.old_card_id, old_index, new_index)
+
+    def sorted_names(self):
+        """显示顺序的全部用户名 (经典列表框一次插入)；按置顶行切片拼接，不逐个判断"""
+        names = self.source.sorted_names()
+        result = list(self.pinned)
+        start = 0
+        for row in self._hidden:
+            result += names[start:row]
+            start = row + 1
+        result += names[start:]
+        return result
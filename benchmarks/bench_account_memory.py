@@ -0,0 +1,61 @@
+# --- 账号表内存对比 ---
+# 比较旧的 {用户名: 卡号} 字典与 AccountStore 紧凑表在不同账号数下的内存占用。
+# 用法: python benchmarks/bench_account_memory.py [--sizes 10000 100000 1000000]
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from account_store import AccountStore  # noqa: E402
+
+
+def make_accounts_json(count, seed=0):
+    """生成与 accounts.json 相同格式的文本：20 位数字卡号，用户名带中文"""
+    rng = random.Random(seed)
+    accounts = {}
+    while len(accounts) < count:
+        username = f"玩家{rng.randrange(10 ** 9):09d}"
+        accounts[username] = f"{rng.randrange(10 ** 20):020d}"
+    return json.dumps(accounts, ensure_ascii=False)
+
+
+def measure(build, text):
+    """返回 build(text) 构建出的对象在释放临时数据后仍占用的字节数"""
+    gc.collect()
+    tracemalloc.start()
+    result = build(text)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def build_dict(text):
+    return json.loads(text)
+
+
+def build_store(text):
+    return AccountStore(json.loads(text))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="账号表内存对比")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'账号数':>10} {'dict (MB)':>12} {'AccountStore (MB)':>18} {'字节/账号 dict':>15} {'字节/账号 store':>16} {'节省':>7}")
+    for count in args.sizes:
+        text = make_accounts_json(count)
+        dict_bytes = measure(build_dict, text)
+        store_bytes = measure(build_store, text)
+        print(f"{count:>10} {dict_bytes / 2**20:>12.1f} {store_bytes / 2**20:>18.1f} "
+              f"{dict_bytes / count:>15.0f} {store_bytes / count:>16.0f} {1 - store_bytes / dict_bytes:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
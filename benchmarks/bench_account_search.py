@@ -0,0 +1,56 @@
+# --- 账号搜索耗时 ---
+# 测量 AccountSearchIndex 建立索引和每次按键搜索的耗时，对比逐个扫描。
+# 用法: python benchmarks/bench_account_search.py [--count 100000]
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from account_search import AccountSearchIndex  # noqa: E402
+from account_store import AccountStore  # noqa: E402
+
+QUERIES = ["玩家", "player1", "PLAYER12345", "1", "12", "0012", "nomatch"]
+
+
+def make_accounts(count, seed=0):
+    rng = random.Random(seed)
+    prefixes = ["玩家", "Player", "maimai", "ＤＸ"]
+    accounts = {}
+    while len(accounts) < count:
+        accounts[f"{rng.choice(prefixes)}{rng.randrange(10 ** 7)}"] = f"{rng.randrange(10 ** 20):020d}"
+    return accounts
+
+
+def linear_search(store, query):
+    folded = query.casefold()
+    return [username for username, card_id in store.items()
+            if folded in username.casefold() or card_id.startswith(query)]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="账号搜索耗时")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    store = AccountStore(make_accounts(args.count))
+    index = AccountSearchIndex(store)
+    _, build_ms = timed(index.prepare)
+    print(f"账号数 {args.count}，建立索引 {build_ms:.0f} ms")
+    print(f"{'查询':<14} {'结果数':>8} {'索引 (ms)':>10} {'扫描 (ms)':>10}")
+    for query in QUERIES:
+        names, index_ms = timed(index.search, query)
+        expected, scan_ms = timed(linear_search, store, query)
+        assert names == expected, query
+        print(f"{query:<14} {len(names):>8} {index_ms:>10.2f} {scan_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# --- 基准测试数据 ---
+# 生成接近真实情况的账号数据：20 位数字卡号 (部分共享前缀，模拟同一批次的卡)，
+# 用户名混合中文、日文假名、全角和 ASCII。相同 seed 生成的数据相同，结果可以跨版本比较。
+import random
+
+# 常用汉字和假名的范围，生成的用户名不全是同一前缀，搜索和排序更接近真实分布
+_CJK = [chr(code) for code in range(0x4E00, 0x4E00 + 2000)]
+_KANA = [chr(code) for code in range(0x30A1, 0x30F6)]
+_PREFIXES = ["玩家", "Player", "maimai", "ＤＸ", "舞萌", "プレイヤー", ""]
+_CARD_BATCHES = 200     # 共享卡号前缀的批次数
+_BATCH_PREFIX_DIGITS = 8
+
+
+def make_username(rng):
+    style = rng.random()
+    if style < 0.4:
+        return "".join(rng.choice(_CJK) for _ in range(rng.randint(2, 6)))
+    if style < 0.55:
+        return "".join(rng.choice(_KANA) for _ in range(rng.randint(3, 8)))
+    return f"{rng.choice(_PREFIXES)}{rng.randrange(10 ** rng.randint(3, 9))}"
+
+
+def make_card_id(rng, batch_prefixes):
+    """20 位数字；约一半来自同一批次 (前 8 位相同)，其余完全随机"""
+    if rng.random() < 0.5:
+        return f"{rng.choice(batch_prefixes)}{rng.randrange(10 ** (20 - _BATCH_PREFIX_DIGITS)):0{20 - _BATCH_PREFIX_DIGITS}d}"
+    return f"{rng.randrange(10 ** 20):020d}"
+
+
+def make_accounts(count, seed=0):
+    """返回 {用户名: 卡号}，用户名和卡号都不重复"""
+    rng = random.Random(seed)
+    batch_prefixes = [f"{rng.randrange(10 ** _BATCH_PREFIX_DIGITS):0{_BATCH_PREFIX_DIGITS}d}" for _ in range(_CARD_BATCHES)]
+    accounts = {}
+    cards = set()
+    while len(accounts) < count:
+        username = make_username(rng)
+        if username in accounts:
+            username = f"{username}{rng.randrange(10 ** 6)}"
+            if username in accounts:
+                continue
+        card_id = make_card_id(rng, batch_prefixes)
+        if card_id in cards:
+            continue
+        accounts[username] = card_id
+        cards.add(card_id)
+    return accounts
+
+
+def sample(accounts, count, seed=1):
+    """从账号中抽取 count 个 (用户名, 卡号)，用于查询类测试"""
+    rng = random.Random(seed)
+    items = list(accounts.items())
+    return [rng.choice(items) for _ in range(count)]
@@ -0,0 +1,67 @@
+# --- 图标导入耗时 ---
+# 对比旧方式 (icon.py 中整个 app.ico 的 base64 字面量: from icon import img，
+# 再 b64decode 写入 tmp.ico) 与新的 icon_assets.py (几种尺寸的 PNG) 的导入耗时。
+# 每次在新的解释器中导入，分别测量无 .pyc (首次运行) 和有 .pyc 两种情况。
+# 用法: python benchmarks/bench_icon_import.py [--runs 20]
+import argparse
+import base64
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LEGACY_STATEMENT = """
+import base64, os
+from icon import img
+with open('tmp.ico', 'wb') as f:
+    f.write(base64.b64decode(img))
+os.remove('tmp.ico')
+"""
+ASSETS_STATEMENT = "from icon_assets import ICON_PNGS"
+
+
+def time_import(directory, statement, cold):
+    """在新解释器中执行 statement，返回耗时 (毫秒)"""
+    if cold:
+        shutil.rmtree(os.path.join(directory, "__pycache__"), ignore_errors=True)
+    code = ("import time\n_t = time.perf_counter()\n" + statement +
+            "\nprint((time.perf_counter() - _t) * 1000)")
+    flags = ["-B"] if cold else []
+    result = subprocess.run([sys.executable, *flags, "-c", code], cwd=directory,
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="图标导入耗时对比")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="icon_bench_")
+    try:
+        # 按旧生成脚本的格式重建 icon.py
+        with open(os.path.join(ROOT_DIR, "app.ico"), 'rb') as f:
+            legacy = "img=%s" % base64.b64encode(f.read())
+        with open(os.path.join(work_dir, "icon.py"), 'w') as f:
+            f.write(legacy)
+        shutil.copy(os.path.join(ROOT_DIR, "icon_assets.py"), work_dir)
+        print(f"icon.py {os.path.getsize(os.path.join(work_dir, 'icon.py'))} 字节，"
+              f"icon_assets.py {os.path.getsize(os.path.join(work_dir, 'icon_assets.py'))} 字节")
+
+        print(f"{'':<32} {'无 .pyc (ms)':>12} {'有 .pyc (ms)':>12}")
+        for label, statement in (("from icon import img + tmp.ico", LEGACY_STATEMENT),
+                                 ("from icon_assets import ICON_PNGS", ASSETS_STATEMENT)):
+            cold = statistics.median(time_import(work_dir, statement, True) for _ in range(args.runs))
+            time_import(work_dir, statement, False)  # 生成 .pyc
+            warm = statistics.median(time_import(work_dir, statement, False) for _ in range(args.runs))
+            print(f"{label:<32} {cold:>12.2f} {warm:>12.2f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
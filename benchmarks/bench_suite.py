@@ -0,0 +1,334 @@
+# --- 基准测试套件 ---
+# 在不同账号数下测量账号存储 (加载、追加日志、压缩)、查找、列表刷新 (含常用账号置顶)、启动时识别当前账号、
+# 账号管理的添加和切换账号的耗时。界面部分用 fake_tk 中的替身控件无窗口运行，
+# 后台执行器改为立即执行，测量的是代码本身的耗时 (不含排队和 fsync)。
+#
+# 用法: python benchmarks/bench_suite.py [--sizes 1000 10000 100000] [--repeat 5] [--only load lookup]
+#                                         [--json results.json] [--baseline old.json --threshold 0.25]
+# 给出 --baseline 时与之前保存的 --json 结果比较，最快一次 (受其他进程干扰最小) 变慢超过 threshold
+# 的用例视为退化，退出码为 1。
+# 结果与机器有关，基线应在同一台机器上生成，仓库中不保存基线文件。
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+import account_storage  # noqa: E402
+import fake_tk  # noqa: E402
+import virtual_list  # noqa: E402
+from account_index import MappedAccountIndex, build_account_index  # noqa: E402
+from account_storage import AccountJournal, dump_accounts_json, encode_record  # noqa: E402
+from account_store import AccountEditSession, AccountStore  # noqa: E402
+from account_usage import ORDER_ALPHA, ORDER_FRECENT, AccountUsage  # noqa: E402
+from cabinet_profiles import load_profiles  # noqa: E402
+from bench_data import make_accounts, sample  # noqa: E402
+from card_targets import make_targets, write_card_targets  # noqa: E402
+
+launcher = fake_tk.import_launcher()
+fake_tk.patch_virtual_list(virtual_list)
+launcher.messagebox = fake_tk.FakeMessagebox()
+
+RESULT_VERSION = 1
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+LOOKUP_OPS = 10_000
+APPEND_OPS = 200
+WAL_RECORDS = 400     # load.journal 重放的日志记录数 (小于 COMPACT_AFTER_RECORDS，与实际使用时相近)
+EDIT_OPS = 500
+SWITCH_OPS = 200
+NOISE_FLOOR_MS = 0.5  # 比较基线时，差值小于此值的不算退化 (计时噪声)
+
+
+class _NoScanner:
+    def running_games(self):
+        return ()
+
+
+def make_app(accounts, virtual, auth_path):
+    """不创建窗口的 LauncherApp：只设置启动识别、列表刷新和切换用到的属性"""
+    app = launcher.LauncherApp.__new__(launcher.LauncherApp)
+    app.root = fake_tk.FakeRoot()
+    app.config = {"auth_file_fsync": False}
+    app.profiles, app.active_profile = load_profiles(app.config)
+    app.accounts = accounts
+    app.accounts_loaded = True
+    app.list_view = accounts
+    app.search_var = fake_tk.FakeVar()
+    app.account_label = fake_tk.FakeWidget()
+    app.io = fake_tk.ImmediateExecutor()
+    app.launcher = launcher.LaunchSupervisor()
+    app.process_scanner = _NoScanner()
+    app.current_auth_path = auth_path
+    app.auth_signature = None
+    app.current_active_card = None
+    app.current_active_username = None
+    app.usage = AccountUsage() # 不设置 on_modified，记录使用时不写文件
+    app.list_order = ORDER_ALPHA
+    app.pinned_count = launcher.DEFAULT_PINNED_COUNT
+    app._pinned_refresh_job = None
+    app.virtual_list = virtual
+    if virtual:
+        app.account_listbox = virtual_list.VirtualListbox(fake_tk.FakeWidget(), accounts, height=10)
+    else:
+        app.account_listbox = fake_tk.FakeListbox()
+    return app
+
+
+def make_manage_window(accounts):
+    """不创建窗口的 ManageAccountsWindow：只设置 add_or_update_account 用到的属性"""
+    window = launcher.ManageAccountsWindow.__new__(launcher.ManageAccountsWindow)
+    window.window = None
+    window.accounts = AccountEditSession(accounts)
+    window.username_entry = fake_tk.FakeEntry()
+    window.id_entry = fake_tk.FakeEntry()
+    return window
+
+
+def new_accounts(count, existing, seed):
+    """生成 count 个与 existing 不冲突的新账号"""
+    fresh = make_accounts(count + len(existing) // 100 + 10, seed=seed)
+    cards = {card_id for card_id in existing.values()}
+    pairs = [(u, c) for u, c in fresh.items() if u not in existing and c not in cards]
+    return pairs[:count]
+
+
+class Suite:
+    def __init__(self, repeat, only, out):
+        self.repeat = repeat
+        self.only = only
+        self.out = out # 被测代码的 print() 输出被丢弃，结果写到这里
+        self.results = {}
+
+    def wanted(self, name):
+        return not self.only or any(name.startswith(prefix) for prefix in self.only)
+
+    def measure(self, name, size, run, setup=None, ops=1):
+        """重复 repeat 次，每次先调用 setup() (不计时)，记录 run(state) 的耗时"""
+        if not self.wanted(name):
+            return
+        times = []
+        for _ in range(self.repeat):
+            state = setup() if setup is not None else None
+            started = time.perf_counter()
+            run(state)
+            times.append((time.perf_counter() - started) * 1000)
+        median = statistics.median(times)
+        self.results[f"{name}@{size}"] = {
+            "median_ms": round(median, 4), "min_ms": round(min(times), 4), "repeat": self.repeat, "ops": ops,
+        }
+        per_op = f"  ({median * 1000 / ops:.2f} us/次)" if ops > 1 else ""
+        print(f"{name:<24} {size:>9} {median:>11.3f} ms{per_op}", file=self.out, flush=True)
+
+
+def bench_storage(suite, size, accounts, workdir):
+    data_json = dump_accounts_json(accounts)
+
+    def fresh_dir():
+        path = tempfile.mkdtemp(dir=workdir)
+        with open(os.path.join(path, 'accounts.json'), 'wb') as f:
+            f.write(data_json)
+        return path
+
+    def load(path):
+        journal = AccountJournal(path, os.path.join(path, 'accounts.json'), fsync=False)
+        journal.load()
+        journal.close()
+
+    # 第一次使用日志存储：导入 accounts.json 并生成快照
+    suite.measure("load.json_import", size, load, fresh_dir)
+
+    # 快照 + 日志重放 (正常启动路径)
+    journal_dir = fresh_dir()
+    load(journal_dir)
+    extra = new_accounts(WAL_RECORDS, accounts, seed=size + 1)
+    with open(os.path.join(journal_dir, account_storage.WAL_FILE_NAME), 'ab') as f:
+        for seq, (username, card_id) in enumerate(extra, start=1):
+            f.write(encode_record({"seq": seq, "ops": [['add', username, card_id]]}))
+    suite.measure("load.journal", size, lambda state: load(journal_dir))
+
+    # 二进制索引映射 (account_index 为 true 时的启动路径)
+    index_path = os.path.join(workdir, f'accounts{size}.idx')
+    build_account_index(accounts, index_path)
+    suite.measure("load.index", size, lambda state: MappedAccountIndex(index_path).close())
+
+    store = AccountStore(accounts)
+    pairs = sample(accounts, LOOKUP_OPS)
+
+    def lookup(target):
+        for username, card_id in pairs:
+            target.get(username)
+            target.owner_of(card_id)
+
+    suite.measure("lookup.store", size, lambda state: lookup(store), ops=LOOKUP_OPS)
+    index = MappedAccountIndex(index_path)
+    suite.measure("lookup.index", size, lambda state: lookup(index), ops=LOOKUP_OPS)
+    index.close()
+
+    # 追加日志：压缩单独测量，这里不让它被触发
+    limits = account_storage.COMPACT_AFTER_RECORDS, account_storage.COMPACT_AFTER_BYTES
+    account_storage.COMPACT_AFTER_RECORDS = account_storage.COMPACT_AFTER_BYTES = float('inf')
+    append_dir = tempfile.mkdtemp(dir=workdir)
+    journal = AccountJournal(append_dir, os.path.join(append_dir, 'accounts.json'), fsync=False)
+    journal.attach(store)
+    added = new_accounts(APPEND_OPS, accounts, seed=size + 2)
+
+    def append(state):
+        for username, card_id in added:
+            store.add(username, card_id)
+
+    def remove_added():
+        store.unsubscribe(journal._on_change)
+        for username, card_id in added:
+            if username in store:
+                store.delete(username)
+        store.subscribe(journal._on_change)
+
+    suite.measure("save.append", size, append, remove_added, ops=APPEND_OPS)
+    remove_added()
+    account_storage.COMPACT_AFTER_RECORDS, account_storage.COMPACT_AFTER_BYTES = limits
+    suite.measure("save.compact", size, lambda state: journal.compact(background=False))
+    store.unsubscribe(journal._on_change)
+    journal.store = None # close() 不再压缩
+    journal.close()
+    return store
+
+
+def bench_ui(suite, size, accounts, store, workdir):
+    auth_path = os.path.join(workdir, 'aime.txt')
+    usernames = [username for username, card_id in sample(accounts, SWITCH_OPS, seed=3)]
+
+    # 与切换账号相同的写入路径 (卡号文件作为单目标事务)；卡号文件须已存在
+    with open(auth_path, 'w', encoding='utf-8') as f:
+        f.write(accounts[usernames[0]])
+    targets = make_targets(auth_path, None, workdir)
+
+    def write_current():
+        write_card_targets(targets, accounts[usernames[0]], fsync=False)
+
+    for mode, virtual in (("classic", False), ("virtual", True)):
+        app = make_app(store, virtual, auth_path)
+        suite.measure(f"refresh.{mode}", size, lambda state: app.refresh_main_listbox())
+
+        # 启动时识别当前账号：读取卡号文件 -> 反向查找 -> 在列表中选中
+        def resolve(state):
+            for _ in usernames:
+                app.process_current_account_on_startup(prompt_unknown=False)
+
+        suite.measure(f"startup.resolve.{mode}", size, resolve, write_current, ops=len(usernames))
+
+        # 按使用记录排序时重建列表 (常用账号置顶)
+        for username in usernames:
+            app.usage.record(username)
+        app.list_order = ORDER_FRECENT
+        suite.measure(f"refresh.pinned.{mode}", size, lambda state: app.apply_search())
+
+    # 切换账号：依次切换到不同账号 (写入) 和重复切换到当前账号 (跳过写入)
+    app = make_app(store, False, auth_path)
+    app.refresh_main_listbox()
+
+    def switch_each(state):
+        for username in usernames:
+            app._switch_account(username)
+
+    def switch_same(state):
+        for username in usernames:
+            app._switch_account(usernames[0])
+
+    suite.measure("switch.write", size, switch_each, write_current, ops=len(usernames))
+    app._switch_account(usernames[0])
+    suite.measure("switch.skip", size, switch_same, ops=len(usernames))
+
+    # 记录一次使用并取出置顶的账号 (每次切换/启动后)
+    def record_uses(usage):
+        for username in usernames:
+            usage.record(username)
+            usage.top(launcher.DEFAULT_PINNED_COUNT, ORDER_FRECENT)
+
+    suite.measure("usage.record", size, record_uses, AccountUsage, ops=len(usernames))
+
+    # 账号管理窗口中添加新账号 (编辑会话覆盖层，关闭窗口前不写入存储)
+    added = new_accounts(EDIT_OPS, accounts, seed=size + 4)
+
+    def edit(window):
+        for username, card_id in added:
+            window.username_entry.text = username
+            window.id_entry.text = card_id
+            window.add_or_update_account()
+
+    suite.measure("edit.add", size, edit, lambda: make_manage_window(store), ops=EDIT_OPS)
+
+
+def compare(results, baseline, threshold):
+    """返回退化的用例 [(名称, 基线耗时, 当前耗时)]，比较各自最快的一次"""
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        old_ms, new_ms = old["min_ms"], result["min_ms"]
+        if new_ms - old_ms > NOISE_FLOOR_MS and new_ms > old_ms * (1 + threshold):
+            regressions.append((name, old_ms, new_ms))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="账号存储、查找、刷新和切换的基准测试")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="账号数 (最多 1000000)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="+", default=[], help="只运行名称以这些前缀开头的用例")
+    parser.add_argument("--json", help="把结果写入此文件")
+    parser.add_argument("--baseline", help="与此前保存的 --json 结果比较")
+    parser.add_argument("--threshold", type=float, default=0.25, help="变慢超过此比例视为退化")
+    args = parser.parse_args()
+
+    suite = Suite(args.repeat, args.only, sys.stdout)
+    print(f"{'用例':<24} {'账号数':>9} {'中位数':>14}")
+    workdir = tempfile.mkdtemp(prefix="aquadx-bench-")
+    try:
+        # 被测代码和准备步骤中的 print() 不输出
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            for size in args.sizes:
+                accounts = make_accounts(size)
+                size_dir = tempfile.mkdtemp(dir=workdir)
+                store = bench_storage(suite, size, accounts, size_dir)
+                bench_ui(suite, size, accounts, store, size_dir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        report = {
+            "version": RESULT_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "results": suite.results,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"结果已写入 {args.json}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get("version") != RESULT_VERSION:
+            print(f"基线文件版本 {baseline.get('version')} 与当前版本 {RESULT_VERSION} 不一致，无法比较")
+            return 2
+        regressions = compare(suite.results, baseline["results"], args.threshold)
+        for name, old_ms, new_ms in regressions:
+            print(f"退化: {name} {old_ms:.3f} ms -> {new_ms:.3f} ms ({new_ms / old_ms - 1:+.0%})")
+        if regressions:
+            return 1
+        print(f"与基线相比没有超过 {args.threshold:.0%} 的退化")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+# --- 无界面运行用的替身 ---
+# 基准测试不创建真正的窗口：列表框、标签、输入框用这里的替身代替，后台执行器改为立即执行，
+# 对话框自动回答“是”。没有安装 tkinter 时，import_launcher() 先注册一个空的 tkinter 模块，
+# 使 AquaDX_Launcher 仍可导入。
+import importlib
+import sys
+import types
+
+END = 'end'
+
+_TK_CONSTANTS = dict(
+    END=END, VERTICAL='vertical', HORIZONTAL='horizontal', LEFT='left', RIGHT='right', TOP='top', BOTTOM='bottom',
+    BOTH='both', X='x', Y='y', W='w', E='e', N='n', S='s', SUNKEN='sunken', BROWSE='browse', EXTENDED='extended',
+)
+
+
+class FakeWidget:
+    def __init__(self, *args, **options):
+        self.options = options
+        self.bindings = {}
+
+    def pack(self, **options):
+        pass
+
+    def bind(self, sequence, func=None):
+        self.bindings[sequence] = func
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+    def cget(self, key):
+        return self.options.get(key, {'font': 'TkDefaultFont'}.get(key, 0))
+
+    def focus_set(self):
+        pass
+
+    def state(self, flags=None):
+        return ()
+
+
+class FakeListbox(FakeWidget):
+    """tk.Listbox 的替身：内容保存在 list 中"""
+
+    def __init__(self, *args, **options):
+        super().__init__(*args, **options)
+        self.items = []
+        self.selection = set()
+        self.active = None
+
+    def _index(self, index):
+        return len(self.items) if index == END else int(index)
+
+    def insert(self, index, *values):
+        index = self._index(index)
+        self.items[index:index] = values
+
+    def delete(self, first, last=None):
+        first = self._index(first)
+        last = first if last is None else self._index(last)
+        del self.items[first:last + 1]
+        self.selection = {i for i in self.selection if i < first}
+
+    def get(self, index):
+        return self.items[self._index(index)]
+
+    def size(self):
+        return len(self.items)
+
+    def curselection(self):
+        return tuple(sorted(self.selection))
+
+    def selection_clear(self, first, last=None):
+        self.selection.clear()
+
+    def selection_set(self, index):
+        self.selection.add(self._index(index))
+
+    def selection_includes(self, index):
+        return self._index(index) in self.selection
+
+    def activate(self, index):
+        self.active = self._index(index)
+
+    def see(self, index):
+        pass
+
+    def nearest(self, y):
+        return 0
+
+    def yview(self, *args):
+        pass
+
+    def yview_moveto(self, fraction):
+        pass
+
+
+class FakeScrollbar(FakeWidget):
+    def set(self, first, last):
+        self.position = (first, last)
+
+
+class FakeFont:
+    def __init__(self, *args, **options):
+        pass
+
+    def metrics(self, key):
+        return 15
+
+
+class FakeEntry(FakeWidget):
+    def __init__(self, text=""):
+        super().__init__()
+        self.text = text
+
+    def get(self):
+        return self.text
+
+    def delete(self, first, last=None):
+        self.text = ""
+
+    def insert(self, index, text):
+        self.text += text
+
+
+class FakeVar:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class FakeRoot(FakeWidget):
+    """只执行 after_idle / after(0) 以外的回调时才需要真正的事件循环，这里直接丢弃"""
+
+    def after(self, ms, func=None, *args):
+        return None
+
+    def after_cancel(self, job):
+        pass
+
+    def bell(self):
+        pass
+
+
+class FakeMessagebox:
+    """对话框替身：询问一律回答 answer，记录弹出次数"""
+
+    def __init__(self, answer=True):
+        self.answer = answer
+        self.shown = 0
+
+    def _ask(self, *args, **options):
+        self.shown += 1
+        return self.answer
+
+    def _show(self, *args, **options):
+        self.shown += 1
+        return 'ok'
+
+    askyesno = askokcancel = _ask
+    showinfo = showwarning = showerror = _show
+
+
+class ImmediateExecutor:
+    """IOExecutor 的替身：在调用线程中立即执行，回调也立即调用 (测量代码本身，不含排队延迟)"""
+
+    def submit(self, func, *args, on_done=None, on_error=None, **options):
+        try:
+            result = func(*args)
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(e)
+            return None
+        if on_done is not None:
+            on_done(result)
+        return None
+
+    def post(self, func, *args):
+        func(*args)
+        return True
+
+    def pending_descriptions(self):
+        return []
+
+
+def _install_tkinter_stub():
+    class _Dummy(FakeWidget):
+        pass
+
+    def make_module(name):
+        module = types.ModuleType(name)
+        module.__getattr__ = lambda attr: _Dummy
+        sys.modules[name] = module
+        return module
+
+    tk = make_module('tkinter')
+    tk.__dict__.update(_TK_CONSTANTS, TclError=Exception)
+    for sub in ('ttk', 'messagebox', 'filedialog', 'simpledialog', 'font'):
+        setattr(tk, sub, make_module(f'tkinter.{sub}'))
+
+
+def import_launcher():
+    """导入 AquaDX_Launcher (不会创建窗口)，没有 tkinter 时先注册替身模块"""
+    try:
+        importlib.import_module('tkinter')
+    except ImportError:
+        _install_tkinter_stub()
+    return importlib.import_module('AquaDX_Launcher')
+
+
+def patch_virtual_list(virtual_list):
+    """让 VirtualListbox 使用替身控件"""
+    virtual_list.tk = types.SimpleNamespace(Listbox=FakeListbox, **_TK_CONSTANTS)
+    virtual_list.ttk = types.SimpleNamespace(Scrollbar=FakeScrollbar)
+    virtual_list.tkfont = types.SimpleNamespace(Font=FakeFont)
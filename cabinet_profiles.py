@@ -0,0 +1,222 @@
+# --- 多机台配置 ---
+# 一台管理电脑管理多套游戏 (多台机台或多个安装副本) 时，每套一个配置：名称、卡号文件路径、启动脚本路径，
+# 以及切换时另外写入的文件 (card_targets，见 card_targets.py)。
+# config.json 中保存为 "profiles": [{"name", "auth_file_path", "launch_bat_path", "card_targets"}] 和
+# "active_profile"；顶层的同名键始终与当前配置相同，命令行模式和旧版本照常使用。
+# 配置与 config.json 的顶层使用相同的键，auth_file_path() / launch_bat_path() 可以直接用于配置。
+# 检查路径、批量分配账号时各机台的文件操作在线程池中并发执行 (网络共享上的文件延迟较高)，
+# 整个批次在 IOExecutor 的后台线程中运行，不阻塞界面。
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from card_file import read_card_file
+from card_targets import make_targets, parse_targets, targets_match, write_card_targets
+from launcher_config import auth_file_path, base_path, launch_bat_path
+
+DEFAULT_PROFILE_NAME = "默认"
+PROFILE_KEYS = ("auth_file_path", "launch_bat_path", "card_targets") # 配置中与 config.json 顶层同名的键
+MAX_PARALLEL_TARGETS = 8  # 同时访问的机台数上限
+
+# 分配结果
+WRITTEN = 'written'       # 已写入
+UNCHANGED = 'unchanged'   # 卡号文件已是该账号的卡号
+MISSING = 'missing'       # 卡号文件不存在
+NOT_FILE = 'not_file'     # 路径不是文件
+FAILED = 'failed'         # 读写出错
+STATUS_LABELS = {WRITTEN: "已切换", UNCHANGED: "无需切换", MISSING: "卡号文件不存在", NOT_FILE: "路径不是文件", FAILED: "失败"}
+
+
+# --- 配置 ---
+def load_profiles(config):
+    """返回 (配置列表, 当前配置名)；配置为 dict 副本。没有 profiles 的旧配置文件视为只有一个默认配置"""
+    profiles = [dict(profile) for profile in config.get("profiles", []) if profile.get("name")]
+    if not profiles:
+        profiles = [dict({key: config.get(key) for key in PROFILE_KEYS if key in config}, name=DEFAULT_PROFILE_NAME)]
+    active = config.get("active_profile")
+    if find_profile(profiles, active) is None:
+        active = profiles[0]["name"]
+    return profiles, active
+
+
+def find_profile(profiles, name):
+    for profile in profiles:
+        if profile["name"] == name:
+            return profile
+    return None
+
+
+def store_profiles(config, profiles, active):
+    """把配置列表写回 config (调用方随后保存 config.json)"""
+    profile = find_profile(profiles, active)
+    config["profiles"] = [dict(profile) for profile in profiles]
+    config["active_profile"] = active
+    for key in PROFILE_KEYS:
+        if key in profile:
+            config[key] = profile[key]
+        else:
+            config.pop(key, None)
+
+
+# --- 并发执行 ---
+def _run_parallel(func, items, on_result=None):
+    """在线程池中对每一项调用 func(item)，按 items 的顺序返回结果；on_result(结果) 在工作线程中调用"""
+    if not items:
+        return []
+
+    def run(item):
+        result = func(item)
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(len(items), MAX_PARALLEL_TARGETS), thread_name_prefix="Cabinet") as pool:
+        return list(pool.map(run, items))
+
+
+class ProfileState:
+    """一个机台的检查结果：路径是否存在、卡号文件中的卡号"""
+
+    def __init__(self, name, auth_path, launch_path):
+        self.name = name
+        self.auth_path = auth_path
+        self.launch_path = launch_path
+        self.auth_ok = False
+        self.launch_ok = False
+        self.card_id = None
+        self.error = None
+        self.elapsed = 0.0
+
+
+def inspect_profile(profile):
+    state = ProfileState(profile["name"], auth_file_path(profile), launch_bat_path(profile))
+    started = time.perf_counter()
+    state.auth_ok = os.path.isfile(state.auth_path)
+    state.launch_ok = os.path.isfile(state.launch_path)
+    if state.auth_ok:
+        try:
+            state.card_id = read_card_file(state.auth_path) or None
+        except OSError as e:
+            state.error = str(e)
+    state.elapsed = time.perf_counter() - started
+    return state
+
+
+def inspect_profiles(profiles):
+    """并发检查所有配置的路径并读取当前卡号，返回与 profiles 同序的 ProfileState 列表"""
+    return _run_parallel(inspect_profile, profiles)
+
+
+# --- 批量分配账号 ---
+class TargetResult:
+    """一个机台的分配结果"""
+
+    def __init__(self, name, username, card_id):
+        self.name = name
+        self.username = username
+        self.card_id = card_id
+        self.status = None
+        self.error = None
+        self.elapsed = 0.0
+
+    @property
+    def ok(self):
+        return self.status in (WRITTEN, UNCHANGED)
+
+    def describe(self):
+        text = f"{STATUS_LABELS[self.status]} ({self.elapsed * 1000:.0f} ms)"
+        return f"{text}: {self.error}" if self.error else text
+
+
+def _assign(target, fsync):
+    profile, username, card_id = target
+    result = TargetResult(profile["name"], username, card_id)
+    path = auth_file_path(profile)
+    started = time.perf_counter()
+    try:
+        if not os.path.isfile(path):
+            result.status = NOT_FILE if os.path.exists(path) else MISSING
+        else:
+            # 卡号文件和该机台配置的其他文件作为一个事务写入，与切换单个账号相同
+            targets = make_targets(path, profile.get("card_targets"), base_path)
+            if targets_match(targets, card_id):
+                result.status = UNCHANGED
+            else:
+                write_card_targets(targets, card_id, fsync=fsync)
+                result.status = WRITTEN
+    except (OSError, ValueError) as e:
+        result.status = FAILED
+        result.error = str(e)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def _written_paths(profile):
+    """分配账号时会写入的全部文件 (规范化的路径)，卡号文件在第一个；card_targets 有误时只有卡号文件"""
+    paths = [auth_file_path(profile)]
+    try:
+        paths += [target.path for target in parse_targets(profile.get("card_targets"), base_path)]
+    except ValueError:
+        pass # 由 _assign 报告
+    return [os.path.normcase(os.path.abspath(path)) for path in paths]
+
+
+def _group_by_files(indices, paths):
+    """按共用的文件把 indices 分组 (共用文件的传递闭包)，组内保持原顺序"""
+    parent = {index: index for index in indices}
+
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    owner = {}
+    for index in indices:
+        for path in paths[index]:
+            if path in owner:
+                parent[find(index)] = find(owner[path])
+            else:
+                owner[path] = index
+    groups = {}
+    for index in indices:
+        groups.setdefault(find(index), []).append(index)
+    return list(groups.values())
+
+
+def assign_accounts(targets, fsync=True, on_result=None):
+    """targets 为 [(配置, 用户名, 卡号)]，并发写入各机台的卡号文件，返回与 targets 同序的 TargetResult 列表
+
+    每个机台单独计时，一个机台失败不影响其他机台。on_result(TargetResult) 每完成一个调用一次 (工作线程中)。
+    """
+    paths = [_written_paths(profile) for profile, username, card_id in targets]
+    # 两个配置指向同一个卡号文件时并发写入的结果不确定：只写第一个，其余报告失败
+    owners = {}
+    results = {}
+    unique = []
+    for index, (profile, username, card_id) in enumerate(targets):
+        path = paths[index][0]
+        if path in owners:
+            result = results[index] = TargetResult(profile["name"], username, card_id)
+            result.status = FAILED
+            result.error = f"与机台 '{owners[path]}' 使用同一个卡号文件"
+            if on_result is not None:
+                on_result(result)
+        else:
+            owners[path] = profile["name"]
+            unique.append(index)
+
+    # card_targets 中的文件 (例如共用的 segatools.ini) 也可能被几个机台共用，并发的读-改-写会互相覆盖：
+    # 共用文件的机台分为一组，组内依次写入，各组之间并发
+    def assign_group(group):
+        written = []
+        for index in group:
+            result = _assign(targets[index], fsync)
+            if on_result is not None:
+                on_result(result)
+            written.append((index, result))
+        return written
+
+    for written in _run_parallel(assign_group, _group_by_files(unique, paths)):
+        results.update(written)
+    return [results[index] for index in range(len(targets))]
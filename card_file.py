@@ -0,0 +1,10 @@
+# --- 卡号文件读写 ---
+# 卡号文件 (aime.txt) 由游戏读取，写入必须是原子的：先写同目录下的临时文件，再 os.replace 覆盖，
+# 游戏只会读到旧卡号或新卡号，不会读到被截断的空文件。写入后重新读取校验。
+# 写入由 card_targets.write_card_targets 完成 (卡号文件与 card_targets 中的其他文件作为一个事务)。
+
+def read_card_file(path):
+    """读取卡号文件，返回去掉首尾空白的卡号"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read().strip()
+
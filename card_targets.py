@@ -0,0 +1,325 @@
+# --- 切换账号时写入的文件 ---
+# 除卡号文件 (aime.txt) 外，有的环境还需要把卡号写到其他地方，例如 FeliCa 卡号文件、
+# segatools.ini 的 [aime] 段。在配置 (或机台配置) 的 card_targets 中列出：
+#   "card_targets": [
+#       {"type": "file", "path": "..\\AMDaemon\\DEVICE\\felica.txt"},
+#       {"type": "ini", "path": "..\\segatools.ini", "section": "aime", "key": "accessCode"}
+#   ]
+# 相对路径相对于程序目录。一次切换作为一个事务写入所有文件：先把每个文件的新内容写入临时文件，
+# 全部成功后依次 os.replace，任何一步失败都恢复已替换的文件，各文件的卡号不会不一致。
+# INI 文件只修改对应键所在的那一行，其余内容 (注释、空行、键的顺序) 原样保留；
+# 解析结果按文件状态 (修改时间、大小) 缓存，文件没有变化时重复切换不会重新解析。
+import os
+import re
+import threading
+import time
+
+import metrics
+from account_storage import write_file_atomic
+from card_file import read_card_file
+from file_watch import file_signature
+
+TARGET_FILE = 'file'
+TARGET_INI = 'ini'
+DEFAULT_INI_SECTION = 'aime'
+DEFAULT_INI_KEY = 'accessCode'
+
+_SECTION_RE = re.compile(r'^\s*\[([^\]]*)\]')
+_KEY_RE = re.compile(r'^\s*([^=;#\s][^=]*?)\s*=[ \t]*(.*?)[ \t]*$')
+
+
+# --- INI 文件 ---
+class IniDocument:
+    """按行保存的 INI 文件：只记录每个键第一次出现的行号，修改时替换该行"""
+
+    def __init__(self, data):
+        self.data = data
+        if data.startswith(b'\xef\xbb\xbf'):
+            self.encoding = 'utf-8-sig'
+        else:
+            try:
+                data.decode('utf-8')
+                self.encoding = 'utf-8'
+            except UnicodeDecodeError:
+                # GBK 等其他编码：按 latin-1 逐字节解码，写回时字节不变 (只改动 ASCII 的键值)
+                self.encoding = 'latin-1'
+        text = data.decode(self.encoding)
+        self.lines = text.splitlines(keepends=True)
+        self.newline = '\r\n' if '\r\n' in text else '\n'
+        self._keys = {}     # (段名, 键名) -> 行号，均为 casefold() 后的名称，与 GetPrivateProfileString 一样不区分大小写
+        self._sections = {} # 段名 -> 该段最后一个非空行的下一行
+        section = None
+        for index, line in enumerate(self.lines):
+            match = _SECTION_RE.match(line)
+            if match:
+                section = match.group(1).strip().casefold()
+                self._sections.setdefault(section, index + 1)
+                continue
+            if section is None or not line.strip():
+                continue
+            self._sections[section] = index + 1
+            match = _KEY_RE.match(line.rstrip('\r\n'))
+            if match:
+                self._keys.setdefault((section, match.group(1).casefold()), index)
+
+    def get(self, section, key):
+        index = self._keys.get((section.casefold(), key.casefold()))
+        if index is None:
+            return None
+        return _KEY_RE.match(self.lines[index].rstrip('\r\n')).group(2)
+
+    def with_value(self, section, key, value):
+        """返回把 section 段的 key 设为 value 后的文件内容 (bytes)"""
+        lines = list(self.lines)
+        index = self._keys.get((section.casefold(), key.casefold()))
+        if index is not None:
+            line = lines[index]
+            body = line.rstrip('\r\n')
+            match = _KEY_RE.match(body)
+            lines[index] = body[:match.start(2)] + value + body[match.end(2):] + line[len(body):]
+        elif section.casefold() in self._sections:
+            insert_at = self._sections[section.casefold()]
+            if insert_at > 0 and not lines[insert_at - 1].endswith(('\n', '\r')):
+                lines[insert_at - 1] += self.newline
+            lines.insert(insert_at, f"{key}={value}{self.newline}")
+        else:
+            if lines and not lines[-1].endswith(('\n', '\r')):
+                lines[-1] += self.newline
+            if lines and lines[-1].strip():
+                lines.append(self.newline)
+            lines += [f"[{section}]{self.newline}", f"{key}={value}{self.newline}"]
+        return ''.join(lines).encode(self.encoding)
+
+
+_ini_cache = {} # 路径 -> (文件状态, IniDocument)
+_ini_cache_lock = threading.Lock()
+
+
+def load_ini(path):
+    """读取并解析 INI 文件；文件状态与上次相同时直接返回缓存的解析结果"""
+    signature = file_signature(path)
+    with _ini_cache_lock:
+        cached = _ini_cache.get(path)
+    if cached is not None and signature is not None and cached[0] == signature:
+        return cached[1]
+    with open(path, 'rb') as f:
+        document = IniDocument(f.read())
+    if signature is not None and signature == file_signature(path):
+        # 读取期间文件没有被修改才缓存
+        with _ini_cache_lock:
+            _ini_cache[path] = (signature, document)
+    return document
+
+
+# --- 写入目标 ---
+class FileTarget:
+    """整个文件只有卡号 (aime.txt、FeliCa 卡号文件)"""
+
+    def __init__(self, path, create=True):
+        self.path = path
+        self.create = create # 文件不存在时是否新建 (aime.txt 由调用方先检查是否存在)
+
+    def describe(self):
+        return self.path
+
+    def read(self):
+        try:
+            return read_card_file(self.path)
+        except FileNotFoundError:
+            return None
+
+    def stage(self, card_id, pending=None):
+        """返回 (新内容, 原内容)；原内容为 None 表示文件原本不存在
+
+        pending 为同一事务中其他目标对该文件准备的内容 (同一文件配置了多个目标时)。
+        """
+        if pending is not None:
+            raise ValueError(f"'{self.path}' 在 card_targets 中重复出现")
+        try:
+            with open(self.path, 'rb') as f:
+                original = f.read()
+        except FileNotFoundError:
+            if not self.create:
+                raise
+            original = None
+        return card_id.encode('utf-8'), original
+
+    def verify(self, card_id, data):
+        written = read_card_file(self.path)
+        if written != card_id:
+            raise OSError(f"写入后校验失败：'{self.path}' 的内容为 '{written}'，应为 '{card_id}'")
+
+    def committed(self, data):
+        pass
+
+
+class IniTarget:
+    """INI 文件中某一段的某个键 (segatools.ini 的 [aime] 段)；文件必须已存在"""
+
+    def __init__(self, path, section=DEFAULT_INI_SECTION, key=DEFAULT_INI_KEY):
+        self.path = path
+        self.section = section
+        self.key = key
+
+    def describe(self):
+        return f"{self.path} [{self.section}] {self.key}"
+
+    def read(self):
+        try:
+            return load_ini(self.path).get(self.section, self.key)
+        except FileNotFoundError:
+            return None
+
+    def stage(self, card_id, pending=None):
+        # 同一 INI 文件的多个键：在前一个键修改后的内容上继续修改
+        document = load_ini(self.path) if pending is None else IniDocument(pending)
+        return document.with_value(self.section, self.key, card_id), document.data
+
+    def verify(self, card_id, data):
+        # 比较读回的字节，不必重新解析
+        with open(self.path, 'rb') as f:
+            if f.read() != data:
+                raise OSError(f"写入后校验失败：'{self.describe()}' 的内容与写入的不一致")
+
+    def committed(self, data):
+        # 写入后的内容已知，更新缓存，下一次切换不必重新解析
+        signature = file_signature(self.path)
+        if signature is not None:
+            with _ini_cache_lock:
+                _ini_cache[self.path] = (signature, IniDocument(data))
+
+
+def _resolve(path, base_path):
+    path = os.path.expandvars(path)
+    return path if os.path.isabs(path) else os.path.normpath(os.path.join(base_path, path))
+
+
+def parse_targets(configs, base_path):
+    """把配置中的 card_targets 转换为写入目标，格式错误抛出 ValueError"""
+    targets = []
+    for config in configs or ():
+        if not isinstance(config, dict) or not config.get("path"):
+            raise ValueError(f"card_targets 中的项目缺少 path: {config!r}")
+        kind = config.get("type", TARGET_FILE)
+        path = _resolve(config["path"], base_path)
+        if kind == TARGET_FILE:
+            targets.append(FileTarget(path))
+        elif kind == TARGET_INI:
+            targets.append(IniTarget(path, config.get("section", DEFAULT_INI_SECTION), config.get("key", DEFAULT_INI_KEY)))
+        else:
+            raise ValueError(f"card_targets 中不支持的类型 '{kind}' (可用: {TARGET_FILE}, {TARGET_INI})")
+    return targets
+
+
+def make_targets(auth_path, configs, base_path):
+    """卡号文件 + 配置中的其他目标；卡号文件总是第一个"""
+    return [FileTarget(auth_path, create=False)] + parse_targets(configs, base_path)
+
+
+def targets_match(targets, card_id):
+    """所有目标都已是 card_id (INI 文件使用缓存，未修改时只需 stat)"""
+    return all(target.read() == card_id for target in targets)
+
+
+# --- 事务 ---
+class _StagedWrite:
+    """一个文件的待写入内容；同一文件可以对应多个目标 (INI 文件的多个键)"""
+
+    def __init__(self, target, data, original):
+        self.target = target
+        self.data = data
+        self.original = original
+        self.tmp_path = None
+        self.replaced = False
+
+
+def _write_temp(path, data, fsync):
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+    except BaseException:
+        # 写到一半失败 (磁盘已满等)：此时调用方还不知道临时文件的路径，由这里删除
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return tmp_path
+
+
+REPLACE_RETRIES = 3        # Windows 上目标文件正被读取时 os.replace 可能暂时失败
+REPLACE_RETRY_DELAY = 0.05
+
+
+def _replace(tmp_path, path):
+    for attempt in range(REPLACE_RETRIES):
+        try:
+            os.replace(tmp_path, path)
+            return
+        except PermissionError:
+            if attempt == REPLACE_RETRIES - 1:
+                raise
+            time.sleep(REPLACE_RETRY_DELAY)
+
+
+def _rollback(staged, fsync):
+    """删除临时文件，恢复已替换的文件；返回恢复失败的说明"""
+    failures = []
+    for write in staged:
+        try:
+            if write.replaced:
+                if write.original is None:
+                    os.remove(write.target.path)
+                else:
+                    write_file_atomic(write.target.path, write.original, fsync=fsync)
+            elif write.tmp_path is not None:
+                os.remove(write.tmp_path)
+        except OSError as e:
+            failures.append(f"{write.target.describe()}: {e}")
+    return failures
+
+
+def write_card_targets(targets, card_id, fsync=True):
+    """把 card_id 写入所有目标：全部成功，或者 (尽可能) 全部恢复原状后抛出 OSError；返回实际写入的文件数
+
+    内容已是 card_id 的目标不写。
+    """
+    # 准备：读取原内容并生成新内容，出错时还没有写任何文件
+    by_path = {}
+    for target in targets:
+        key = os.path.normcase(os.path.abspath(target.path))
+        write = by_path.get(key)
+        if write is None:
+            data, original = target.stage(card_id)
+            by_path[key] = _StagedWrite(target, data, original)
+        else:
+            write.data = target.stage(card_id, write.data)[0]
+    staged = [write for write in by_path.values() if write.data != write.original]
+    try:
+        with metrics.timed('switch.write'):
+            for write in staged:
+                write.tmp_path = _write_temp(write.target.path, write.data, fsync)
+            for write in staged:
+                _replace(write.tmp_path, write.target.path)
+                write.replaced = True
+        with metrics.timed('switch.verify'):
+            for write in staged:
+                write.target.verify(card_id, write.data)
+    except OSError as e:
+        failures = _rollback(staged, fsync)
+        if failures:
+            raise OSError(f"{e}\n以下文件未能恢复原内容:\n" + "\n".join(failures)) from e
+        raise
+    except BaseException:
+        _rollback(staged, fsync)
+        raise
+    for write in staged:
+        write.target.committed(write.data)
+    return len(staged)
@@ -0,0 +1,290 @@
+# --- 事件记录 ---
+# 界面中的诊断信息 (切换、启动、加载、保存、刷新等) 记为带类型的事件，代替 print()：
+# 打包后的 exe 没有控制台，print() 的内容无处可看。事件带单调时间戳，保存在固定大小的环形缓冲区中，
+# 由后台线程每隔 flush_interval 秒把新事件成批追加到数据目录的 launcher.log (每行一个 JSON)，
+# 文件超过 max_bytes 时轮转为 launcher.log.1 ... 同时写入计数器和耗时统计的快照 launcher.metrics.json。
+# 诊断信息窗口读取缓冲区，命令行 "events" 读取日志文件。config.json 中的设置：
+#   "event_log": {"enabled": true, "capacity": 2000, "flush_interval": 5, "max_bytes": 1048576, "backups": 3}
+# 设为 false 时不记录事件、不写文件，emit() 只做一次判断。
+# 有控制台时 (从源码运行) 事件内容同时输出到 stdout，与原来的 print() 相同；命令行模式不开启记录。
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+import metrics
+
+# 事件类型
+APP = 'app'
+LOAD = 'load'
+SAVE = 'save'
+SWITCH = 'switch'
+LAUNCH = 'launch'
+REFRESH = 'refresh'
+ACCOUNT = 'account'
+CONFIG = 'config'
+REMOTE = 'remote'
+UI = 'ui'
+KIND_LABELS = {APP: "程序", LOAD: "加载", SAVE: "保存", SWITCH: "切换", LAUNCH: "启动", REFRESH: "刷新",
+               ACCOUNT: "账号", CONFIG: "配置", REMOTE: "转交", UI: "界面"}
+
+# 级别
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+LOG_FILE_NAME = 'launcher.log'
+METRICS_FILE_NAME = 'launcher.metrics.json'
+DEFAULT_CAPACITY = 2000
+DEFAULT_FLUSH_INTERVAL = 5
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_BACKUPS = 3
+
+
+class Event:
+    __slots__ = ('seq', 'uptime', 'time', 'kind', 'level', 'message', 'fields')
+
+    def __init__(self, seq, uptime, wall_time, kind, level, message, fields):
+        self.seq = seq
+        self.uptime = uptime     # 程序启动后的秒数 (单调时钟)
+        self.time = wall_time
+        self.kind = kind
+        self.level = level
+        self.message = message
+        self.fields = fields     # 附加数据 (用户名、耗时等)，没有时为 None
+
+    def to_dict(self):
+        record = {"seq": self.seq, "uptime": round(self.uptime, 4), "time": round(self.time, 3),
+                  "kind": self.kind, "level": LEVEL_NAMES.get(self.level, str(self.level)), "msg": self.message}
+        if self.fields:
+            record["data"] = self.fields
+        return record
+
+
+class EventLog:
+    """环形缓冲区 + 后台批量写入的轮转日志文件"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.enabled = False
+        self.echo = sys.stdout is not None # 打包为窗口程序时没有 stdout
+        self.capacity = capacity
+        self.path = None
+        self.metrics_path = None
+        self.max_bytes = DEFAULT_MAX_BYTES
+        self.backups = DEFAULT_BACKUPS
+        self.dropped = 0          # 写入文件前就被新事件覆盖的事件数
+        self._ring = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._seq = 0
+        self._flushed_seq = 0
+        self._started = time.monotonic()
+        self._stop = threading.Event()
+        self._flusher = None
+
+    # --- 记录 ---
+    def emit(self, kind, message, level=INFO, fields=None):
+        if self.echo:
+            print(message)
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._seq += 1
+            self._ring.append(Event(self._seq, now - self._started, time.time(), kind, level, message, fields))
+        metrics.increment(f'events.{kind}')
+
+    def recent(self, kind=None, min_level=DEBUG):
+        """缓冲区中的事件，按时间顺序"""
+        with self._lock:
+            events = list(self._ring)
+        return [event for event in events
+                if (kind is None or event.kind == kind) and event.level >= min_level]
+
+    # --- 写入文件 ---
+    def configure(self, settings, directory):
+        """按 config.json 中的 event_log 设置开启记录；settings 为 False 时关闭"""
+        if settings is False or (isinstance(settings, dict) and not settings.get("enabled", True)):
+            self.enabled = False
+            return
+        settings = settings if isinstance(settings, dict) else {}
+        capacity = max(100, int(settings.get("capacity", DEFAULT_CAPACITY)))
+        if capacity != self.capacity:
+            with self._lock:
+                self.capacity = capacity
+                self._ring = deque(self._ring, maxlen=capacity)
+        self.path = os.path.join(directory, LOG_FILE_NAME)
+        self.metrics_path = os.path.join(directory, METRICS_FILE_NAME)
+        self.max_bytes = int(settings.get("max_bytes", DEFAULT_MAX_BYTES))
+        self.backups = max(0, int(settings.get("backups", DEFAULT_BACKUPS)))
+        self.enabled = True
+        self._start_flusher(float(settings.get("flush_interval", DEFAULT_FLUSH_INTERVAL)))
+
+    def _start_flusher(self, interval):
+        if self._flusher is not None:
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(interval):
+                self.flush()
+
+        self._flusher = threading.Thread(target=run, name="EventLogFlush", daemon=True)
+        self._flusher.start()
+
+    def _unflushed(self):
+        with self._lock:
+            count = min(self._seq - self._flushed_seq, len(self._ring))
+            events = list(self._ring)[len(self._ring) - count:] if count else []
+            self.dropped += self._seq - self._flushed_seq - count
+            self._flushed_seq = self._seq
+        return events
+
+    def flush(self, force=False):
+        """把上次写入后的新事件追加到日志文件，并更新统计快照 (可以在任何线程中调用)
+
+        没有新事件时不写文件 (统计随事件变化)，force 为 True 时仍更新统计快照。
+        """
+        if self.path is None:
+            return
+        with self._flush_lock:
+            events = self._unflushed()
+            if not events and not force:
+                return
+            try:
+                if events:
+                    lines = ''.join(json.dumps(event.to_dict(), ensure_ascii=False, default=str) + '\n' for event in events)
+                    self._append(lines.encode('utf-8'))
+                self._write_metrics()
+            except OSError as e:
+                # 写日志失败不影响程序，只在有控制台时提示
+                if self.echo:
+                    print(f"写入事件日志失败: {e}")
+
+    def _append(self, data):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            size = 0
+        if size and size + len(data) > self.max_bytes:
+            self._rotate()
+        with open(self.path, 'ab') as f:
+            f.write(data)
+
+    def _rotate(self):
+        """launcher.log -> launcher.log.1 -> ... -> launcher.log.N，最旧的被覆盖"""
+        if self.backups == 0:
+            os.remove(self.path)
+            return
+        for index in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{index}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def _write_metrics(self):
+        snapshot = {
+            "time": round(time.time(), 3),
+            "uptime": round(time.monotonic() - self._started, 3),
+            "events": self._seq,
+            "dropped": self.dropped,
+            "counters": metrics.all_counters(),
+            "histograms": {hist.name: hist.to_dict() for hist in metrics.all_histograms()},
+        }
+        tmp_path = f"{self.metrics_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.metrics_path)
+
+    def close(self):
+        """停止后台线程并写入剩余的事件"""
+        if self._flusher is not None:
+            self._stop.set()
+            self._flusher.join()
+            self._flusher = None
+        if self.enabled:
+            self.flush(force=True)
+
+
+log = EventLog() # 程序中唯一的事件记录，诊断信息窗口直接读取
+
+
+def emit(kind, message, **fields):
+    """记录一条 INFO 事件；附加数据用关键字参数给出"""
+    if log.enabled or log.echo:
+        log.emit(kind, message, INFO, fields or None)
+
+
+def debug(kind, message, **fields):
+    if log.enabled or log.echo:
+        log.emit(kind, message, DEBUG, fields or None)
+
+
+def warning(kind, message, **fields):
+    if log.enabled or log.echo:
+        log.emit(kind, message, WARNING, fields or None)
+
+
+def error(kind, message, **fields):
+    if log.enabled or log.echo:
+        log.emit(kind, message, ERROR, fields or None)
+
+
+# --- 读取日志文件 (命令行) ---
+def log_files(directory):
+    """从旧到新的日志文件 (launcher.log.N ... launcher.log.1, launcher.log)"""
+    path = os.path.join(directory, LOG_FILE_NAME)
+    backups = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        backups.append(f"{path}.{index}")
+        index += 1
+    return list(reversed(backups)) + ([path] if os.path.exists(path) else [])
+
+
+def read_events(directory, limit=None, kind=None, min_level=DEBUG):
+    """日志文件中最新的 limit 条事件 (dict)，按时间顺序；损坏的行跳过"""
+    events = deque(maxlen=limit)
+    for path in log_files(directory):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if kind is not None and record.get("kind") != kind:
+                    continue
+                if _level_value(record.get("level")) < min_level:
+                    continue
+                events.append(record)
+    return list(events)
+
+
+def read_metrics(directory):
+    """最近一次写入的统计快照，没有时返回 None"""
+    try:
+        with open(os.path.join(directory, METRICS_FILE_NAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _level_value(name):
+    for value, level_name in LEVEL_NAMES.items():
+        if level_name == name:
+            return value
+    return INFO
+
+
+def format_record(record):
+    """一行文字：时间 [类型] 级别 内容 附加数据"""
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record.get("time", 0)))
+    text = f"{stamp} [{record.get('kind')}] {record.get('level', 'INFO'):<7} {record.get('msg', '')}"
+    if record.get("data"):
+        text += " " + " ".join(f"{key}={value}" for key, value in record["data"].items())
+    return text
@@ -0,0 +1,72 @@
+# --- 跨进程文件锁 ---
+# 锁在单独的 .lock 文件上 (Windows: msvcrt.locking，其他系统: fcntl.flock)。
+# 锁随文件句柄释放，进程崩溃后自动失效；锁文件本身保留，不需要清理。
+import os
+import time
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+LOCK_TIMEOUT = 5.0
+LOCK_RETRY_DELAY = 0.02
+
+
+class FileLockTimeout(OSError):
+    pass
+
+
+class FileLock:
+    """with FileLock(path): ... 在多个进程之间互斥；acquire(timeout=0) 只尝试一次"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    @property
+    def locked(self):
+        return self._file is not None
+
+    def acquire(self, timeout=LOCK_TIMEOUT):
+        """取得锁返回 True，超时返回 False"""
+        if self._file is not None:
+            return True
+        deadline = time.monotonic() + timeout
+        f = open(self.path, 'a+b')
+        while True:
+            try:
+                if os.name == 'nt':
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                self._file = f
+                return True
+            except OSError:
+                if time.monotonic() >= deadline:
+                    f.close()
+                    return False
+                time.sleep(LOCK_RETRY_DELAY)
+
+    def release(self):
+        f, self._file = self._file, None
+        if f is None:
+            return
+        try:
+            if os.name == 'nt':
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        finally:
+            f.close()
+
+    def __enter__(self):
+        if not self.acquire():
+            raise FileLockTimeout(f"等待文件锁 '{self.path}' 超时")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
@@ -0,0 +1,150 @@
+# --- 文件监视 ---
+# 监视单个文件 (卡号文件 aime.txt) 是否被其他程序修改。
+# Linux 下用 inotify (通过 ctypes 调用 libc)，监视所在目录中该文件的写入/替换/删除；
+# 其他平台或 inotify 不可用时，在后台线程中定期 stat，只比较 (修改时间, 大小, inode)，不读取文件。
+# 回调在监视线程中调用，调用方负责转交到界面线程 (例如 root.after)，并自行去抖和过滤自己的写入。
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+
+import event_log
+
+POLL_INTERVAL = 0.5  # stat 轮询间隔 (秒)
+
+# inotify 常量 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+def file_signature(path):
+    """文件状态摘要：(修改时间 ns, 大小, inode)，文件不存在返回 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _load_inotify():
+    """返回 libc (含 inotify 函数)，不可用时返回 None"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class FileWatcher:
+    """文件变化时 (在后台线程中) 调用 on_change()"""
+
+    def __init__(self, path, on_change, poll_interval=POLL_INTERVAL):
+        self.path = path
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.backend = None  # 'inotify' / 'poll'
+        self._thread = None
+        self._stop = threading.Event()
+        self._wake_r = self._wake_w = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        inotify_fd = self._open_inotify()
+        if inotify_fd is not None:
+            self.backend = 'inotify'
+            self._wake_r, self._wake_w = os.pipe()
+            target, args = self._run_inotify, (inotify_fd,)
+        else:
+            self.backend = 'poll'
+            target, args = self._run_poll, ()
+        self._thread = threading.Thread(target=target, args=args, name="FileWatcher", daemon=True)
+        self._thread.start()
+        event_log.emit(event_log.APP, f"开始监视文件 ({self.backend}): {self.path}", backend=self.backend)
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        if self._wake_w is not None:
+            os.write(self._wake_w, b"x")
+        self._thread.join(timeout=2)
+        self._thread = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._wake_r = self._wake_w = None
+
+    def set_path(self, path):
+        """改为监视另一个文件"""
+        if path == self.path:
+            return
+        running = self._thread is not None
+        self.stop()
+        self.path = path
+        if running:
+            self.start()
+
+    # --- inotify ---
+    def _open_inotify(self):
+        libc = _load_inotify()
+        if libc is None:
+            return None
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            # 目录不存在等情况，退回轮询
+            os.close(fd)
+            return None
+        return fd
+
+    def _run_inotify(self, fd):
+        name = os.fsencode(os.path.basename(self.path))
+        try:
+            while not self._stop.is_set():
+                ready, _, _ = select.select([fd, self._wake_r], [], [])
+                if fd not in ready:
+                    continue
+                try:
+                    data = os.read(fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                changed = False
+                offset = 0
+                while offset < len(data):
+                    _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                    offset += _EVENT_HEADER.size
+                    if data[offset:offset + length].rstrip(b"\0") == name:
+                        changed = True
+                    offset += length
+                if changed:
+                    self.on_change()
+        finally:
+            os.close(fd)
+
+    # --- stat 轮询 ---
+    def _run_poll(self):
+        signature = file_signature(self.path)
+        while not self._stop.wait(self.poll_interval):
+            current = file_signature(self.path)
+            if current != signature:
+                signature = current
+                self.on_change()
@@ -0,0 +1,271 @@
+# --- 启动游戏 ---
+# 图形界面和命令行共用的启动逻辑。
+# 启动脚本不再经过 shell=True：可执行文件直接运行，批处理交给 cmd /c 执行一次。
+# LaunchSupervisor 在监视线程中跟踪启动的进程树：启动脚本的退出码，以及脚本启动的游戏进程
+# (Windows 上用作业对象，其他系统上用会话 ID) 是否仍在运行。
+# 启动参数、环境变量、工作目录和预启动步骤由 launch_profiles.py 按账号决定。
+import os
+import subprocess
+import threading
+import time
+
+import event_log
+import metrics
+
+TREE_POLL_INTERVAL = 1.0 # 启动脚本退出后，每隔这么久检查一次进程树中是否还有进程
+
+# --- 启动会话的状态 ---
+STARTING = 'starting'       # 已请求启动，进程尚未创建
+RUNNING = 'running'         # 启动脚本正在运行
+HANDED_OFF = 'handed_off'   # 启动脚本已退出，它启动的游戏进程仍在运行
+EXITED = 'exited'           # 进程树中的进程已全部退出
+FAILED = 'failed'           # 启动失败
+
+
+class LaunchOptions:
+    """启动脚本的参数、环境变量 (完整的环境，None 表示继承) 和工作目录 (None 表示脚本所在目录)"""
+
+    def __init__(self, args=(), env=None, cwd=None):
+        self.args = list(args)
+        self.env = env
+        self.cwd = cwd
+
+
+def build_command(path, args=()):
+    """构造不经过额外 shell 的启动命令"""
+    ext = os.path.splitext(path)[1].lower()
+    if os.name == 'nt':
+        if ext in ('.bat', '.cmd'):
+            # 批处理只能由 cmd 执行；/s 加两层引号，路径中有空格或 & 等字符时也能原样传递
+            comspec = os.environ.get('COMSPEC', 'cmd.exe')
+            arguments = f' {subprocess.list2cmdline(args)}' if args else ''
+            return f'"{comspec}" /s /c ""{path}"{arguments}"'
+        return [path, *args]
+    if ext == '.sh' or not os.access(path, os.X_OK):
+        return ['/bin/sh', path, *args]
+    return [path, *args]
+
+
+def _spawn(path, launch_options=None):
+    if not os.path.isfile(path):
+        raise FileNotFoundError(path)
+    launch_options = launch_options or LaunchOptions()
+    work_dir = launch_options.cwd or os.path.dirname(path)
+    event_log.emit(event_log.LAUNCH, f"尝试执行: {path} {' '.join(launch_options.args)} (工作目录: {work_dir})")
+    options = {}
+    if os.name != 'nt':
+        # 新会话：脚本启动的所有进程共用以脚本 PID 为 ID 的会话，脚本退出后仍可找到它们
+        options['start_new_session'] = True
+    return subprocess.Popen(build_command(path, launch_options.args), cwd=work_dir, env=launch_options.env, **options)
+
+
+def start_game_script(path, launch_options=None):
+    """在脚本所在目录 (或 launch_options.cwd) 中启动游戏启动脚本 (不等待结束)，返回 Popen 对象
+
+    脚本不存在时抛出 FileNotFoundError，启动失败时抛出 OSError。
+    """
+    return _spawn(path, launch_options)
+
+
+# --- 进程树跟踪 ---
+if os.name == 'nt':
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _JOB_OBJECT_BASIC_ACCOUNTING_INFORMATION = 1
+
+    class _JobAccounting(ctypes.Structure):
+        _fields_ = [
+            ("TotalUserTime", ctypes.c_longlong),
+            ("TotalKernelTime", ctypes.c_longlong),
+            ("ThisPeriodTotalUserTime", ctypes.c_longlong),
+            ("ThisPeriodTotalKernelTime", ctypes.c_longlong),
+            ("TotalPageFaultCount", wintypes.DWORD),
+            ("TotalProcesses", wintypes.DWORD),
+            ("ActiveProcesses", wintypes.DWORD),
+            ("TotalTerminatedProcesses", wintypes.DWORD),
+        ]
+
+    _kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+    _kernel32.CreateJobObjectW.argtypes = (ctypes.c_void_p, wintypes.LPCWSTR)
+    _kernel32.AssignProcessToJobObject.argtypes = (wintypes.HANDLE, wintypes.HANDLE)
+    _kernel32.QueryInformationJobObject.argtypes = (
+        wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD, ctypes.c_void_p)
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+
+class _ProcessTree:
+    """启动脚本及其子孙进程；alive_count() 返回仍在运行的进程数，无法得知时返回 None"""
+
+    def __init__(self, process):
+        self.process = process
+        self._job = None
+        if os.name == 'nt':
+            # 作业对象：之后脚本创建的子进程自动加入同一作业 (不设置 KILL_ON_JOB_CLOSE，启动器退出不影响游戏)。
+            # 在 Popen 返回后才加入，脚本在这之前就创建的子进程不会被跟踪，cmd 启动批处理需要的时间远大于此
+            job = _kernel32.CreateJobObjectW(None, None)
+            if job and _kernel32.AssignProcessToJobObject(job, int(process._handle)):
+                self._job = job
+            elif job:
+                _kernel32.CloseHandle(job)
+                event_log.warning(event_log.LAUNCH, f"无法跟踪游戏进程树 (错误码 {ctypes.get_last_error()})，只跟踪启动脚本本身")
+
+    def alive_count(self):
+        if self._job is not None:
+            info = _JobAccounting()
+            if _kernel32.QueryInformationJobObject(self._job, _JOB_OBJECT_BASIC_ACCOUNTING_INFORMATION,
+                                                   ctypes.byref(info), ctypes.sizeof(info), None):
+                return info.ActiveProcesses
+            return None
+        if os.name != 'nt':
+            return _count_session_processes(self.process.pid)
+        return None
+
+    def close(self):
+        if self._job is not None:
+            _kernel32.CloseHandle(self._job)
+            self._job = None
+
+
+def _count_session_processes(session_id):
+    """通过 /proc 统计会话中的进程数 (不含僵尸进程)；没有 /proc 时返回 None"""
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return None
+    count = 0
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'rb') as f:
+                stat = f.read()
+        except OSError:
+            continue # 进程刚好退出
+        # 进程名可能含空格和括号，从最后一个 ')' 之后开始解析: state ppid pgrp session ...
+        fields = stat[stat.rfind(b')') + 2:].split()
+        if len(fields) > 3 and int(fields[3]) == session_id and fields[0] != b'Z':
+            count += 1
+    return count
+
+
+# --- 启动监视 ---
+class GameSession:
+    """一次游戏启动；状态见上方 STARTING / RUNNING / HANDED_OFF / EXITED / FAILED"""
+
+    def __init__(self, path, requested_at, options=None, prelaunch=None):
+        self.path = path
+        self.options = options       # LaunchOptions
+        self.prelaunch = prelaunch   # 启动前要完成的步骤 (launch_profiles.PrelaunchRun)，没有时为 None
+        self.requested_at = requested_at # 用户点击启动时的 time.perf_counter()
+        self.state = STARTING
+        self.pid = None
+        self.exit_code = None      # 启动脚本的退出码
+        self.error = None
+        self.started_at = None     # 进程创建完成时
+        self.started_clock = None  # 同上，time.time()，用于显示
+        self.script_exited_at = None
+        self.ended_at = None       # 进程树全部退出时
+        self.process = None
+
+    def is_active(self):
+        return self.state in (STARTING, RUNNING, HANDED_OFF)
+
+    def describe(self):
+        if self.state == STARTING:
+            if self.prelaunch is not None:
+                return f"游戏正在启动 (预启动: {self.prelaunch.describe()})"
+            return "游戏正在启动"
+        if self.state == FAILED:
+            return f"游戏启动失败: {self.error}"
+        if self.state == EXITED:
+            return f"游戏已退出 (启动脚本退出码 {self.exit_code}，运行 {self.ended_at - self.started_at:.0f} 秒)"
+        since = time.strftime('%H:%M:%S', time.localtime(self.started_clock))
+        if self.state == RUNNING:
+            return f"游戏启动脚本运行中 (PID {self.pid}，启动于 {since})"
+        return f"游戏运行中 (启动脚本退出码 {self.exit_code}，启动于 {since})"
+
+
+class LaunchSupervisor:
+    """启动并跟踪游戏进程
+
+    begin() 在界面线程中登记一次启动 (之后 active_session() 立即可见，用于拦截重复启动)，
+    spawn() 可在后台线程中创建进程。状态变化时在监视线程中调用 on_event(session)，
+    界面需要自行转交到 Tk 线程。
+    """
+
+    def __init__(self, on_event=None, poll_interval=TREE_POLL_INTERVAL):
+        self.on_event = on_event
+        self.poll_interval = poll_interval
+        self.last_session = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def active_session(self):
+        """正在启动或运行中的会话，没有时返回 None"""
+        with self._lock:
+            session = self.last_session
+        return session if session is not None and session.is_active() else None
+
+    def begin(self, path, requested_at=None, options=None, prelaunch=None):
+        session = GameSession(path, time.perf_counter() if requested_at is None else requested_at, options, prelaunch)
+        with self._lock:
+            self.last_session = session
+        return session
+
+    def spawn(self, session):
+        """执行预启动步骤后创建进程并开始监视；失败时会话状态为 FAILED 并重新抛出异常"""
+        try:
+            if session.prelaunch is not None:
+                # 每个步骤开始和结束时通知，界面显示各步骤的进度和用时
+                session.prelaunch.run(on_step=lambda step: self._notify(session))
+            session.process = _spawn(session.path, session.options)
+        except Exception as e:
+            session.error = e
+            session.state = FAILED
+            self._notify(session)
+            raise
+        session.started_at = time.perf_counter()
+        session.started_clock = time.time()
+        session.pid = session.process.pid
+        session.state = RUNNING
+        latency = session.started_at - session.requested_at
+        metrics.histogram('launch.start').record(latency)
+        event_log.emit(event_log.LAUNCH, f"游戏启动脚本已启动: PID {session.pid} (点击到进程创建 {latency * 1000:.1f} ms)",
+                       pid=session.pid, latency_ms=round(latency * 1000, 1))
+        tree = _ProcessTree(session.process)
+        self._notify(session)
+        threading.Thread(target=self._monitor, args=(session, tree), name="GameMonitor", daemon=True).start()
+        return session
+
+    def _monitor(self, session, tree):
+        try:
+            session.exit_code = session.process.wait()
+            session.script_exited_at = time.perf_counter()
+            metrics.histogram('launch.script').record(session.script_exited_at - session.started_at)
+            event_log.emit(event_log.LAUNCH, f"游戏启动脚本已退出，退出码 {session.exit_code}",
+                           pid=session.pid, exit_code=session.exit_code)
+            alive = tree.alive_count()
+            if alive:
+                session.state = HANDED_OFF
+                self._notify(session)
+                while alive and not self._stop.wait(self.poll_interval):
+                    alive = tree.alive_count()
+                if self._stop.is_set():
+                    return
+            session.ended_at = time.perf_counter()
+            session.state = EXITED
+            event_log.emit(event_log.LAUNCH, f"游戏进程已全部退出 (运行 {session.ended_at - session.started_at:.0f} 秒)",
+                           pid=session.pid, runtime_s=round(session.ended_at - session.started_at, 1))
+            self._notify(session)
+        finally:
+            tree.close()
+
+    def _notify(self, session):
+        if self.on_event is not None:
+            self.on_event(session)
+
+    def stop(self):
+        """停止监视线程 (不会结束游戏进程)"""
+        self._stop.set()
@@ -0,0 +1,573 @@
+# --- 图标资源 (自动生成) ---
+# 由 tools/build_icon_assets.py 从 app.ico 生成，请勿手动修改。
+# 每个尺寸一张 PNG，base64 文本可直接传给 tk.PhotoImage(data=...)。
+ICON_PNGS = {
+    16: (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAC50lEQVR42l2TS0wbVxRAz8z4Mx6DDJYDCKIGBzWUpB/RRhHqAiHU'
+        'sIkiRVlEipJNy6qLqruwSxdd0U3KrooUqe2miypE/SlSVSTyL0ppFyAIHwdjl49TsHHMx57xzPS9wR5FGc2b9+be+8599757lfLW'
+        '0oqqqKgBFQVwxfBmV85yJQWuJ/cf8WPbtrBxCaiq2qlpmq+oG5u2w+TctifsfytBJKR6UMlUxAgENA8iAR5JKvbKJrnCPsm2GN/8'
+        'kebmRMbjXupr4/rFblZzRWJRnaYG3bNXVQ21fkrpNrNdJtkeZzb9gh//3KApGkKv7vDT03Wml3K0JxpZK1R8e3kStR50xXLIFuHJ'
+        '/Dqnki20BHcZu9LN18N9GE6JU50JplP/YSphtvfMQ4bYG8A9TF1YxNgcDbBTsLg/u0kyeZzTbx6R56S1Y5PbjzO0NgWJxRSRD416'
+        'xv0QzKqDeDHCGiM/LHKwPif0Dq5jEynnGP0tQ+nAQhPAfMni0LEE1GIIaSIa2+SrX1YxhfL9E23MLWeZT2VpNSyJ4sbdDKnNlxyN'
+        'R2pJkCH4WZQ0YaYFuTvSS0SzGfvuZyLhIF98fI6reZvPv52hPRao3XctBKW2ep7dJLu+xdl3W4g3hEhlcpx5r4dKVWViao53Ogw+'
+        'HepidmGFsmlRd6xUiysebvz3Kc4PfsC9+W1RJGEW1ooURLb398t0d8TQIzq9bxjEwjCzkGbgzNsewL+F5V2DT0Z/5UhzIxOCeSyh'
+        'UzhQ2C1XmVx8iaFaDHXrPJ79l4sfnUZZ/h732AUUeyftHlg2A18+FMa2d7fXznfR32VQrVoY0QYsy+LWgxfc+WvD83qiLcr4Zz2g'
+        'hQnIyn+0mKdUcbzKiotauPzhUUKi1hU/XS7Dg7oPeLaxRyqv0tUaQjHzKdcRO2cyJaqigTriOu1NuteJ9c6UH9kvf6eL5IoVgqJz'
+        'B08mhFA4rWwt/aOIu/A7ktqOV/zzmkaG6TiOB/0fPd86LPeHw1MAAAAASUVORK5CYII='
+    ),
+    32: (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAIrElEQVR42nVXeWwU1xn/vTl2ba/3wCfY+DbF3EcJBEwgRoFIoaXQ'
+        'YEIbhSZQNaqIWiB/NEcrSFSqRi2RolYoPZI4iDSoQgmE0qYcSTlMKCZQwlFi8IHXBxiMvcaw6z3m9XtvZmdnDd3dmdl5x/e+8/d9'
+        'Hxvuu/o55xzJj6Io8mLMGhBTzJ5Gcimjr9yXttD5dH7MtUbCgPgySZDujIMN37oiaTIipKkarDl5Ek8j4WSCWe90Z85VSW65Y1e6'
+        'BIKRRCIhn4J3RUwrTIGu6SkaPCkjs8e4kw1mLiJSRMiQxMzLHDUlTv4foRUioWmqpTgSWjxUGuA2fQf33FK1NcYtTrpDw3j7YBv6'
+        '7sSkGgMeHevqylCR57FWc4cWU0w7taiStuPxOFj0dgtXVRU8ZVz7ULEhFudkGpi2trT55JtN+LrnbpqVc7MU/OPVWmS5VNtZbFEY'
+        'e4BXMGkKTajfXsqS6jYlONdyA7eH4ohGw6ibUQFdVXCqJYRLPUNQ070Ct+7FsaepC9+fN1YYFcfPB2EQmQTd6qaXpTuTJYiiMFrp'
+        'VA132Ix+g0S0bkYlFk6vwP4vmnFvOIadx4IjDk/Ko+DD413Sx/9+shk1ZblYMLUUMUNJd+U0zxa7bBslb2KRgsFwHMFBsd6AW1ex'
+        'rLYGnzQ2418Xb9n766YUYUJOHJHWEzCGh9B6K4y3Pj6LeVNKkef3SFIZHi8uk8ZMr+MjwknoypYgNdrVH8aru5uxfN54HDrTSu8R'
+        'qa4VC2owMR8YvtaE+SUcv1hWhqm+fmxavxY8HIKXD2HF3EoEsjMkpQ+PXsXCyWPQ2BrB4Qu9aRGa9DlFWnxEzI8Z5UaBz4VMLYHK'
+        'PBf2n+6Q425dw2PTCuGvfhivPP0I8r0ZeOX5eqxdNA4u0tLUslEoHxOQayMxA83Bm+DxCJ1roHZ8jnU4TxNZEaAy0jZC2ky3W24s'
+        'Ly7AtZ4+OS6c8ncHr+OpRypRXpANRigisCtL53ho5lQcbzfw3oFLcm2wL4xSCktBuNCfhd7BqG138zhLA2wEyiVf8ry6dMqEgE9i'
+        '8vbgXWxouIAEU/FcXTW4EbGclUgZw5hVnS/3bvu0B19c6kRCQK8l1FAkinzSKNL9L2kCNiI+OO4OJ5Djy5b/e/oGMa26CJv+3IQb'
+        '93RMLAkg4I6bEcMs9hMxTCb1i1eD6di047/QjCgMRZfzwjTHLvdZxmdpHifD0MwFVnByc/LLqz3oJawpLRyF9mA3TnUpkqEzhz9C'
+        '7XfXEwhrttMmuIo/bt+OWPdXRMdAKObGpndO45lHq+kEHYe+6kZpbqZNOwXtPBkFHJynuPIQmq2aXYh3PmvFgTNB7Dg5ZPmGgeyc'
+        'AtTOnm6hton/AlIvN7fACA+aJiZhroYysHnHSZxovQcXi6NmtM9m2AHQYImBNpGXHBFi3oX9Dl+8iY0N54hxU9qiHBd++/QkTC31'
+        '4cKVDuw9fJLQUcWTj89H+dhCbNnTij3/7jAPkQAUx5qFZXhhcQU8bt1mIGl/wbwmJWcWCDq8UWEiB1BOoNpgfJEPaxaUYPGkADIF'
+        '1tPiT4804ffv74dO6/w+D56vfxxbVozDqjnF+KCxE387HSRyKhZOzKPD1bSM6Cg/oDGW8qdUFjPjY+fRoITY+RMK8O0ZeTRu4Mvz'
+        'V/HNKdX4ybPLca37JvzeTPxw5RLp9ZdbWjGpqgRb68dBJcY/OXUN+5p68HBV4P5ahZlgpHBHokseHo4M4w+7DqGDYjnLreFHi0rk'
+        '4SKr6e5MbNz6J3x88IRkzuPxSVNs2PouvP48E8x5HMsfKpIEz5MzN11oScvyFhTIS9380oYtYMkoMD+/3L4bq56Yj9W1JTjddgcl'
+        '+V74PS4QLxid60Nd7SwqKtx4aukCZGb58IMXf4MZkyegfsksySghFIpGeTAm4MLm+ol4d/fnqBibj4DXkyp0WBIJUyWQ/NzoGyCb'
+        'ZqMo34dRVGi8sXocNu86Rw55W6osHOOEahEEcgIYCEdRVV6Mn/90HebMnEy4KShqePmvLdi27xKWzcyVtDetXYade4/eV7iJf9rI'
+        'QsEwyM4XWsmmpB5aVeh3443v1eCtA51YOqMQ6xvO4uTXN+2SSgjwjeIAXL0G+tVOLJ9djGvX+/Haj6fbPn25tRt3I9F0R7QuzfYN'
+        'a64wPwc9cT82/up9aYZcSqttbV1ob+/FrJf7KTwNWTU7k8qVnpAsE5u7BvDBsQ6snKySH8Wge7OwY89RNJ69gryKiWb8RyidD/cD'
+        '3gqylCZwoJ1zB0+fXerDCw3nCVSGEOvvBFN1qJl+qNm5Ej4yo7fx2rNz8c9zt3CiOUQmSRDKuVBT7MUR2hulEs6IhBALXYcLMfpq'
+        'cBVWw0XV1JHXFyIQ/AuU/2yBsegj8JxpxECoXRS2ZqVL13Nvn6Oyq9+hFlPN2RT/29ZMQpHfhaONTcjL8UHTXaioqkRnsAv3hgZR'
+        'VF5JvjKAhiNBKIq5U6C9KGoEDL/0nWo8M280WP9FgtsxMNwFgoE2LibFIaKiWfrrEzIdi5Bj1maDYHHdo6V48VtVJp5zZwWV3gNw'
+        '2rf49WPoGYyJYDDXWxFWkZuBfT+baycjIblidjdmGO5qJOBRVDtETM7JGWnN6vljrWTC7CzI7BIuVW4JUVYQGqb3EOZ0y40wzrQP'
+        '2LlAHG0yYKnqeihmkVRswgbNLyHvL/Zn4P6ygT+obUL93GLoipXgrEscKf5e7Lhjd1WyO4pQa6brZqLouxvF/jO9CEcTspyO0+XP'
+        'UrFyThFVPQrsEhIP7huZldoFE8ea+7G36TqiCW5jf4FPw4YnquDL1GW2i1NfIHtDYW9V0xzp8sGdnWktxU6pqYOTjBn/t0NMq7xF'
+        'v0CHi6eWrFBFThcdknRABzawtDLK0ZRyZ2PqKGaYo8ZiTitZ3TTMLjk5TkjAGpKwFI/H7PY8Wbdyxu9vUlmqj2SpF+t8q61j6VIn'
+        'u+KR3fv/ACXl3qi0FqccAAAAAElFTkSuQmCC'
+    ),
+    48: (
+        'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAQ8UlEQVR42m1aC3xU1Zn/nzvvvAMhIQRCICG8AhFfIYqguKII0v6K'
+        'K7pSd1vabrWVrr8u7M/iat2ltrvVLq7VYtmtEsBdEbcC8hJEggF2gQQETMDIKwGSkHdIMjOZmXv2vO695w5emMnMfZzzvb//931D'
+        'op2N74CC/3cOagKEwDA87MU/sjdK2AcTVN1I2HVxq3VCXKfiO79G+XeYYKuIxSm7Bn5K20jeqz5bF6hh30Sp3I//lfvJF/9o7UMY'
+        'AzYN1uHxcMKJRqSziTxDLBLgUCX/csLFc1ReF8y4nqDJj+Abl4SQh/jK5ZlIJJg4Epx8m06+tldfhX/y+nwOMbpShBjZO+daEArY'
+        'QqGODAmSpCxJsFmX2rY0Yz1DtM+KEuqsSAwKL7MGLpxEPGHpR7wblvg5Nz5fwF5MmIRpid+6R5kDdYQlvxCX2DiB8qX+UalyahFF'
+        'iS0eYrGptnG2o5qpOSrz+ryayoQG5OH1etVClpGbDmG61om2vuKTWM8pc+GO0x9N2Frir5CfmSW3BQpL5m5VEcd+qOWURFFgyO/S'
+        'ohnRXg/iTBOCbmnzhrOcayGlas0mQZUTwVTOKpmwiDr0dQ9+9UE9rnSE5XkmCINdyc0M4LmFpZg/I09qFlJAVPcBl9/ofgWNAXmd'
+        '+yn3CxLpaKQ+bvecKFNGH6JUbHGse5rj8XJFopnS1d4YFv66BkMmcTmbLc74EN768e2YXZoNO/zoiiC6u7sd2uXcatdYLM6DjZK+'
+        'SXWLtCzHcUP21tE7gKo9J/HF+VabAKrZa1X1ZURNI4l4YVNyFa8Pr398VgSCZDu/1tmHPx88i7rGa0lmpf7ojChT4ZGS0a9kSJIj'
+        'IhVadpwc2F93EY/Oq8RgeAh/3HocA+yvlTYG4gRbj127iXRrV0s09VcGcOJyj4jtFjHbD5/FkTPNeGjmJJxo7FQmQx0/o0lasE3J'
+        'gOFi1ZKKFVkI1UIfEGOmkcqcsbKsEEv+Yhr+c0ct2nr62UIU244240aU3hxHXeJkEmPBYmN1kxBIgmn9nV11GDsyG4vvnYqQz0BG'
+        'Wiqudw9oAZW47Yw663FfMAhx5xEnuLvJ4JowDOYrNC4uZ6YG8LeL7sCWz75Ea08Emz6/KkmkcNuxZYbxqL3pvlPXca0vhvW7T2J2'
+        'eRGmF+fZPjCxMAdX23u1bGzlBd0XndBuuC4QbWsebUSyMcDd452DzSAp2Sp6yCPg92LZwtvw9tZjuNwx6CI5NzOEf1xyK/7m7jwM'
+        'ntmBwS93IdF7TWwVZ0ysWvc5ZpaNQXHBMNdzJYW5ePd/O3C1OyrpMVTEInAJVuYGTiGhLnVRuO2sc2AIz64/jbS0LCy5pwQtHd14'
+        'r+ayvWGQMbH80QqMSw0j0deGcMMeBGI9LNrcjXmTQtjz4UZsem0lps5bCk9mPvOXGII0ytYqwpSxI+x1uDn9x96vkOoz8eITlfjN'
+        'x5fwyal2O79I+9cSkjJ3QwdS1JKu7QsEV7rCQrpZqX6QRBTDM4LYsLtOJCrryE4L4oUnbkFqRib8BeW4JaMTk/NDuN7WjheffRJ3'
+        'Tx+PFd+ezjSxE9Hzh7GgLAMPVpS4JH/wXCcuNV0BTQxhRJpPRJhr3WG3T1GiJyuZyKgGmlyxWUWm8sJ0LLptJPKYSVAzCh9LIMW5'
+        'QZxu6kPlhGz77oFIjMV/P0YUjMUfXn4YJH4Dk8aPwWT2Antu9tR85N+5CD0DFOH4zYG2pqEdFSVqPXZ/etCDv55TqEEVzVKU1fBL'
+        'ygfUcuY3BBDGVGPrIMoKs+x4Nj4vDU2azV9q6cTKTecQhwc/eGAigkZcQmF2hiNISvkViopJI8UGO+tjePvjOtc25692YgKzfym7'
+        'BCaOHobz1weUUHVcARtTUZVhHJsiSWlPfe2PDDGJ91gehZSADzcicSn5cBTL1x3DgBlCblYAj1aOY/uHZZy35cw+M9ufWZorpcfW'
+        'eePTDlSfvGAz0DcYRWpKUAnNi0MNrTJEUo0WF6SQfw0L8xOLU5L0ADsKc1JQkpcqJMOPnsGYAGd87ZeqDuPr3pA4v+D2MUjzc8Lj'
+        'bjQpNDuEGeNyWESTe5hGEP+w6SwuM+3xIxQMovfGoLo/jsIR6chOdaC9Qo2OTIiV43WWoKV45RwxFh0iCS/SA47VftUWxsRRaahi'
+        'zryjQUmagbb7po1i8T6ipU4tRyZijKg0pIb89nZ9Zhp+svYIBpmGpxaNwLkr3bYJlRcNY1HoOnT0oyMsomg1LC+nLv04t5291s9C'
+        'pQ/N3TEQT0CcXf6dOzF0owuv7m5h53xSErFBfLhlC/YdrpNlIXFrkTMVGRxArm9QwQB54UJ/Ola+/Sl+eN9YzJoxUd7qTRMWcfxC'
+        'jwYiLVhDHPxFlAaIUgbRE5n6UFaQhjEsOPz2oy/YLbJ8KMgw8PfrTyLhTVfmZyJy+Rje+2AbnvnFGsTgc5eKTP0x6sOCpctxZk8V'
+        'Yi1fimesGz696MOWfbUs0gXE94arN7D7+HmsWFhyMxyhjiNreQB2FeYu7oWT4MnKAvT0h1n653HFj+fWVqMHOXb659IkoUzxtbR4'
+        'LDyGodajdmkYjkbR0tYBjtjNaL9qGkgmiMePNw90o+bkecQ9GTh0rg3fvmMkctMCTuy3LIVIgduOnOi9SG28YbMHB8ip441PLmDn'
+        'yTYUZ5rY/1VERAqJbRKiYspnEejXi4sxrbgAAQ8/R+wQaCYErMVnxxqw63ADdjYzE/EEVZeDBUIOwRkzWejFmLGFyEoxsPrRKchJ'
+        '97sRrcs8VF0e77lIiYimqvqy/cHKcERpxsTpawN44vWjtu9bUeuu0mFY/dgkjGAbcue60tGFF16tQtPVNlGqTikuxC//7kkGAEMw'
+        'vQE89eZxnLrUZQcLapWtTBDzpufhd09OvQnFErUX1WIOl7xXEGdnNqqBJi10Kc00d/bbDpiR4se90/Ixb2oGZrEKi5uaFYqP1NZj'
+        'z8HjomL1MSnXn7uEbz1YgfvumA6POYQ/sarscGMPwjGKVRuPIxantrAe4iUn0famenEPu9y00JvhBkdJ2FvL98TwYOOBJqUl4NkF'
+        'ZVi9uAT3MOKJyiNE2fwj98/EndNLRT7g+fihOeWYfXuZ7RM+GsGckiDmT03Hv32/AukpfrEuF+D+U624qQOmWYQshKjbiZ00kNy4'
+        'stimONXcg1OX+2RXgNn3pFGpAllaSfBQbQOz8TPic5CZzebf/wIL51bge0vmYe0rP2dQggi/2PX5CTS3dNgJazZj5M0fVsArGgsE'
+        'e0+0oTdiOhaqh3kL9qhwKbFQkvCpji3UhX01X2D9HlbLMiDHj8UMLpQX+FxOPmlCMf5pzQb8964a9IQjDB+1o7W9C719EbR39+HG'
+        'ECtgth7Aho8OIn9UoauNWTIyFX6f1GyUOTUvdCxztgOMBh9092BOfEmWNFrU0ToceG97NZPaKbyy4rtYu78Ffz7eij/+uBKV4xwG'
+        'DEM6dXvvEN7auA21p79CWiiAHy39FlvXh6U/fQEGk3AomIL/274OWcGYq69KWH55/1gX/rCrHq8sKcVHW3cjOz2AVU8/huSU7mA7'
+        'KhoRJMEYcKV81XDla19kUeRHq9bio7dXIeCV555//xyTkg9zp+XhlsJMFGYmlP3LlQk3BcMvJCtMjCW7v/rZK/jscC2GZ2fiy33v'
+        'woz0OK1IRjzP5o1trAKL3cD43BSGlwiefmkdlsyvwLxZMzTwQFRpKx3ZZEnFoBqMsBuviqF17+/Fc8u+I4i3uF/9WKnAO6s21GJb'
+        'bYtAllKSbDGPFTmiArwJUzUHsebln2HCuDEom1jMay8blHVGfFjxX434y98dQXiwVxAvNMqk+6ufL8UbVTvg7jzr9FGnM6fV+QrH'
+        'y7vONF7G44/MFd+tHM0d+DePT8LSN0+gpr4FP32A2XMigovdJl7bVo8YS1o8E3uYaHjPiUsrlcHvdWv+WRD2+vZ6PPNgMTyMwX1n'
+        'OrCnrglvLZuGqQyy6EdOdhr8wRB6+1k1mJ6ixSKZk6Da914dORPNSzjnFeUT8fxv38WW369klZizeJA53L88MRlL/r0ONY19uH1c'
+        'Jl7cfBy1F7rE8sQFXaQ9bq9rYcyDQYo4Jo4ZjgfKhuPA6QY8NXs07tIqO0vVr6/fjSstbQgGA243SGoSea2cYbW9LQfgp+6fOweb'
+        'PzmBTdtq0NrZgxXLFsFDZBrh8HrycBPPMDjs8QUQZ7UscbUArXXk/XEzAY4ouEZWbarFn/KzWaTqYoK4y0X7nsP1TOKpqG+8hKyi'
+        'cvj8XtHyFEmy9xKQPk5v1GpRCFozi2MsD8XKDfXYfqwZkZYGZMXaMK2kAIPRGK60daP1RhzBgjIYGfl212BOaSqON0VFfUws37AE'
+        'QpIHIexzpBc54fMoGzsME4pGIoUVNdVHz6D6VBNSCqbAl12I9c/ehtuKsmAMdcOoWQaaPQ0YPR80r1JGIckA0eK/HOm0hxkuefkg'
+        'hoR/UpF06FBYRAzi9avykjhPJeL4yR0mps24FX3hOFb/z9ciobXfGILJAN8DU4chLyuE/nCMmVOH3W6kHNDFhgRCNaODLICFWOAa'
+        'Llv1bN/5t+Tgte+WgzTtBDnzryADTTBnvQvkzxZRyKsjUJ4pqUpvmw9dwZCp3JeHSR7ugulK2A7+KM0NYvmCCRiREcSevQdwYO8+'
+        'ZDCnq/rBnegfjCDiz2RoFDhUXQ1/N8Go4cPx6lNTcORcFz48cpVpmjm6L8QID4KkUwkOVD+da3H/6U50MYEMG/2wqKtpJoMo8X7H'
+        'LQScFiblaCFOPJj70mdoHzRV1U9UAiFO/4hjWO6cz1eiKCdkO1c0xvAPY/xw3VmkpYRYICixPTCeSIjhhGwnEKyoOo0dJ9oFCiUW'
+        'yBdDvoSdmBLs3pULi/C9OUVyQqQdJlvPkBnbaZDK3mUbrvcntNGSNplUeIkX57MmD5PEa7A34POxgj+A+yunY2b5RAm9rXGQx+sq'
+        'MR+/pxBCPeK64UyG7IEkYUGD4IMapikxIzPdmI0QG9g7jQh28r2DTar3TlytFqeDx+dnJpbeO0bvs6pCm6i1SHJ/V1VvxF5yRlEm'
+        'ivPScBP0tdah0tkvdkZx9HynNmyUxIus7MxqJRUd/THUXuqxndQhxND69SaKR6Sy+J3jbgRr82P3XMBw2vTUQZpc/YvvGiWax66p'
+        'aFInnfvmtmOtCoQSZ/bM1jK4J+vYm2fNjJBXYns7LTlEmewhXiI+/XAxu8d016tUR7Pa3E2HAHBPCRfPHM1yiuW3VhvdcOZ0qrSO'
+        'xRLazJHYU08xI+OOxdO+hVzrr/ajqroZXQNxJBISNMWZmBLsiRQ/wSJWcD9y60jAdI9YdRSbXBs5VRZ1TzrZ29ELvfjl5ga0dEeE'
+        'b1lBBWoCOj4vhDXfL8fY4SlK2xABQVhPpLNRnOJMyJDpRBlX8iFOP8Ok1JknE71jfNPIUeErzbRUO8Uey5pU/JzBZE4aiaufKphE'
+        'eRwR11K8xC6soPBaIm6KtSWU4KEzHmdM+KTdqt8riExHYBcXDhRXjkgMjUFiE0u1DoL1mwbneUP+hkI9K3KP4MtEyFKmx4Ftrlat'
+        'avuYcWr7pjd5bOn1GoJra0e9xif68MO2AcM9jiWy3Ue1gQSl1P1I0sK2ARpwadU1DqdSJ1zy+uF1woOEp/G4M0g2DN22rYXd5R3X'
+        'kpCHmuyTpBKVwAnFRHNqYjPpODmh0LAsscftltnKUTCSGCDGc1ZE4Kajwi9zkjh748x4bAlbRNrmYFpZzpS/UrHI01uUFklEI8sy'
+        'H+LMka0CxdCCFSc6nuBRLy7L1m8Y4v4/Vf9ufXOH4NwAAAAASUVORK5CYII='
+    ),
+    64: (
+        'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAczElEQVR42nVbCXxV1Zn/n/uWJC8hC5BAAmEL+w6ylEUZRKvirlVc'
+        'y+jUrdIqjjpqq5b+yjjVcSlo6/azrQqK29RWKW6IbFJkU2QJIYGEQAjZyfKS9969Z849+03wanjbvWf5znf+3/9bDumsL/sNAUAJ'
+        '+5dSEPYfJRTU8/h7OIS/d0gIxGEfnRDMRf1H+HP+fbwdyM/mE9RX1G/f7weiTb891hn/0e8ZxGVfOPJ+/zM1D0M2yT+z+9h4ePM0'
+        'JJ9jbcIDPDYOh8qe/Tmw9vw+PXaf44n+iHgl7JV0NZRR8TCV4yX8QfDp+40RhEKOHLiZDVUT5IKDHCyRY6RmAnKCvF3/f3m/EhQR'
+        'UpAT9/jvFK41WyM4040SrhKw/E2NjfXpMQG7nv/elX1ScQN/T2RfDsJaunoQooFwOCRWm/VIqBCQFBOCAhOaQqmcLFED81fZyAdy'
+        '8JRS+asvVGp0hA/U0b+bB4icrxg0tSfDuydq2EID+IoLTQ2x4XtMQ1w3FZymHDPE3Y5szEg1Go0gpFSdawuVHQjpUd4ArOcgV9KT'
+        'K+3oFy44IrVCCk9piefJDnyV5IJypSAduZKUP0XlAhjReOI3CqMJBDCSEAvht+f3HY6E+IIGNUa05lDemNJQgmgkQ66o2cvUM6qo'
+        'NyOVE6FiatSjeh+K92pcxGxholZJvvJBerx91R21p0qJ1EjKtYXvZ/8ez+4b1jZDACsolRrtia0XiUStrePw2xzRiWgkEomwN24A'
+        'wPyOFRip/UuUhH0hOHJNiYUD8nHaTVvMe2q2il5FsaoksLeh26MaD5W2KAkbzeDCtL4PbDFH9BsOh832YldYjNZj+yVk3akVRKo1'
+        '1ath4wSRgqNqT1KJ8HJ5+BbwpPJzYTmoj7vYXtqAts6kEB7rn+EsMiIEE4floyiHrZLnCjQnRFsaoiaqwFjvaaJfCHWEBRPS15vN'
+        'jE30F3LCDBtcfl9YoaGP9Fx1+RwUSHhq6eTq+R2I32wLpRBaSF4CEVU7SHbM2v/jJxV44eNSpEgam7TZMmpGJJXEotkD8avrxiOs'
+        'NcZYANjWlVjmUWw0CdSO3DKO/Ey01qh+QqxxLyHmx0HQCcl9yrFHSJ8/pB+W5opQ3ZVSd8MFumuKGaT/xD921OC5jytAwxGEWX+O'
+        '4/+BrQYTvm9q2SuJpGPNthr8bs1+kDCV5hYBkyiBQgrBgaQV0oKrcRuAUIugtZQLiP0bcqQtYnc5Uloa7BQqSztGJDnRy0DNfU1t'
+        'XQbh7IFaRMkLR7GSrbyPxEQhdeAi0nwxYYUiWLO5CqU1HdrKKJXWYOKI8SVTLpKuEpFj2tICkVjAvw3JhRIA7jhiHGGh6v7AXK6+'
+        'nMBQa98QKqWnzIshOl/uOYLN3x1HMtGF6WMH4OLZo/h+NsAqtsemfadwpLELkVAEP3xRA17MDL/2eRl+f+MEBgeUY4eFfCg/3ozV'
+        'n36L3OxMNLXG8di/z7NMpBw8pXrLChG4BoDlq6/Vjs/0+MQh7TxRAKKZS3D1ZQf+c//aV41Hb78cy362AOnRMB5/dT3qWzolDkjz'
+        'w1Tt9Q1HGcZEEUSvngJQq+gLbe03tWjqlOvvScvExvPuhn14j/3du2gOfnH1LBQW9GUCaRKEyJq80RwSYIs2IeLbkMD4AMZEEmPL'
+        'A6hjbHOKqV+IqTaRQHX+9OG488oZeHLVRhypaRHTZCyjoq4dWw41iKmRbqvdYxtoAs6AMox3Nx/V+9Zl/Ty75msmSIL/unEuesWi'
+        'fNxjhxVhd9kJC3/s7UC79UlgGL2wMo7YJ3IFNJuy+ba1n61GTzZ1oLBvHpN8Ut8xoG8vPHrLfLz84Tc4VN3I5EjwxvqjTNJhgeba'
+        '1zgzXhhBEA5SqzceRZIJwjdtT765CdNGF+Gqc8Zaz7oYVdwXFSea5Ogs4ORmWph2m5gZ4UtCToiit2rSXjfbqWDW0QDif65rakV+'
+        '72xowi+vXhlRPMaE8OePdmLPkUaO/j90edSnw2LA7umTSNTsA03Gdf81rRSff1uDFe9uw5wJg3D2pCHdlIYgPy+GhOvwLam+IyCa'
+        'ZRp8JkG5yzE7ik8rZ1a5q8RWe0tl/Af/dbgJD7x7BAX9+kGbDuvKSIvgkcXzsPKdzeh0zzz5K2cNwbrHL8Lqe2YjXP4JOg58jlRj'
+        'FVJNx7S5892RZ97ajqFFvXHO5CE/IEXWQe5A3PvG92iJe5qRqvlaHNyYRZ8weZr2GVfVuCrUAkRoHzrFEPnZdYex7P/KsOL2c3DW'
+        'sN7styT+sLYUXamgILJjaXj81vkoDDXxz50VW9jfVr7CP54yEMtvOAsFGQksfegxLJg2Ci+sfBYZ4y5EpGCkbiONJnDehN64fO7o'
+        'HvNu73Lx9tYqNpEkHrtmChZMHorrV+7AtsPN3HxTi4fIWVuuvKe3g0M0cbdcygAVNybw1Q2VeO3LSvzsvDEYNzAXNNXBidPub/fh'
+        'jc3VPQZZnJ+Ne6+ciJjXhkj+CNB4C9p2v4/7LxnFn/3o8y0YUNAHT//6Tlw2cxgunT4IyVOliB/4DG5jJUbnJLDk6plnXPiXGLZs'
+        '37WXYxBNxXHR1GJMHV6AJX/ewxaDaidKe7skCIAaAyilmiVx3k7tGy0niP2/+JwBuG3BEKz4aC887pUl+S3/NrYP/vFNdQAL1LXw'
+        'RyMwZ3gmnKx+SGcrvOTntyM/JwNIJXDxvOl4YdkvEXL9dlK4ZcFIpFrrEMrpj7T0GB68bgYy03tyB1/X/ra1AudPKpIgl0DFyVZ8'
+        'e6QWHyydgbSIY3EWT2sxlYQIVlDF0TvBn5FDLbCUdlkTIY85LGEM75/JVLiYfZ3U+3/mhBIcOFyJ0/Fkj8F+d/g4vijt4G2W9M/G'
+        'A4sXIuqkuEcZS49yMiPcjiTGDOyN4TPOQ7RoIhLp/fDaur1nXP1jDXEcP1aFmZPkdvFSGFHYixGtEIr7xizGSrphABW+jHZkOFUK'
+        'mWCHUg0qwI7ae0FK9OtDjTh3woCA+RsyoB9oVzuON8YDA21oacOSl3cgFerFO7974TgmYz9ulxDOK1t1xihkTCDJ75kzplCr5+cV'
+        'YTz/wdc9BFBxqh29Mwh652bp7xy2IOMG98Xh2vZuAR5iMT+jEMrjdaA5IJEWkBi4JLBUSUhy99EWlDIqSkLpBvXZSsbSQmhoTejv'
+        '/HjcPS98gXo3j38eXMA0Z9IAUDfOIcXj0ZqQCY74GsXezRhRIKNIPgUO44UNTVi/szQggHrWT5/sDGtyBHE3jKq6NnxXdbp7OCEA'
+        '7MR2GbgrTrqRMT3hbrE3iah3njcU5bWnhdeolINN1vdJXKvjp1ZtwK76bPmshyUXj0PIn7nbxbpwjX+hotHcC01i1uh+llvNXiJZ'
+        'eOD1/Thyoi4g3JRnubjs+ZTroq6lHZdP6x+I+mgKp3kdCQRiHKoidNTTkjKaY0U05evBE61sCxRJNRZXU1s7s/ch9M4UgLVu6/f4'
+        'y/YOEbr2zVnYwbkT/dXvNBNTApYA5flEiwkgLzMN/fMypRkW7cfDfXDXyg3o6BSeZ24sgsa2pMAtRcDSKIr69MKJxk4LjL0eUWkq'
+        'I88CAx04Rrsdiw12d1o8/c3XZU04e2whm0yX/rW0vBrp2X0xhKl5eXUtHn6rFE60l957s8YUIDPKJugLQMUPVTyBmNC4woGxg3pL'
+        '4mXGUJUowH3P/5O/H12UhVYvAydONRgtTHVhyrC+WLunNkCp+b++x0OJ9jOgcgWKCJEevB/dEhvClu6rbkVJYW8erXGiubqRZCiG'
+        'nzIT5jA0vmvFenRF8wOtTByUh5OnTonJetL9VlSNEh1DIRIHppX0DUxetfTVsUysWLMBQ/JjuOnHk5i9V8MLc4FPGtIH//QFoAPc'
+        'IhBCXRMFpjIs7i8Ctwip5goaUHWnp+en9sTe6tN45J1STC3Jx90XjkO/WEKsmtSRny1/G9saC4MUurMR8f1rkepsx3/ccBmW3XMT'
+        'Y68JHWC1BU+Yy/zd4RNY/qf3sKvGQ6RwPPc2Pc9ko7yOBjxzw1AsPHuyeS6cgc1lrVizpQLxeAdeuW2yGTt1dBKESmzhxo9nkfR0'
+        'VQDS4YFFAmsPWY7EhOJs/M91o1F+ogH7q5u45NX16gcbsbU2NzB5wsAuUXuQwUWcR2D++s5ajhU69kFMkNO3jp2pEG74+aP4eutW'
+        'dB3ZhlTdIYnWRkhOrA8eWb0PlTV1FpyH8eH2SkwbnIEXbpmo21Nz8LeAyU+YpA6VmT9rx9uZGjvALokRe2LcgCzMHtmbeXps/4Wz'
+        'WN8xfLOvAs99VgsnErMm7/EOnYxsQ42LChCNhA0np0HAbmltR3NLq/QU2cgSHTo0b1urRKwYdz7zCeJdSZBoDhtDOrYfqsWFk1n7'
+        'vgflSfygCviozl8YmJN5ARE2olJNYBwgmfyw8lTavRxVmIW3Npbh+qc/Q2VDB+55cQsQKwhGdxwRFYr0G4kp8y7CnYuvxdsvPsH2'
+        'XIdxT3WqTCRj87MjWLzoUv4+nJnLnh0lVJgLwA2ColeEh/+0Fh/vrsFP/7Cem8GCrHQr5k+swC2sPIQK+Ulr5DYfoSpXR9Veod0A'
+        'SGZTlTYk2AB9tF33bS227j0Gl2kCZ46eI11qk5iYMiQHKxdPQA7zDomvl370l1HWdrZ6be0dPFCanRVDxCdHXoqvTJxN5sX1J/Ha'
+        'F6VyDxs1oSrq47hia0XT8fDloxjQZmPCwByh4OoZ5Q1qakM06VNB4LDO6crUa4/JU+Nji0RlCBG2updP7Y/hA7Kx6WCDCWj5aWop'
+        'pwjTxJvPHoQlFwxl9xOe/PS77nJTuOmuZdi6pxRuKsktQlZ6GJddOA/P/vp2RutTyGC84dZzS7BudzVqGtst/0SOhXMGtmTRDIwZ'
+        '0As3zB4o1dqTzpxKjoT4VqRSc6iMdXoytyESI5QYpmSFv4kVa9dbgogApUhUhFDqAyENOoFFeTHMHtUbN8/pj6H5Me1NKrGWlR/D'
+        'xh0HEHIiTBPCiLDBdCU9rP77Z/jVL25AH6YNPsHJiXThgwfmM7NWg3gihQPVzfgHAzoVm1DZvWtmF0Nn2CkxSKbV3M4uSTCU6EdE'
+        'ZsiepNkzNJh/MjN0pFaxJX59faXMBAvNeennZ2POiGxG6OKiiEG50n6nEpXHjhiKSaMHY++hat6XvxZhti3mz56OfMYAvYQnsrrs'
+        '/gy04uopObyPk+1FOHjsNMpqmsVW8Dcs62LHoVNYNLOQvXd18kbAu3J8FOlydJKHykmI+G8PF570JEZ2fEBKcgfzCg+ebJPbR7Cu'
+        'jgRTc2bjYfkJvMAiHJHA53Bv8I0VjzAhDOL3ucwjnDt9FF5cvkRO3uO5fSJzlb7P4XONfrE43rpvLub7nqgu3qD4dFcNWjqlGhIr'
+        'AKL2vpXf0AkYa26O5uUaOb2eZhAk4CiRsIe/fnmYrVyabmb8oFzMH5MnBKBNIcHR4/W46MaH0MV9DR5xQb+cXlj7+hM4e/oE3HLN'
+        'BVj1/GOIRaJy8gTN7Qlcv+S3oN1SYhH3NJ5ZPAVji3N1GU2XF8HftlVZDN7Ti8QxQW1vz7JQxAjBoRocSKB4QIiGdosJMB+/qRU7'
+        'D9Zj/ff1DIvMFnl80RQ4qfYeZHrIoEGIpIVx4y+fQG1rJ0LRCOMLIdTUNaHqeC3KK08yJyfFtCTEfouiur4Vi36xHJMmn4Ww8ies'
+        'K8L6zM1Kk3ZB1Cat3lQFLxSRPoa0/ZRYdJuaeACIlW/0E7LMDIrUtUwgggby5/xGT2jG4coaXHbHcvxk4TnoM3IaXvnyGH9mfHEe'
+        '3l46m6lwa2CwPvvzBXs6Eca9j/4vvti8HZMnjuFt7dpzGD9dtBDjRo3Csqeex4wpY9HR1YVvdpfiwgXz8PIT9zHPuYl7a55n0+U0'
+        'bKnoxJKXt3LbP3lwDvKav8fBsjK89dz9yM/JMW62qZiRuGGFyT3CU+SMB1TqkicdQyNEbiETFTrdFsf5ix/FzVcvxJ2L5vP9+wXT'
+        'gvtXHcS88YVYcctk6SIT7Sk6skCA8MxvjNHXRmzbcwipRBIzJo/EyMEFzFJl4oIbl2LP/jKdK/h09XOYNLwf8/A6jUbamsWYn++T'
+        'xJwkHrqsBCFmTe7//RvMwhzBB398BNFoyMS3KemRe1JFFT7hCj3+0NLfQOfgVX69e6aGYtnzb7MVTcPy+67TIDesIIZ+uWl4fWMV'
+        '6pl/vr8mjhQzLANzw5qIEIW+bhK5mRGMK+mPCSOKkJfFVJZxAr/fCeNGY/XfPtUFUjddeQEKmW9PvVQQnJmz5ETSkaJRhGiCm1oB'
+        'ch7OnT0Z73+6HSdq6zBn6lgrG2bcYIX6ihRxo6CYoEB/L1DUoFppOt2ByZfcg0/ffBIlRdk99uWqLcfx+7+X8/cXTRuEp24YI1dP'
+        'VqY43VNhnkFkH38yeuPl1R/j0adeQpih//4Nb6NXJM4E5Eou7+BwUwirN1ag7Hgz4xphLL9mJK8rsK/D7LdLb/01dn74LLIz03Xa'
+        'w65U41opeYSbchkTtCotqK72gi6Q8P+27jqAksFFGF7chw2qZ+T3xjkD0NyRwkufV+Lb8jq2UpO1ACjzGMvrO3CyWWyLkKP+RDwu'
+        '5Bc5OHFcc/mPkd8nF20djN6Gw8xqhBH1maWfIWKM77FVW7G3sok5Ynn47U96Tt6/hhf3xajhQ/Dltu9w+XkzZTGmBD1PBXo9CW+q'
+        'RogaM0dgTZ6YCHEn27On2zqw8vV/MrO1AJnRnp3fsWAQdpQ3Y+eRFmw51IRZg4Udrz7t4JLlm0R4jMDUFMr3nuQWBdnp+M+rJqGw'
+        'MIKrnvgMw/Kj+NMdsxipamcq76D0eAtzlqL470WjEQ2RMyTXHZRX1SMrloGG5jahWY7t+DimqMoz4TZHF3gF6nVMAZR/zZ8xniP6'
+        'sZMNiKWFzxirD7POll83GhkMgJ7/eD8SoWw0pzKw9LXt7Mc0nu31y2AcTowIr0P0S3NCvKDRQT2z/Q+98Q2WvLIFx5iHufFAA/bV'
+        'dPJgx8c7a5BIefjdtaPQO+vMRRZ+pciTL76LrTu/x8wpo4WQPQQiWjaXUeseVtDH3WE/aSjD1VoY7M7eedk4e9452P71Nuw6cAzV'
+        'NfWIML9+4dyxgXLWoj5ZuGxqPtZsO4lZD61lLTlwVfTHgymvpaaUjvevF8HTSE3Z1rj9hU2YM24APt1ZhXlj+2DWiLweEy+rbmS4'
+        'EUZhfh7zGZJI6zMERQMLLVLHJs8cLB68seIDuv9U0xEq8ma0uzsgg6oeOtlOmffwejRU7kP7se94gvPBu27CzInD0BbvxPGTjTh0'
+        'tAbbd+9DVbOLtFELFA/WCuprSMqFrtmh3ZwuzUYpCRQ0eLLIarB7BFfMLsHUccMwpmQgz0X4av7BZztw77KVPNDixgqQOWIuHrhi'
+        'NG6dX8xUPSR4UeXfgdr1oFN+x1Cf+SkZBbx91/MEESLSueher6PKzd7bdgKPvn9QJDKYaeo8wVS8vpKZ/Q5mljIQSs+Ck94L4Zz+'
+        'iOQWmuJlSTkHO7X4w32X4KqndyDKdK4rSQOFnTSQh9Sev3RgJDljJKur7ii6Gk+AdrVyHIoy9tjSHgfJ6odYyY/YOGLctA3ICeOT'
+        'ZfP9Kio4JzfAKX8T5OR63p436XHQETfzsbnMyoSVo2DAqVs8IBLBX76qDNQCpxeNQ/qA8d2qLuxUjChX8xmcr9ZVx0+gTzrFu/dO'
+        'ZX5AGh5cdQBbSltQ0i+G8to4T4957P7HrihBO9PW6SV5WPrnvahrS2k3lqRlIzpwAtKKJ7EhChLjb69eoYh0nDwdZ/SjVNvL6jFz'
+        'KPMZsktAs4axcayX1i6lLZ2wAvwpEwUyESHhD2wva0QZ8/pMiamqDKc9I+hEBs7Y4KYN6YVr5w5ihCcNdacG4raHn8eCOZNQfbIe'
+        'z919LZN7CMlEApvKW9kWpWg93Yov133ECM0kvPf+Zlw7fSIisTzsrGjGV9/X8tgBF4Tsx/EnHUoz2T2ZyPV/DIejeHvTcYYZufBi'
+        'xcDoO0DbKkHHLwXqt0s1UyGxliMCiiisVJhQUSdCcPcr3+GL/Q2m4sI6GxDIHkiBeJ6DqYMz8Nd7Z/BgA/GEKpcePYHKE3UYVtwP'
+        'qz78Cu3xJLJ7xfDInVfqAqq6pnZGicsxedxQ5Odlq1IuZlWOYMW6Cl4gpSLJRIe8nDM4bczaMDq+8YnzkZfmyICJYKQ2x3OZZWFM'
+        '8ChFjwiqQNCaNoIFj65jnlZUUkhPJjU8WYAkDzeoBIT/x5Du1bvPwtyRuVZsTp4QkVgjYgNhUd5CzrCFAoc2gC6mLfMeXIcWN6wD'
+        't4RYgdtARZhYHL+a5b6Lh+KOc4eYOKKqdpVTdJl1cCiCFd7KNPlBiTWbDsNz0rVvzWmDjBcE/AUiIy3s4+D8dMwenS9PjMAqWpRE'
+        'iC+HdJKILGQQhFkcouiW1vbHl8bav2jGYNaNq+/TwVK78lyHrHyGSfDeRuEmm8Ivcx8xeSArI6BTZhSdrIP3txzjRc1EORTWAQlV'
+        'DKmzL1QwyOvnDRaZXivbJCavsjQI1hRb0SdeXq9K8x3ooi1fs66ZO1C6xXbI216EnpmmqqYEth2q132ooCi1yo4drpq21sk5frHn'
+        'BBrini5TJXbSVJ3o0AkH4UT1Ynv06lnFVqmtYzFMYlWe2mU4XkDtg+ekiDylQnn0d3xxttG8QM2htX2oOnkCHmR5Z8tRmaRW2kX0'
+        '1vEF4iipEBVIlCzsaF2c+Q8hfVbIxNPkRLT6EpneprhizkDmxVHheFB7crr8UWqTfcjKVIgKZ8XSHButGbZcd85A5he4uqRDVPg4'
+        'poaRM11HfE+E2LczAKdOVOIW9EkXj6qQGKW84MCsDuV2dtaovgwhXf6eUGJqialVPc4b8jijYn4Kbr9ghHQ0aKDkTg+OerqqX6yA'
+        'ZxWg0x5gRikNBDAunT4YA7Mjoi5AleirMn0Eq93E0RqgL7ufSOeHEhUg8Tgo60NT/qkqvbpyVaYwO/704okYVRBDZthDBvs5HYxr'
+        's1bDjA36lV2E/UUZsZg+LA9v3jcb+TFiqag5/BKopLfOAfXct8G0HFEKR0Spe5T1v/K2aeibBR4G9+fg0+uU6/E/12Wa6Hr8e39R'
+        'M0NJ/Pq6CaytTo0/gvKLcBj/3FlfRsUxEkccIrDGwJrlUSA1Etdnd1JRPLlPw9yjSoqzjHYsUafSQuIckkOCuTn7JIhSTRXW9vew'
+        'dp09K4MsQuZxNpldFY1oaUuwMZmDEdzsEqHeOWwxzirJR7Y/fHVgU3KYVMqTFTGOOjgpaaEfv+femTkzYKrGgxWldtmJ8fDs80Om'
+        '2szEmq1EJbXKWD0aqPHVfQfKdQzt1vxH4gVBt5OqxES4hc2n+qAG37JJT4O6ODXmiaNoyWTCgBCh2koRWcZCLMulKqxIoCbf07DG'
+        'pevIknRxOipQxh4MWctqLWKDoSpNsEBUg7jIDWqPnRJZbkSC8S9bLlScU+Tsz6KDYTUj1U2SeVA+5fS5tmgrUGKteYIKMvJzO/Yy'
+        'OVSTFCUKKkmPvxL8bhoybrEUgqeOx1KbCDomUQMTtBUhd2IoODEOnSZI1LTtt+v7J/z0SbcyfSsbSnVY3HcTU0wQwptztAicwBkt'
+        'r1vpmX2S1ITUVModdsSZdDsgoY/CObp6y1iSkH4uGLWClQFS9UD2qQZhzXjw0xWTP2MkK1ATaB9gZquWSjIz6IeuHJE4EcJQeVkZ'
+        'PyQ0YOm1fhDrbCFR5Zlu8CwxsQEweKrbjAnG8ZFC1BBlm1sSrP8TtYuuFtwPXX48YL7OF/pVg54KjoR0nt3XCLgyvi9PeXJ0d5TD'
+        '4qt0SqujCK2JGiFxNtMz8pYUmgvZU6rrcfKiHR1lEUi3Q1DElPMSlXSxErdU5jZSyaRs29U+yA9d/w+jVs5g6uk8IAAAAABJRU5E'
+        'rkJggg=='
+    ),
+    128: (
+        'iVBORw0KGgoAAAANSUhEUgAAAIAAAACACAYAAADDPmHLAABoSUlEQVR42uy9d7hdRfUG/M7sfc6tuem9kIQ0Ail0UDqhiSKg2MEC'
+        'KCoqiv4EBcWGvSEqoiIqggoqCAiCgJSEGkqAkEYCIT037ebWc86e+WbWrCknCSE+z/ff94Un3Jt7z9ln75k1q77rXcD//+f/039E'
+        'b/vLGqhBSgGtJLT5T9D3hfl1CQLK/MT+Mf8X5v9KmC9V831mvnevhTCvL8zrpTTfmt9r81cq87rc/d6/316A/prXauG+NV+1/Qxt'
+        'roXMXENDJDdIn02vte8x19fun/Qjrcwvpfmr+LXSvYPeZK6pMntrdE36mXm/1oV7cMlX1znfT/qZ/HmC75d/p+krfx59oZtwz6E0'
+        '323mrmfXwa6L5ufWNV7DPPkg//n2JTX3OrMHkAV9rxHv2/5eyIw+JyydrtLn0c/98tLi5O56dI/p/bp7Fdreo9vDXNADZO5Gzfd0'
+        '00qFDdJhZcwFVc5rkltJ4Nda4SlDlsrIM7NBkLShfintYvpt1/ZB7HV5k921JT+se48I//ffyWRjzH/m/VL4d5uHN5uszIJLEjR7'
+        'jRyqZu7N3AtyfxXJfzUvCL+WhFSSoLvPt8+duU0UVff5flHpICiWHJbA8Efy4tpFt79r9HdLT2bXjdZMeGH1z1dJBLicPGVGv6f3'
+        'mnXX5v32Z9qsuX1WXQgnpOa+42mxn1vw97z+9iDafSNBZEEyG+/uK6O35O7FvDFhIzJ3AvjNUBnfs06OZQmZWWSZlZ1U8Y81WCrp'
+        'PjLSBCTotPGFWwTzveK9Zzk3l5ZOMs1rdNwidw988iRYQ7EwCXOPWiq3rzV3PUl7zafWXs8+PF1DxwNtForknTSeoM8gYYa9puKT'
+        'yadXJo9sf1+Y99AJ1XTPdk1Iq9iLi4wVJWtNzWsm/Kl1QkTPKez3Oa+bEwL7c/e6eDxIiwo+CObhssxsmVl3ZQ5praiadaw5oeaH'
+        'i2Kp6OdaeK3otZXZk+S5cpIKegD73DlLkWI1ohL1xM9j1J4sKXMPvEVCBHXlH4AWwb5X8kabjRKkNWRQ3+4zWDLtwghdZ5ustNvX'
+        'S/MAyu2WeY35bHoo3kAnQaQRlD3NQga1qYXiEyDC9dyCZnRfUvuTJ+NpJROh3CP59ykvOBrxuPEWiWiCRLB0Ga+l0Yx2eWmN2MSR'
+        'gIOeVfBhsxqMfpfJsAZO09XYnLDKNr9ThaYDJIwA2k9tyBtJW9dqVRTWZEtvLnJ3cMj0eY1TC9qWzr39udUAOjwSS4rw9kQlNsV8'
+        'OG2GQqmc00JHtVzwxheJxDtZj2vm/AV6QJWoTdIC7gbpmnS/taAlSFMgbgAtmnBmAN7seukGy27mNsVez55qe0KsH0KnXfPzWRMn'
+        'tfM9lBVO/gytUbfNQgSh0opXymo0q4a15M0R8MeJ1oDuJ+NtLNjesiGU0feJgs/+Bm+O0KkQKf68xJdRTnORQNBamU0s5bD/Vat9'
+        '7nnBe+f1Mpkg78vU+MeSzIN0i5+xCvMOlNcCIOfFqtDcXKPcUI5q1GoFUtvS3Yh9GL+ZSrKNid4TqeFg3mtRQpMTKug054mNjlKt'
+        'rZA5D4Y2Rkodrk8Lbz874+uRkIDsJWkyzYaGTmLVPZa1o4rPm3AaQJOj5U4oPR+dRE33JqW7L6cgeWG122TnxLLN9VoITuA0q3+l'
+        'iuDQOm2kwmucbdbBwXWHzzrY7FMptxdWa1mTSs8lnAB7U2XXIC+XUTK+mCbNx6aMtaQ7ec5Ik3Kld1snEEU8jZq9WLohp4Lsj/K8'
+        'jKzkHUVnr62UKmElSNSpKedrFGHRJTkgGZllq8rtBmv2rvjV7vPs6zOdODSSTQlvsEgcQzYl1swIs8F0XTjzQ4vl32+dw8xvDNi3'
+        'YQvpVsGdfnbq7KY7le9Pqdt87+OQArD+XnBMFa+vJE2gWTOKoKUKElrruzhtbn4uNd+PYOVl17AMBcUCrek6Ntqy5g988nUIothR'
+        'p2iNBY81Jh0g8zllUTL+gRfSAmEh/fMLjnXsQaKPVODNteGbZtvvFrBk1EuWlWhhyVEjx6lCr3ebbzY3M/KmtFPX1qYp/7nO7lpb'
+        'SU6yWT3yYrUOD+scGHeC3fsEmwntFtCEl2Se6MRyiGgXgSTfRRxO1euw4PRwskbvsxttZYI+175aVele3edL/plm9ZuFxdIcnno7'
+        '5s2X0mza/I4oH4K6+6eTapU2CUMeHUqzoarwiy34q1P3VjuSKdE+bPOCkEZTIGH3ryOzq3L2c/g1hb0dpyXsvjkhyxOjVvW2xzmC'
+        'heSjH+y9DraJ/E+7+bLkHA/tb8xJp7fLyqhU92AZOYhuMzVHPVmM5kURPGNp8ws6izfmQzO6jyJsDl0k44jEO5W8HMqraBEjCKX4'
+        'ZCk2F1LzezmuphdLpxVYzfoTYW2ns6ksQIrvz+cqCu2iOB3f40yBE0wyYewyKe/gCbeOSrC2gQth3VIL9hl8iJaGxppDXSdfwh9y'
+        'WfOi4cwA4kHyEZT9dJJJsyalvMRmvcaHygmEiwIk+Uu5000qJkKUO9U23LBrr2lh7A2500FqX7gTbxdacpijbHypnD2SMgserdDe'
+        'PPB72IMPcaPU4XtBSQ3h1LN1oHx+gn6epGlogzXb2xqpZJsHkJx4ERnbbp9ECgG9YvXvzI6PGJxG9P/WYT00vDnQnIAR8TyGUMoJ'
+        'iRAxg6E05yukd7YVh3rhbPMrZfRjvEqGd3x10MqavcboDEunbZQTci2iKaUkng1zeZ1LxnxXU3MgBUuTu3Ye3V4+dRxXZ7lkybTC'
+        'olhV19jxMbdgpEPpIqZy7GZkOsTq4BDHbaYK0k8axD5cwccoK5wNDjZXh5vTfAPuS8FhEWsKSgyqEN8qVmlkSgTiSWZDZbUTqWnB'
+        'YViw/1bIKkZoBIXBfHbDOgjFIXKWx5BKezOjw+Y4AXJCGwJFq6LJQVQuOrGXVDKaP51EROTVq5CvKlhjJJ5hyDvY5ydTTfknjpiC'
+        'uRAcfuqgefM8MxFC1by1xAkt4bSA2Z8cPlEgfGrSOBGlDGH3OZYVkp3FQpEjQxvIPoO2yRE2I5psEKtCr/rYkdNKRMm311MujBJs'
+        'Er0HD+9UuV12/5YiZCVp2XPvabMJsZm7TCT2jjVPVnOXsOoQrW7Tva0nR9dueqvTOJx4kvaiNRcxFJQrs2JdcLgqgucupOQNdhGF'
+        'yGXIwNn1ECGpk9HzkNnSSebO24yQA5F80q1zJpxjiLguTu0j5FZ9PtBlbGPKWrEGk6w96PHNvRYFOOEkOfwkE1ALH2xVh7P5GSdt'
+        'XDbQLRhLsuR4VhUhcrBev98w7T1MuNNP8TgtsgsTXSZMuN97xynjRFCR0ca6uFuyeVC0aSEnz6FN8KKtfaPQMcmH29u0EYUR5C7V'
+        'iEeeW48Hn12FV1ZvRV/RYz4rJzMRbLK5L/vVPntu7mVY/yYcOG0Cjj5gGEY0meesJBURJUPuwpUiFJm8pGIS1LHiMA3eBCShtvYq'
+        'ndS4cyKtb2SfR/sagc8uhfDca0SRhJnKaR0fcRfONNr7Upyno0xCVqach5bJ2ba307txsQbbd3uzpbJkpy9mvbw3KoJ0F3wDHBnw'
+        'BsUHtl5wbtQYp1hJfTtlIzi75pxNEVS6DEZekGlx++uuJ50HZP7FBRPB8T3YDrNTEfzh3Lw/a8St89biBzc9gvVd5l4bm2y84lSn'
+        '1WpKBR/CpWXtl5z9BONXVGtozLvxoROm4xOnH4pGtYVUurZC6s0QmYHCCQVnGV3I6sNuPuX2+hRe5rSZVp9QXsDmHWw+n80RJGsX'
+        'wSY3VK1UTIcLtx92TYXO2f8wZ6dmt7FwB44iiyKk2EERUU77Va26zKRbs5KtBi7W3sOyjl7OaoxMn7XVNp+fK+cH2bjaxt1Ss6rS'
+        'MQtWsEPHSshKpWAvNs3i+YWRrNIpVCsU11g4M6Y4PPQOYkjZ+lSnF223aE6JuXCQNrjUiitvfga/vmcJsoZ+pNIl3Y8KttI5WXzv'
+        '2sXUpFn8CTNmrbAvr3RixugGXHvp2zCovN08TxazmVb4MyfQNjGlVKrWVeIrSM58ex1dcHFIuSx8FpNB9j5VUp2UUnItRbmMpmYf'
+        'ymcmffRmtV7uPABKNNnMrfTrX5BwWoe9VhPGFHARinIQFKu6i+R5UuXyBTTp8tgk5WSXanxVzp0r5ZIv1r7xRjsJ1Jx906Gu5ZIB'
+        'KrHzubPzwoVR9BmKLT2HkyG/Hv44rRJ9bs4CUhhmbX4D/vzQUvzq3iVoKLWgRKnSilu8THN6V7AZcXJkNy9ck5xk829zMGXJPFNj'
+        'jgXrK/jod29DlxzEgqI4Za1Cckyzn+KTRTF75ErrLt+iWJZF0MHW+XQJH3cz5DSHf/uIwtUAtE6rswg+iVMULi+iOHklfKadntMl'
+        'gMgQhbSAJFPvRJMWIQ8hkvZOdCgxKvY8BRcjpFHxGatxrwVindupev5PxIKPq5FnfHhrLnTkxISNKkSS6XJHS8e4268bYQ/Y8yaN'
+        'wg6YzTBmXWjvy/H9Pz+GrDTQnR5SpxbXUF/zr/+TcaqZNYx2YZbN0GVGoKQJpZ5dVeDnf3vSmJcmKtwINIZkVUhosnEtaKNF8AgQ'
+        'QkQRPHrvEoATVb445oU5VM1CWKqDRgl/BWtKrxWDMx9De825Aa18/t9pFZcU8uU0XcBbMW+K3YlM8+06OA/2d0XhT6pkuyZCdU7D'
+        'L4ZMkhXxzPpkj5Narx0EaxmfH/fqPlRO3IP5AknqyVBdwSY2+uPP9y7CtmpunLkahZgyVMD0bnAxGjsWU8m2ixofDpsUK+O6f7+I'
+        'lZutgBotlLn8g7vH5FI2YqAQTddpgaDRvLulOAOZJsTIimaspZAUdEQI1UNhik2j16BxfbkeoZzmsH4NJaOFDLmR1N9ySXXI6Afa'
+        'N3oPnxA1OS98eoI0e8K1IGlKFqEg4v4U9B6hZXwPpUNFMCdWJS5ZuxVrt3aisIudu8IKSahUiffrhNRmHV1xJ66Zy0pa1V9Bn4lz'
+        'b7z/RaChxSESKO7VewiOSkIxv7G+Emq0QG7upydrxXW3P2Xusx+fi6IO3MNxLYe7qHtuX5+gSMrG5SbM3N5Xweaeboee4kSV4jxL'
+        'EHBO/JDPJUWoULq/scIr2KTpEDlm4TCqmssxeCCNK7hpHwYWnCwphdiVUqkksUVAjwSglrcfvPCa42P4okJQ+TYMTBIU2juDfJPG'
+        'Ht/6yCL86MZH6KGGDWzBMftPxFlz9sOwAa2cSRNJ3SAL5oVOQPCBvPcs8Z/5r2FVl/HeGxu52qbrTvWeC4IOC+Ru25x24xw3mH//'
+        '/bEluOgdh2BAg10eEYqnIpx49kW4kphuvN3ARa9uwJ/ueg5PLV7DoA6Fr5x3HI6dPT7mQULaVofEjddizo/IOC+SYBo8kov9EkpU'
+        '2o2WtQRp5QtSZs9lie4pt7Y7k74OkBSCtEuvKu3r0jLelC+QIJZfQ9GDViNLUpNIIGbstZvrV82D/+HOp/G59x+PGVNG49kXluH2'
+        'uYtw28Mv4d1zZuDsU/Y3IukROiLYNu8zhMykdOqtKLfh93c9gIaGplDNi/WL/+UPO3k+6+hhXeQk5ugsSvjHvKU4d85oTn0jVE6d'
+        'p5WFHD84BLPLua2niqv/+ijun78MB00bg29ecAIm7zUWdz26BNf9cz6ONcIfg/NYjwkmImgWTv+ycFtNoOoKRhn/vAgmxOMfFe8R'
+        '5TyM81mtaacBSAKsBBeIyRZfYbNJm8yrFre5gmvcLtRR8eG5JAwvSCLJOvhSKd/qM0vWoK9a4NSjzEbnOfYe0ojTj94Hdz66GNfe'
+        '+hQefGYFrvjICZgwagDHEAWDVUU4mWB7aYXqxVc24+nXKsibGzgSKYLWwP+sA3zcIhKv26V+G2Qzrr9vCc45YbJZvD6XYmbVS0gd'
+        'qozKCPIwp/DJRavxresfQFNDju9deAoO3meMMYWFrbPjsFmTcc3N92Phq+2YNmZQkn9BAjgVdeljn/fRBWsHEbYsOqPBd/IHkRNE'
+        '/G/CUBqTKl3sm7GNcSVbJGALV6atBkhVQA+FZEVU01RP1z75GIsfECJUHGlZTbj58LMrcPD0cSg3NAanxDpsp715Gq7/yjsxpH8z'
+        'Lvj+P3D7vJcCxk+HMnEWgBy0UaUSrv/XfGSN5jSwU6pFVpeb+5+g0sFxFAHk6tbUhXprTVj4yMLN5nubfu5mgCwnYb3jzDX/64yW'
+        'u+QXd+MQs+m/vewsHDRptEMh2d+b144bPhAD+jXj0Wdf4YyedBhM77h6o+4TS9acWNkqZD1qOfi53j/z0YlwCSPFiGoLMoVHYWmb'
+        'I6lxupBVvS+peqiVjkAKKxy2Pm+zTgEk6p0RjkWFj2V9OTY4hvw92bAC8xevxsEz9nbFFl1j2+k+c3BrI3746bfgjGP2xU//PA9X'
+        '3/KoQzpwdtAjYGidsipWb5O4+7mNNnBHSafnuIgJpFCW1m8gFGIX//YetqLTlzWW8Md/PQXdMIAKL5RlUz4UdqbUGoVvXH8/bvz3'
+        's7jgzEPx5Q8djeYSQnTgytY1ZEYLTB43wvgEq1mRcunbmxB/ar1pkB6nyaXzEPp5M+0Ppk/uCQeckSKYKJ8IEyb0ly6nzhWzYDuz'
+        'qE+40kdvsMLBCRX4WFwl6BbNqchgShWXTj1CxyVMthlHbf2mLkwaN9J5vaoawylO1NhvP37GIfjiOUfjn8ZZvOI396HmU75WhZm/'
+        'Ze3yBTff97y5jZwzEZoKKQ6nKOMi+UXUYheb/MYawTl2NmhqMLeaY97irXh5bQejm2scMjrD0WtU8xevvhvzXngN377gRLzz2P1i'
+        'T4GI9ppOp3n2aeNHYOX6bejrrYaMYBRW3nuLY/DQPY/iTkJQKsPrpHbgTQODVWy21d6EzLJQeRWUBxCqrpRIVSfKUQs+xDnDzX29'
+        'XIYaufZYeSTxCKJ20CGyiuALqx3WmM23NmisUX+ubFqNvkNdh4bGCYdMwvc+cRKeWLgal5hFrShGygjnbHX3lXDzg0vM4W+sC+cE'
+        'FbE8Fl78b1GAeD0N4YrdNkytlVpxw70LzKFvor3IOGLpNuHd5396J5atasdVF52Kg/YZ7UqvqM8VuJDR1hwqmDpxNLZ392H91i5K'
+        'kFHtRHGJuRAh/q9LDrFQiNA84pJrPvciQtUHXFATofimdVI6FkkGz6kP4R1hOvWUl5ZJ3tlvrI9HZcT2ERRRJ9kvEQtI3rm0P17X'
+        'vh39WhrR2tTgfJWihiSHWn/6zHtmTR6Jn1z0Fix+rR2X/vxuVH0NwDzknfPXY2NfFh+2rgtpd6r99TZf7dD0sYN7SNU/TR//z3kr'
+        'sakqHEDFvK+30PjiVf/CGvN8P/vcaZg0evCuPzWEjM4Rmzp+JKnqNe1dVFmETCqhCXC2oE4gj0xKTQRnM5EUnzjz6pOKLrscNaHm'
+        'VIEUDK701SbtCzxegGSC3UshSF4bIHqbITOseLOtKVHc7oSMhUZjw+ZtJu7vR45asGdvYJWnjB2CHxu/YIkRgsuuudcshkZVNuCP'
+        '976EvNz4/0aX3A52VySLm8qAZFSyMWW1Rtz60MuEQ6gZTXnZL/+NlRu24aefOdU4d/13L3Mhva3MWrRiqPm7oX1rkgr3QA8Ru3yE'
+        'W0+PVfT+kLtVFXMeOgshoHOdJJ8/wZcUKaY1d102CCaY41qnYsjbhEog3GzvC26osPVnKmkKQuZKUSY77wGS0XFxXqnMSli3pReD'
+        '+rck/XF75qlPGjOYwqjnl6/Dd//wXzy6aC2Wru/Y4/eHtbcFRKNFbBLG/rVZOcVqsbZlFXoW3o3Op25E1/y/oLphSX0aRbv0Ky1s'
+        'XsafHjD+R9ZI9/PSKxvwgwtPNps/YM+zDsqFyzP2mYQXVnU4G631DjUAdxDptAZLy+l0nSU4xXoTSnA+reKB9Ugg39NgXViHk88D'
+        'Zs7VmPPQHCKpDYmjAAZAuoQO6hq4EOr3iCoq6eS0i1Y1v//eLYtx81OdOGXWyERd7PmffcYPxRXnzcFXrr0XDy5cD10a/r/F+GYB'
+        '9hrWDx8+fipmTRxCvsjqTd249m8PYu5dt6Do2cLhmCInsm/5oygN2dtFIUkmw5WCu7FmY4b/u/oOPPvSSnzLOHyTxw35HyNPTTmL'
+        '8RMn4lu3PI01vc/iG+/ZFwPL5dgXoXyQzzgJrw1Q8xWyekyn5MSVyoPJdoLiHHVK0ZtQXDsgjFPRoQ5OsXwsRIRGT6URK5U6qU7l'
+        'SdOHDuoqeLzSaY9XNvXhHT98AjfNW02Qs1MOnsjdvTqgkffkINuPOGT6GHz+A0dB93WjRfTu+ojv6rSZD3jPUZNw25dPwllvmoDJ'
+        'w/th4tB+WL7gcTxy63Xmeh2EAcgHjELj5KNRHrkPSqOm7+ybcLeybYptLtfwnNn8z7//SLovofdUEJNvzNqeeMAYHDBhCO5/cSPe'
+        '+t15mPdye9xcjwnRvuCmGS6XJYUzEWoR7tAVCZ5Q0X+CczEyz4KwZJdfcuEVgtu6HZ5P1JWDKZySiTdJ4RWfAh/nCxHaoTxoEfA3'
+        'LHDT46vwqeufw+btVRw/czR+/cljsN+4gZzn6CNH6LVNPejsK9DWlO+Rtd57zCBs7ujBqldXojvrF1C3qmcbKqueMYelCtnYr86O'
+        'H7HPCPzw3MMYZ1LQZ9/0j7tx6ZVX0/PvO21vXPuTKzF300BUS/2RDxpnhGH0LjbPLao06ns4NuCkQyfjnLfsv7O3v5sH2NxVpcgh'
+        't2F13oh+jWW884i9MbR/Mx5euBa3PLEGWztrOGzqYHbTizoMgExhciH6KnYAzuiYGPKYCpUxeJXD9kr7yzore/SOSyYI7nmjhgUw'
+        'xFtlyUkXCYQ8QRXr1NvW2Go29Mt/fhEPLNxI9uvzZ8zCR46fxrg1I8XVLvN9L0n6qZffjnW1frjt84dg9ICm1zvEdQ57xfzvo1f+'
+        'A69tNiGUHEFubc+ie1Hb9Ipr5zKhYeOEw1EaNhmjBjbhxv+bgyHNZfNsxhiZ075s1Xqc8L7PU/buuCMOwq9/9HVYQNSjSzbgI1c9'
+        'YDYoq3sep9UK7pUUGKHWY0T/HNdd9g40SrlHgYa9ykurt+N9V8/Hew9swxffdZDbo1I/SmRZ2Vrf0Ydzf3o/lm/YjvFDmvDTc2Zj'
+        '0vDG2N8nUri7a98LzbxsKkIaPKSl2SQXzsGn+omqcrkcMTYUDGRQdVUmxBq0TMq7knvidaKfOXywyZB3/eQJPPRSO0n69Z85Dh8+'
+        'bhqpO+du1Nzmc4lvL7EafT3d+ObfFxNKZk9Oke2ov+K8483XCtpUBy1Kw7iDkLWNcDXxWhU9Sx5A16L78ePzDzebX3JrWOskB+6H'
+        '1/yVNPCMqRPwq29fjJJ0YdGbpo3AuSfsw+gcQdrEOoeVVc+i2LaenrFNb0dJ9+GyDx23x5vvrcelNy1E77Z2lLtWsSk1q13pCP2B'
+        'w1rLuP6zJ2DckFajGXvxnp89gY6+IsFRqgDScRY6Z6RS7FCWPtvo2+oEYpJJ6/BzGcN7dhiECvBKFy7UQutWnfEqMraFnJ1SMrQ8'
+        'UTasotG+vS8UKj533Vz8de7Lu6zBq1oNH3n3iehY+TweWrQFKzZ2x6rfG7jze43oj4+deRiaa5uNzPdCNrWhecbb0HLAO5G1DqbX'
+        '9K1fgvUrV3Dptjvk119euZq+/uLKz6FMvQbdwd+54JR90dyQo/LK4+h84gZ0m8igb+VT6HnpHrMUFbTWtuD9J++P6eOH7PnmmxuY'
+        't3gzlqzvRnXN8/jgmXO4l7Fe0bR3VfD9v82nYpmNVqxZzD2SRCR8Dont17q+548SSqEflNPDST+Ky8oxhIfgWcIRDUhOZxIbRU1w'
+        '40EWcADSS5VMM4jKpYeF7xUQGNCS4W+fPQzH7DOUbm5rZwXfvuUZ9NW4X7DWE57aXnP21PFo6dtAl7jr6XWMud8zp/CMI6bhsH3H'
+        'oH+xmfHxRv03GkGYeToGTn0z3nzwLOwzaS+XI6v1upi6VuCqKz6F6773BYwfOdSdmFofZSXtPbQ1lvCOQ8agb/Xz1DJmiTBk8yCU'
+        'Ru6HNnRi2l6D8YGTZv1PIaj1vG9+dJUJvaqYOizHoEH9Y0xuD44Fa5qbvO3R5fjnk69ge08Fn5wzAf/8wiFoboopd5f3UfUH0//O'
+        'qnhfC6BCaTngE7xwaDLnzmFkhpAsNKHp4FDISHHCeDyLelXwuHyf6i04EmDEivatVwp7DZb42Ydn4Nb563DJjS/i5APGomz5BYrC'
+        'XKtStzh5QwkHTBmB5yrbcc+CDfjEyRNTwM1u/1gM3gdOmY07FzwE3cCp0MzG+DV8+ePvw3uPmkqNHbqyLXQX29dMnziW/kIl0Yu9'
+        'L+maYc86Zjp+d/fb6elEs9ks2UTP3GME9WNnHhpRyXv4p1Ip8OjSLejd9BpOOmamUa61Opvm/KEGTN9riDn9Ct9+71S8/cARRiZ1'
+        'XdeyKw97KhuNCONwfRs7teInnAyUwxCMLkbh+QGsAJVCaZcaI4N0OfWukz42F77nnBXLEpImTh0LMAy5gW568art5Gi97ZAJrrOI'
+        'Nn+Hk1Ot4ehD9kPPlrVYaSKC3t5ij8Jpe78dvRWc+42/oq9hSF0jxYgBrTjrzRONq1JzUGwjEELJ16/6CU+85MzflBFtGD9uNJkS'
+        'Icuhda2nPASf+t4t6KxU9sxUcQj6inmuDvNc3e2rcPghM53TXfcil+rdf8Ig9Df+ykMLXSgo88Rk6hS4wjgJn1ZOORnIpOnglwtO'
+        'HrmO6SKYEOnAmAXHlS5+JD+AwISsVjKVxJtJKVLETbKevasQeieyFrhx5i7ZTA908KQh7KT27bQBdoGmTZuAvo52dPUpLGvfMz/A'
+        'mooLrrgeW/pNr/MtamZxzz1hKkreobSnqy5TZkTVOqKElFFRcKg8He3yYVNHxFpHcssbmvbBx772+z02VfbUvfBqBzmnuXFCp4wd'
+        'sQvXwTqBFTQZbXjQ3kPx5PKtRHgVy8cy5Pqd3yUS86yib2YhY8jqOA4sdxMhr+m/UmB8Y3C8TNKDObeuK4ca8U0aKiUXYBYrGWvV'
+        'QsikyZQ7d823G7f1kVN36JTh9GCuXl7ddWw/2oRylW562HWbe94Qz6fN53/zmr/j6c4xSTXSrc3oQS1G9e8dlRYJXYyZC11h6FeV'
+        'iyex+9edRIe4mbP/WFRqagfgqPOk5m8fja/98hZzH9ke+KsCr5h1sOCrwa05BrS1RPtfZwYqpCXPeNNErDFr8NK6rlhgk6quuiky'
+        'hQjVlLFHIisiqlg7uj4i9FCsobUDn1rYmAsKQ3ky+aDQhlfUI0wSbqDQ4St0fV9/AnWev2Ibeio1nGgWktJsgbRo5z+D25rRYGyW'
+        'xautau/ZZS0mjR/uevBJ/O6x7cgbW+vc6Jo5xTaMK3n7XPRwt7IMVDGOLEoGsIsVBBHAFbVQ95g1fjAaSll0dpPNyhta8YfHe/CP'
+        'e+dBv6GwAq9s6CJfZGhbk4Ph7dKkubU/ZPIwypjOfWkTU+ClrWZcn1OsdQOZRFbXXhcKfJ5kwJN/SK4ounb02g774RAuHnLtHMSs'
+        'PpZRXDELnTsRgZJmAq3Xe59x6MpUTxDcm258g3L/nXwAexqaGspoaXCmZ2t39XU1gFVrr6zZiM9d8zAaB4+vx9UbYW01Hvzph01g'
+        'edbk+Qs+ORQNKSa1lAmFGm1/lVVjJaj8gS1ljB3SEruSZX1nTsPgsbjkuieweMWqNzRZ9pmssz1sUL/Xs2e0Nr5jqbEkcf8LGyLt'
+        'ncduBOa1lBfJq4KChcI32hTxNVoEOF2sTHsVH9gua65xsg5y7NuvfA2zFuNQFXPQgqlbQswJm/Ks0In+v+vn4uZHltXbq50MpaRe'
+        'dvu8m03YqOWuN9+CLs6+7HfIRu6/w6IripsvOHlfEiTXOVaJlHSy4lBKOmIe6nmKJLsJKpIumn+fvP845hTKdi5dW0jiyJn4wFf+'
+        'hC29fbsVgm09zjtvaiy/rl6z71+8rgPHXfZPygOUcpm4LY4p1GE4M2rujACYyN1EIWJoAinH6EGowEEo2Ny7tjSp6jEUUsXmQ50T'
+        '7s03GsTTziZD6tAnQGVgwWQItPga33rPdBw8cSBJcWtzmbOKuxYA+3MPiZdS7LKqZh2Zi775G7T3m5VkxuLpH96/CeccNzXk5bVP'
+        '7uTsLXuYmvTMqNzT5/v8PKkSh6nWUz98+igqGwuOLuQOWsC+rXvIAfjol3/lzIreDQTAlqJr6nXtGkUZJly0f4+cNsSE0bMCxWtg'
+        'FkthbtxH4IAf1WgqtAxxGTn4DCoNHBfwLel6h+ILIUgzpx4pxqw4JIpXQaEtK81HK24FUJ4ZIlxuRP9G7D28GWUjydauuVWt7OwH'
+        'WICHCQW7+1xWK99FfG2dtJ/f+C/cv6rNhEaNO12jMAv1vqMmotETNdjP0ZHEyYdd9c6XjqluzTx8gpMy7H3vN3YAZQU1Z0EipCrZ'
+        'WlnCc93j8LWr/2wOoXzdSMCGzZu3d7+OH2Q3RNHnjRjQjA6jMQa0luqKnDo0nMigCajB1HMqMTjEH0zBmi21//Wfx31/kYG5Frp1'
+        'PQjRM1ZoBi8EAmhRfwp2hb6ySZp7n9+IfUYPME5eE7cvVXfp1G3t6kGFvFVlHKWG+tKq+YAnFyzGD25djIaBo3ZaQE8fe+yssUHD'
+        '6FoXL5wK5syxnbhwV/gup6QlTImMHdlacPqajU8xclBrqMWngNn0Dkotg/D7xzrwj3t27RQOaCkRrmBzR+/rZBAFVSgt5/Kx+43C'
+        'gpXbCDwTXuqoVkKbu0/42PWitrnQtZ2HDXbtdJrxf3lo2HWmLuessIdtS1+bKBirr0Ozh/aNBdr3+Gdx54rES61Dz2g8t2o7Vptw'
+        '5qw3T3I3SJUrtUsBWNO+BarUj4Rm9KCmoGns13UdXfjIN/+K5jGzd6libbPmuKHNmDKS06vJ6Sevt5YniFqHv1f+1AvNFDisKwp2'
+        'P1XM1E0c0ebq74L1wC7jf4Hm4VPwf796EEteWV3vD5hvRw1qpI/b3GM2plp9HTNYofDzqBmj0Wt8gHue21AXDTmTnTOphHDNpGCC'
+        'QE4HB2oZ5hB05lQTKYVNawsdCbMlqTsktWML7LK8gKw2qcVIZyGkiJWkBLYk+atIGEZpUyTueHItWhpznHTAWCdPtd7XtY9Ll61E'
+        'qW0oXXfiiBZOKYOaPc679BdQow7jrO0Op1+4FusTZo/hzKyNp3sClr9GdUOXZXPM6gUXOiNqyTOB+gqKDqbK0dLPnjCYiJs8Mhhi'
+        '11lge8sNex2K93/pt9jam2QKzY1PH9WPfIlO1Yh1m7ft2mG0EYrZJIuXaDRh4K1PrU0ALsx+plTI2yjOBHreA4lEOALg131vNYDM'
+        '8jq4uUQgGnJZJZnF1mvHEiJDL1p9OSlUJXb4edygwjzsfS9sNA8zyKi/Blc/oITMzg8uSjkeeeolNA0cbkKvEiYNa3GFKSNEl//o'
+        'D1hcTETCbrBTRahWFDh+9lhn5yn1WwsObV7rNkJU9oyYsU4eVKvv0Rehi8lRsVWdCJnNmzVxKGpacdOYVZ21hBZ/BzVuBKpr6MH4'
+        '6JeuDplCu6YHThroTGvbSMx/funr5wyMGRhmfKdBrY1YvKYTr4SsqMNdOudbkaYKnEm+RzGUhSOTOn1P7CsFm8oIE3NEZ7ZFiJGw'
+        '3kvXzOyptQht43Vc9wElpEN5MmQDhcs0PfuaUf9benDqQXuZH7kbkw0DIcptu3zwZ9eYBTfO3an7j0S55Jisbr7rYdz4ZAdKrUN3'
+        '6PKpx9k3lnNMGt7qLFS1OxHEktNgnDYl8spQzUwEwffhhe6ZnkCOYQVx1rgB6NdoT1HBjF3i9e/HiknehGc6RuGrV91IGUt7IqeO'
+        'bDUOXhsaBo3GS69uJrxlvZdort8wyHxpobWcbpxBK4/3PLOhTpBcZjZ2ZDkH1yG6VOFphfLgC6lAXiHY9DHhtehjVDCYE9fz3Pmc'
+        'Dsf2zj3IXd++Z6IIbWM6ghMS3l/7cP+av5aSQEfuyx1AbJOEbCSvud6FL/Cdz74X7z18FC46dW+ygwuXrsQlv/gPWkbvtxtcv8Pq'
+        'Tx87CL09PeQovrJ2LWPrC9d6Bk+f7mU20SQiTac6tnJK9qhyHf6hwQjYtNH9UUcZ79fndYSgPGAUfv/IBvzlzocC99HVH56Ji986'
+        'BRe8Z46rnyTPIY3QeHoY8gOMI2jX7fan19YjpDzbt4jwtJS/MIJ1GJ3NJt61hhTsF+R+YohDv3rkqVIRqOnJD70jpVMXn+nNwqZD'
+        'Je3i7suaLb309b7n1uCUA8dg2doOctKG9mskR6YuGjBvPWzSABw+ZSCZjo0mVHrPF36Opkkn7rbkLhgV8+z9t+Kgm36AaqWKLM9w'
+        '2pzD8dPvfAkNqpsyfCqjRkgmlJBxc4lkitvapWR2UuGL3uSUiVIznn9pBSqbVkL1mfPWNAhZzUHZXGNL/rpC0DJ2thHie6gN7qDp'
+        'e2O4iW7OP278ru2/cI7qY4vXES1/Z0/B+Q2O33WSrJHMXUBV3GoYOSO4RdxzKBPtXmBbkfC9oN5XE5UtyylsJa5dDzESCX5JJm1j'
+        '6U0ryfWXHblrIl37a5t78YGrn0J7Z4XUqK0J/PLjR+OkmaPN+014U92+i3yAG2ry1vO+jlcbZ0M2Dnjd0y84Ndu77EFUNyzbKWN4'
+        'zlmn4spLP2U+agNB26XQO9C5uLA3UNIGnVo4bsPGgWjfshGfvuzHuH/ufAfgNK9pGDYJ2eSTjTWuhFlGSsndwL5rKJbchf/8/nIT'
+        '3bTtogjEjlrjIDqMJ3z1Dqzc2Ek/HdJWxg2fPBDjBzcHNFggq2SsJmRC9RtChiLBCRZs/riH0PG4o6gWnq/KefYirfhpz3Ydqcgd'
+        'wRN7zhnz+QckcDoUyoEXxplQ7s8XHYITZwzDPqP7ocGczKWrtzjgiNz1qbHS+N1rbsHSyqjdbz7XHCzub8fNd6dG4pY77kNftebM'
+        'jd4xgaWITNLx5yHG9hb0Qk2wZWIX/cSlP8IjTywgDgPnP0j0bXwZ1Vfn1tXed2cKLDEl9joKF3zpZ68TPoJPp8Cy9R1m87dj5rg2'
+        'fOLECbjZrF/YfN8lqBIIPqGbdWQaU5I5gTLfUB1MQPAJlDPlNrSXHuqllEeIeE+TvWkeyRI/noVDyZjx00hUv04KQyb27d+An3zI'
+        '2L23TyHl8rxxfrSPx0W+0+mfN38hrr17ERpNPL07sJ3gdKiudO4ytWw3u6unF1s6Oq01ZoFB4rcwpVrKlF7o0GRjH+1lE8s/8viz'
+        'u1DXArX1ixgN5VhPhdhdPdCe7v5Y2DMSV1og6o5CYA9W5vokn162kazxKbOH4dOn7I0RZv0St4OXKWfnNXYLB8IOWaWUsK0GWhIK'
+        '7QEjYUZBwSxuGbuxur7OTS0ERQK4szVkjdBQGFU9Yg3ekznp2OErfW8bt49NHtpMDuGiVVtDO5SNCFxl0Cd7OnHeFdej36Qjdttd'
+        '4xCwvOjlpoSWvr43pK21CQPbWpJBTEBESiJSrIWKpgq09NZWrl7X7ijfdtXUUVRdeZtL4+6+ds870GhMx6/uXoZ/PzQ/0dglFxnl'
+        'zSQY9y9YTQduyug2cgRFUrgivJ/mgp0neZC+vJN0aQdSacFayykep71zLhRpJHlQF9pYepPAtsl8NCH7p+P4LBHafouk+CCS1yhu'
+        'VY62erCJ7Qe2lrBuaw8Wre6g5I5rICqTilbmcz/8+R8D445MSJF2rfpFKIYYfVVqRGnopJ17/2oK55/9DpTLDVQRpBhY8cyAOoJJ'
+        '3yXJwIkgJxkm7jXSqP6sTgPUbKhlPfCGViODpcgm5ilvdycE5lf9Jr4JF373L1TOJvhdqTXptgYWr95KvsZ4c2CQVioDCQcLvqif'
+        'kZiMKeNEUBYJoziEVwzJd7MfOVgQOpI8En+tZsSOFQjppn14sKffbF8x9SzYdX6AlgxY3IHZwgiXTe7k5utXbngU5151H/42b4U7'
+        'ncbL/upP/ogl1bHmRLfuJr5GGMIQKl3mRrIJhyI3p8sKTq1WQ3NTEy75zEfwuY+ebTzKLjJlwncnSxGrZwXP27FfaRwcEznbxhXV'
+        'h9FD2vDWOUdyXalKlOs0acc4jqVxh9S3wPksKPEHFNi1CnNrV977WLzv4h+jS5Wo9rB43Tb84q4X8JN/LsDGjl60NecY2VqOJNlx'
+        '8RNCjsis7lOSHtVA7G7aD9p0xJoqmcISr2dZwrjrNDAAaRm46RzPrK+AFaFj2HHr6mQYUzJcIWAX/cAITwevKAny+MtbsHhNB/1u'
+        '7qINhHoZ19yBPzz4Glr3fvMbsLcw23gY1eY+z9bMG6cejT9e9X9obShh9MghaCyZxbX+Qa07aKUAk2KevbTaZKue2ufIhZvMUfRu'
+        'xY++8Vk0Njbgtn8/iL5KBeVGo3HGHWS0zrike1dGMAYfBisESmU7p60pAVXGptaZuOTbv8Z5556LD/z4voBLtLTu9vTTPEadNN3o'
+        'iAV0MzS4JT8OHCPfSoT6TZhfwz5cpO/x7X+0DrWtyzV5wjaOLPyYF2YI18m0MeUHSnpS5SQqlDplKAyFBodB5xs2D76xo4ov3Pg8'
+        'ATW7KwrPreygjepbPg9q1KGca3Dc/HqXi1eNffKiCOredh5dc+5sHDyxPxFbuiKJ8461FNGJDVzOtTjPlJi8HZ29GzqRcZo1dkBL'
+        '46B1VrZha1eG17YAH776YdJk0XfwtXnUN8eS2s3qOqmIr4dvvHfNIjSPnEyh315DmnH0tCHUFnb+sXth6sh+oTknglGcQ0eCGqjo'
+        '/BApTl8Tzi/m+zV39LI7xxgIZ8ZrJkIyArBME8+uozvmpt8I/6YpX1z0cTMAiqQlPOk28WYgGVUm/Ig03zLu05lGKDZ0duOkKx+l'
+        'Gj4tkmZUEaFc/LhUDzBNppnqxNkynzG4pYxfnz8bew9rCijhMNPLhkdZKUKnSv3R3duL9e1bsH17D2k1+/uWltw4i23E1iVrBRWS'
+        'SHApUcXPbyngcuNQlvrhlK/fSRVOnVLYJrS1YUAlO9I0yEm76SiBGj4FqJr7/PmHZ+G4/YY6v6SGkLYVnhJPyZD2dSN5VERx8zi5'
+        '6JhH0ko3eJPp+FkIBE+AKYyflHtacU9i5DgAqkwXp5IZdwwgkC5ORmKJA180hxpRaynmyOdJYZYKhrJUEiNNePO2g0bhH4+vTgZU'
+        'c0EDIo5wDb5F3Hxy8swJ3X+v/vjFR2ejNRd1M3vS5YWsQJl4/snnXsE3vncNXli+Fl3dXeaE19i/yo1N14S/GzG0P049/jh8+oJ3'
+        'YbBR9QH0XnPes20qtff6hTNm4VPXzotgTVHU1wF8p0aow7sxsdYW19l1pn+dMLQJx+w7hMc11jvYmqF6gvmH/egbou230D3pp6vy'
+        'kAz4kXjM7s5jaNxrE+o76aa4iNqWFdpNpMyY9Dmj0EdwyRRMHctdlUlpUsQGBZ9FSwYt+4HKkihJPT+dEwQLFrXx59Mbynjvd/5t'
+        '1Ckzj+ss8NjEaSNIIGguXBzQXMIXT5+Mt+0/nNLGkQE7QstceJSRf7tiTSeOPPWD0EYQiEbJAiGEI1lUmlkNeRp5X5Fj2t4DcP/N'
+        'VyNnKvyAADIvysqWXHUwrr1nIX502wICb+xY1lYBx4D6kFknEG7GH1hB/sE5M3HqrKEsOEluJWEAy4xmpF6LMIsgC9S7zkwUO/Mi'
+        '8NgYVRe6M/kXm4A8EEH7UIJ4ZJWbahGozWrO+wwVKcSyKU3y8KPLZDKk2Kl8parJsG1mp9eNEI3duHfuiwG7J+oGQ8hQ1xc8McNS'
+        'y7Y25jjz4BG44MQJGGC+V7z59QAvEXB5RVZFSTbi3v8+hIouOe585j0suJRdkirOGyaEZxUvLFuLRSs2YMZeg3kVuWdCufm9otiG'
+        'j544HYdMGY6r/vkcZe4seMP2PdgS7oJXNwXHK3rrKkYM2ms5YIyx/ScfMMRxMwRHOw6e9LzAtMFK1OE2A0GHqKWgQhedSW4IEQlb'
+        'WKB/imF7jjDzlxNBjBBWPsVJEyh8KtHzJ8Vp1H7qR6SIRf2sGyEDTRl4SLLNVm3ra8VfH1lqft66Ey7OaxKL7x81qAEHTRqKQ6cM'
+        'xQn7tBov39Xn67JzqeRrFZooqepXFBg8qM0NeCD28CyQJnn6NRIx4VBQmTkQpbwLDWVPmZ+z7eYJI5Yqv9Zjlq2KWWPacN1Fxzum'
+        'E8XVNyMsH/rRPXjq5U2hOObItlUggHSHWJBbM3FIA0rlftCV7ZxPiwO56AUyScpljija4S7dQKwYKSROqYxsrTa0F4jMIv4AO7rf'
+        'wmc+uKvEs0z43kAhAhu45tk9mvkABE8IC+jgQK/mW5hUgh0RIRnhejFy3PnIcrT3ZmhpRF0Ryf+ZOX4QPn/m/jhw4mA3B6/STXX+'
+        'MD006SdIETMuL+H48gQzm8059k0YMuA32NrTnTi5kdFbixLHNXYkThMOmjEakyaMhujrcHUBxUOyufji+PhrJkzcDFHJKJvnneKs'
+        'oc0I7Ag8vnSLa6iFS1y5ZkzBJsKIhLlOxQjn3AUrsGHboRjeJCPxdOi3THrGVRLvWxmoKaaIiYhu4UvAmlvzNPcGBCBp9DsQJjyI'
+        'OOHSSRcSivfYSCB42rYbFslTKjltGiQyHRAh6pveHVedmz9Qy5txw53Po7GhkYsxO/QJmkX/8XlHYPbYVhTd7Si6NprN79p1ckWI'
+        'aAZU4glT6ONi9P5NJfz0ys8CVZvoLieRjOKOakWgV8sI0r9/H372vYuRVSwcrCEObATX3pWq75CyOLtar/trBLTo68SFb90PPzn/'
+        'MEJCSxHH8LhT6QTImqfMOG3duhl3zl3i5iaLZFCHr1aGtrAizFHS/t+aYe0ij2N3ENE+bqKaTrif4714/mPpkCWyriUsqNWApk2Y'
+        'wIWDVwc15auD3gkMdKj1myq9pjYq4PEXNmDRxh5mjk8ZMEUAmtzw36WUIs4a+r8RUUiomZN5EdHW2pNeaDci/oSj98d3L7vIrFsX'
+        'z9tL2Est9s98bSr34YZffRHjhw0g56+ocQOsdtVLC7/2Axtftwu42omiZzOVvG+77CSMGNAEJOTZfj4hc3MYp7IBt/x3EaqimSew'
+        '5bxYKrJ9ad+XoQOpFMLEMO0adZiLkbozMh33QmdRwwuVOOoi0EGG6Z7hxIsICPHOghSSOXxFbNwgjeC1RS0dCpPcbCIo9nelRlx/'
+        '+3ygsTEMTxKiDupC116wYiN9LSrbd9tw6cGnKDeZOL2BvXmvkXhyp1GXwjhpH3z3m3HjL6/A0LZWIr1WFCYZjVD0GpXfH7ff9Auj'
+        'vmcbc5Mb16EIWo0GLNiVsSEXfU55932ARcUIQTvGDmzA3790MqaO7pcM5C6F0NaeuwZdwaJ2hSeXrnc23jvZ6aAsPu1+MkiKwKIq'
+        'ropaW3OehXyzTCAdOYcdJ7TCj85ijLifiFVHv0EDD4ow81fzQCQCWCCLbcphqkg60CGpW2d9NPx46fpuzF2yDrloQF7IxIHJww0O'
+        'bC0bFXoEtLX5ReUNBWCh8doPOva9+PfDz0KUpRt1y12wIT9lTaK51PGHzcQjd/0OJx55AMHFhO7G1z//Cdx987WYPGqoUeU9bCIQ'
+        'FpkGLFhByMq49oZb8eNrbnzDtnCaq9SzCW1lhV9/6lgMbm3wHgBjLJ1fpWwxrFTGX+56loTYkXRlCSqLizmFTCj9812kiJEM89DR'
+        'HwozHWR0xHl2oa15SMc+6RsK0oyW9wmyehsm+fWW6NjfRWhTTkZ3oh5dJHWZWLv+9O/nUeQtxMZVCwOV/GiUgmDTP/zI4RjYaAsw'
+        '2/eAdiXHsy8sxqvre/Dxi6/EirUdqBkhyHLlGnClDNNM6eGNALc19OLCj55tBKwXI4f1w8c/+HaUVWfCC8DrQQ3EGW1+YW74P/Ne'
+        'wGXfuw5XXX8bemtyjwgsit4tGGQcvG9+4CDjglTrAnzrRNurl0ykcd8LW7B+mw3BXeUyzFnwE8EyFecpazck0v08KQbYv8QPkGT9'
+        'yFTIuiaekOqnrdR+oxRLPqtkLZJEhIqnQrIaUa6BUhexaTQOdIgNiJ6m3G7v1p6ycXiWQxiJ12LHxIW7/lv2H41Dpw5n1iy8sfo3'
+        'NvP0t70NY4Y1osd81BlnfwavrjGaw7aO5a5OkAn2DzhrJ7JmPPHUc2ZdGtC+tRcbNplTbxw+D7wWNEbWTduy84BVqQFPLFyO8z/3'
+        'dXPdZlzy2Y+juW0ojWPdAw4TWpiJIxJ0k/bTWGuoSdfT2Ikm/P2hRXR9O3XVcSyzE8cg1ji3mM0bt+EHvmaPds5chjDLEtfDj/7x'
+        'OAJvyv0UKop3wXVknfEkTsWDB3NnCykZoZgTuMQOS9IxnyXev3bZPbsB/3rwWfzu5vtwx0MLsanIKezSdXfm4NtWA33+jP2h+rpd'
+        '3P5Gp5/kthutxsv/3S++Txi9dVsVTjzzw/jTbQ+ikhvb29gK0SAJdiCamtArWvCz627Ft376WwpHO7sLnHn2J/HC8vUQjS3mr3m2'
+        'ksUDmuc37+1DI37627/j9HMuQXdV4r1vPwEfP/sMV2wqqm/MDJIbn8EI/JdveNJOiGGCfR27c6xDnTu/5y//XYKeShZYwi2ZtvAe'
+        'vPYZSRGo5XwzjlJJJVdzxrSosQXRISOYcMUEZIsotr6iqfpVcwOeaNxoEZ2x0IzobbVUcTyZd+48DZlHBmU6+IcXXnEN/nrXXEqP'
+        'XvyRt2NlaTIeXLyFnUg/3N1N8T5s8iD89rPHo+hs32X/4I6YvwBpMs6fLg3A3Mefwjmf/CI6qyVqQBk7vB+OOPwQ7LvPJJLTl5Yu'
+        'xX0PzMdrm7ZT6fStRx+Es95+Gi751tXY1L4KRx28H4475k0YOXwUuo3qXvDCCtx9z4NU+BHmM950wL64+TffceUq83t7j3lmm1J2'
+        'B13LkDcNwvL2HpzzkwfQ3tET6wU2I8l1g3ftm+HXv/49BvRrwk+/+mGc8OaDCHEkfLs3uAUvcwOq3NsEDynRkfOPmUAVXAEopbcJ'
+        'JX6u49UqVA1cwf1XWage6YT4OTJTpLEkE0dTUshLMo+SDwTQGS7+1q9xw+0Pk4SefeZJuOzT78YAYw/vWdCOS25aihrNIoqTZL50'
+        '1kx88JhJqJnY/w1PvnfC/HSazMTsDW1Yu74dX/rmD3D3f59EzaY685y0SU278Egbrz83J/fc95+KKy65iNytux58AmdfeJl5bQmF'
+        'cTwV8SSVUDInlz7HXGfi2JG45y8/Rz+jbSxOQHPomNOQ7GK3vAA07aNxIIwc4bQr78bWjgpB1a0WnDi0Cd969zTo7q245Pt/wrML'
+        'l9BhufbKT+G042Y7ribJ6XiODPw4PTKvUoSef1cbcPUUFZJ1rhxuryn9tDFGElsIvahtXqlFoITRSfwvAoLEzQdMJ1Bol2UTSDbc'
+        'OyGCTNY1N96Nr/74Bjqp3/nyhTjntCNMSNcZPfdVnTjv1wvQxQyYlVoNv7voeBwxqZ+x/9vqs2C76AQOAqB5krbFtpgNtDZUlFqw'
+        'Zu063Hn/w3j0qQV4bVW7kfYKhgxswqH7z8A73n4KJuw1xqi/brMQjWYDBY48/Xy8vHLNLjeyVivwy+9+Ee96yzG08VYAXCWB5/kK'
+        'tQcOodma5sG46ZEVuOIvT9M6HDN1MH58znTkzOEvmwbgQ5/9Du556AkKOe+67jLMmDwxMqfqpIroP1tbW8/DqrTvHi1ofahOo3zI'
+        'zu1hWgcCqWqfFQBjAhw5pI4VOTtuXLg2I4dzi+SRLicgwmw8vUOhyf7g8eeX4bTzv0Ef9s0vfgIfeccxZhW7dlqSVcb5eudPnkF3'
+        'RRNj16Vn7Y8PHTuZsn6CT47LexY75QNkgK77+oETyMy3KxpHz26uDd00d9G4IRZV81xdJrK17dTmSDYMJ+G+8/7HcPZnriD4907J'
+        'HbOKl3/mw/jMee824WQfir4tcbo3F7P3JCKwgmnT38d8+Q6ccdAIfO3MyQkxN8/xaRqIsz76VTz2zIsY2K8F//3ztzFkQCtXOyMH'
+        'MKWXkbviVOJM2++LwpNYpIgewcPBVHAAq5U+u7cu7vThheQx6lSOzSLaRAc7XzABkeXijZSymosStmr3sS/93EhlhsP2n47z33PC'
+        'Ljff/hkzuAm/PHcGXdaWVa++ayH+s2CN8eYbzM8aUTWqZP32qnHgWmK2EvVI9DigwEUkVisWRpuoinEkK0ZV92yEqKyD6FkP9K4z'
+        'qnYT1RVqFtRrm2FYK73l+MMx54iDXk+HE3lFbJCRO0DfxO6jAELv0jhyNJck5kwfhG+8c0rd5vvN0z1b8LsfX4axI4dj6/Yus5ZX'
+        'M7Uefy73Bmr+G7mLIqOrCCQekiF5ImRxhZ8ixpVEgoRR6ZcRQYqBO4Vy/oAr9yY89IGPNg6TdhTyzvv8y78ewYVf/RUayiU89s9f'
+        'Y3ib3j3zt/ndAy9uwqf/sIgcOqtu7ayEklmoPluZ03148gfvQVbdllC9RTPggERMm8LYBeHbptISrG+G0JwGRhbYTWV5ADVmbtza'
+        'iYNP/iB6dyCAtPd0zXeMCTj1GLqHoq8D9cP6RJ0OoESNLDvItzFLNtqwR2XN5i7c/uhivPdNw9Ag5euui/3oxSaUPf5dF9KQ7r9f'
+        'cymOPHCfiMYmv5nL1NTNlUc8YppBFDqUaoTHI4jYwlftqxHEIaBOCg2WLAYXCj9BO2GfDOQDMggEjSi3LdrmZT+49h/m9Et89H1v'
+        'x8ghzXtE+37svoNx1QenOYRvZlWYQF+vuU1zg9t7JF5ev90mzXc6V66PMY62d5B2lUQ7IhmmwT/nSpirF7mQSvdtp9cPHdiGq775'
+        'OQeISe7bOlAT9hrLo5BqzCkkEbgSE+WUlduQtwzF5koZDy/dhj8+uByf/fVczLn8dnzqlw/grMN2v/k+/7PP+CE4772nGcfU+FC/'
+        'vJl9njiq3gJtQl+Ddh1OYaCn4Molp/Y9h2BIMAWNVbPlBjexm1KQtoEyV2z3M7KdOjCCJJAnIepBkOwLPPzUi1ixaj0hfD7xoXeQ'
+        'et2jP1YIpg/BF0/bO6Jp+FfWQXp+xUZziBp2HQ4yPDwzG5PxvkiGj9s+B0rj2tCVyBMLN/qdcIP8H8OvdMX5HW+bcyR+9JXPMIbe'
+        'PeuIoYMwY9oE5/vYARc0ks7ll11CjPPqxsb3oIxP/vJBHHXJbfjITx/AN4zDd88zq4n44TcXzEZLLt/4UBAMvQuf/9i7qS/hiQXL'
+        '8OSC5aH/kGYB2YZQrlG4NH01gD3JRHjkdoCrZWEsrQjgnZyPAhcYXDdswpDBDQZUiJIiVLAc2NOTMLIaNs7TfQ8/a1R3jkNmTcWg'
+        'Ac179KCp3nv/EWPwlXdMicyYcImkZ5atN/dQ2mUHkPKThe1Nlmx/fQNEo1G/DcYJtN83lKjvQND3ZVfMaTALYP6i0Wxk2b7HCr/l'
+        'A+glgfrAO07GdT+6nBa/z4RKX/nseWgo5W7kK1yCRiHiEEPFttSEmx95Gfc+u4b+bcvB9v5HDWzA7z+xP5r3cPO9P9C/tYxjDj+A'
+        '7uO2e+Y6PgHhsp+BB8lDGyTPBUwJPz2TnxUYVQScovaZyMgW7sabq8KXc30+n3vr03Zpkj7feaqp/ZgYOI2kLbFkiea/A2ZMNXHd'
+        'dryhf7QLIXj34aOw4NUO/HP++qAO5y3agGrNjllt3ikaIBRjY5uxmZvxwIJV2NZRRc2cUhJXC/iUitK6lBLOC8pguvSwEQYT7Vjv'
+        'mtK+hAhajxGDmjDngEk41TiFT//7j1i/aQv2mzKePuvpFe0Y1L8ZEwY3o0ahoIpAKKt6jJA+8uJaMoHO1wDB2P5w4f4YzMMq/pc/'
+        'VoOectyb8e8HH8f8F152CbaChj2iCJwHsVYD5mh0+Rgu0knF6Tb28IQzaR4AkweSDxEHEugwGy/nRI0OxQVXrZLhdTqZD9fXV+PR'
+        'cBmFPHbMqhRV6GrfnsuAHb542iQ8sWwrYeTt56/Z2mfU6EqcYnmGdhCArNyK7qrGe791B7bX+jGSymXLHOuJs39Oq3AYFYAuNWqJ'
+        'd4O5MlLrNhw9+7hN+PK7D8bQwW0YMrAfLdpNDy7Fl66fZ9azE//4ypnYb+xAijIiH1KZoGHL1m5LGNI0vnT6JAxpKeF//UONqyak'
+        'mbz3XgR83dzR6SIBmzrmXL8IkH0RO3446SOYDld7MK0HioS50NbE87hdLXaY9yMirt5jALSHKpH60IjTK4QbUGWkbfjQAfT6q353'
+        'C35/893o6erGHX/6CaaNbqpD7b5Rmq+1IcOvzp+BM380n1Kltqn0d/ctxVvspDHi8q+GxkpRbsa1f38CW8UA2DZAorPzpc9kICaV'
+        'rhneJhlQaRWgoiWoujNiPsvoB/zl4ZV44Pl1OOXAsRjUr8FolnV4ZvlGY1GazGeXcMu8FZj1gZGoVWSAzFtKmHVbtlPvo28Be8+b'
+        'RuGtBwzfY0p5rwVreSseePwlcnLvuOdByk00NZqHyzwELE5PT1C6cfQfO6gUvSk36jY0+CqHy6R5UIKeXiZpRJlU9H2JVhCMmkyB'
+        'UJGd03fECNdKpUyodObJb8Lf73mMWrW2m83/wBknYdqEYZDVzv9J+u0lJwxrwcdP2AtX3b2CfrZgxWbMf3kD9h9nQjabKaTu4gGY'
+        't/A1XHP/KyhJLlWrIsGlZiF9TQ0WvmrJWDkn2jWEJ9e+8QLY0NmH6x9YTgtVslg/u4hmDexomT/PW4kL3jITI1r70RAK8pOMk3rX'
+        '/KWUebNVuDGDGnGpOf1h1tKennzziZu39eCjn/kazSMol0skzNOnjHFCq1m80tqLh/t6UmiRUMZQFtc5ir5/wOETmf/DbbwnDtSh'
+        'DqADY1aMHX2NWqbNiRyC2K8nH30Qvv75D5Pqs7nz73zpY27zRT134J6ehPOOG4cpI1tD+9fFv3kUK9p7TZg1BFnTINz55Ap88ueP'
+        '0CRxp6kUE2SIgHpxSSzOWAZUDsLvHGTOtYbBdy954ITVER6eRe+tGJ/XmZKv3/ik8T2Mc1nuT3n+1zZ14up/LaIw1n7WD963D4/X'
+        '+d9Uv92k4f0zLHvib3j7iUeR4A0fNgxfu/j93C7OfE6ezcUDb+DHx8d5Qq6BWCUlZN/Kk3RuU2+gYK8+qQEIeK7ZwjF8+7Yx+K4T'
+        'RKYw5bxKq2qWtvfhTaecS4v48299AWfOOdA4bl3GVjcSvWtvXxUNxnFU1Z49kQE8tKgdH7/uxUAda+3bKGOb7WlctanDhJxVj64L'
+        'ZF+Ja0zOnfZYed9Pl1LciWrk3BOxAzkAbJIw1y1iwVAsTbR05540HVu39+DyG57Elk7n67xl9jB87/37xDLtG226RQIZzVUYX0mw'
+        'Dd/UXcbx774QW7Z2YMqBx+C+ay9AZodeFEzzIhDnC3s4H4V+eeR1UhmHir4ZVEeQq3mWSqXPMwnqhAZVh1DBNXd6oEEWfy+K+nys'
+        'rtEUTRsqrtzYh/LwqahtXIpPXfYDPP70yTjxmMPw1DMv4u93/Rer1qzHDb/8Jo6eOXoXXrEO1cEsN1668fr3GdmHoS0SW3s8+7Ug'
+        'O2udt9yWWrVtsY6EB24za7xR6ai1GmLjDQ++0snAyyAaOQ2y1AklRsQtRkax3Hzmf59bjbufXkO1k4YkRL3AmC6LbJJv4PYTMTSa'
+        'cfk3rjP+0yBccPbpFPq9tnoTzvnMpcYUbKfwd011EB56oR1zpre4sNdrMx2FgKKOSocJzvo5G4RIdWKLSZpJsjNkfKiZLNMWg6j3'
+        'LONfcPO/i7l9MwiHFWn2U3E52HcOmRu1OfsPXnkXHl2do/rKXHSveoFeX6nWKJa1AnXmKcfgh1/9NBrQFQ2+dAgX+/st5jQtXLYG'
+        'jz31HO59+AksWLgMbeP2Qzb2INQB4awH7NU+8+f7aeaRUNk3SOYhg6l9StgDIkT0gTRP27K0sTrQp2RR5aYekmbAKXdGZXz9vHcT'
+        'rnzPTMx500yU7EBOE5IWlT66hmASiAAJM5/f3i1x5Ns/ge09PRg8oD81sSxZ/prDOxgnt3XmyUZ79sObJ7fiuovnUANJUfjULgM/'
+        'taPbEfe/y8j8ZujjbqUWdJ9PED60t74aN/zae68YH8MJgMcDZDXux+OkgmJgYaD84TZkzUhUX/+nz69h2fpGnHb5ragZm1g2qrWy'
+        'vR29qxagtm29cRL7yKs92WgDK+3DhwwwglGgu6cPG0ysvXL1OqxZ107fV6pV8nwz6ShOhu57FCr9xu3EFKKFA3gLbm+zW2Nn7HX2'
+        'VilPoQPULFbMggnz2TEGuzqmsGrAycbfiSTvn0W8YwL+RCIujZsX49XnHsLA/m3YZ/J4HDRrH+w/YxplEscNG2DOiayroNrnu+Ef'
+        'D+CzV/yYkmie57/UfwRapxxpDlU/miaWG1/qX997F8b2qznuH1Wm/k3XQ+KaV+XDH4RY/yDU0EOg3/xboGsNsG0hMPpEAs14je7J'
+        'vh0eYNtyTpXnYW6A9udIp9U2HRkmgn/goOM2bSwaBL7+++dxw6OvwfVV5XwqjF4x9r7n5SfQt+HlwD5eKB289dBXqljNW3h38wA0'
+        'jpqG8qCxTCq5A0e//cww2FoRZ8/swb347SVvxZ/mrsIPbn8ZoYzuVb/OQ6eTp06LeMQ4Fsbl+LHDXF5VZy4QtIOu502ypeuNy9Gz'
+        'YRlqHRuormDpauwz9+vXgn4tzVQos9NR7CnfYtT86nUbaVCGFYaWyUcgbxuKvLHNNdTaLuCigmpV4VOnTMBFZ8yE6NuOqglHc2oX'
+        'c0Mk0G1M0VNfhNzwCFtCEz3YsXS2xnPSPyAGznTcR4XL09jsYK1KPcuSoc/e6immipcuzgzMAt6BZtNQyOgLmMXZ2tOC2x8zIVve'
+        '4upsQoXGT8t20TL1KDSNm4XK5tVmYdYhq/S4TiETx2cN5j1Nxps238vGVvoLHuGOusqAkxiqXCo/ANn9rGf1QkyZMBxls+tHTh2E'
+        '7922HAP6lTC8LcPC1b0oSwQ2k1j+zupYzQqaGxSRRrZDKc8KnqGYkeotMTo3nYsU8w0uodYwbAyy4VOgejpQ62x3gtC91WxiL9q3'
+        'dTmCqYRQo9zUirz/SDSPm2kEfzAzlHCNhvkAsryEWx5aigvOmIVG429Jiyiylc+1D0E+drEdAh27suiWKi49PO3TZvMPNr+pMMg0'
+        'S5azoFoLM2noIB3S2gqFcFp1aEpIcg60ydLZKiO9f3toGTbVykaSORMFFUiJPZDRTvNuHL2PUUn78jVEXc9aHbJkB0p5D3yqeTHl'
+        'phMLfLCmJW8ZgCcXLKV8+ZQRLXjXYcPwyZMmmpCqwUQSm3HxH56ncbYuJHRAk3Twg1twP1BKYezgZpx16Bj84aGVqJj1OXnmUBwz'
+        'fSi+dvNiIr4kgKzvYIbXLJrayWrS+RrCnOJys/k7dCKDMVgFW9IqYxItcNPmD2RgOqvyEzrUjmsRY8oZUcHabTXMXbAGc2YMMuE1'
+        'Z/kGzYSaejbkK3dAdC7eGZDc2J/WiIhAtcsgasRw2PgAKzW4ckSgwSJJJCRkQmGzOOoojKOU0dRrE07k/XHyJX/Hqk5XXXMQMhU1'
+        'B+o7f/73P86JKex91ZyBcn2fGaFzSZZrFWx74kbc8MPP4rjDZzCRhQ54uNWbe3HR7xfixdWdxMNzxNSBGNRSwm3zHYsoOX7C+Qc1'
+        'c1J/9J4JeNthextV60KujEuNn/j5PDy8ohZS5L545lLnRhTM66uZE9BMuOSRoFHzcZiWYr+CuuJkbHAPcfsu1ormXhqBOWxSM274'
+        'wonkWFpUiwixv/m7/EZkT13qwvOkj1Af+lOIcacnkDB3/Wql18Y8RSwbMQ15FB8ZkMAaMQ52JeiMUqqWBXPewrV4ZYOJKZsbIqmD'
+        'h6h5DbLHm1//Ok9valc8MyeHHFDjrE0b1oi9R7VRPz6dWWMrHy8OwIVfvQZ3/OZyTJo4Gt3dPfj9Lffh/PedhFEDGvC3iw80IWQF'
+        'ZaOlBre6DJsFn7y8rsMIUMmpfXP99a8uxy+unYejZl9iwrJmuo9ec62b7pyLxx5+FKNmHIVqXx86uwS2G4F0dTG3lNXMMaj4IQ0U'
+        'IxArp+AzVaLsY3A0ASanKpLBoOxs6ixEN1I6BNDjyzrwansVY/tr1BM1Ge3Rb7xzRptGQh9+NbDynxCr74ZY/Fvo8WcSvwFpPWZK'
+        'o24wigK0H4CQu35y3xZOgENL2cRCotKuekueZD60YSg+8p078cgrvY5Ld6dhT2IXM3Z2gEHt2IHruQkSbkcaemg0y+SBGt8570jM'
+        'HN+fSRBA0zbtZ67fvBXHnnUptnZ0YerEMVjx2nr0mI2aNmEMrvnWJzB54mjPnU6S9Z8nFuGAGXtjKI2DUaFIYiORU8++HOs3bcOB'
+        '++6N7V29WPTyKowcPhB//uXlmDhuDKnqzl5z6DZWcNN9z+C2ua+gL2shm+po4COZlm/a9D6TS0UXyQZmIVkVuBfTsJMxjYWyzqDE'
+        'p08cj8+8cwpEr3LONPdx6N6NyB7+ONThP4E0URPlNIztt06k9cOEh/pJF7HUevs4E8i4IacEJNvuwjOXu6qfFQwpYuhjNYwJ/ZZu'
+        'asNbv3QLNWBk0odDBVORapeeFokQJLY/cuzo8PlJ+o1Doox8E1uCnjqgF3+47EwMKHcSnTs5QvZqyvcWFli/dTt+dt0dWPbaGhw6'
+        'ayrOfsexuOaGf+E3f7kXe40aggNn74OmphbMe2YReju348G/fhMlykH4Xjon3pVC4N8PL8DDjz9NTudRh83AyUcfaMJbmfAiK9IY'
+        'Fvb150c24Io/PoYizwmtE7mAioScQccWO7EjwVR9mtzPcYjJLUkkFtYEDm6o4f4fnI7Gosf5aoo6cBj/mTsn0y+21EltxFcKXeho'
+        'TQBpAP9MlCuyzFnceOAYKmoht+7x57T/FtxQbsC3bpyP3z60GrntphEZt14XnExOhkki9qdrZhyrg5P7tDMi2teDkYhOp9aNGy99'
+        'C2aPBVGpKOokcjS0jjUs49Z1TY6sDxE0Eyl1dHbjoacW4vH5i4yG6MbBsyfjzBPfjJamvA5Y7Dtn/EEQJQeRI4IrETGRgZRBOIYu'
+        'VWrFV34zDzc+uYl6EnMZcYIi5FHSE456AeA18uZSwFczZbJekjKMqqcdv/jUHJw4Y6DRAILYSsBDKSJTKAL3oPSHGK7TS7MAVCgP'
+        'QBpA8mkV9YBCsDZIGkKcl5qRZ7lVDsTxF/0B23Wr88a1+7lIcYM8eNIDGne58V79WeyAciqSedEp6ZGZTdx/TAl/uuxUioGVj9+F'
+        'SthIeMNDAlCGkSnCj00jEGjZZTULBn6Gvkl3mgUjnsLkdIiEDFsmKeTIbUB23tzSyo4mnHrJTSgyE8NnecJlaFvCKwnFLnY6/bEu'
+        'gTgQOnABqkCEUS0yal0/fEIJf7jkWHNZsx8VxXyIWdgvyWA57XmbVeLL8emytQDpZuPoQBkvfZlUe4hRQjDECQ/qEzCq7s65L2NT'
+        'n3RZOcbmgTPOYYP8nF6RUJUii4vr+ezZ53CJIc9XwNw8tQLvPnGWkdYOoj6RKTeuLAIDF51GGqtWMKWaDDzAvjHU2kMaDs20sRk5'
+        'ra7cLbSbPhKAo+EemTxDcau1t9/cm6e1A9buNQSYbWcjKu5H54SZ8CnzsPhpYi0h4qjrwCrqYe/a0cnnua2BVPHU0q1Yvt5NRNGC'
+        'EV2h9uGEQITuf839AEnRWflxgB4x4hGmKZ9DwtbpQRTENi1tu3QT/nLPkyiV+jkOPJq8JZNUqSc61IioUo7B/b99jV7Ut555zkJH'
+        'RSAwrA2Yc6BxvGoZea6K25tdI6sMTB8u354FGJuzf+V4L7TJkgNLZt9S4BY330Hs4OIEpGBcfYBb+USY11Bpp69xzoyHhvcdMw3b'
+        'zabkqsZ5FMl5Ef/efIdoKPH2PW19qO+nSRvWkspxNfUZP+Mf971E3AIu768iHa6WnKdRIRUuwx47OJhg7SnjyPXolNHCa2a+Fn6I'
+        'AiLbl/n79NItWLihzxEjC5WMkpdcRduxH0DUOTs60MnWaxcdavrstBibd9aRe6Ml67LY38hC6qOLwIOP4MD56wVtEtAwCMwcYZwq'
+        'ZDL/2N+GiFlgqWP52zNziDhrmLs2XMxtFumo/cdjTGPF8YVyjkLSWBefUq5FDehxBkHVM7eRH+BBEPcstIdHTLjFNTbgjkeWotv4'
+        'QlJWnJmRvtKn2DmWgXhDe61IDnkWSENk8Aq5eYJq2JI3VIg62heyKnbD8wb88a4FEA1t9HCSJExFelSPmBVI0q2Ii4iIMI4spH4q'
+        'ZmQjF0ZVt6AXZxw3jZIeKR16miF2A7BjW3sw3TpB4Yb+Br8wCJm/SIihgyBYT14VIlYCublCBo9O1Xvy3IrdWurEWw6dgpoqcZFG'
+        'ua4pulk3gYWGVIYYN0uEo4gVUg/JpxNcq8NICM4Mru4u479Pr48t+gkVjPMFiiSgEhHt7WnkKaWuFWPEeXOZXNn1ilRdSOfz36wS'
+        'V21VeGTBKpdHFt3OBDBQVPDJU97ZE0liycOVSN1Vk1kVIhRmXMJMOf/DmJtjZo3CmIEZsXuJQGWXZgg5EyeZKErzRmrPkuEctTAp'
+        'jH7mhy1m3DufcRYu3gdR03m8nxSJP6h4fVwvvkyJsqizSeGdx042jmt3KJZFs5Z4+lonxae0Qpkk4MJsA69TmaZHuzGwaMxx4wMv'
+        'GDPQzMSROilueYe4YAsp6/wQSlWTa2NPluBxcTHQCz6BQJ7yvBBA4a8PLESXnXFH9rKR+wnDRAN2QHTi7KQ4QhEkNFZV48I4h1LQ'
+        '2JPGvhrOOWU/m4YjD70Otyp4s70Pr2rOmdW+czRpXBUeyiYDZAwBAOOGW6TESc6kMTeySPoAC5eNUx5HYBNnOp03KO2QckwbOwAz'
+        'xw4KQ1SEV+co6rnNPNYycAdnCcVOyvJVhNqIYCG0GtruwNNL1uDljd1u/o9kFnR/HZoXkAXUuFN4Ds7vB3pIO0pUa5/vRx06Jtjs'
+        'ohomUCpje/795BIjdU2xQzjZYPLCVcSgx2yWqMOrxQf0YMxaAmUyYlfkmDSmFQdMHOBQvZ7wyStv4vDNWC3n1AUU8PnstZPmYtia'
+        'pax1KOcYoZBGUTJgBdz42JybLz0HrwtFHYKmFnrwFJVqE2SUdq8hpH2xBe89forjDlTe+crrTF1Q+SnNa4CsJaglzrqmo33JPFAn'
+        'tEIlG4LbH37RPH8jzzZGmPNk+RCCgZUZzwxUgXk8kkoUCJm7Hc2B0HEsuTZq2JIjtW+xD19iOtlokCXPrnMvLkVIlH14qQL7KFHL'
+        'aJmkinmBmFaGjEOtDx84dT9k1S7ngBaCy7Ic1wtn1/1kjDitTBNIlGDgRWyasBGKa3PnRVV+2ocOMGqXrazFFEWibSLfnuA5DJKI'
+        'JeFRupCcwzBaw0QEcw6ZiIENNcf1GPoSnKZUbCK1H7ND18+T8TMyHhqe66jr+BJcBbTILGhV4792siitaYPvk4qcTdw8KzgfoKm7'
+        '26e9C+IKQ8FMHV4KBTcUkkMmkxQwdQIpijpoGKMnevaNBsgiHp9n1PiQT0Amnn6xQ0FABTZS2+9uZXW4sfunHDicsYmaN9oDp/1J'
+        'UIhDH/ikFy7mpdMuHcqWtAMvKCHQAmuWZMy8CuGk9J20CgnzhjdZ7KhKBwNTTO/iUFHOp5CcmGpt6MQZh09E1WhPwi/wQMo0BNRU'
+        'KWRWrzp6viLRkHlIFLlsXlIu1i4buq2zjy5R5N28tjlTF3M5n3iEXHXWFqMK5Z3QcgR7Ec2JLyv6noAies1OqyoYxY/Zk0a5eFRr'
+        'd7DpxAnqjFG84XYolJKu8UL72cLIYvgEGajhnCKxlKtu1rcqevDx02eZzyr4oXUMDf0wK+7MlaGunwVeQskElNQTR+PTdCDCVmHQ'
+        'RuFoXkMhyk9K5fA0Y9ibSvh1mZpN+YbQgnmRQ2eOIg+fuowqGuecfABadC81KlFBJpBACjJpLmVe3YEFJYtIJTYB7okLxmXKgFwu'
+        'eLp5a7NZB2Pbs1pTRFgF9paM/ABH8aeZR0FwiFq42cE+5Zpm73wZmNC0sohlykoPPnf6figXXeb5y6hZB4rsYY17DDPXbaNdCtc9'
+        'aMJYJTnrh8hraxe0ZiKOPrK3JRw/dRjeecQkl38vEObjRUQvc20xKbJO29YDlqRgzz+yiIQsX0hR6wBF81orkGF4504mvfVsagIj'
+        'h8QOY2KEI33idPLoAQIfOnE6PRclyLntng6Kn9zF0VIMDLiXwSOkmRqWMnc6OtRkwuxUFWMqTz54PHVLaTszkItivujk3q5cWtya'
+        'Iirqaa7bSH4yYvOu8cT1PHi0FB5ZinXtQkPN1JDTRjfj++cfjv61DrOfjqDAdaEqCh2JS5h72wgeUzibZR+aTjmXd+3IEjqR1kaZ'
+        'uNna+9NmNuGHnzrO+FvbuP+9VjeBJNpN1Hu7rNqpbu7tapjaEat39p4UzxMKkDJEvmMRCXSTxFWav4/gDRHYV93MYddB7Zg9bY+h'
+        'Nk7gZ94+A0dOaDHv60Il0Lf5yR41IoAoiDXUTfqyeX67JpSDUILXkkmkOQy01xaW0dTc76QBCmebSEmr7a7ErCNFn0vc1Vx4zNS5'
+        '/097V9NrWVVEd9U5rzE2iTAzTDSGxBASZjpxwITwI/gR/geHjvwZRv+FccjAmTECMTowGhjwkdBN33N2cXbVWlV1RRLoKbxJd/q9'
+        'vve+s/euXbVq1VpnTg+JRx95+uEHVg5TOh7tD4EbWbBp8oVyHu0M1OkKkf/+bIw//On98Ze//mf895NPx5PjEco5ifBkmEnDNIv3'
+        '9D0hihJs+hN8Nn501bM//8mPxztvvTbefP3lK4m6sufr7vQTDJ1+0Z4FjzvPgjSpGkg2p9V9G9rqcAoL1Swiea4kMkeqcRp4ApLl'
+        'htXkbYZ5cigVDJsazXL8Y9G8LODkxeVb3ghP9PH47e/fHX/88z/HbQ3M7jtdCpJj1wsjMVrLaMq8xjfCNGsehxNtf/nTx+N3v357'
+        'vPJ46R09hOdBc0XVscEvSLJTepwnpouiWSVPP/q7DdqNrRk4HyfbC/uboTnDFzRMzRw+ZLn856/dvWzPs90w/Q5cu9kl7Q1JmcVM'
+        'vZ/+5jCyXT/34g+upVsLtwYbVnXhmvxHwqxp7pwL0aaTCA/7XYoSc5spikSxBHYl7yxt5I4yDL8kg68xOIKLLb2djf1LDUUYaFn7'
+        'PL3fc8Z1E/2RJZL9wnj/wzVM8o/xt399PJ5+8XQ4aVeiC7twjJVATjZqaOOlETlP0PAfX4/61VdeGr9642fjF6/+8Lr3PwdF/Ig2'
+        'fRgyNIZRaDB6J/EWqKT3PCD1d22A91BmAqpcufy+jIebBCy9/zgzOGOXng9XgrOUP2EsKQNDHjbBbaNEydHk6JtcajZTsFHYDTxB'
+        'QgWPfbGSsoyaW/PMOdt1QAYymtFAAF3Z1Gvghr5x9k+x4NJo7v4J92xidTg5cHapGQk2bta9uu1FljGIZo0tx7DGfsM1MVy9rKqB'
+        '2TQZtCGdWjrBSMwNV5qTSm/kXazvrJK7crgJhXZFS9yPx/Es8g4pqfqYcEo6OPr2ht2oe7UfJmRg02s6llbPF1I9jBqDvvNHgDRF'
+        'coB1+cmQhi6Xork0uVWsjEdGCCF4rjPRQCFzpSOM9BvwZPZo83jRzZurZCMZ8q45dYY8biNR5Of1+LZHBSJnywGQuAlMrSjbyumh'
+        '0XyIIaBBapvcIgs/vWx6Us/SP/sNyWFninQB7q3lKRPuofEbRoYfE86B7W/JJPISHjMY81Qo6d2Pq+3U7JWchjucb74sWPfFI1sv'
+        'ssnoRi0roTBKjjkgBHuZEzuVnLjEFui3gwROz/QczPA82M1D9S2GdiUWIQd0wjw5W9UWrCVpv0W82oPnIUHCiIhGeVXHMzZg/ivJ'
+        'IsqWppQjsYVQUwfIg5pfTTLAdP+hvE50lgMYOm/uCGJa/lGct9CSmTFGF1QNecWVDAkY1xwRl8ZNwJOT0ANwIQm8xnG71VX0lWnk'
+        'nKa19A0YiALHlcUa5u0K9DsgOyJFtjC0XdfCbjOxdg+tU9OqfPBeh9hkhiIaV7XunMudesJ4C/5gTmvQrh11rYSHHgWdPDlTtoM1'
+        'ZFWguS9Sp8pSPTuKIRnlb8CyT0kMQZ9dmehZkS34noSgWY3UaQNrKL0TumBz0zxiFDUmsBBuFkudPzKtcoPoHHMUhSwFqN0lJf6+'
+        'aF8q29dq9Wg26Qxq4PkPm+PgB9qw0jn61JufOxA8CD+ztjStD70DpQME7DWolpct0brYvBt+uRPkjijrPJud0bUM9BX/j3esVC/C'
+        'oKpNsWQvYzfY2NLjUiSJIZG0FgYvYONETlJGjEZks1vBEpVcEWr+T59iYgbQo81EIkZzDkrwWplvayiyhlXMxPdG/hm7egPR48wk'
+        'Tgljez4QDbGo+89xe3ZUM+trvvYIzyx/Wp/coj+wgIOlkrki5uZ8ulFdOyR1guYEd6lRrgxyMqK9I7w1E+g4zR6sdFYz5+Q8AhMv'
+        '/t8Qfu7eFGLlTBrO3o9AfqhBVoEukEG73+CuJdlhjDKVDKEMd5wYblR1LyN1AHsfXsfrbiCVIuTDm5jky7DmjeeisIMjVBsDNJos'
+        'Yk8UrZlwUiA6eZk1vJuj6yDFCIW+r4O5BmXkG6hS7Xei0CASxkY4irR51ZjHdZ/avvjlOzLJGrQ0IXMYWT+ZOdKS7kZEiEXRHC9P'
+        'E6V0gKq2qSCZshzopNCRlgm0L9QGv8gzp1/opUM3z7jPJQ0s7jWOR6Ou82TFJlfCr94bsXRTdz+EjT9neA82hmbRyDBF5NFNJxZM'
+        '71nDFu1tL1zE6LbXItVohzPKyzhEhRME2ngLQO8bSpJpt4gpMMIws2+tbTmckrySw0kSKRMnD2+VhPAVlfdSsqm1tcObdQq977Cr'
+        'GdozGWT17/K1D7j3ZswDIDyuYQwqiBPbdwRMAwzyRFZrjFtxRTl66GzmuMK4EH6SwaGjA9kkQxr5Snj11qkM/wdw7UjTBhQriGCd'
+        'BOqU9VHGWUbsfwLqHaMRPaU2AK/IqYg48UR8bU4Z30aPbh9p29AZwB1dG8DaBcYV86opYyhze5D2XhHGiuK3RVkG/z4mjcTwqUMQ'
+        '1+QWNerWcJpNG6GCaF0khZKDExEVQgOfKAUfwIOHgAlMwl3Qnfw5m41KdDuNp4+L7af0hBQLylQqpKEb50iaX0e0dosFdgVPa3MD'
+        'GJSJz3Skf8Ag/tCInHUwIANjW+NVQOipTyRn9AuBbPm2QoTMAbzhI2Cr8jTCl66Yq833TuPUHje0QFey7ZbmJIRSm24DxxZslwlk'
+        'LLNgyJXpSEKqLyAqCYNoUvboYXDt7dgZYpVZS0sH9qbLvKxIpskdONGvt5wD0KGFGI5q+vAgsAqYC08fNFxQJI0H5Fgr1wEdKaME'
+        'sYHgIUjm60FMgQ+xRPlH8qqg7KTil1O3Gm/R0n7evIPr/sk2nmvxsQEatp5hutivDEWFl2CelALEFoKIp3vzWtqZC5O/hGFHw/Nr'
+        '7k3TiEIbIwZ8+qbs5Yd9K/SMw5dRJpEE8VAPS5oDGPoYQVzWen/9P0OrREXpmwwVdWs5UWziYjRFfyTKXGlCE8Er2AH0NNoXnq1u'
+        'M30MqHqcY9saLeDqOmHm4gSwE0EfSfXzLT6AoPEb6s2UWMKZD0ekMO60NF2GUesj6KgRcAuGSTSCUIfqLdWrUsZsVtKk4O+tXyqJ'
+        'JEz0VGAcBQ38Gd45Bn1in7RRGF2th+wvdusy0yivLF2541geTo8ysp/umkkHyB/AKLYI/3QTu/NEbqWgJPyt7Rqly+hsSKMkpT1Z'
+        'TMKRcK0BVV4D63VnXGOrXR88BG0CURzTff4N8P3Xd/zrS20xtXAsnLTyAAAAAElFTkSuQmCC'
+    ),
+}
@@ -0,0 +1,20 @@
+# --- 图标资源加载 ---
+# 图标以 PNG 形式保存在 icon_assets.py (由 tools/build_icon_assets.py 生成)，
+# 第一次设置图标时才导入，直接在内存中创建 PhotoImage，不经过临时文件。
+import tkinter as tk
+
+_photos = None  # PhotoImage 必须保持引用，否则图标会被回收
+
+
+def load_icon_photos(master):
+    """返回各尺寸的图标 PhotoImage (从大到小)，只创建一次"""
+    global _photos
+    if _photos is None:
+        from icon_assets import ICON_PNGS
+        _photos = [tk.PhotoImage(master=master, data=ICON_PNGS[size]) for size in sorted(ICON_PNGS, reverse=True)]
+    return _photos
+
+
+def set_window_icon(root):
+    """设置窗口图标，之后创建的 Toplevel 也使用同一图标"""
+    root.iconphoto(True, *load_icon_photos(root))
@@ -0,0 +1,228 @@
+# --- 后台 I/O ---
+# 磁盘操作 (加载账号、读写卡号文件、保存配置、检查路径) 放到线程池中执行，
+# 结果经队列交回界面线程，由 root.after 定时取出后调用回调，回调中可以安全地操作 Tk。
+# 其他后台线程 (文件监视、进程监视、单实例服务等) 也经 post() 使用同一个队列，
+# 不在非界面线程中调用 root.after (Tkinter 不保证这样做安全，退出时可能抛出 RuntimeError)。
+# 另有 UIWatchdog 测量界面线程的停顿，用于确认事件循环没有被阻塞。
+import queue
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+import event_log
+import metrics
+
+PUMP_INTERVAL_MS = 10       # 有未完成的请求时，界面线程每隔这么久取一次结果
+IDLE_PUMP_INTERVAL_MS = 50  # 没有请求时也定期查看队列，处理其他线程 post() 的回调
+FRAME_MS = 1000 / 60        # 一帧的时间：界面线程的停顿不应超过它
+HEARTBEAT_INTERVAL_MS = 16
+STALL_REPORT_MS = 100       # 心跳停顿超过此值时输出界面线程的调用栈
+
+
+class IORequest:
+    """一次后台请求；cancel() 后其回调不再被调用"""
+
+    def __init__(self, key, description, on_done, on_error):
+        self.key = key
+        self.description = description
+        self.on_done = on_done
+        self.on_error = on_error
+        self.cancelled = False
+        self.future = None
+
+    def cancel(self):
+        self.cancelled = True
+        self.future.cancel() # 尚未开始执行时直接取消；已在执行时只丢弃结果
+
+
+class IOExecutor:
+    """线程池 + 界面线程回调
+
+    submit() 只能在界面线程调用，post() 可以在任何线程调用。相同 key 的新请求会取消尚未完成的旧请求 (例如连续切换账号、
+    重复读取卡号文件时只处理最后一次)。serial=True 的请求在单独的线程中按提交顺序执行，
+    用于写文件等不能并发或乱序的操作。
+    """
+
+    def __init__(self, root, max_workers=4, on_busy_changed=None):
+        self.root = root
+        self.on_busy_changed = on_busy_changed # on_busy_changed(descriptions)：未完成请求的描述列表
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="IO")
+        self._serial = ThreadPoolExecutor(max_workers=1, thread_name_prefix="IOSerial")
+        self._completed = queue.SimpleQueue()
+        self._pending = []
+        self._latest = {} # key -> 最新的请求
+        self._pump_job = None
+        self._pump_fast = False
+        self._closed = False
+        self._busy = ()
+        self._schedule_pump()
+
+    def submit(self, func, *args, on_done=None, on_error=None, key=None, description=None, serial=False):
+        """在后台执行 func(*args)；完成后在界面线程调用 on_done(结果) 或 on_error(异常)"""
+        if key is not None:
+            previous = self._latest.get(key)
+            if previous is not None:
+                previous.cancel()
+        request = IORequest(key, description, on_done, on_error)
+        request.future = (self._serial if serial else self._pool).submit(func, *args)
+        # 完成回调在工作线程中执行，只把请求放进队列
+        request.future.add_done_callback(lambda future: self._completed.put(request))
+        if key is not None:
+            self._latest[key] = request
+        self._pending.append(request)
+        self._schedule_pump()
+        self._notify_busy()
+        return request
+
+    def post(self, func, *args):
+        """在任何线程中调用：由界面线程执行 func(*args)；执行器已关闭 (程序正在退出) 时返回 False"""
+        if self._closed:
+            return False
+        self._completed.put((func, args))
+        return True
+
+    def cancel(self, key):
+        request = self._latest.get(key)
+        if request is not None:
+            request.cancel()
+            self._notify_busy()
+
+    def pending_descriptions(self):
+        return [request.description for request in self._pending
+                if request.description and not request.cancelled]
+
+    def _schedule_pump(self):
+        """有未完成的请求时每 PUMP_INTERVAL_MS 取一次结果，否则每 IDLE_PUMP_INTERVAL_MS 查看一次"""
+        if self._closed:
+            return
+        fast = bool(self._pending)
+        if self._pump_job is not None:
+            if self._pump_fast or not fast:
+                return
+            self.root.after_cancel(self._pump_job)
+        self._pump_fast = fast
+        self._pump_job = self.root.after(PUMP_INTERVAL_MS if fast else IDLE_PUMP_INTERVAL_MS, self._pump)
+
+    def _pump(self):
+        self._pump_job = None
+        while True:
+            try:
+                request = self._completed.get_nowait()
+            except queue.Empty:
+                break
+            if not isinstance(request, IORequest):
+                self._call(*request)
+                continue
+            self._pending.remove(request)
+            if self._latest.get(request.key) is request:
+                del self._latest[request.key]
+            if not request.cancelled:
+                self._deliver(request)
+        self._schedule_pump()
+        self._notify_busy()
+
+    def _call(self, func, args):
+        try:
+            func(*args)
+        except Exception:
+            self.root.report_callback_exception(*sys.exc_info())
+
+    def _deliver(self, request):
+        try:
+            error = request.future.exception()
+            if error is None:
+                if request.on_done is not None:
+                    request.on_done(request.future.result())
+            elif request.on_error is not None:
+                request.on_error(error)
+            else:
+                event_log.error(event_log.APP, f"后台任务出错: {type(error).__name__}: {error}",
+                                task=request.description)
+        except Exception:
+            # 与 Tk 回调中的异常一样处理，不影响队列中的其他结果
+            self.root.report_callback_exception(*sys.exc_info())
+
+    def _notify_busy(self):
+        busy = tuple(self.pending_descriptions())
+        if busy != self._busy:
+            self._busy = busy
+            if self.on_busy_changed is not None:
+                self.on_busy_changed(list(busy))
+
+    def shutdown(self):
+        """退出时调用：放弃尚未开始的读取，等待已提交的写入完成；之后 post() 的回调不再执行"""
+        self._closed = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._serial.shutdown(wait=True)
+
+
+class UIWatchdog:
+    """界面线程看门狗
+
+    心跳由 root.after 每 HEARTBEAT_INTERVAL_MS 触发一次，实际触发时间比预期晚多少，就是界面线程
+    在这期间被阻塞了多久，记录到直方图 ui.stall。后台线程发现心跳停顿超过 STALL_REPORT_MS 时，
+    输出界面线程当时的调用栈，便于找到阻塞事件循环的代码。
+    """
+
+    def __init__(self, root, interval_ms=HEARTBEAT_INTERVAL_MS, report_ms=STALL_REPORT_MS):
+        self.root = root
+        self.interval = interval_ms / 1000
+        self.report_after = report_ms / 1000
+        self.histogram = metrics.histogram('ui.stall')
+        self.beats = 0
+        self.over_frame = 0 # 停顿超过一帧的次数
+        self._expected = None
+        self._last_beat = None
+        self._reported = False
+        self._job = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._main_thread_id = threading.get_ident()
+
+    def start(self):
+        self._last_beat = time.perf_counter()
+        self._expected = self._last_beat + self.interval
+        self._job = self.root.after(int(self.interval * 1000), self._beat)
+        self._thread = threading.Thread(target=self._watch, name="UIWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except Exception:
+                pass # 窗口已销毁
+            self._job = None
+
+    def _beat(self):
+        now = time.perf_counter()
+        stall = max(0.0, now - self._expected)
+        self.histogram.record(stall)
+        self.beats += 1
+        if stall * 1000 > FRAME_MS:
+            self.over_frame += 1
+        self._last_beat = now
+        self._reported = False
+        self._expected = now + self.interval
+        self._job = self.root.after(int(self.interval * 1000), self._beat)
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            if self._reported:
+                continue
+            stalled = time.perf_counter() - self._last_beat - self.interval
+            if stalled > self.report_after:
+                self._reported = True # 每次停顿只输出一次
+                frame = sys._current_frames().get(self._main_thread_id)
+                stack = "".join(traceback.format_stack(frame)) if frame is not None else "(无法取得调用栈)\n"
+                event_log.warning(event_log.UI, f"界面线程已停顿 {stalled * 1000:.0f} ms",
+                                  stalled_ms=round(stalled * 1000), stack=stack)
+
+    def summary(self):
+        if not self.beats:
+            return "界面线程: 无心跳记录"
+        return (f"界面线程: {self.beats} 次心跳，最大停顿 {self.histogram.max_ms:.1f} ms，"
+                f"超过一帧 ({FRAME_MS:.1f} ms) 的 {self.over_frame} 次")
@@ -0,0 +1,305 @@
+# --- 启动配置与预启动步骤 ---
+# 不同玩家需要不同的启动参数、环境变量时，在 config.json 中定义启动配置并按账号指定：
+#   "launch_profiles": {
+#       "练习": {"script": "..\\启动_练习.bat", "args": ["-w"], "env": {"SEGATOOLS_CONFIG": "segatools_练习.ini"},
+#                "cwd": "..\\bin", "hooks": ["patch_ini", "local_server"]}
+#   },
+#   "account_launch_profiles": {"玩家A": "练习"},
+#   "default_launch_profile": "练习",          (可选，没有单独指定的账号使用)
+#   "prelaunch_hooks": {
+#       "patch_ini": {"command": ["python", "patch.py"], "timeout": 10},
+#       "local_server": {"command": ["server.exe"], "wait": false, "ready_port": 8080, "timeout": 15,
+#                        "after": ["patch_ini"]}
+#   }
+# script 省略时使用当前机台的启动脚本；相对路径相对于程序目录，环境变量的值可以引用 %VAR% / $VAR。
+# 预启动步骤按 after 组成依赖图：没有依赖关系的步骤并发执行，每个步骤有超时 (秒)。
+# wait 为 false 的步骤 (本地服务器等) 启动后即视为完成，给出 ready_port 时等到本机该端口可以连接，
+# 进程继续运行；端口在启动前已可连接时认为服务器已在运行，不再启动。
+# 游戏在它需要的步骤全部完成后立即启动，任何一步失败或超时则不启动。
+# 超时的步骤连同它启动的子进程一起结束 (.bat 经 cmd /c 执行，真正的程序是孙进程)，
+# 不会留下占用端口的半启动服务器。
+import os
+import shlex
+import signal
+import socket
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import event_log
+import metrics
+from game_launch import LaunchOptions, build_command
+
+DEFAULT_HOOK_TIMEOUT = 30
+READY_POLL_INTERVAL = 0.1
+
+# 预启动步骤的状态
+PENDING = 'pending'
+RUNNING = 'running'
+OK = 'ok'
+FAILED = 'failed'
+TIMEOUT = 'timeout'
+SKIPPED = 'skipped'   # 依赖的步骤失败，没有执行
+STATUS_LABELS = {PENDING: "等待", RUNNING: "运行中", OK: "完成", FAILED: "失败", TIMEOUT: "超时", SKIPPED: "跳过"}
+
+
+class PrelaunchError(Exception):
+    """预启动步骤失败或超时，游戏没有启动"""
+
+
+def _resolve(path, base_path):
+    path = os.path.expandvars(path)
+    return path if os.path.isabs(path) else os.path.normpath(os.path.join(base_path, path))
+
+
+def _command(command, cwd):
+    """配置中的命令：列表原样使用 (批处理、脚本交给 build_command)，字符串按 shell 语法拆分"""
+    if isinstance(command, str):
+        command = shlex.split(command, posix=os.name != 'nt')
+    if not command:
+        raise ValueError("命令不能为空")
+    program = command[0]
+    if os.path.splitext(program)[1].lower() in ('.bat', '.cmd', '.sh'):
+        return build_command(_resolve(program, cwd), [str(arg) for arg in command[1:]])
+    return [str(arg) for arg in command]
+
+
+def _environment(env):
+    if not env:
+        return None
+    merged = dict(os.environ)
+    merged.update({str(key): os.path.expandvars(str(value)) for key, value in env.items()})
+    return merged
+
+
+# --- 启动配置 ---
+class LaunchSpec:
+    """一次启动要运行的脚本、参数、环境和预启动步骤"""
+
+    def __init__(self, script, options, hooks=(), profile_name=None):
+        self.script = script
+        self.options = options
+        self.hooks = list(hooks)
+        self.profile_name = profile_name
+
+
+def resolve_launch_spec(config, script_path, username, base_path):
+    """按账号选择启动配置；没有配置时只运行 script_path。配置错误抛出 ValueError"""
+    profiles = config.get("launch_profiles", {})
+    name = config.get("account_launch_profiles", {}).get(username) if username else None
+    name = name or config.get("default_launch_profile")
+    if not name:
+        return LaunchSpec(script_path, LaunchOptions())
+    profile = profiles.get(name)
+    if not isinstance(profile, dict):
+        raise ValueError(f"找不到启动配置 '{name}'")
+    script = _resolve(profile["script"], base_path) if profile.get("script") else script_path
+    cwd = _resolve(profile["cwd"], base_path) if profile.get("cwd") else None
+    args = profile.get("args", [])
+    if isinstance(args, str):
+        args = shlex.split(args, posix=os.name != 'nt')
+    options = LaunchOptions([str(arg) for arg in args], _environment(profile.get("env")), cwd)
+    return LaunchSpec(script, options, profile.get("hooks", []), name)
+
+
+# --- 预启动步骤 ---
+class Hook:
+    def __init__(self, name, config, base_path):
+        if not isinstance(config, dict) or "command" not in config:
+            raise ValueError(f"预启动步骤 '{name}' 缺少 command")
+        self.name = name
+        self.cwd = _resolve(config["cwd"], base_path) if config.get("cwd") else base_path
+        self.command = _command(config["command"], self.cwd)
+        self.env = _environment(config.get("env"))
+        self.timeout = float(config.get("timeout", DEFAULT_HOOK_TIMEOUT))
+        self.after = list(config.get("after", []))
+        self.wait = config.get("wait", True)
+        self.ready_port = config.get("ready_port")
+
+
+class HookResult:
+    def __init__(self, name):
+        self.name = name
+        self.status = PENDING
+        self.elapsed = None
+        self.detail = ""
+
+    @property
+    def done(self):
+        return self.status not in (PENDING, RUNNING)
+
+    def describe(self):
+        if self.status == OK:
+            return f"{self.name} {self.elapsed * 1000:.0f} ms"
+        if self.elapsed is not None:
+            return f"{self.name} {STATUS_LABELS[self.status]} ({self.elapsed:.1f} 秒)"
+        return f"{self.name} {STATUS_LABELS[self.status]}"
+
+
+def _port_open(port):
+    try:
+        with socket.create_connection(("127.0.0.1", int(port)), timeout=READY_POLL_INTERVAL):
+            return True
+    except OSError:
+        return False
+
+
+def _kill_tree(process):
+    """结束步骤进程及其全部子进程，并回收进程"""
+    if os.name == 'nt':
+        subprocess.run(['taskkill', '/T', '/F', '/PID', str(process.pid)], stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, creationflags=subprocess.CREATE_NO_WINDOW)
+        if process.poll() is None:
+            process.kill()
+    else:
+        # 步骤进程是新会话的首进程，进程组 ID 即其 PID；首进程已退出时组内可能还有子进程
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    process.wait()
+
+
+def _popen_hook(hook):
+    options = {}
+    if os.name != 'nt':
+        options['start_new_session'] = True # 独立的进程组，超时时可以整组结束
+    return subprocess.Popen(hook.command, cwd=hook.cwd, env=hook.env, **options)
+
+
+def _run_hook(hook, result):
+    """执行一个步骤，结果写入 result"""
+    if not hook.wait and hook.ready_port and _port_open(hook.ready_port):
+        result.status, result.detail = OK, "已在运行"
+        return
+    process = _popen_hook(hook)
+    if hook.wait:
+        try:
+            code = process.wait(timeout=hook.timeout)
+        except subprocess.TimeoutExpired:
+            _kill_tree(process)
+            result.status, result.detail = TIMEOUT, f"超过 {hook.timeout:g} 秒"
+            return
+        if code != 0:
+            result.status, result.detail = FAILED, f"退出码 {code}"
+            return
+        result.status = OK
+        return
+    # 后台进程：等到端口可以连接 (没有 ready_port 时启动即完成)
+    deadline = time.perf_counter() + hook.timeout
+    while hook.ready_port and not _port_open(hook.ready_port):
+        code = process.poll()
+        if code is not None:
+            result.status, result.detail = FAILED, f"进程已退出 (退出码 {code})"
+            return
+        if time.perf_counter() >= deadline:
+            _kill_tree(process) # 否则半启动的进程会一直占用端口，下次启动时被当作已在运行
+            result.status, result.detail = TIMEOUT, f"{hook.timeout:g} 秒内端口 {hook.ready_port} 未就绪"
+            return
+        time.sleep(READY_POLL_INTERVAL)
+    result.status = OK
+
+
+class HookGraph:
+    """配置中的全部预启动步骤；plan() 选出某次启动需要的步骤"""
+
+    def __init__(self, config, base_path):
+        self.hooks = {name: Hook(name, hook, base_path) for name, hook in config.items()}
+        for hook in self.hooks.values():
+            for dependency in hook.after:
+                if dependency not in self.hooks:
+                    raise ValueError(f"预启动步骤 '{hook.name}' 依赖的步骤 '{dependency}' 不存在")
+
+    def plan(self, names):
+        """names 及其依赖的步骤，按依赖顺序排列；有循环依赖时抛出 ValueError"""
+        order = []
+        state = {} # 名称 -> 'visiting' / 'done'
+
+        def visit(name, path):
+            if name not in self.hooks:
+                raise ValueError(f"预启动步骤 '{name}' 不存在")
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f"预启动步骤循环依赖: {' -> '.join(path + [name])}")
+            state[name] = 'visiting'
+            for dependency in self.hooks[name].after:
+                visit(dependency, path + [name])
+            state[name] = 'done'
+            order.append(self.hooks[name])
+
+        for name in names:
+            visit(name, [])
+        return PrelaunchRun(order)
+
+
+class PrelaunchRun:
+    """一次启动的预启动步骤；run() 可在后台线程中调用"""
+
+    def __init__(self, hooks):
+        self.hooks = hooks
+        self.results = {hook.name: HookResult(hook.name) for hook in hooks}
+        self.elapsed = None
+
+    def describe(self):
+        return "，".join(self.results[hook.name].describe() for hook in self.hooks)
+
+    def _step(self, hook, dependencies, on_step):
+        for event in dependencies:
+            event.wait()
+        result = self.results[hook.name]
+        failed = [name for name in hook.after if self.results[name].status != OK]
+        if failed:
+            result.status, result.detail = SKIPPED, f"依赖的步骤 {', '.join(failed)} 未完成"
+        else:
+            result.status = RUNNING
+            if on_step is not None:
+                on_step(result)
+            started = time.perf_counter()
+            try:
+                _run_hook(hook, result)
+            except OSError as e:
+                result.status, result.detail = FAILED, str(e)
+            result.elapsed = time.perf_counter() - started
+            if result.status == OK:
+                metrics.histogram(f'launch.hook.{hook.name}').record(result.elapsed)
+        log = event_log.emit if result.status == OK else event_log.warning
+        log(event_log.LAUNCH, f"预启动步骤 {result.describe()}" + (f": {result.detail}" if result.detail else ""),
+            hook=hook.name, status=result.status)
+        if on_step is not None:
+            on_step(result)
+
+    def run(self, on_step=None):
+        """执行所有步骤，没有依赖关系的并发执行；有步骤未完成时抛出 PrelaunchError
+
+        on_step(HookResult) 在步骤开始和结束时调用 (工作线程中)。
+        """
+        if not self.hooks:
+            return
+        started = time.perf_counter()
+        finished = {hook.name: threading.Event() for hook in self.hooks}
+
+        def run_step(hook):
+            try:
+                self._step(hook, [finished[name] for name in hook.after], on_step)
+            finally:
+                finished[hook.name].set()
+
+        # 每个步骤一个线程：等待依赖的步骤时不会占住其他步骤需要的线程
+        with ThreadPoolExecutor(max_workers=len(self.hooks), thread_name_prefix="Prelaunch") as pool:
+            for future in [pool.submit(run_step, hook) for hook in self.hooks]:
+                future.result()
+        self.elapsed = time.perf_counter() - started
+        metrics.histogram('launch.prelaunch').record(self.elapsed)
+        failed = [result for result in self.results.values() if result.status != OK]
+        if failed:
+            raise PrelaunchError("；".join(f"{result.describe()}" + (f": {result.detail}" if result.detail else "")
+                                          for result in failed))
+
+
+def build_prelaunch(config, spec, base_path):
+    """spec 需要的预启动步骤，没有时返回 None；配置错误抛出 ValueError"""
+    if not spec.hooks:
+        return None
+    return HookGraph(config.get("prelaunch_hooks", {}), base_path).plan(spec.hooks)
@@ -0,0 +1,317 @@
+# --- 命令行模式 ---
+# 供脚本、快捷按键 (Stream Deck 等) 调用，不导入 tkinter，不启动图形界面:
+#   AquaDX_Launcher.py switch [--force] <用户名>          切换账号 (写入卡号文件)
+#   AquaDX_Launcher.py launch [--as <用户名>] [--force]   (先切换账号再) 启动游戏
+#   AquaDX_Launcher.py current [--json]         显示卡号文件对应的当前账号
+#   AquaDX_Launcher.py list [--json] [--order recent|frecent]   列出所有账号 (可按使用记录排序)
+#   AquaDX_Launcher.py export <文件>             导出账号 (.csv / .jsonl / .json)
+#   AquaDX_Launcher.py import [--no-update] [--report <文件>] <文件>   批量导入账号
+#   AquaDX_Launcher.py events [--kind 类型] [--limit N] [--problems] [--json] [--metrics]   查看图形界面的事件日志
+# stdout 只输出结果，诊断信息输出到 stderr；退出码见下方 EXIT_*。
+# 图形界面正在运行时，switch 和 launch 转交给它执行 (见 single_instance.py)。
+# 每次按键都会启动一个进程：模块顶层只导入 launcher_config，其余模块 (进程扫描、启动、导入导出、
+# 单实例转交等) 在用到的子命令中才导入，current / list 不必为它们付出导入时间。
+import contextlib
+import json
+import os
+import sys
+
+from launcher_config import (
+    USAGE_FILE, account_journal, auth_file_path, base_path, data_path, launch_bat_path, load_accounts, load_config,
+)
+
+EXIT_OK = 0
+EXIT_ERROR = 1              # 其他错误
+EXIT_USAGE = 2              # 参数错误 (argparse 的默认退出码)
+EXIT_UNKNOWN_ACCOUNT = 3    # 找不到账号，或当前卡号不在账号列表中
+EXIT_CARD_FILE = 4          # 卡号文件不存在、为空或读写失败
+EXIT_LAUNCH_FAILED = 5      # 游戏启动脚本不存在或启动失败
+EXIT_GAME_RUNNING = 6       # 游戏正在运行，拒绝切换账号或再次启动 (--force 跳过检查)
+
+FORWARDED_COMMANDS = ("switch", "launch")
+
+
+def _error(message):
+    print(f"错误: {message}", file=sys.stderr)
+
+
+def _load_accounts(config):
+    # 只读加载，图形界面同时运行时也不会改动存储文件；
+    # 有最新的二进制索引 (图形界面开启 account_index 后生成) 就直接映射，不必解析全部账号
+    return load_accounts(use_index=True, read_only=True)
+
+
+def _running_games(config):
+    from process_scan import DEFAULT_GAME_PROCESSES, ProcessScanner
+    return ProcessScanner(config.get("game_process_names", DEFAULT_GAME_PROCESSES)).refresh()
+
+
+def _switch(config, username, card_id, out, force=False):
+    from card_targets import make_targets, targets_match, write_card_targets
+    from process_scan import describe_games
+    path = auth_file_path(config)
+    if not os.path.isfile(path):
+        _error(f"卡号文件 '{path}' 不存在")
+        return EXIT_CARD_FILE
+    try:
+        # 卡号文件和 card_targets 中的其他文件作为一个事务写入
+        targets = make_targets(path, config.get("card_targets"), base_path)
+        if targets_match(targets, card_id):
+            print(f"卡号文件已是 '{username}' 的卡号，跳过写入")
+        else:
+            games = () if force else _running_games(config)
+            if games:
+                # 游戏运行中改写卡号文件会让本局的游玩记录记到错误的账号上
+                _error(f"游戏正在运行 ({describe_games(games)})，不切换账号；确实需要时请加 --force")
+                return EXIT_GAME_RUNNING
+            write_card_targets(targets, card_id, fsync=config.get("auth_file_fsync", True))
+    except ValueError as e:
+        _error(f"配置错误: {e}")
+        return EXIT_ERROR
+    except OSError as e:
+        _error(f"写入卡号文件 '{path}' 失败: {e}")
+        return EXIT_CARD_FILE
+    print(f"已切换为: {username}", file=out)
+    return EXIT_OK
+
+
+# --- 子命令 ---
+def cmd_switch(args, config, out):
+    accounts = _load_accounts(config)
+    card_id = accounts.get(args.username)
+    if card_id is None:
+        _error(f"找不到账号 '{args.username}'")
+        return EXIT_UNKNOWN_ACCOUNT
+    return _switch(config, args.username, card_id, out, force=args.force)
+
+
+def cmd_launch(args, config, out):
+    from game_launch import start_game_script
+    from launch_profiles import PrelaunchError, build_prelaunch, resolve_launch_spec
+    from process_scan import describe_games
+    games = () if args.force else _running_games(config)
+    if games:
+        _error(f"游戏正在运行 ({describe_games(games)})，不再启动；确实需要时请加 --force")
+        return EXIT_GAME_RUNNING
+    if args.username is not None:
+        code = cmd_switch(args, config, out)
+        if code != EXIT_OK:
+            return code
+    try:
+        # 启动配置按账号指定时才需要知道当前账号 (读取卡号文件和账号列表)
+        username = args.username
+        if username is None and config.get("account_launch_profiles"):
+            username = _current_username(config)
+        spec = resolve_launch_spec(config, launch_bat_path(config), username, base_path)
+        prelaunch = build_prelaunch(config, spec, base_path)
+    except ValueError as e:
+        _error(f"启动配置有误: {e}")
+        return EXIT_ERROR
+    path = spec.script
+    try:
+        if prelaunch is not None:
+            prelaunch.run()
+        start_game_script(path, spec.options)
+    except PrelaunchError as e:
+        _error(f"预启动步骤未完成，游戏没有启动: {e}")
+        return EXIT_LAUNCH_FAILED
+    except FileNotFoundError:
+        _error(f"游戏启动脚本 '{path}' 不存在")
+        return EXIT_LAUNCH_FAILED
+    except OSError as e:
+        _error(f"启动游戏脚本失败: {e}")
+        return EXIT_LAUNCH_FAILED
+    print("游戏已启动", file=out)
+    return EXIT_OK
+
+
+def _current_username(config):
+    """卡号文件对应的账号，读取失败或不在账号列表中时返回 None"""
+    from card_file import read_card_file
+    try:
+        card_id = read_card_file(auth_file_path(config))
+    except OSError:
+        return None
+    return _load_accounts(config).owner_of(card_id) if card_id else None
+
+
+def cmd_current(args, config, out):
+    from card_file import read_card_file
+    path = auth_file_path(config)
+    try:
+        card_id = read_card_file(path)
+    except OSError as e:
+        _error(f"读取卡号文件 '{path}' 失败: {e}")
+        return EXIT_CARD_FILE
+    if not card_id:
+        _error(f"卡号文件 '{path}' 为空")
+        return EXIT_CARD_FILE
+    username = _load_accounts(config).owner_of(card_id)
+    if args.json:
+        print(json.dumps({"username": username, "card_id": card_id, "auth_file": path}, ensure_ascii=False), file=out)
+    elif username is not None:
+        print(username, file=out)
+    else:
+        print(f"未在列表 (卡号：{card_id})", file=out)
+    return EXIT_OK if username is not None else EXIT_UNKNOWN_ACCOUNT
+
+
+def cmd_list(args, config, out):
+    from account_usage import ORDER_ALPHA, PinnedView, read_usage
+    accounts = _load_accounts(config)
+    names = accounts
+    if args.order != ORDER_ALPHA:
+        # 用过的账号按使用记录排在前面，其余按用户名
+        usage = read_usage(USAGE_FILE)
+        names = PinnedView(accounts, usage.top(len(usage), args.order))
+    if args.json:
+        rows = [{"username": username, "card_id": accounts.get(username)} for username in names]
+        json.dump(rows, out, ensure_ascii=False)
+        out.write("\n")
+    else:
+        for username in names:
+            print(username, file=out)
+    return EXIT_OK
+
+
+def cmd_export(args, config, out):
+    from account_transfer import export_accounts
+    try:
+        count = export_accounts(_load_accounts(config), args.path)
+    except (OSError, ValueError) as e:
+        _error(f"导出到 '{args.path}' 失败: {e}")
+        return EXIT_ERROR
+    print(f"已导出 {count} 个账号", file=out)
+    return EXIT_OK
+
+
+def cmd_import(args, config, out):
+    from account_store import AccountEditSession
+    from account_transfer import plan_import, read_rows
+    # 需要写入：可写加载，取得写入锁
+    accounts = load_accounts()
+    try:
+        if account_journal.locked_out:
+            _error("账号数据正被图形界面使用，请在图形界面中导入 (设置 -> 导入账号...)")
+            return EXIT_ERROR
+        if account_journal.store is not accounts:
+            _error("账号数据加载失败，不导入")
+            return EXIT_ERROR
+        session = AccountEditSession(accounts)
+        try:
+            report = plan_import(session, read_rows(args.path), update_existing=not args.no_update)
+        except (OSError, ValueError) as e:
+            _error(f"读取 '{args.path}' 失败: {e}")
+            return EXIT_ERROR
+        with account_journal.transaction():
+            report.record_failed(session.commit_to(accounts))
+    finally:
+        account_journal.close() # 压缩一次，accounts.json 立即为最新
+    for line in report.problem_lines():
+        print(line, file=sys.stderr)
+    if args.report and report.problems:
+        try:
+            report.write(args.report)
+        except OSError as e:
+            _error(f"保存导入报告 '{args.report}' 失败: {e}")
+    print(report.summary(), file=out)
+    return EXIT_OK
+
+
+def cmd_events(args, config, out):
+    """输出图形界面写入的事件日志 (launcher.log) 的最后几条，或统计快照"""
+    import time
+    import event_log
+    if args.metrics:
+        snapshot = event_log.read_metrics(data_path)
+        if snapshot is None:
+            _error("没有统计快照 (图形界面尚未写入，或 event_log 已关闭)")
+            return EXIT_ERROR
+        if args.json:
+            print(json.dumps(snapshot, ensure_ascii=False, indent=1), file=out)
+            return EXIT_OK
+        print(f"写入时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(snapshot['time']))}，"
+              f"运行 {snapshot['uptime']:.0f} 秒，{snapshot['events']} 条事件", file=out)
+        for name, value in snapshot.get("counters", {}).items():
+            print(f"{name}: {value}", file=out)
+        for name, hist in snapshot.get("histograms", {}).items():
+            if hist.get("count"):
+                print(f"{name}: {hist['count']} 次，平均 {hist['avg_ms']:.2f} ms，p50 ≤{hist['p50_ms']:.2f} ms，"
+                      f"p95 ≤{hist['p95_ms']:.2f} ms，最大 {hist['max_ms']:.2f} ms", file=out)
+        return EXIT_OK
+    min_level = event_log.WARNING if args.problems else event_log.DEBUG
+    records = event_log.read_events(data_path, args.limit, args.kind, min_level)
+    for record in records:
+        print(json.dumps(record, ensure_ascii=False) if args.json else event_log.format_record(record), file=out)
+    return EXIT_OK
+
+
+def build_parser():
+    import argparse
+    from account_usage import ORDER_ALPHA, ORDER_LABELS
+    from event_log import KIND_LABELS
+    parser = argparse.ArgumentParser(prog="AquaDX_Launcher", description="AquaDX Launcher 命令行模式")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    switch = commands.add_parser("switch", help="切换账号 (写入卡号文件)")
+    switch.add_argument("username")
+    switch.add_argument("--force", action="store_true", help="游戏运行中也切换")
+    switch.set_defaults(handler=cmd_switch)
+
+    launch = commands.add_parser("launch", help="启动游戏，可先切换账号")
+    launch.add_argument("--as", dest="username", metavar="USERNAME")
+    launch.add_argument("--force", action="store_true", help="游戏运行中也切换")
+    launch.set_defaults(handler=cmd_launch)
+
+    current = commands.add_parser("current", help="显示当前账号")
+    current.add_argument("--json", action="store_true")
+    current.set_defaults(handler=cmd_current)
+
+    listing = commands.add_parser("list", help="列出所有账号")
+    listing.add_argument("--json", action="store_true")
+    listing.add_argument("--order", choices=list(ORDER_LABELS), default=ORDER_ALPHA,
+                         help="recent: 最近使用的在前；frecent: 最常使用的在前 (按图形界面中的切换/启动记录)")
+    listing.set_defaults(handler=cmd_list)
+
+    export = commands.add_parser("export", help="导出账号 (格式按扩展名: .csv / .jsonl / .json)")
+    export.add_argument("path")
+    export.set_defaults(handler=cmd_export)
+
+    importing = commands.add_parser("import", help="批量导入账号 (图形界面运行时请在界面中导入)")
+    importing.add_argument("path")
+    importing.add_argument("--no-update", action="store_true", help="只添加新账号，不修改已有账号的卡号或用户名")
+    importing.add_argument("--report", metavar="FILE", help="把未导入的行写入此 CSV 文件")
+    importing.set_defaults(handler=cmd_import)
+
+    events = commands.add_parser("events", help="查看图形界面的事件日志")
+    events.add_argument("--kind", choices=list(KIND_LABELS), help="只显示这一类事件")
+    events.add_argument("--limit", type=int, default=50, help="显示最后几条 (默认 50)")
+    events.add_argument("--problems", action="store_true", help="只显示警告和错误")
+    events.add_argument("--json", action="store_true", help="每行一个 JSON 对象")
+    events.add_argument("--metrics", action="store_true", help="显示计数器和耗时统计的快照")
+    events.set_defaults(handler=cmd_events)
+    return parser
+
+
+def main(argv):
+    args = build_parser().parse_args(argv)
+    out = sys.stdout
+    # 共用的加载代码会 print 诊断信息，命令行模式下转到 stderr，保持 stdout 可供脚本解析
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.command in FORWARDED_COMMANDS:
+            # 由已运行的图形界面执行：不会两个进程同时写卡号文件，界面也会立即显示新账号
+            import single_instance
+            result = single_instance.forward(data_path, args.command, {"username": args.username, "force": args.force})
+            if result is not None:
+                code, message = result
+                if code == EXIT_OK:
+                    print(message, file=out)
+                else:
+                    _error(message)
+                return code
+        config = load_config()
+        try:
+            return args.handler(args, config, out)
+        except Exception as e:
+            _error(f"{type(e).__name__}: {e}")
+            return EXIT_ERROR
@@ -0,0 +1,186 @@
+# --- 启动器配置与数据路径 ---
+# 图形界面和命令行共用的部分：常量、数据文件路径、配置和账号的加载/保存。
+# 这里不导入 tkinter，命令行模式可以不启动 Tk 直接使用。
+import json
+import os
+import sys
+
+import event_log
+from account_store import AccountStore
+from account_storage import AccountJournal, StorageError, write_file_atomic
+from file_lock import FileLock
+
+# --- 常量 ---
+ACCOUNTS_FILE_NAME = 'accounts.json'
+CONFIG_FILE_NAME = 'config.json'
+USAGE_FILE_NAME = 'accounts.usage.json'
+PROFILES_FILE_NAME = 'accounts.profiles.json'
+DEFAULT_AUTH_FILENAME = "..\\AMDaemon\\DEVICE\\aime.txt"
+DEFAULT_LAUNCH_BAT_FILENAME = "..\\启动.bat"
+PLACEHOLDER_AUTH_PATH = "请设置卡号文件 (aime.txt) 的路径"
+PLACEHOLDER_LAUNCH_BAT_PATH = "请设置游戏启动脚本 (启动.bat) 的路径"
+DATA_DIR_NAME = 'LauncherConfig'
+
+# --- 确定基础路径 ---
+if getattr(sys, 'frozen', False):
+    base_path = os.path.dirname(sys.executable)
+elif __file__:
+    base_path = os.path.dirname(os.path.abspath(__file__))
+else:
+    base_path = os.getcwd()
+
+# --- 数据文件路径 ---
+data_path = os.path.join(base_path, DATA_DIR_NAME)
+ACCOUNTS_FILE = os.path.join(data_path, ACCOUNTS_FILE_NAME)
+CONFIG_FILE = os.path.join(data_path, CONFIG_FILE_NAME)
+CONFIG_LOCK_FILE = os.path.join(data_path, 'config.lock')
+USAGE_FILE = os.path.join(data_path, USAGE_FILE_NAME)   # 切换/启动记录 (account_usage.py)
+PROFILES_FILE = os.path.join(data_path, PROFILES_FILE_NAME)   # 玩家信息缓存 (player_profiles.py)
+# 账号数据由日志存储引擎管理，accounts.json 作为兼容导出文件
+account_journal = AccountJournal(data_path, ACCOUNTS_FILE)
+
+
+# --- 提示信息 ---
+# 默认输出到 stderr；图形界面启动时替换为 messagebox.showerror / showwarning
+def _print_message(title, message):
+    print(f"{title}: {message}", file=sys.stderr)
+
+
+show_error = _print_message
+show_warning = _print_message
+
+
+# --- 辅助函数：确保目录存在 ---
+def ensure_dir_exists(path):
+    if not os.path.exists(path):
+        try:
+            os.makedirs(path, exist_ok=True)
+            event_log.emit(event_log.APP, f"创建目录: {path}")
+        except OSError as e:
+            show_error("目录错误", f"无法创建数据目录 '{path}': {e}")
+            return False
+    return True
+
+
+def resolve_path(config_value, placeholder, default_filename):
+    """配置中的路径未设置时，使用程序目录下的默认路径"""
+    if not config_value or config_value == placeholder:
+        return os.path.join(base_path, default_filename)
+    else:
+        return config_value
+
+
+def auth_file_path(config):
+    return resolve_path(config.get("auth_file_path"), PLACEHOLDER_AUTH_PATH, DEFAULT_AUTH_FILENAME)
+
+
+def launch_bat_path(config):
+    return resolve_path(config.get("launch_bat_path"), PLACEHOLDER_LAUNCH_BAT_PATH, DEFAULT_LAUNCH_BAT_FILENAME)
+
+
+# --- 账号数据管理 ---
+def read_accounts(use_index=False, read_only=False):
+    """只读取账号，不提示、不挂接日志，可以在后台线程中调用
+
+    返回 (accounts, problems)，problems 为 [(级别, 标题, 内容)]，级别为 'error' 或 'warning'；
+    有 'error' 时 accounts 是空的 AccountStore。参数含义见 load_accounts。
+    """
+    problems = []
+    if not os.path.exists(data_path):
+        try:
+            os.makedirs(data_path, exist_ok=True)
+            event_log.emit(event_log.APP, f"创建目录: {data_path}")
+        except OSError as e:
+            problems.append(('error', "目录错误", f"无法创建数据目录 '{data_path}': {e}"))
+            return AccountStore(), problems
+    if use_index:
+        account_journal.enable_index()
+        index = account_journal.open_index()
+        if index is not None:
+            event_log.emit(event_log.LOAD, f"已从索引映射 {len(index)} 个账号", count=len(index))
+            return index, problems
+    try:
+        store, warnings = account_journal.load(read_only=read_only)
+    except StorageError as e:
+        problems.append(('error', "加载错误", f"加载账号数据时出错: {e}\n将使用空列表，本次的修改不会被保存。"))
+        return AccountStore(), problems
+    if warnings:
+        details = "\n".join(warnings[:10])
+        if len(warnings) > 10:
+            details += f"\n... 共 {len(warnings)} 条"
+        problems.append(('warning', "账号数据", f"加载账号数据时发现以下问题:\n\n{details}"))
+    return store, problems
+
+
+def finish_loading(accounts, problems, use_index=False, read_only=False):
+    """在调用线程中提示 read_accounts 发现的问题并挂接日志，返回 accounts"""
+    for level, title, message in problems:
+        (show_error if level == 'error' else show_warning)(title, message)
+    if read_only or not isinstance(accounts, AccountStore):
+        return accounts
+    if any(level == 'error' for level, title, message in problems):
+        # 不挂接日志，避免用空数据覆盖磁盘上的账号
+        return accounts
+    account_journal.attach(accounts)
+    if use_index:
+        # 索引缺失或已过期：后台压缩一次，顺便重建索引，下次启动即可直接映射
+        account_journal.compact()
+    return accounts
+
+
+def load_accounts(use_index=False, read_only=False):
+    """通过日志存储加载账号，返回 AccountStore；之后对它的修改会自动追加到日志
+
+    use_index 为 True 且二进制索引是最新的时，直接返回只读的 MappedAccountIndex，
+    需要修改时再调用 load_accounts() 完整加载。
+    read_only 为 True 时只读取 (命令行查询用)：不修复日志、不挂接日志、不触发压缩。
+    """
+    accounts, problems = read_accounts(use_index, read_only)
+    return finish_loading(accounts, problems, use_index, read_only)
+
+
+# --- 配置管理 ---
+def load_config():
+    if not ensure_dir_exists(data_path):
+        return {
+            "auth_file_path": PLACEHOLDER_AUTH_PATH,
+            "launch_bat_path": PLACEHOLDER_LAUNCH_BAT_PATH
+        }
+    default_config = {
+        "auth_file_path": PLACEHOLDER_AUTH_PATH,
+        "launch_bat_path": PLACEHOLDER_LAUNCH_BAT_PATH
+    }
+    try:
+        if os.path.exists(CONFIG_FILE):
+            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                content = f.read()
+                config = json.loads(content) if content.strip() else default_config
+                if "auth_file_path" not in config or not config["auth_file_path"]:
+                    config["auth_file_path"] = PLACEHOLDER_AUTH_PATH
+                if "launch_bat_path" not in config or not config["launch_bat_path"]:
+                    config["launch_bat_path"] = PLACEHOLDER_LAUNCH_BAT_PATH
+                return config
+        else:
+            return default_config
+    except (json.JSONDecodeError, IOError) as e:
+        show_error("加载错误", f"加载配置文件 '{CONFIG_FILE}' 时出错: {e}\n将使用默认设置。")
+        return default_config
+
+
+def write_config(config_data):
+    """写入配置文件，失败抛出 OSError (可以在后台线程中调用)
+
+    加跨进程锁并原子替换，其他进程不会读到写了一半的文件。
+    """
+    os.makedirs(data_path, exist_ok=True)
+    data = json.dumps(config_data, indent=4, ensure_ascii=False).encode('utf-8')
+    with FileLock(CONFIG_LOCK_FILE):
+        write_file_atomic(CONFIG_FILE, data)
+
+
+def save_config(config_data):
+    if not ensure_dir_exists(data_path): return
+    try:
+        write_config(config_data)
+    except IOError as e:
+        show_error("保存错误", f"保存配置到 '{CONFIG_FILE}' 时出错: {e}")
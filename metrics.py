@@ -0,0 +1,101 @@
+# --- 耗时统计 ---
+# 按名称登记的延迟直方图 (对数刻度分桶)，用于观察切换账号等操作在慢速磁盘上的耗时；
+# 以及按名称登记的计数器 (事件次数等)。快照由 event_log.py 定期写入 launcher.metrics.json。
+import time
+
+# 各桶的上界 (毫秒)，最后一个桶收集所有更慢的记录
+BUCKET_BOUNDS_MS = (0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class LatencyHistogram:
+    """延迟直方图：记录次数、总耗时、最小/最大值和各桶计数"""
+
+    def __init__(self, name):
+        self.name = name
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = None
+
+    def record(self, seconds):
+        ms = seconds * 1000
+        index = 0
+        while index < len(BUCKET_BOUNDS_MS) and ms > BUCKET_BOUNDS_MS[index]:
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.min_ms = ms if self.min_ms is None else min(self.min_ms, ms)
+        self.max_ms = ms if self.max_ms is None else max(self.max_ms, ms)
+
+    def percentile(self, fraction):
+        """近似分位数 (返回所在桶的上界，最慢的桶返回最大值)"""
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= target and bucket_count:
+                if index < len(BUCKET_BOUNDS_MS):
+                    return min(BUCKET_BOUNDS_MS[index], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def to_dict(self):
+        if not self.count:
+            return {"count": 0}
+        return {"count": self.count, "avg_ms": round(self.total_ms / self.count, 3),
+                "min_ms": round(self.min_ms, 3), "p50_ms": round(self.percentile(0.5), 3),
+                "p95_ms": round(self.percentile(0.95), 3), "max_ms": round(self.max_ms, 3)}
+
+    def summary(self):
+        if not self.count:
+            return f"{self.name}: 无记录"
+        return (f"{self.name}: {self.count} 次，平均 {self.total_ms / self.count:.2f} ms，"
+                f"最小 {self.min_ms:.2f} ms，p50 ≤{self.percentile(0.5):.2f} ms，"
+                f"p95 ≤{self.percentile(0.95):.2f} ms，最大 {self.max_ms:.2f} ms")
+
+
+class _Timer:
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.record(time.perf_counter() - self.started)
+        return False
+
+
+_histograms = {}
+_counters = {}
+
+
+def histogram(name):
+    """按名称取得直方图，不存在时创建"""
+    hist = _histograms.get(name)
+    if hist is None:
+        hist = _histograms[name] = LatencyHistogram(name)
+    return hist
+
+
+def timed(name):
+    """with metrics.timed('switch.write'): ... 记录代码块耗时"""
+    return _Timer(histogram(name))
+
+
+def all_histograms():
+    return [_histograms[name] for name in sorted(_histograms)]
+
+
+def increment(name, amount=1):
+    """计数器加 amount (多个线程同时调用时偶尔少计一次，不加锁)"""
+    _counters[name] = _counters.get(name, 0) + amount
+
+
+def all_counters():
+    return dict(sorted(_counters.items()))
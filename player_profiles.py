@@ -0,0 +1,375 @@
+# --- AquaDX 玩家信息 (可选) ---
+# 账号列表只有自己填写的用户名；配置了 AquaDX 兼容的查询接口时，按卡号查询服务器上的玩家名、
+# Rating 和最后游玩时间，显示在账号管理的表格中。在 config.json 中设置：
+#   "player_profiles": {"url": "http://127.0.0.1:8080/api/v2/card/summary",
+#                       "batch": true, "batch_size": 50, "max_connections": 4, "timeout": 5,
+#                       "ttl": 86400, "token": "...", "fields": {"name": "name", "rating": "rating",
+#                                                              "last_play": "lastPlayDate"}}
+# batch 为 true 时 POST url，请求体 {"cardIds": [...]}，响应 {"卡号": {玩家信息} 或 null}；
+# 否则逐个 GET url?cardId=卡号，404 表示服务器上没有该卡。fields 为玩家信息中各项的键名 (可省略)。
+# 查询结果按卡号缓存在数据目录的 accounts.profiles.json 中，ttl 秒内不重新查询；
+# 缓存的读取和查询都在后台线程中进行，启动和打开窗口不等待网络。
+# 连接复用 (HTTP keep-alive)，同时最多 max_connections 个请求；网络不可用时保留缓存的信息，
+# OFFLINE_RETRY 秒内不再尝试。tools/aquadx_stub_server.py 是用于测试的本地服务器。
+import http.client
+import json
+import os
+import queue
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import event_log
+import metrics
+from account_storage import write_file_atomic
+
+DEFAULT_TTL = 24 * 3600
+DEFAULT_TIMEOUT = 5
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_CONNECTIONS = 4
+OFFLINE_RETRY = 60          # 网络不可用后多久再尝试 (秒)
+DEFAULT_FIELDS = {"name": "name", "rating": "rating", "last_play": "lastPlayDate"}
+PROFILE_CACHE_VERSION = 1
+
+# 重用的空闲连接可能已被服务器关闭，此时用新连接重试一次
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                            ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+
+class ProfileServiceError(Exception):
+    """查询接口不可用 (网络错误、服务器错误或响应格式错误)"""
+
+
+# --- 连接池 ---
+class ConnectionPool:
+    """同一服务器的 keep-alive 连接池，最多 max_connections 个连接同时使用"""
+
+    def __init__(self, url, max_connections=DEFAULT_MAX_CONNECTIONS, timeout=DEFAULT_TIMEOUT):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"不支持的地址 '{url}' (需要 http:// 或 https://)")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path or '/'
+        self.query = parts.query
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()   # 最近用过的连接先取出，不容易因空闲超时被服务器关闭
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self.created = 0                 # 新建连接数 (统计复用效果)
+
+    def _connect(self):
+        self.created += 1
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def request(self, method, path, body=None, headers=None):
+        """发送请求，返回 (状态码, 响应内容)；网络错误抛出 OSError 或 http.client.HTTPException"""
+        with self._slots:
+            try:
+                connection, reused = self._idle.get_nowait(), True
+            except queue.Empty:
+                connection, reused = self._connect(), False
+            try:
+                try:
+                    response = self._send(connection, method, path, body, headers)
+                except _STALE_CONNECTION_ERRORS:
+                    if not reused:
+                        raise
+                    connection.close()
+                    connection = self._connect()
+                    response = self._send(connection, method, path, body, headers)
+                data = response.read()
+            except BaseException:
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                self._idle.put(connection)
+            return response.status, data
+
+    @staticmethod
+    def _send(connection, method, path, body, headers):
+        connection.request(method, path, body=body, headers=headers or {})
+        return connection.getresponse()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+# --- 查询接口 ---
+class ProfileClient:
+    """按配置查询玩家信息；fetch() 可以在多个线程中同时调用"""
+
+    def __init__(self, settings):
+        self.batch = settings.get("batch", True)
+        self.batch_size = max(1, int(settings.get("batch_size", DEFAULT_BATCH_SIZE))) if self.batch else 1
+        self.max_connections = max(1, int(settings.get("max_connections", DEFAULT_MAX_CONNECTIONS)))
+        self.fields = dict(DEFAULT_FIELDS, **settings.get("fields", {}))
+        self.pool = ConnectionPool(settings["url"], self.max_connections,
+                                   float(settings.get("timeout", DEFAULT_TIMEOUT)))
+        self.headers = {"Accept": "application/json"}
+        if settings.get("token"):
+            self.headers["Authorization"] = f"Bearer {settings['token']}"
+
+    def _path(self, **params):
+        query = '&'.join(filter(None, [self.pool.query, urllib.parse.urlencode(params)]))
+        return f"{self.pool.path}?{query}" if query else self.pool.path
+
+    def _profile(self, data):
+        """从服务器返回的玩家信息中取出需要的几项"""
+        if not isinstance(data, dict):
+            return None
+        return {field: data.get(key) for field, key in self.fields.items()}
+
+    def _call(self, method, path, body=None):
+        headers = dict(self.headers)
+        if body is not None:
+            body = json.dumps(body).encode('utf-8')
+            headers["Content-Type"] = "application/json"
+        try:
+            status, data = self.pool.request(method, path, body, headers)
+        except (OSError, http.client.HTTPException) as e:
+            raise ProfileServiceError(f"无法连接 {self.pool.host}: {e}") from e
+        if status == 404:
+            return status, None
+        if status != 200:
+            raise ProfileServiceError(f"服务器返回 HTTP {status}")
+        try:
+            return status, json.loads(data)
+        except ValueError as e:
+            raise ProfileServiceError(f"服务器返回的内容不是 JSON: {e}") from e
+
+    def fetch(self, card_ids):
+        """查询一批卡号，返回 {卡号: 玩家信息 或 None (服务器上没有该卡)}"""
+        if not self.batch:
+            return {card_id: self._profile(self._call('GET', self._path(cardId=card_id))[1]) for card_id in card_ids}
+        status, data = self._call('POST', self._path(), {"cardIds": list(card_ids)})
+        if status == 404 or not isinstance(data, dict):
+            raise ProfileServiceError("服务器不支持批量查询 (可在配置中设置 \"batch\": false)")
+        return {card_id: self._profile(data.get(card_id)) for card_id in card_ids}
+
+    def close(self):
+        self.pool.close()
+
+
+# --- 缓存 ---
+class ProfileCache:
+    """卡号 -> [查询时间, 玩家信息 或 None]"""
+
+    def __init__(self, entries=None):
+        self._entries = entries if entries is not None else {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, card_id):
+        entry = self._entries.get(card_id)
+        return None if entry is None else entry[1]
+
+    def fetched_at(self, card_id):
+        entry = self._entries.get(card_id)
+        return None if entry is None else entry[0]
+
+    def put(self, card_id, profile, when):
+        self._entries[card_id] = [when, profile]
+
+    def retain(self, card_ids):
+        """去掉已不在账号列表中的卡号，返回去掉的数量"""
+        missing = [card_id for card_id in self._entries if card_id not in card_ids]
+        for card_id in missing:
+            del self._entries[card_id]
+        return len(missing)
+
+    def to_dict(self):
+        return {"version": PROFILE_CACHE_VERSION, "cards": dict(self._entries)}
+
+    @classmethod
+    def from_dict(cls, data):
+        entries = {}
+        for card_id, (fetched_at, profile) in data.get("cards", {}).items():
+            entries[str(card_id)] = [float(fetched_at), profile if isinstance(profile, dict) else None]
+        return cls(entries)
+
+
+def read_profile_cache(path):
+    """读取缓存，文件不存在或损坏时返回空缓存 (之后重新查询)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return ProfileCache.from_dict(json.load(f))
+    except FileNotFoundError:
+        return ProfileCache()
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        event_log.warning(event_log.LOAD, f"读取玩家信息缓存 '{path}' 失败，将重新查询: {e}")
+        return ProfileCache()
+
+
+def write_profile_cache(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    write_file_atomic(path, json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), fsync=False)
+
+
+# --- 查询服务 ---
+class RefreshResult:
+    """一次刷新的结果"""
+
+    def __init__(self):
+        self.requested = 0      # 需要查询 (没有缓存或已过期) 的卡号数
+        self.fetched = 0        # 查询到的卡号数 (包括服务器上没有的卡)
+        self.error = None       # 查询失败时的说明，已查询到的结果仍然保留
+        self.offline = False    # 网络不可用，显示的是缓存的信息
+        self.elapsed = 0.0
+
+    def describe(self):
+        if self.offline:
+            return f"玩家信息: 离线，显示缓存的信息 ({self.error})" if self.error else "玩家信息: 离线，显示缓存的信息"
+        if not self.requested:
+            return "玩家信息: 已是最新"
+        return f"玩家信息: 已更新 {self.fetched} 个卡号 ({self.elapsed:.1f} 秒)"
+
+
+class ProfileService:
+    """玩家信息的缓存和后台查询；lookup() 只读缓存，refresh() 在后台线程中调用"""
+
+    def __init__(self, settings, cache_path):
+        self.client = ProfileClient(settings)
+        self.ttl = float(settings.get("ttl", DEFAULT_TTL))
+        self.cache_path = cache_path
+        self.cache = None           # 第一次 refresh() 时在后台线程中读取
+        self.offline_until = 0.0
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config, cache_path):
+        """没有配置查询接口时返回 None；配置错误时输出提示并返回 None (不影响其他功能)"""
+        settings = config.get("player_profiles")
+        if not isinstance(settings, dict) or not settings.get("url"):
+            return None
+        try:
+            return cls(settings, cache_path)
+        except (ValueError, TypeError) as e:
+            event_log.warning(event_log.CONFIG, f"player_profiles 配置有误，不查询玩家信息: {e}")
+            return None
+
+    def lookup(self, card_id):
+        """缓存中的玩家信息，没有时返回 None"""
+        with self._lock:
+            return None if self.cache is None else self.cache.get(card_id)
+
+    def _load(self):
+        with self._lock:
+            if self.cache is not None:
+                return
+        cache = read_profile_cache(self.cache_path)
+        with self._lock:
+            if self.cache is None:
+                self.cache = cache
+
+    def _stale(self, card_ids, now, force):
+        with self._lock:
+            if force:
+                return list(card_ids)
+            return [card_id for card_id in card_ids
+                    if (self.cache.fetched_at(card_id) or 0) + self.ttl <= now]
+
+    def _save(self):
+        with self._save_lock:
+            with self._lock:
+                data = self.cache.to_dict()
+            try:
+                write_profile_cache(self.cache_path, data)
+            except OSError as e:
+                event_log.error(event_log.SAVE, f"保存玩家信息缓存失败: {e}")
+
+    def refresh(self, card_ids, on_update=None, force=False, prune=False):
+        """查询缓存过期的卡号，返回 RefreshResult
+
+        on_update({卡号: 玩家信息}) 先以缓存的信息调用一次，之后每查询完一批调用一次 (工作线程中)。
+        force 为 True 时忽略有效期 (手动刷新)；prune 为 True 表示 card_ids 是全部账号的卡号，
+        缓存中的其他卡号 (已删除的账号) 一并去掉。
+        """
+        result = RefreshResult()
+        started = time.perf_counter()
+        card_ids = list(dict.fromkeys(card_id for card_id in card_ids if card_id))
+        self._load()
+        pruned = 0
+        if prune:
+            with self._lock:
+                pruned = self.cache.retain(set(card_ids))
+        if on_update is not None:
+            with self._lock:
+                cached = {card_id: self.cache.get(card_id) for card_id in card_ids if self.cache.fetched_at(card_id)}
+            if cached:
+                on_update(cached)
+        stale = self._stale(card_ids, time.time(), force)
+        result.requested = len(stale)
+        if stale and time.time() < self.offline_until and not force:
+            result.offline, result.error = True, self.last_error
+            stale = []
+        if not stale:
+            if pruned:
+                self._save()
+            return result
+
+        size = self.client.batch_size
+        batches = [stale[start:start + size] for start in range(0, len(stale), size)]
+        failed = threading.Event() # 一批失败 (通常是网络不可用) 后，尚未开始的批次不再发送
+
+        def fetch(batch):
+            if failed.is_set():
+                return
+            try:
+                with metrics.timed('profiles.fetch'):
+                    profiles = self.client.fetch(batch)
+            except ProfileServiceError as e:
+                if not failed.is_set():
+                    failed.set()
+                    result.error = str(e)
+                return
+            now = time.time()
+            with self._lock:
+                for card_id, profile in profiles.items():
+                    self.cache.put(card_id, profile, now)
+                result.fetched += len(profiles)
+            if on_update is not None:
+                on_update(profiles)
+
+        with ThreadPoolExecutor(max_workers=min(len(batches), self.client.max_connections),
+                                thread_name_prefix="Profiles") as pool:
+            list(pool.map(fetch, batches))
+        if failed.is_set():
+            self.offline_until = time.time() + OFFLINE_RETRY
+            self.last_error = result.error
+            result.offline = True
+            event_log.warning(event_log.REFRESH, f"查询玩家信息失败，{OFFLINE_RETRY} 秒内使用缓存的信息: {result.error}")
+        else:
+            self.offline_until = 0.0
+            self.last_error = None
+        if result.fetched or pruned:
+            self._save()
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def close(self):
+        self.client.close()
+
+
+# --- 显示 ---
+PROFILE_COLUMNS = (('PlayerName', "玩家名", 140), ('Rating', "Rating", 70), ('LastPlay', "最后游玩", 140))
+
+
+def profile_columns(profile):
+    """表格中玩家信息各列的文字"""
+    if profile is None:
+        return ("", "", "")
+    return tuple("" if profile.get(field) is None else str(profile.get(field))
+                 for field in ("name", "rating", "last_play"))
@@ -0,0 +1,175 @@
+# --- 游戏进程检测 ---
+# 后台线程定期扫描进程表，缓存正在运行的游戏进程 (Sinmai.exe、AMDaemon.exe 等)，
+# running_games() 只返回缓存的结果，切换账号或启动前检查几乎没有开销。
+# 扫描是增量的：只解析上次扫描之后新出现的进程，消失的进程直接从缓存中删除；
+# 已缓存的游戏进程 (只有几个) 每次重新读取状态，退出后成为僵尸进程的不再算作运行中。
+#   Linux:   读取 /proc/<pid>/stat (proc_root 可指向测试用的假目录)
+#   Windows: CreateToolhelp32Snapshot
+import os
+import threading
+
+import event_log
+
+DEFAULT_GAME_PROCESSES = ("Sinmai.exe", "AMDaemon.exe")
+SCAN_INTERVAL = 1.0
+COMM_MAX_LENGTH = 15 # Linux 的进程名 (comm) 最多 15 个字符
+
+
+if os.name == 'nt':
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _TH32CS_SNAPPROCESS = 0x00000002
+    _INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+    class _ProcessEntry(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", ctypes.c_long),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", ctypes.c_wchar * 260),
+        ]
+
+    _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    _kernel32.CreateToolhelp32Snapshot.argtypes = (wintypes.DWORD, wintypes.DWORD)
+    _kernel32.Process32FirstW.argtypes = (wintypes.HANDLE, ctypes.POINTER(_ProcessEntry))
+    _kernel32.Process32NextW.argtypes = (wintypes.HANDLE, ctypes.POINTER(_ProcessEntry))
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+
+def _list_toolhelp():
+    """Windows：返回 {pid: 进程名}"""
+    snapshot = _kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if snapshot == _INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    processes = {}
+    try:
+        entry = _ProcessEntry()
+        entry.dwSize = ctypes.sizeof(entry)
+        ok = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            processes[entry.th32ProcessID] = entry.szExeFile
+            ok = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        _kernel32.CloseHandle(snapshot)
+    return processes
+
+
+def _read_proc_name(proc_root, pid):
+    """读取 /proc/<pid>/stat 中的进程名；进程已退出或是僵尸进程时返回 None"""
+    try:
+        with open(os.path.join(proc_root, pid, 'stat'), 'rb') as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # 格式: pid (comm) state ...，comm 可能含空格和括号
+    start = stat.find(b'(')
+    end = stat.rfind(b')')
+    if start < 0 or end < start or stat[end + 2:end + 3] == b'Z':
+        return None
+    return stat[start + 1:end].decode('utf-8', 'replace')
+
+
+class ProcessScanner:
+    """缓存的游戏进程检测
+
+    names 为要检测的可执行文件名 (不区分大小写)。start() 后由后台线程每 interval 秒增量扫描一次；
+    游戏进程集合变化时在扫描线程中调用 on_change(games)。
+    """
+
+    def __init__(self, names=DEFAULT_GAME_PROCESSES, interval=SCAN_INTERVAL, on_change=None, proc_root='/proc'):
+        self.interval = interval
+        self.on_change = on_change
+        self.proc_root = proc_root
+        self._wanted = set()
+        for name in names:
+            name = name.lower()
+            self._wanted.add(name)
+            self._wanted.add(name[:COMM_MAX_LENGTH])
+        self._known = {}  # (pid, 目录 inode) -> 进程名，上次扫描时的全部进程；PID 被重用时 inode 不同
+        self._games = ()  # ((pid, 进程名), ...)，按 pid 排序，整体替换，读取时无需加锁
+        self._game_keys = frozenset() # _known 中游戏进程的键
+        self._scan_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.scans = 0
+
+    def running_games(self):
+        """缓存中正在运行的游戏进程 ((pid, 进程名), ...)"""
+        return self._games
+
+    def start(self):
+        """启动后台扫描线程 (第一次扫描也在线程中进行)"""
+        self._thread = threading.Thread(target=self._run, name="ProcessScanner", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+            except OSError as e:
+                event_log.warning(event_log.APP, f"扫描进程失败: {e}")
+            if self._stop.wait(self.interval):
+                break
+
+    def refresh(self):
+        """立即扫描一次 (增量)，返回游戏进程"""
+        with self._scan_lock:
+            if os.name == 'nt':
+                self._refresh_from(_list_toolhelp())
+            else:
+                self._refresh_proc()
+            self.scans += 1
+        return self._games
+
+    def _refresh_proc(self):
+        try:
+            entries = os.scandir(self.proc_root)
+        except OSError:
+            return # 没有 /proc (例如 macOS)，无法检测
+        known = self._known
+        game_keys = self._game_keys
+        current = {}
+        with entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                # inode 来自目录项本身，不需要额外的系统调用
+                key = (int(entry.name), entry.inode())
+                name = known.get(key)
+                if name is None or key in game_keys:
+                    # 新进程，或者是游戏进程：它可能已退出但还没被回收 (僵尸)
+                    name = _read_proc_name(self.proc_root, entry.name)
+                    if name is None:
+                        continue
+                current[key] = name
+        self._update(current)
+
+    def _refresh_from(self, processes):
+        # Toolhelp 每次都返回完整的进程名，不需要缓存
+        self._update({(pid, 0): name for pid, name in processes.items()})
+
+    def _update(self, current):
+        self._known = current
+        wanted = self._wanted
+        game_keys = [key for key, name in current.items() if name.lower() in wanted]
+        self._game_keys = frozenset(game_keys)
+        games = tuple(sorted((pid, current[(pid, inode)]) for pid, inode in game_keys))
+        if games != self._games:
+            self._games = games
+            if self.on_change is not None:
+                self.on_change(games)
+
+
+def describe_games(games):
+    return "、".join(f"{name} (PID {pid})" for pid, name in games)
@@ -0,0 +1,159 @@
+# --- 单实例 ---
+# 图形界面启动时锁定 LauncherConfig/launcher.lock，并在本机回环地址上监听一个端口，
+# 端口号和随机令牌写入 launcher.ipc。之后再次启动图形界面或运行 switch / launch 命令时，
+# 命令通过这个端口转交给已运行的实例，当前进程立即退出。
+#
+# 协议：每个连接一个请求，双方各发送一行 JSON。
+#   请求 {"version": 1, "token": ..., "command": "focus" | "switch" | "launch", "args": {...}}
+#   应答 {"code": 退出码, "message": ...}
+import hmac
+import json
+import os
+import secrets
+import socket
+import threading
+import time
+
+import event_log
+from account_storage import write_file_atomic
+from file_lock import FileLock
+
+LOCK_FILE_NAME = 'launcher.lock'
+INFO_FILE_NAME = 'launcher.ipc'
+PROTOCOL_VERSION = 1
+CONNECT_TIMEOUT = 1.0
+REPLY_TIMEOUT = 60.0   # 转交的命令可能需要在界面上确认，等待时间较长
+MAX_MESSAGE = 64 * 1024
+SERVER_START_WAIT = 3.0 # 取得锁到开始监听之间 (创建窗口等) 需要的时间
+
+
+def claim(data_dir):
+    """尝试成为唯一实例：成功返回持有中的 FileLock，已有实例在运行时返回 None"""
+    os.makedirs(data_dir, exist_ok=True)
+    lock = FileLock(os.path.join(data_dir, LOCK_FILE_NAME))
+    return lock if lock.acquire(timeout=0) else None
+
+
+def _read_line(sock):
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+        if len(data) > MAX_MESSAGE:
+            raise ValueError("消息过长")
+    return json.loads(data.decode('utf-8'))
+
+
+def _send_line(sock, message):
+    sock.sendall(json.dumps(message, ensure_ascii=False).encode('utf-8') + b"\n")
+
+
+def _connect(data_dir):
+    try:
+        with open(os.path.join(data_dir, INFO_FILE_NAME), 'r', encoding='utf-8') as f:
+            info = json.load(f)
+        return info, socket.create_connection(("127.0.0.1", info["port"]), timeout=CONNECT_TIMEOUT)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, None # 信息文件不存在或已过期 (上次异常退出)
+
+
+def forward(data_dir, command, args=None, timeout=REPLY_TIMEOUT, wait_for_server=0):
+    """把命令转交给已运行的实例，返回 (退出码, 信息)；没有可连接的实例时返回 None
+
+    wait_for_server 秒内连接不上时每隔 0.1 秒重试 (已知另一个实例持有锁时使用)。
+    """
+    deadline = time.monotonic() + wait_for_server
+    info, sock = _connect(data_dir)
+    while sock is None and time.monotonic() < deadline:
+        time.sleep(0.1)
+        info, sock = _connect(data_dir)
+    if sock is None:
+        return None
+    with sock:
+        try:
+            sock.settimeout(timeout + CONNECT_TIMEOUT) # 服务端等待 timeout 后一定会应答
+            _send_line(sock, {"version": PROTOCOL_VERSION, "token": info.get("token"),
+                              "command": command, "args": args or {}})
+            reply = _read_line(sock)
+            return reply["code"], reply.get("message", "")
+        except socket.timeout:
+            return 1, "等待已运行的启动器应答超时"
+        except (OSError, ValueError, KeyError, TypeError):
+            return None # 端口已被其他程序占用等情况
+
+
+class _Reply:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+    def __call__(self, code, message=""):
+        """回复请求 (可在任意线程调用，只有第一次有效)"""
+        if not self.done.is_set():
+            self.result = (code, message)
+            self.done.set()
+
+
+class InstanceServer:
+    """接收其他进程转交的命令
+
+    handler(command, args, reply) 在服务线程中调用，需要自行转交到界面线程；
+    处理完成后调用 reply(退出码, 信息)，超时未回复时对方收到错误。
+    """
+
+    def __init__(self, data_dir, handler):
+        self.data_dir = data_dir
+        self.handler = handler
+        self.info_path = os.path.join(data_dir, INFO_FILE_NAME)
+        self._token = secrets.token_hex(16)
+        self._sock = None
+        self._closed = False
+
+    def start(self):
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.listen(8)
+        port = self._sock.getsockname()[1]
+        info = {"pid": os.getpid(), "port": port, "token": self._token}
+        write_file_atomic(self.info_path, json.dumps(info).encode('utf-8'), fsync=False)
+        threading.Thread(target=self._accept_loop, name="InstanceServer", daemon=True).start()
+        event_log.emit(event_log.APP, f"单实例服务已启动: 127.0.0.1:{port}", port=port)
+
+    def stop(self):
+        self._closed = True
+        if self._sock is not None:
+            self._sock.close()
+        try:
+            os.remove(self.info_path)
+        except OSError:
+            pass
+
+    def _accept_loop(self):
+        while not self._closed:
+            try:
+                conn, address = self._sock.accept()
+            except OSError:
+                break # 已关闭
+            # 每个连接单独一个线程，等待界面确认时不影响其他请求
+            threading.Thread(target=self._serve, args=(conn,), name="InstanceRequest", daemon=True).start()
+
+    def _serve(self, conn):
+        with conn:
+            try:
+                conn.settimeout(CONNECT_TIMEOUT)
+                request = _read_line(conn)
+                if not hmac.compare_digest(str(request.get("token")), self._token):
+                    return # 不是本机启动器发来的请求
+                if request.get("version") != PROTOCOL_VERSION:
+                    _send_line(conn, {"code": 1, "message": "启动器版本不一致，请关闭已运行的启动器后重试"})
+                    return
+                reply = _Reply()
+                self.handler(request.get("command"), request.get("args") or {}, reply)
+                if not reply.done.wait(REPLY_TIMEOUT):
+                    reply(1, "处理超时")
+                conn.settimeout(CONNECT_TIMEOUT)
+                _send_line(conn, {"code": reply.result[0], "message": reply.result[1]})
+            except (OSError, ValueError, AttributeError) as e:
+                event_log.error(event_log.REMOTE, f"处理转交的命令失败: {e}")
@@ -0,0 +1,70 @@
+# --- 启动耗时分析 ---
+# 用 --profile-startup 参数或环境变量 AQUADX_PROFILE_STARTUP=1 开启，
+# 按阶段记录启动过程各步骤的耗时，输出到 stderr。未开启时 mark()/phase() 几乎没有开销。
+import sys
+import time
+
+
+class _Phase:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler._record(self.name, self.started)
+        return False
+
+
+class _NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.entries = []      # (阶段名, 耗时, 距启动的时间)，单位秒
+        self._started = None
+        self._last = None
+        self._reported = 0
+
+    def start(self, started, enabled):
+        """started 为程序开始执行时的 time.perf_counter()"""
+        self.enabled = enabled
+        self._started = self._last = started
+
+    def _record(self, name, phase_started):
+        now = time.perf_counter()
+        self.entries.append((name, now - phase_started, now - self._started))
+        self._last = now
+
+    def mark(self, name):
+        """记录从上一个阶段结束到现在的耗时"""
+        if self.enabled:
+            self._record(name, self._last)
+
+    def phase(self, name):
+        """with profiler.phase(name): ... 只记录代码块本身的耗时 (用于空闲回调等不连续的阶段)"""
+        return _Phase(self, name) if self.enabled else _NULL_PHASE
+
+    def report(self, title):
+        """输出上次报告之后新记录的阶段"""
+        if not self.enabled:
+            return
+        print(f"--- 启动耗时: {title} ---", file=sys.stderr)
+        for name, elapsed, since_start in self.entries[self._reported:]:
+            print(f"  {name:<16} {elapsed * 1000:8.1f} ms   (启动后 {since_start * 1000:8.1f} ms)", file=sys.stderr)
+        self._reported = len(self.entries)
+
+
+profiler = StartupProfiler()
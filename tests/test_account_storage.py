@@ -0,0 +1,155 @@
+# --- AccountJournal 加载与恢复测试 ---
+# 在临时数据目录中手工构造快照、日志 (.wal / .wal.compacting) 和 accounts.json，检查加载时的恢复逻辑。
+#   python -m unittest discover tests   或   python -m pytest tests
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import account_storage  # noqa: E402
+from account_storage import AccountJournal, StorageError, encode_record  # noqa: E402
+from file_lock import FileLock  # noqa: E402
+
+CARD_A = "1" * 20
+CARD_B = "2" * 20
+CARD_C = "3" * 20
+
+
+class JournalTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="journal_")
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        self.json_path = os.path.join(self.directory, "accounts.json")
+
+    def journal(self):
+        journal = AccountJournal(self.directory, self.json_path, fsync=False)
+        self.addCleanup(journal._writer_lock.release)
+        return journal
+
+    def write_snapshot(self, accounts, seq=0):
+        path = os.path.join(self.directory, account_storage.SNAPSHOT_FILE_NAME)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"seq": seq, "accounts": accounts}, f)
+
+    def write_log(self, path, records, tail=b""):
+        with open(path, 'wb') as f:
+            for seq, ops in records:
+                f.write(encode_record({"seq": seq, "ops": ops}))
+            f.write(tail)
+
+    def test_torn_last_line_dropped_and_truncated(self):
+        self.write_snapshot({"alice": CARD_A})
+        journal = self.journal()
+        torn = encode_record({"seq": 2, "ops": [["add", "carol", CARD_C]]})[:-7] # 写到一半断电
+        self.write_log(journal.wal_path, [(1, [["add", "bob", CARD_B]])], tail=torn)
+        valid_size = os.path.getsize(journal.wal_path) - len(torn)
+
+        store, warnings = journal.load(read_only=True)
+        self.assertEqual(store.to_dict(), {"alice": CARD_A, "bob": CARD_B})
+        self.assertEqual(os.path.getsize(journal.wal_path), valid_size + len(torn)) # 只读时不修复
+
+        store, warnings = journal.load()
+        self.assertEqual(store.to_dict(), {"alice": CARD_A, "bob": CARD_B})
+        self.assertEqual(journal.seq, 1)
+        self.assertTrue(any("损坏" in warning for warning in warnings))
+        self.assertEqual(os.path.getsize(journal.wal_path), valid_size)
+
+    def test_crc_mismatch_on_last_line(self):
+        self.write_snapshot({"alice": CARD_A})
+        journal = self.journal()
+        bad = bytearray(encode_record({"seq": 2, "ops": [["delete", "alice"]]}))
+        bad[0:8] = b"%08x" % (int(bad[0:8], 16) ^ 1)
+        self.write_log(journal.wal_path, [(1, [["add", "bob", CARD_B]])], tail=bytes(bad))
+        store, warnings = journal.load()
+        self.assertEqual(store.to_dict(), {"alice": CARD_A, "bob": CARD_B})
+        self.assertEqual(journal.seq, 1)
+        self.assertTrue(warnings)
+
+    def test_compacting_replayed_before_wal(self):
+        self.write_snapshot({"alice": CARD_A}, seq=1)
+        journal = self.journal()
+        # 压缩中断：.compacting 有 seq 1-3 (1 已在快照中)，新日志从 3 开始 (重复的记录只应用一次)
+        self.write_log(journal.compacting_path, [
+            (1, [["add", "alice", CARD_A]]),
+            (2, [["add", "bob", CARD_B]]),
+            (3, [["rename", "bob", "bobby"]]),
+        ])
+        self.write_log(journal.wal_path, [
+            (3, [["rename", "bob", "bobby"]]),
+            (4, [["add", "carol", CARD_C], ["set_card", "alice", "4" * 20]]),
+        ])
+        store, warnings = journal.load()
+        self.assertEqual(warnings, [])
+        self.assertEqual(store.to_dict(), {"alice": "4" * 20, "bobby": CARD_B, "carol": CARD_C})
+        self.assertEqual(journal.seq, 4)
+
+    def test_external_accounts_json_edit(self):
+        journal = self.journal()
+        store, warnings = journal.load()
+        journal.attach(store)
+        store.add("alice", CARD_A)
+        journal.close() # 压缩：写入快照 (含 export_signature) 和 accounts.json
+
+        # 手动编辑 accounts.json (比快照新，签名不同)
+        with open(self.json_path, 'w', encoding='utf-8') as f:
+            json.dump({"alice": CARD_A, "manual": CARD_B}, f)
+        snapshot_mtime = os.stat(journal.snapshot_path).st_mtime_ns
+        os.utime(self.json_path, ns=(snapshot_mtime + 10**9, snapshot_mtime + 10**9))
+        self.write_log(journal.wal_path, [(2, [["add", "ignored", CARD_C]])])
+
+        journal = self.journal()
+        store, warnings = journal.load()
+        self.assertEqual(store.to_dict(), {"alice": CARD_A, "manual": CARD_B})
+        self.assertTrue(any("外部修改" in warning for warning in warnings))
+        journal.close()
+
+        # 重新导出后签名一致，不再当作外部修改
+        store, warnings = self.journal().load(read_only=True)
+        self.assertEqual(store.to_dict(), {"alice": CARD_A, "manual": CARD_B})
+        self.assertEqual(warnings, [])
+
+    def test_writer_lock_released_when_load_fails(self):
+        with open(os.path.join(self.directory, account_storage.SNAPSHOT_FILE_NAME), 'w') as f:
+            f.write("{broken")
+        journal = self.journal()
+        with self.assertRaises(StorageError):
+            journal.load()
+        self.assertFalse(journal._writer_lock.locked)
+        other = FileLock(os.path.join(self.directory, account_storage.WRITER_LOCK_FILE_NAME))
+        self.assertTrue(other.acquire(timeout=0))
+        other.release()
+
+    def test_freeze_failure_reported(self):
+        journal = self.journal()
+        store, warnings = journal.load()
+        journal.attach(store)
+        errors = []
+        journal.on_error = errors.append
+        seen = []
+        store.subscribe(seen.append)
+        replace = os.replace
+
+        def locked_wal(source, target):
+            if source == journal.wal_path:
+                raise PermissionError("locked")
+            return replace(source, target)
+
+        account_storage.os.replace = locked_wal
+        try:
+            store.add("alice", CARD_A)
+            journal.compact(background=False)
+        finally:
+            account_storage.os.replace = replace
+        store.add("bob", CARD_B) # 日志仍可写入，后面的订阅者照常收到通知
+        self.assertEqual(len(errors), 1)
+        self.assertEqual([change.username for change in seen], ["alice", "bob"])
+        journal.close()
+        store, warnings = self.journal().load(read_only=True)
+        self.assertEqual(store.to_dict(), {"alice": CARD_A, "bob": CARD_B})
+
+
+if __name__ == "__main__":
+    unittest.main()
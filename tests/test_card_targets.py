@@ -0,0 +1,128 @@
+# --- card_targets 测试 ---
+# INI 文件的按键修改 (保留注释、换行符和 BOM)、多文件事务的恢复、解析缓存的失效和已是该卡号时的跳过。
+#   python -m unittest discover tests   或   python -m pytest tests
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import card_targets  # noqa: E402
+from card_targets import FileTarget, IniDocument, IniTarget, targets_match, write_card_targets  # noqa: E402
+
+CARD_OLD = "0" * 20
+CARD_NEW = "1" * 20
+
+
+class IniDocumentTest(unittest.TestCase):
+    def test_patch_keeps_comments_crlf_and_bom(self):
+        data = ("﻿; 注释\r\n[vfs]\r\namfs=..\\amfs\r\n\r\n"
+                "[aime]\r\n; 卡号\r\nenable = 1\r\naccessCode = 0000  \r\n").encode('utf-8')
+        document = IniDocument(data)
+        self.assertEqual(document.get("AIME", "accesscode"), "0000")
+        patched = document.with_value("aime", "accessCode", CARD_NEW)
+        self.assertEqual(patched, data.replace(b"0000", CARD_NEW.encode('ascii')))
+        self.assertTrue(patched.startswith(b'\xef\xbb\xbf'))
+
+    def test_add_key_to_existing_section(self):
+        document = IniDocument(b"[aime]\nenable=1\n\n[io]\npath=x\n")
+        self.assertEqual(document.with_value("aime", "accessCode", CARD_NEW),
+                         f"[aime]\nenable=1\naccessCode={CARD_NEW}\n\n[io]\npath=x\n".encode('ascii'))
+
+    def test_add_missing_section(self):
+        document = IniDocument(b"[io]\r\npath=x")
+        self.assertEqual(document.with_value("aime", "accessCode", CARD_NEW),
+                         f"[io]\r\npath=x\r\n\r\n[aime]\r\naccessCode={CARD_NEW}\r\n".encode('ascii'))
+
+
+class WriteCardTargetsTest(unittest.TestCase):
+    def setUp(self):
+        card_targets._ini_cache.clear()
+        self.directory = tempfile.mkdtemp(prefix="card_targets_")
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        self.auth_path = self.write("aime.txt", CARD_OLD.encode('ascii'))
+        self.felica_path = self.write("felica.txt", CARD_OLD.encode('ascii'))
+        self.ini_data = f"; segatools\n[aime]\naccessCode={CARD_OLD}\n".encode('ascii')
+        self.ini_path = self.write("segatools.ini", self.ini_data)
+        self.targets = [FileTarget(self.auth_path, create=False), FileTarget(self.felica_path),
+                        IniTarget(self.ini_path)]
+
+    def write(self, name, data):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def assert_unchanged(self):
+        self.assertEqual(self.read(self.auth_path), CARD_OLD.encode('ascii'))
+        self.assertEqual(self.read(self.felica_path), CARD_OLD.encode('ascii'))
+        self.assertEqual(self.read(self.ini_path), self.ini_data)
+        self.assertEqual(sorted(os.listdir(self.directory)), ["aime.txt", "felica.txt", "segatools.ini"])
+
+    def patch_replace(self, replace):
+        original = card_targets._replace
+        card_targets._replace = replace
+        self.addCleanup(setattr, card_targets, '_replace', original)
+        return original
+
+    def test_write_all_targets(self):
+        self.assertEqual(write_card_targets(self.targets, CARD_NEW, fsync=False), 3)
+        self.assertEqual(self.read(self.auth_path), CARD_NEW.encode('ascii'))
+        self.assertEqual(self.read(self.ini_path), self.ini_data.replace(CARD_OLD.encode(), CARD_NEW.encode()))
+        self.assertTrue(targets_match(self.targets, CARD_NEW))
+
+    def test_skip_when_already_written(self):
+        write_card_targets(self.targets, CARD_NEW, fsync=False)
+        calls = []
+        original = self.patch_replace(lambda tmp_path, path: (calls.append(path), original(tmp_path, path)))
+        self.assertTrue(targets_match(self.targets, CARD_NEW))
+        self.assertEqual(write_card_targets(self.targets, CARD_NEW, fsync=False), 0)
+        self.assertEqual(calls, [])
+
+    def test_failed_replace_restores_replaced_files(self):
+        original = card_targets._replace
+
+        def fail_second(tmp_path, path):
+            if path == self.felica_path:
+                raise PermissionError("locked")
+            original(tmp_path, path)
+
+        self.patch_replace(fail_second)
+        with self.assertRaises(OSError):
+            write_card_targets(self.targets, CARD_NEW, fsync=False)
+        self.assert_unchanged()
+
+    def test_failed_verify_restores_all_files(self):
+        original = card_targets._replace
+
+        def corrupt_ini(tmp_path, path):
+            original(tmp_path, path)
+            if path == self.ini_path:
+                with open(path, 'ab') as f:
+                    f.write(b"garbage\n") # 例如被其他程序同时改写
+
+        self.patch_replace(corrupt_ini)
+        with self.assertRaises(OSError):
+            write_card_targets(self.targets, CARD_NEW, fsync=False)
+        self.assert_unchanged()
+
+    def test_ini_cache_invalidated_by_external_edit(self):
+        target = IniTarget(self.ini_path)
+        write_card_targets([target], CARD_NEW, fsync=False)
+        self.assertEqual(target.read(), CARD_NEW)
+        self.assertIs(card_targets.load_ini(self.ini_path), card_targets.load_ini(self.ini_path)) # 缓存
+        # 外部修改：内容和修改时间都变了
+        stat = os.stat(self.ini_path)
+        self.write("segatools.ini", b"[aime]\naccessCode=22222222222222222222\nenable=1\n")
+        os.utime(self.ini_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(target.read(), "2" * 20)
+        self.assertFalse(targets_match([target], CARD_NEW))
+
+
+if __name__ == "__main__":
+    unittest.main()
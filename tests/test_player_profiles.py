@@ -0,0 +1,124 @@
+# --- 玩家信息查询测试 ---
+# 在临时端口上运行 tools/aquadx_stub_server.py，检查批量请求、连接复用、缓存有效期和离线模式。
+#   python -m unittest discover tests   或   python -m pytest tests
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tools'))
+from aquadx_stub_server import StubPlayers, drop_connections, make_server  # noqa: E402
+from player_profiles import ProfileService, read_profile_cache  # noqa: E402
+
+CARD_COUNT = 120
+
+
+def card_ids(count=CARD_COUNT):
+    return [f"{index:020d}" for index in range(1, count + 1)]
+
+
+class PlayerProfilesTest(unittest.TestCase):
+    def setUp(self):
+        self.server = make_server(players=StubPlayers({"00000000000000000001": {"name": "ALICE", "rating": 15000}}))
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+        self.addCleanup(self.stop_server)
+        self.directory = tempfile.mkdtemp(prefix="profiles_")
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        self.cache_path = os.path.join(self.directory, "accounts.profiles.json")
+
+    def stop_server(self):
+        if self.thread is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            drop_connections(self.server)
+            self.thread = None
+
+    def make_service(self, **settings):
+        settings = dict({"url": f"http://127.0.0.1:{self.server.server_port}/api/v2/card/summary",
+                         "batch_size": 50, "max_connections": 2, "timeout": 2}, **settings)
+        service = ProfileService(settings, self.cache_path)
+        self.addCleanup(service.close)
+        return service
+
+    def test_one_request_per_batch(self):
+        service = self.make_service()
+        result = service.refresh(card_ids())
+        self.assertIsNone(result.error)
+        self.assertEqual(result.requested, CARD_COUNT)
+        self.assertEqual(result.fetched, CARD_COUNT)
+        self.assertEqual(self.server.requests, 3) # 120 张卡，每批 50 张
+        self.assertEqual(service.lookup("00000000000000000001"),
+                         {"name": "ALICE", "rating": 15000, "last_play": None})
+        self.assertEqual(len(read_profile_cache(self.cache_path)), CARD_COUNT)
+
+    def test_get_per_card(self):
+        service = self.make_service(batch=False)
+        result = service.refresh(card_ids(5))
+        self.assertEqual(result.fetched, 5)
+        self.assertEqual(self.server.requests, 5)
+        self.assertEqual(service.lookup("00000000000000000001")["name"], "ALICE")
+
+    def test_connections_reused(self):
+        service = self.make_service()
+        for _ in range(3):
+            service.refresh(card_ids(), force=True)
+        self.assertEqual(self.server.requests, 9)
+        self.assertLessEqual(service.client.pool.created, 2) # 不超过 max_connections
+        self.assertEqual(self.server.connections, service.client.pool.created)
+
+    def test_stale_connection_retried(self):
+        service = self.make_service(max_connections=1)
+        service.refresh(card_ids(10))
+        drop_connections(self.server) # 服务器关闭了空闲连接
+        time.sleep(0.05)
+        result = service.refresh(card_ids(10), force=True)
+        self.assertIsNone(result.error)
+        self.assertFalse(result.offline)
+        self.assertEqual(service.client.pool.created, 2)
+
+    def test_cache_hit_within_ttl(self):
+        service = self.make_service()
+        service.refresh(card_ids())
+        requests = self.server.requests
+        updates = []
+        result = service.refresh(card_ids(), on_update=updates.append)
+        self.assertEqual(result.requested, 0)
+        self.assertEqual(self.server.requests, requests)
+        self.assertEqual(len(updates), 1) # 只有缓存的信息
+        self.assertEqual(len(updates[0]), CARD_COUNT)
+        # 新的服务实例从缓存文件读取，同样不查询
+        self.assertEqual(self.make_service().refresh(card_ids()).requested, 0)
+        self.assertEqual(self.server.requests, requests)
+
+    def test_prune_removes_deleted_cards(self):
+        service = self.make_service()
+        service.refresh(card_ids())
+        service.refresh(card_ids(10), prune=True)
+        self.assertEqual(len(read_profile_cache(self.cache_path)), 10)
+
+    def test_offline_keeps_cached_profiles(self):
+        service = self.make_service(ttl=0)
+        service.refresh(card_ids())
+        self.stop_server()
+        result = service.refresh(card_ids())
+        self.assertTrue(result.offline)
+        self.assertIsNotNone(result.error)
+        self.assertGreater(service.offline_until, time.time())
+        self.assertEqual(service.lookup("00000000000000000001")["name"], "ALICE")
+        # 离线期间不再尝试连接，仍然提供缓存的信息
+        created = service.client.pool.created
+        updates = []
+        result = service.refresh(card_ids(), on_update=updates.append)
+        self.assertTrue(result.offline)
+        self.assertEqual(service.client.pool.created, created)
+        self.assertEqual(len(updates[0]), CARD_COUNT)
+
+
+if __name__ == "__main__":
+    unittest.main()
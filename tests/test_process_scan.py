@@ -0,0 +1,107 @@
+# --- ProcessScanner 测试 ---
+# 用临时目录模拟 /proc (proc_root)：<pid>/stat 的内容为 "pid (进程名) 状态 ..."。
+#   python -m unittest discover tests   或   python -m pytest tests
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from process_scan import ProcessScanner  # noqa: E402
+
+
+class FakeProc:
+    def __init__(self):
+        self.root = tempfile.mkdtemp(prefix="fake_proc_")
+        os.mkdir(os.path.join(self.root, "self")) # 非数字目录应被跳过
+
+    def close(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _write_stat(self, directory, pid, name, state):
+        with open(os.path.join(directory, "stat"), "w", encoding="utf-8") as f:
+            f.write(f"{pid} ({name}) {state} 1 {pid} {pid} 0 -1 4194304\n")
+
+    def start(self, pid, name, state="S"):
+        """新进程；pid 已存在时模拟 PID 被重用：换成新目录 (inode 不同)"""
+        path = os.path.join(self.root, str(pid))
+        fresh = path + ".new"
+        os.mkdir(fresh)
+        self._write_stat(fresh, pid, name, state)
+        # 新目录建好后再删除旧目录，保证两者的 inode 不同
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.rename(fresh, path)
+
+    def set_state(self, pid, state, name):
+        """原地修改状态 (同一进程，inode 不变)"""
+        self._write_stat(os.path.join(self.root, str(pid)), pid, name, state)
+
+    def exit(self, pid):
+        shutil.rmtree(os.path.join(self.root, str(pid)))
+
+
+class ProcessScannerTest(unittest.TestCase):
+    def setUp(self):
+        self.proc = FakeProc()
+        self.addCleanup(self.proc.close)
+        self.changes = []
+        self.scanner = ProcessScanner(("Sinmai.exe", "AMDaemon.exe"), on_change=self.changes.append,
+                                      proc_root=self.proc.root)
+
+    def test_detects_games_case_insensitive(self):
+        self.proc.start(100, "bash")
+        self.proc.start(200, "sinmai.exe")
+        self.proc.start(300, "AMDaemon.exe")
+        self.assertEqual(self.scanner.refresh(), ((200, "sinmai.exe"), (300, "AMDaemon.exe")))
+        self.assertEqual(self.scanner.running_games(), ((200, "sinmai.exe"), (300, "AMDaemon.exe")))
+
+    def test_detects_name_truncated_by_comm_limit(self):
+        # /proc/<pid>/stat 中的进程名最多 15 个字符
+        scanner = ProcessScanner(("ChunithmLauncher.exe",), proc_root=self.proc.root)
+        self.proc.start(100, "ChunithmLaunche")
+        self.proc.start(101, "ChunithmLaunch")
+        self.assertEqual(scanner.refresh(), ((100, "ChunithmLaunche"),))
+
+    def test_zombie_is_not_running(self):
+        self.proc.start(200, "Sinmai.exe", state="Z")
+        self.assertEqual(self.scanner.refresh(), ())
+
+    def test_game_turning_zombie_after_first_scan(self):
+        self.proc.start(200, "Sinmai.exe")
+        self.assertEqual(self.scanner.refresh(), ((200, "Sinmai.exe"),))
+        # 已缓存的游戏进程退出但尚未被回收
+        self.proc.set_state(200, "Z", "Sinmai.exe")
+        self.assertEqual(self.scanner.refresh(), ())
+        self.assertEqual(self.changes, [((200, "Sinmai.exe"),), ()])
+        self.proc.exit(200)
+        self.assertEqual(self.scanner.refresh(), ())
+        self.assertEqual(len(self.changes), 2) # 没有变化时不通知
+
+    def test_pid_reused_by_game(self):
+        self.proc.start(100, "bash")
+        self.assertEqual(self.scanner.refresh(), ())
+        self.proc.start(100, "Sinmai.exe")
+        self.assertEqual(self.scanner.refresh(), ((100, "Sinmai.exe"),))
+
+    def test_pid_of_game_reused_by_other_process(self):
+        self.proc.start(100, "Sinmai.exe")
+        self.assertEqual(self.scanner.refresh(), ((100, "Sinmai.exe"),))
+        self.proc.start(100, "bash")
+        self.assertEqual(self.scanner.refresh(), ())
+
+    def test_exited_process_removed(self):
+        self.proc.start(100, "Sinmai.exe")
+        self.proc.start(101, "AMDaemon.exe")
+        self.scanner.refresh()
+        self.proc.exit(100)
+        self.assertEqual(self.scanner.refresh(), ((101, "AMDaemon.exe"),))
+
+    def test_missing_proc_root(self):
+        scanner = ProcessScanner(proc_root=os.path.join(self.proc.root, "missing"))
+        self.assertEqual(scanner.refresh(), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+# --- 本地 AquaDX 查询接口 (测试用) ---
+# 按 player_profiles.py 的请求格式应答，用于在没有 AquaDX 服务器时测试玩家信息列：
+#   python tools/aquadx_stub_server.py [--port 8080] [--data players.json] [--delay 0.2] [--missing-rate 0.1]
+# 然后在 config.json 中设置 "player_profiles": {"url": "http://127.0.0.1:8080/api/v2/card/summary"}。
+# 支持 POST (批量，{"cardIds": [...]}) 和 GET ?cardId=卡号，使用 HTTP/1.1 keep-alive。
+# --data 为 {"卡号": {"name", "rating", "lastPlayDate"}}；没有给出的卡号按卡号生成固定的玩家信息，
+# --missing-rate 比例的卡号当作服务器上不存在。结束时输出请求数和连接数，可以确认连接是否被复用。
+# 测试 (tests/test_player_profiles.py) 用 make_server() 在临时端口上运行，drop_connections() 模拟连接失效。
+import argparse
+import hashlib
+import json
+import socket
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubPlayers:
+    def __init__(self, players=None, missing_rate=0.0):
+        self.players = players or {}
+        self.missing_rate = missing_rate
+
+    def get(self, card_id):
+        if card_id in self.players:
+            return self.players[card_id]
+        digest = hashlib.sha1(card_id.encode('utf-8')).digest()
+        if digest[0] / 256 < self.missing_rate:
+            return None
+        return {
+            "name": f"PLAYER{int.from_bytes(digest[1:3], 'big') % 10000:04d}",
+            "rating": int.from_bytes(digest[3:5], 'big') % 16000,
+            "lastPlayDate": time.strftime("%Y-%m-%d %H:%M", time.gmtime(1700000000 + int.from_bytes(digest[5:8], 'big'))),
+        }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def setup(self):
+        super().setup()
+        with self.server.stats_lock:
+            self.server.connections += 1
+            self.server.open_connections.add(self.connection)
+
+    def finish(self):
+        with self.server.stats_lock:
+            self.server.open_connections.discard(self.connection)
+        super().finish()
+
+    def _reply(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _begin(self):
+        with self.server.stats_lock:
+            self.server.requests += 1
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+    def do_GET(self):
+        self._begin()
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        card_id = query.get("cardId", [""])[0]
+        player = self.server.players.get(card_id) if card_id else None
+        if player is None:
+            self._reply(404, {"error": "card not found"})
+        else:
+            self._reply(200, player)
+
+    def do_POST(self):
+        self._begin()
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            card_ids = json.loads(self.rfile.read(length))["cardIds"]
+        except (ValueError, KeyError, TypeError):
+            self._reply(400, {"error": "expected {\"cardIds\": [...]}"})
+            return
+        self._reply(200, {card_id: self.server.players.get(card_id) for card_id in card_ids})
+
+
+def make_server(port=0, players=None, delay=0.0, verbose=False):
+    """创建服务器 (port 为 0 时自动选择端口，见 server.server_port)，调用方运行 serve_forever()"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    server.players = players or StubPlayers()
+    server.delay = delay
+    server.verbose = verbose
+    server.stats_lock = threading.Lock()
+    server.requests = 0
+    server.connections = 0
+    server.open_connections = set()
+    return server
+
+
+def drop_connections(server):
+    """断开所有 keep-alive 连接 (客户端下次使用空闲连接时失败)；停止服务器后调用，已建立的连接也不再应答"""
+    with server.stats_lock:
+        connections = list(server.open_connections)
+    for connection in connections:
+        try:
+            connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="用于测试玩家信息查询的本地 AquaDX 接口")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--data", help="玩家信息 JSON 文件 ({卡号: 玩家信息})")
+    parser.add_argument("--delay", type=float, default=0.0, help="每个请求的延迟 (秒)，模拟网络延迟")
+    parser.add_argument("--missing-rate", type=float, default=0.0, help="当作不存在的卡号比例")
+    parser.add_argument("--verbose", action="store_true", help="输出每个请求")
+    args = parser.parse_args()
+
+    players = {}
+    if args.data:
+        with open(args.data, 'r', encoding='utf-8') as f:
+            players = json.load(f)
+    server = make_server(args.port, StubPlayers(players, args.missing_rate), args.delay, args.verbose)
+    print(f"正在监听 http://127.0.0.1:{server.server_port}/api/v2/card/summary (Ctrl+C 结束)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"共 {server.requests} 个请求，{server.connections} 个连接")
+
+
+if __name__ == "__main__":
+    main()
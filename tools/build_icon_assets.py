@@ -0,0 +1,192 @@
+# --- 生成图标资源 ---
+# 从 app.ico 中取出图像，缩放成窗口图标需要的几种尺寸，编码为 PNG，
+# 以 base64 文本写入 icon_assets.py (Tk 的 PhotoImage(data=...) 可以直接使用，不需要解码)。
+# 更换 app.ico 后重新运行: python tools/build_icon_assets.py
+import argparse
+import base64
+import os
+import struct
+import zlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ICON_SIZES = (16, 32, 48, 64, 128)
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+# --- 读取 ICO ---
+def read_ico_entries(data):
+    """返回 [(宽, 高, 图像数据)]，图像数据为 PNG 或 BMP (DIB)"""
+    reserved, kind, count = struct.unpack_from('<HHH', data, 0)
+    if reserved != 0 or kind != 1:
+        raise ValueError("不是 ICO 文件")
+    entries = []
+    for i in range(count):
+        width, height, _, _, _, _, size, offset = struct.unpack_from('<BBBBHHII', data, 6 + 16 * i)
+        entries.append((width or 256, height or 256, data[offset:offset + size]))
+    return entries
+
+
+def decode_dib(dib):
+    """32 位 DIB -> (宽, 高, RGBA 字节)"""
+    header_size, width, double_height, _, bpp = struct.unpack_from('<IiiHH', dib, 0)
+    if bpp != 32:
+        raise ValueError(f"只支持 32 位图标，实际为 {bpp} 位")
+    height = double_height // 2
+    stride = width * 4
+    pixels = dib[header_size:header_size + stride * height]
+    mask_stride = ((width + 31) // 32) * 4
+    mask = dib[header_size + stride * height:]
+    has_alpha = any(pixels[3::4])
+    rgba = bytearray()
+    for y in range(height - 1, -1, -1):  # DIB 行从下往上存储
+        row = pixels[y * stride:(y + 1) * stride]
+        for x in range(width):
+            b, g, r, a = row[x * 4:x * 4 + 4]
+            if not has_alpha:
+                # 没有 alpha 通道的旧图标用 AND 掩码表示透明
+                transparent = mask and mask[y * mask_stride + x // 8] & (0x80 >> (x % 8))
+                a = 0 if transparent else 255
+            rgba += bytes((r, g, b, a))
+    return width, height, bytes(rgba)
+
+
+# --- 缩放 ---
+def fit_square(width, height, rgba):
+    """补透明边成为正方形"""
+    side = max(width, height)
+    if width == height:
+        return side, rgba
+    out = bytearray(side * side * 4)
+    left = (side - width) // 2
+    top = (side - height) // 2
+    for y in range(height):
+        start = ((top + y) * side + left) * 4
+        out[start:start + width * 4] = rgba[y * width * 4:(y + 1) * width * 4]
+    return side, bytes(out)
+
+
+def downscale(side, rgba, size):
+    """按面积平均缩小 (预乘 alpha，避免透明边缘发黑)"""
+    scale = side / size
+    out = bytearray()
+    for oy in range(size):
+        y0, y1 = oy * scale, (oy + 1) * scale
+        for ox in range(size):
+            x0, x1 = ox * scale, (ox + 1) * scale
+            acc = [0.0, 0.0, 0.0, 0.0]
+            total = 0.0
+            for sy in range(int(y0), min(side, int(-(-y1 // 1)))):
+                wy = min(y1, sy + 1) - max(y0, sy)
+                for sx in range(int(x0), min(side, int(-(-x1 // 1)))):
+                    w = wy * (min(x1, sx + 1) - max(x0, sx))
+                    i = (sy * side + sx) * 4
+                    a = rgba[i + 3] * w
+                    acc[0] += rgba[i] * a
+                    acc[1] += rgba[i + 1] * a
+                    acc[2] += rgba[i + 2] * a
+                    acc[3] += a
+                    total += w
+            alpha = acc[3]
+            if alpha:
+                out += bytes((round(acc[0] / alpha), round(acc[1] / alpha), round(acc[2] / alpha),
+                              round(alpha / total)))
+            else:
+                out += b"\0\0\0\0"
+    return bytes(out)
+
+
+# --- PNG 编码 ---
+def _png_chunk(kind, payload):
+    return struct.pack('>I', len(payload)) + kind + payload + struct.pack('>I', zlib.crc32(kind + payload))
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def encode_png(size, rgba):
+    """RGBA -> PNG，每行选用绝对值之和最小的滤波方式"""
+    stride = size * 4
+    raw = bytearray()
+    previous = bytes(stride)
+    for y in range(size):
+        row = rgba[y * stride:(y + 1) * stride]
+        candidates = []
+        for kind in range(5):
+            filtered = bytearray(stride)
+            for i in range(stride):
+                left = row[i - 4] if i >= 4 else 0
+                up = previous[i]
+                upper_left = previous[i - 4] if i >= 4 else 0
+                predictor = (0, left, up, (left + up) // 2, _paeth(left, up, upper_left))[kind]
+                filtered[i] = (row[i] - predictor) & 0xFF
+            candidates.append((sum(v if v < 128 else 256 - v for v in filtered), kind, filtered))
+        _, kind, filtered = min(candidates)
+        raw.append(kind)
+        raw += filtered
+        previous = row
+    header = struct.pack('>IIBBBBB', size, size, 8, 6, 0, 0, 0)
+    return (PNG_SIGNATURE + _png_chunk(b'IHDR', header)
+            + _png_chunk(b'IDAT', zlib.compress(bytes(raw), 9)) + _png_chunk(b'IEND', b''))
+
+
+# --- 生成模块 ---
+def build_icons(ico_data, sizes):
+    """返回 {尺寸: PNG 字节}"""
+    entries = read_ico_entries(ico_data)
+    icons = {}
+    bitmaps = []
+    for width, height, image in entries:
+        if image.startswith(PNG_SIGNATURE):
+            if width == height and width in sizes:
+                icons[width] = image  # 已经是所需尺寸的 PNG，原样使用
+        else:
+            bitmaps.append(decode_dib(image))
+    if not bitmaps and len(icons) < len(sizes):
+        raise ValueError("ICO 中没有可缩放的位图图像")
+    if bitmaps:
+        side, rgba = fit_square(*max(bitmaps, key=lambda item: item[0] * item[1]))
+        for size in sizes:
+            if size not in icons:
+                icons[size] = encode_png(size, downscale(side, rgba, size) if size < side else rgba)
+    return icons
+
+
+def write_module(icons, path, source_name):
+    lines = [
+        "# --- 图标资源 (自动生成) ---",
+        f"# 由 tools/build_icon_assets.py 从 {source_name} 生成，请勿手动修改。",
+        "# 每个尺寸一张 PNG，base64 文本可直接传给 tk.PhotoImage(data=...)。",
+        "ICON_PNGS = {",
+    ]
+    for size in sorted(icons):
+        encoded = base64.b64encode(icons[size]).decode('ascii')
+        lines.append(f"    {size}: (")
+        for start in range(0, len(encoded), 100):
+            lines.append(f"        '{encoded[start:start + 100]}'")
+        lines.append("    ),")
+    lines.append("}")
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="从 app.ico 生成 icon_assets.py")
+    parser.add_argument("--ico", default=os.path.join(ROOT_DIR, "app.ico"))
+    parser.add_argument("--output", default=os.path.join(ROOT_DIR, "icon_assets.py"))
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(ICON_SIZES))
+    args = parser.parse_args()
+
+    with open(args.ico, 'rb') as f:
+        icons = build_icons(f.read(), args.sizes)
+    write_module(icons, args.output, os.path.basename(args.ico))
+    total = sum(len(png) for png in icons.values())
+    print(f"已生成 {args.output}: {', '.join(f'{size}px {len(icons[size])} 字节' for size in sorted(icons))}，共 {total} 字节")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+# --- 虚拟列表 ---
+# 账号很多时，只把可视区域 (+少量缓冲) 内的行放进 Listbox / Treeview，
+# 滚动条按逻辑总行数计算。数据源需提供 len()、name_at(i)、index_of(name)。
+import tkinter as tk
+from tkinter import ttk, font as tkfont
+
+BUFFER_ROWS = 2          # 可视区域之外额外渲染的行数
+WHEEL_SCROLL_ROWS = 3    # 鼠标滚轮每格滚动的行数
+
+
+class _VirtualView:
+    """Listbox / Treeview 虚拟列表的公共逻辑：视口位置、滚动、按用户名记录选中项"""
+
+    def __init__(self, source):
+        self.source = source
+        self.first = 0             # 视口第一行的逻辑序号
+        self.visible_rows = 10     # 视口能完整显示的行数
+        self.selected_key = None   # 选中的用户名 (插入/删除其他行时保持不变)
+        self.active_key = None
+        self.on_select = None      # 用户改变选中项时回调 on_select(username)
+        self._keys = []            # 当前已渲染的行
+        self._rendering = False
+
+    # --- 数据源 ---
+    def set_source(self, source):
+        self.source = source
+        self.first = 0
+        self.render()
+
+    def size(self):
+        return len(self.source)
+
+    def apply_change(self, change):
+        """账号数据变化后保持视口和选中项稳定，只重绘可视区域"""
+        if change.op == 'delete':
+            if change.username == self.selected_key:
+                self.selected_key = None
+            if change.old_index is not None and change.old_index < self.first:
+                self.first -= 1
+        elif change.op == 'add':
+            if change.new_index is not None and change.new_index < self.first:
+                self.first += 1
+        elif change.op == 'rename':
+            if self.selected_key == change.old_username:
+                self.selected_key = change.username
+            if self.active_key == change.old_username:
+                self.active_key = change.username
+        self.render()
+
+    # --- Listbox 风格接口 (逻辑序号) ---
+    def curselection(self):
+        if self.selected_key is None:
+            return ()
+        index = self.source.index_of(self.selected_key)
+        return () if index is None else (index,)
+
+    def get(self, index):
+        return self.source.name_at(index)
+
+    def selection_clear(self, *args):
+        self.selected_key = None
+        self.render()
+
+    def selection_set(self, index):
+        self.selected_key = self.source.name_at(index)
+        self.render()
+
+    def selection_includes(self, index):
+        return self.selected_key is not None and self.source.index_of(self.selected_key) == index
+
+    def activate(self, index):
+        self.active_key = self.source.name_at(index)
+        self.render()
+
+    def see(self, index):
+        if index < self.first:
+            self.first = index
+        elif index >= self.first + self.visible_rows:
+            self.first = index - self.visible_rows + 1
+        self.render()
+
+    def yview(self, *args):
+        """滚动条回调：('moveto', 比例) 或 ('scroll', 数量, 'units'/'pages')"""
+        total = len(self.source)
+        if not args:
+            if total == 0:
+                return (0.0, 1.0)
+            return (self.first / total, min(1.0, (self.first + self.visible_rows) / total))
+        if args[0] == 'moveto':
+            self.first = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= max(1, self.visible_rows - 1)
+            self.first += amount
+        self.render()
+
+    # --- 渲染 ---
+    def render(self):
+        total = len(self.source)
+        self.first = max(0, min(self.first, total - self.visible_rows))
+        end = min(total, self.first + self.visible_rows + BUFFER_ROWS)
+        name_at = self.source.name_at
+        self._keys = [name_at(i) for i in range(self.first, end)]
+        self._rendering = True
+        try:
+            self._fill(self._keys)
+            self._mark(self._slot_of(self.selected_key), self._slot_of(self.active_key))
+        finally:
+            self._rendering = False
+        if total <= self.visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.first / total, (self.first + self.visible_rows) / total)
+
+    def _slot_of(self, key):
+        """用户名在已渲染行中的位置，不在视口内返回 None"""
+        if key is None:
+            return None
+        index = self.source.index_of(key)
+        if index is None or not (self.first <= index < self.first + len(self._keys)):
+            return None
+        return index - self.first
+
+    def _set_visible_rows(self, rows):
+        rows = max(1, rows)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.render()
+
+    # --- 键盘 / 滚轮 ---
+    def _bind_navigation(self, widget):
+        widget.bind('<Up>', lambda event: self._move_selection(-1))
+        widget.bind('<Down>', lambda event: self._move_selection(1))
+        widget.bind('<Prior>', lambda event: self._move_selection(-max(1, self.visible_rows - 1)))
+        widget.bind('<Next>', lambda event: self._move_selection(max(1, self.visible_rows - 1)))
+        widget.bind('<Control-Home>', lambda event: self._move_selection(-len(self.source)))
+        widget.bind('<Control-End>', lambda event: self._move_selection(len(self.source)))
+        widget.bind('<MouseWheel>', self._on_mouse_wheel)
+        widget.bind('<Button-4>', lambda event: self._scroll_rows(-WHEEL_SCROLL_ROWS))
+        widget.bind('<Button-5>', lambda event: self._scroll_rows(WHEEL_SCROLL_ROWS))
+
+    def _on_mouse_wheel(self, event):
+        return self._scroll_rows(-WHEEL_SCROLL_ROWS if event.delta > 0 else WHEEL_SCROLL_ROWS)
+
+    def _scroll_rows(self, rows):
+        self.first += rows
+        self.render()
+        return "break"
+
+    def _move_selection(self, step):
+        total = len(self.source)
+        if total == 0:
+            return "break"
+        current = self.curselection()
+        index = current[0] + step if current else (0 if step > 0 else total - 1)
+        index = max(0, min(total - 1, index))
+        self.selected_key = self.source.name_at(index)
+        self.active_key = self.selected_key
+        self.see(index)
+        if self.on_select:
+            self.on_select(self.selected_key)
+        return "break"
+
+    def _user_selected_slot(self, slot):
+        """用户点击了第 slot 个已渲染行"""
+        if self._rendering or slot is None or slot >= len(self._keys):
+            return
+        key = self._keys[slot]
+        self.active_key = key
+        if key != self.selected_key:
+            self.selected_key = key
+            if self.on_select:
+                self.on_select(key)
+
+
+class VirtualListbox(_VirtualView):
+    """替代 tk.Listbox：在 parent 中创建 Listbox + 滚动条，只渲染可见行"""
+
+    def __init__(self, parent, source, **listbox_options):
+        super().__init__(source)
+        self.visible_rows = listbox_options.get('height', 10)
+        self.scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox = tk.Listbox(parent, exportselection=False, yscrollcommand=self._on_inner_scroll, **listbox_options)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        line_space = tkfont.Font(root=self.listbox, font=self.listbox.cget('font')).metrics('linespace')
+        self._line_pitch = line_space + 1 + 2 * int(self.listbox.cget('selectborderwidth'))
+        self._frame_border = 2 * (int(self.listbox.cget('borderwidth')) + int(self.listbox.cget('highlightthickness')))
+
+        self.listbox.bind('<<ListboxSelect>>', self._on_listbox_select)
+        self.listbox.bind('<Configure>', self._on_configure)
+        self._bind_navigation(self.listbox)
+        self.render()
+
+    def bind(self, sequence, func):
+        return self.listbox.bind(sequence, func)
+
+    def focus_set(self):
+        self.listbox.focus_set()
+
+    def _fill(self, keys):
+        self.listbox.delete(0, tk.END)
+        if keys:
+            self.listbox.insert(0, *keys)
+        self.listbox.yview_moveto(0)
+
+    def _mark(self, selected_slot, active_slot):
+        self.listbox.selection_clear(0, tk.END)
+        if selected_slot is not None:
+            self.listbox.selection_set(selected_slot)
+        if active_slot is not None:
+            self.listbox.activate(active_slot)
+
+    def _on_listbox_select(self, event=None):
+        selection = self.listbox.curselection()
+        if selection:
+            self._user_selected_slot(selection[0])
+
+    def _on_inner_scroll(self, first, last):
+        # 拖拽选择等操作会让内部 Listbox 自己滚动，把偏移折算到逻辑视口上
+        if self._rendering:
+            return
+        top = self.listbox.nearest(0)
+        if top > 0:
+            self.first += top
+            self.render()
+
+    def _on_configure(self, event):
+        self._set_visible_rows((event.height - self._frame_border) // self._line_pitch)
+
+
+class VirtualTreeview(_VirtualView):
+    """替代 ttk.Treeview (表格模式)：固定数量的行槽位，滚动时原地更新 values"""
+
+    def __init__(self, parent, source, row_values, columns, **tree_options):
+        super().__init__(source)
+        self.row_values = row_values  # row_values(username) -> 该行各列的值
+        self.tree = ttk.Treeview(parent, columns=columns, show='headings', selectmode='browse', **tree_options)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._slots = []
+
+        self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
+        self.tree.bind('<Configure>', self._on_configure)
+        self._bind_navigation(self.tree)
+        self.render()
+
+    # 供调用方配置表头、绑定事件等
+    def heading(self, *args, **kwargs):
+        return self.tree.heading(*args, **kwargs)
+
+    def column(self, *args, **kwargs):
+        return self.tree.column(*args, **kwargs)
+
+    def bind(self, sequence, func):
+        return self.tree.bind(sequence, func)
+
+    def identify_region(self, x, y):
+        return self.tree.identify_region(x, y)
+
+    def refresh_row(self, username):
+        """某一行的列值变化 (例如卡号修改) 时只更新该行"""
+        slot = self._slot_of(username)
+        if slot is not None:
+            self.tree.item(self._slots[slot], values=self.row_values(username))
+
+    def _fill(self, keys):
+        while len(self._slots) < len(keys):
+            self._slots.append(self.tree.insert('', tk.END, iid=f"slot{len(self._slots)}"))
+        while len(self._slots) > len(keys):
+            self.tree.delete(self._slots.pop())
+        for slot_iid, key in zip(self._slots, keys):
+            self.tree.item(slot_iid, values=self.row_values(key))
+        if self._slots:
+            self.tree.yview_moveto(0)
+
+    def _mark(self, selected_slot, active_slot):
+        if selected_slot is None:
+            self.tree.selection_set(())
+        else:
+            self.tree.selection_set(self._slots[selected_slot])
+        if active_slot is not None:
+            self.tree.focus(self._slots[active_slot])
+
+    def _on_tree_select(self, event=None):
+        # 渲染时设置的选中状态也会产生 <<TreeviewSelect>>，_user_selected_slot 会忽略未变化的选中项
+        selection = self.tree.selection()
+        if selection and selection[0] in self._slots:
+            self._user_selected_slot(self._slots.index(selection[0]))
+
+    def _on_configure(self, event):
+        row_height = 20
+        header_height = row_height
+        if self._slots:
+            bbox = self.tree.bbox(self._slots[0])
+            if bbox:
+                header_height, row_height = bbox[1], bbox[3]
+        self._set_visible_rows((event.height - header_height) // row_height)